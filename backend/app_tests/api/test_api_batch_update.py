@@ -0,0 +1,136 @@
+"""Tests for the "update" batch action of BaseModelViewSet: every object goes
+through partial_update, so the update guards of each viewset apply."""
+
+import pytest
+
+from core.models import AppliedControl, RiskAcceptance
+from iam.models import Folder, User, UserGroup
+
+BATCH_ACTION_URL = "/api/applied-controls/batch-action/"
+
+
+@pytest.fixture
+def folder(db):
+    return Folder.objects.create(name="batch-update-folder")
+
+
+@pytest.fixture
+def other_folder(db):
+    return Folder.objects.create(name="batch-update-folder-2")
+
+
+def _make_controls(folder, count):
+    return [
+        AppliedControl.objects.create(name=f"control-{i}", folder=folder)
+        for i in range(count)
+    ]
+
+
+def _update(client, ids, values, url=BATCH_ACTION_URL):
+    return client.post(
+        url,
+        {"action": "update", "ids": [str(i) for i in ids], "value": values},
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+def test_batch_update_applies_values_to_all_ids(
+    authenticated_client, folder, other_folder
+):
+    controls = _make_controls(folder, 3) + _make_controls(other_folder, 2)
+    resp = _update(authenticated_client, [c.id for c in controls], {"status": "active"})
+    assert resp.status_code == 200, resp.content
+    assert resp.json()["failed"] == []
+    assert sorted(s["id"] for s in resp.json()["succeeded"]) == sorted(
+        str(c.id) for c in controls
+    )
+    assert set(
+        AppliedControl.objects.filter(id__in=[c.id for c in controls]).values_list(
+            "status", flat=True
+        )
+    ) == {"active"}
+
+
+@pytest.mark.django_db
+def test_batch_update_skips_denied_folders(
+    authenticated_client, folder, other_folder, monkeypatch
+):
+    from iam.models import RoleAssignment
+
+    allowed = _make_controls(folder, 2)
+    denied = _make_controls(other_folder, 1)
+    denied_folder_id = other_folder.id
+
+    def fake(user, perm, folder, **kwargs):
+        return folder.id != denied_folder_id
+
+    monkeypatch.setattr(RoleAssignment, "is_access_allowed", staticmethod(fake))
+
+    resp = _update(
+        authenticated_client, [c.id for c in allowed + denied], {"status": "active"}
+    )
+    assert resp.status_code == 200, resp.content
+    assert [f["id"] for f in resp.json()["failed"]] == [str(denied[0].id)]
+    assert set(
+        AppliedControl.objects.filter(status="active").values_list("id", flat=True)
+    ) == {c.id for c in allowed}
+
+
+@pytest.mark.django_db
+def test_batch_update_reports_invalid_values(authenticated_client, folder):
+    controls = _make_controls(folder, 2)
+    resp = _update(authenticated_client, [c.id for c in controls], {"status": "bogus"})
+    assert resp.status_code == 200, resp.content
+    failed = resp.json()["failed"]
+    assert len(failed) == 2
+    assert all("status" in f["error"] for f in failed)
+    assert not AppliedControl.objects.filter(
+        id__in=[c.id for c in controls], status="bogus"
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_batch_update_rejects_missing_values(authenticated_client, folder):
+    controls = _make_controls(folder, 1)
+    resp = authenticated_client.post(
+        BATCH_ACTION_URL,
+        {"action": "update", "ids": [str(controls[0].id)]},
+        format="json",
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.django_db
+def test_batch_update_keeps_the_approver_only_justification(
+    authenticated_client, folder
+):
+    acceptance = RiskAcceptance.objects.create(
+        name="acceptance", folder=folder, justification="approved as is"
+    )
+    resp = _update(
+        authenticated_client,
+        [acceptance.id],
+        {"justification": "rewritten"},
+        url="/api/risk-acceptances/batch-action/",
+    )
+    assert resp.status_code == 200, resp.content
+    assert [f["id"] for f in resp.json()["failed"]] == [str(acceptance.id)]
+    acceptance.refresh_from_db()
+    assert acceptance.justification == "approved as is"
+
+
+@pytest.mark.django_db
+def test_batch_update_keeps_the_last_admin(authenticated_client):
+    admin = User.objects.get(email="admin@tests.com")
+    admin_group = UserGroup.objects.get(name="BI-UG-ADM")
+    resp = _update(
+        authenticated_client,
+        [admin.id],
+        {"user_groups": []},
+        url="/api/users/batch-action/",
+    )
+    assert resp.status_code == 200, resp.content
+    (failure,) = resp.json()["failed"]
+    assert failure["error"] == {"error": "attemptToRemoveOnlyAdminUserGroup"}
+    assert admin_group.user_set.filter(id=admin.id).exists()
@@ -1,12 +1,16 @@
 import uuid
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 from core.models import (
+    Answer,
     ComplianceAssessment,
     Framework,
     Perimeter,
+    Question,
     RequirementAssessment,
     RequirementNode,
 )
@@ -423,3 +427,183 @@ class TestComplianceAssessmentListProgress:
         audit.create_requirement_assessments()
 
         assert _list_progress(authenticated_client, audit.id) == 0
+
+
+@pytest.mark.django_db
+class TestComplianceAssessmentTreeETag:
+    """`/api/compliance-assessments/<id>/tree/` sends an ETag and answers
+    304 to a matching If-None-Match until the audit or its framework
+    changes."""
+
+    @staticmethod
+    def _tree(client: APIClient, audit_id, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return client.get(f"/api/compliance-assessments/{audit_id}/tree/", **headers)
+
+    def test_unchanged_tree_is_not_modified(self, authenticated_client):
+        framework = _make_framework()
+        for i in range(3):
+            _make_requirement(framework, f"E{i}")
+        audit = _make_audit(Folder.get_root_folder(), framework)
+        audit.create_requirement_assessments()
+
+        first = self._tree(authenticated_client, audit.id)
+        assert first.status_code == status.HTTP_200_OK
+        etag = first["ETag"]
+
+        second = self._tree(authenticated_client, audit.id, etag)
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second["ETag"] == etag
+
+    def test_assessment_change_refreshes_tree(self, authenticated_client):
+        framework = _make_framework()
+        _make_requirement(framework, "C0")
+        audit = _make_audit(Folder.get_root_folder(), framework)
+        audit.create_requirement_assessments()
+        etag = self._tree(authenticated_client, audit.id)["ETag"]
+
+        ra = audit.requirement_assessments.get()
+        ra.result = RequirementAssessment.Result.COMPLIANT
+        ra.save(update_fields=["result", "updated_at"])
+
+        response = self._tree(authenticated_client, audit.id, etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.json()[str(ra.requirement_id)]["result"] == "compliant"
+
+    def test_answer_change_refreshes_tree(self, authenticated_client):
+        framework = _make_framework()
+        requirement = _make_requirement(framework, "Q0")
+        question = Question.objects.create(
+            requirement_node=requirement,
+            urn=f"{requirement.urn}:q1",
+            ref_id="Q1",
+            text="Why?",
+            type=Question.Type.TEXT,
+            order=0,
+        )
+        audit = _make_audit(Folder.get_root_folder(), framework)
+        audit.create_requirement_assessments()
+        ra = audit.requirement_assessments.get()
+        etag = self._tree(authenticated_client, audit.id)["ETag"]
+
+        answer = Answer.objects.create(
+            requirement_assessment=ra, question=question, folder=ra.folder
+        )
+        created = self._tree(authenticated_client, audit.id, etag)
+        assert created.status_code == status.HTTP_200_OK
+        etag = created["ETag"]
+
+        answer.value = "Because"
+        answer.save(update_fields=["value", "updated_at"])
+        response = self._tree(authenticated_client, audit.id, etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.json()[str(requirement.id)]["answers"] == {
+            question.urn: "Because"
+        }
+
+    def test_framework_change_refreshes_tree(self, authenticated_client):
+        framework = _make_framework()
+        requirement = _make_requirement(framework, "F0")
+        audit = _make_audit(Folder.get_root_folder(), framework)
+        audit.create_requirement_assessments()
+        etag = self._tree(authenticated_client, audit.id)["ETag"]
+
+        requirement.name = "renamed requirement"
+        requirement.save()
+
+        response = self._tree(authenticated_client, audit.id, etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[str(requirement.id)]["name"] == "renamed requirement"
+
+
+@pytest.mark.django_db
+class TestComplianceAssessmentTreeChildren:
+    """`/api/compliance-assessments/<id>/tree/children/` returns one page of
+    a node's children with counts over their collapsed subtrees."""
+
+    @staticmethod
+    def _children(client: APIClient, audit_id, **params):
+        return client.get(
+            f"/api/compliance-assessments/{audit_id}/tree/children/", params
+        )
+
+    @staticmethod
+    def _setup():
+        framework = _make_framework()
+        sections = [
+            _make_requirement(framework, f"S{i}", assessable=False, order_id=i)
+            for i in range(3)
+        ]
+        leaves = [
+            _make_requirement(
+                framework, f"S0.{i}", parent_urn=sections[0].urn, order_id=i
+            )
+            for i in range(4)
+        ]
+        audit = _make_audit(Folder.get_root_folder(), framework)
+        audit.create_requirement_assessments()
+        ra = audit.requirement_assessments.get(requirement=leaves[0])
+        ra.result = RequirementAssessment.Result.COMPLIANT
+        ra.save(update_fields=["result"])
+        return audit, sections, leaves
+
+    def test_top_level_pages(self, authenticated_client):
+        audit, sections, _ = self._setup()
+
+        first = self._children(authenticated_client, audit.id, limit=2)
+        assert first.status_code == status.HTTP_200_OK, first.content
+        body = first.json()
+        assert [n["id"] for n in body["results"]] == [str(s.id) for s in sections[:2]]
+        assert "children" not in body["results"][0]
+        assert body["results"][0]["children_count"] == 4
+        assert body["results"][0]["requirements_count"] == 4
+        assert body["results"][0]["assessed_count"] == 1
+        assert body["results"][0]["result_counts"] == {
+            "compliant": 1,
+            "not_assessed": 3,
+        }
+        assert body["results"][1]["children_count"] == 0
+
+        second = self._children(
+            authenticated_client, audit.id, limit=2, cursor=body["next"]
+        ).json()
+        assert [n["id"] for n in second["results"]] == [str(sections[2].id)]
+        assert second["next"] is None
+
+    def test_children_of_a_node(self, authenticated_client):
+        audit, sections, leaves = self._setup()
+
+        body = self._children(
+            authenticated_client, audit.id, node=str(sections[0].id)
+        ).json()
+        assert body["parent"] == str(sections[0].id)
+        assert [n["id"] for n in body["results"]] == [str(r.id) for r in leaves]
+        assert body["results"][0]["result"] == "compliant"
+
+    def test_queries_do_not_grow_with_the_tree(self, authenticated_client):
+        audit, sections, _ = self._setup()
+        self._children(authenticated_client, audit.id, node=str(sections[0].id))
+        with CaptureQueriesContext(connection) as before:
+            self._children(authenticated_client, audit.id, node=str(sections[0].id))
+
+        # Neither the siblings of the node nor their subtrees are loaded
+        for i in range(20):
+            _make_requirement(
+                audit.framework, f"S1.{i}", parent_urn=sections[1].urn, order_id=i
+            )
+        with CaptureQueriesContext(connection) as after:
+            response = self._children(
+                authenticated_client, audit.id, node=str(sections[0].id)
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(after) == len(before)
+
+    def test_unknown_node_and_bad_limit(self, authenticated_client):
+        audit, _, _ = self._setup()
+
+        missing = self._children(authenticated_client, audit.id, node=str(uuid.uuid4()))
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        bad = self._children(authenticated_client, audit.id, limit=0)
+        assert bad.status_code == status.HTTP_400_BAD_REQUEST
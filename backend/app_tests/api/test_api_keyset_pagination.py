@@ -0,0 +1,98 @@
+"""Tests for the opt-in keyset pagination (?cursor=) of BaseModelViewSet list
+endpoints: every object is returned once, and the total is only computed
+when asked for."""
+
+import pytest
+
+from core.models import AppliedControl
+from core.pagination import KeysetPagination
+from iam.models import Folder
+
+LIST_URL = "/api/applied-controls/"
+
+
+@pytest.fixture
+def controls(db):
+    folder = Folder.objects.create(name="keyset-folder")
+    return [
+        AppliedControl.objects.create(name=f"control-{i}", folder=folder)
+        for i in range(7)
+    ]
+
+
+def _walk(client, url):
+    ids = []
+    pages = []
+    while url:
+        resp = client.get(url)
+        assert resp.status_code == 200, resp.content
+        data = resp.json()
+        pages.append(data)
+        ids += [item["id"] for item in data["results"]]
+        url = data["next"]
+    return ids, pages
+
+
+def _creation_order():
+    return [
+        str(pk)
+        for pk in AppliedControl.objects.order_by("created_at", "id").values_list(
+            "id", flat=True
+        )
+    ]
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_returns_every_object_once(authenticated_client, controls):
+    ids, pages = _walk(authenticated_client, f"{LIST_URL}?cursor=&limit=3")
+    expected = authenticated_client.get(LIST_URL).json()["count"]
+
+    assert len(pages) > 1
+    assert len(ids) == len(set(ids)) == expected
+    assert {str(c.id) for c in controls} <= set(ids)
+    assert ids == _creation_order()
+    assert all("count" not in page for page in pages)
+    assert all(page["next"] is None or page["next"].startswith("/") for page in pages)
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_ignores_client_ordering(authenticated_client, controls):
+    ids, _ = _walk(authenticated_client, f"{LIST_URL}?cursor=&limit=3&ordering=-name")
+    assert ids == _creation_order()
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_caps_page_size(authenticated_client, controls, monkeypatch):
+    monkeypatch.setattr(KeysetPagination, "max_page_size", 2)
+    resp = authenticated_client.get(f"{LIST_URL}?cursor=&limit=1000000")
+    assert resp.status_code == 200, resp.content
+    assert len(resp.json()["results"]) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("mode", ["exact", "estimate"])
+def test_keyset_pagination_count_on_demand(authenticated_client, controls, mode):
+    expected = authenticated_client.get(LIST_URL).json()["count"]
+    resp = authenticated_client.get(f"{LIST_URL}?cursor=&limit=3&count={mode}")
+    assert resp.status_code == 200, resp.content
+    data = resp.json()
+    assert len(data["results"]) == 3
+    if mode == "exact":
+        assert data["count"] == expected
+    else:
+        assert data["count"] >= 0
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_rejects_invalid_cursor(authenticated_client, controls):
+    resp = authenticated_client.get(f"{LIST_URL}?cursor=not-a-cursor")
+    assert resp.status_code == 404
+
+
+@pytest.mark.django_db
+def test_limit_offset_pagination_unchanged(authenticated_client, controls):
+    data = authenticated_client.get(f"{LIST_URL}?limit=3&offset=3").json()
+    assert data["count"] >= len(controls)
+    assert len(data["results"]) == 3
+    assert data["next"].startswith("/")
+    assert data["previous"].startswith("/")
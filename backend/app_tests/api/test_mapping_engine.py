@@ -5,8 +5,10 @@ These tests exercise map_audit_results, best_mapping_inferences, and
 _most_restrictive_result using plain dicts — no database required.
 """
 
+import random
+
 import pytest
-from collections import defaultdict
+from collections import defaultdict, deque
 from unittest.mock import patch, MagicMock
 
 # Patch DB access before importing the module (module-level `engine = MappingEngine()`)
@@ -583,3 +585,138 @@ class TestBestMappingInferences:
         assert best_path == ["urn:fw:A", "urn:fw:C", "urn:fw:D"]
         assert "urn:req:D1" in inferences["requirement_assessments"]
         assert "urn:req:D2" in inferences["requirement_assessments"]
+
+
+# ---------------------------------------------------------------------------
+# Mapping graph closure and batched multi-hop inference
+# ---------------------------------------------------------------------------
+
+
+def _legacy_all_paths_between(engine, source_urn, dest_urn, max_depth=None):
+    """Per-call BFS over every simple path, as used before the closure."""
+    if (source_urn, dest_urn) in engine.direct_mappings:
+        return [[source_urn, dest_urn]]
+    queue = deque([([source_urn], {source_urn})])
+    shortest_paths = []
+    shortest_length = None
+    while queue:
+        path, visited = queue.popleft()
+        current = path[-1]
+        if current == dest_urn:
+            if shortest_length is None:
+                shortest_length = len(path)
+            if len(path) == shortest_length:
+                shortest_paths.append(path)
+            continue
+        if max_depth and len(path) >= max_depth:
+            continue
+        for neighbor in engine.framework_mappings.get(current, []):
+            if neighbor not in visited:
+                queue.append((path + [neighbor], visited | {neighbor}))
+    return shortest_paths
+
+
+def _legacy_best_mapping_inferences(engine, source_audit, source_urn, dest_urn, depth):
+    """One independent chain of hops per candidate path."""
+    inferences, best_path = {}, []
+    for path in _legacy_all_paths_between(engine, source_urn, dest_urn, depth):
+        tmp_inferences = source_audit.copy()
+        for hop_index, (src, dst) in enumerate(zip(path, path[1:]), start=1):
+            tmp_inferences = engine.map_audit_results(
+                tmp_inferences, engine.get_rms((src, dst)), hop_index, path
+            )
+        if len(tmp_inferences) > len(inferences):
+            inferences, best_path = tmp_inferences, path
+    return inferences, best_path
+
+
+def _random_mapping_engine(seed, frameworks=9, requirements=6, edges=22):
+    rng = random.Random(seed)
+    urns = [f"urn:fw:{i}" for i in range(frameworks)]
+    engine = _make_engine(
+        frameworks={urn: {"min_score": 0, "max_score": 100} for urn in urns}
+    )
+    pairs = [(a, b) for a in urns for b in urns if a != b]
+    for src, dst in rng.sample(pairs, edges):
+        mappings = [
+            {
+                "source_requirement_urn": f"{src}:r{rng.randrange(requirements)}",
+                "target_requirement_urn": f"{dst}:r{rng.randrange(requirements)}",
+                "relationship": rng.choice(
+                    ["equal", "superset", "subset", "intersect", "not_related"]
+                ),
+            }
+            for _ in range(requirements)
+        ]
+        rms = _rms(src, dst, mappings, urn=f"urn:rms:{src}-{dst}")
+        engine.all_rms[(src, dst)] = engine._compress_rms(rms)
+        engine.framework_mappings[src].append(dst)
+        engine.direct_mappings.add((src, dst))
+    source = _source_audit(
+        {
+            f"urn:fw:0:r{i}": {
+                "result": rng.choice(
+                    ["compliant", "partially_compliant", "non_compliant"]
+                ),
+                "status": "done",
+                "score": rng.choice([None, 50, 100]),
+                "is_scored": True,
+                "applied_controls": [f"ctrl-{i}"],
+                "name": f"RA {i}",
+                "id": f"ra-{i}",
+                "source_framework": {"id": "fw-0", "name": "Framework 0"},
+            }
+            for i in range(requirements)
+        }
+    )
+    return engine, urns, source
+
+
+class TestMappingClosure:
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("max_depth", [None, 2, 3])
+    def test_shortest_paths_match_bfs(self, seed, max_depth):
+        engine, urns, _ = _random_mapping_engine(seed)
+        for src in urns:
+            for dst in urns:
+                assert engine.all_paths_between(
+                    src, dst, max_depth
+                ) == _legacy_all_paths_between(engine, src, dst, max_depth)
+
+    def test_reachable_respects_max_depth(self):
+        engine = _make_engine()
+        for src, dst in [("A", "B"), ("B", "C"), ("C", "D")]:
+            engine.framework_mappings[src].append(dst)
+        assert engine.closure.reachable("A") == ["A", "B", "C", "D"]
+        assert engine.closure.reachable("A", max_depth=3) == ["A", "B", "C"]
+        assert engine.closure.reachable("D") == ["D"]
+
+    def test_closure_is_reset_on_reload(self):
+        engine = _make_engine()
+        engine.framework_mappings["A"].append("B")
+        assert engine.closure.reachable("A") == ["A", "B"]
+
+        engine.framework_mappings = defaultdict(list, {"A": ["C"]})
+        assert engine.closure.reachable("A") == ["A", "C"]
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("max_depth", [None, 3])
+    def test_batched_inference_matches_per_target(self, seed, max_depth):
+        engine, urns, source = _random_mapping_engine(seed)
+        expected = {
+            dst: _legacy_best_mapping_inferences(
+                engine, source, urns[0], dst, max_depth
+            )
+            for dst in urns
+        }
+
+        batched = engine.best_mapping_inferences_many(
+            source, urns[0], urns, max_depth=max_depth
+        )
+
+        assert batched == expected
+        for dst in urns:
+            assert (
+                engine.best_mapping_inferences(source, urns[0], dst, max_depth)
+                == expected[dst]
+            )
@@ -0,0 +1,252 @@
+"""
+Content-hash embedding cache and change detection for RAG indexing.
+
+Two tables back this module:
+
+- ``EmbeddingCacheEntry`` maps (embedder, sha256(text)) to a vector, so the
+  embedding model is only called for text it has never seen. Unchanged
+  objects, reverted edits and duplicated library entries reuse stored
+  vectors.
+- ``IndexedPointState`` remembers the fingerprint (embedder + text +
+  payload) of the last version of each Qdrant point we upserted, so a
+  save that does not change the indexed text or payload skips both the
+  embedding and the upsert.
+
+Vectors are tied to the embedder that produced them: switching embedding
+backend or model changes ``embedder_key`` and therefore misses the cache,
+and ``init_qdrant`` resets the point states whenever it creates the
+collection. Indexing runs also reset them when they find the collection
+empty (fresh or wiped Qdrant storage).
+"""
+
+import hashlib
+import json
+import uuid
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def text_sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def embedder_key(embedder) -> str:
+    """Stable identifier of an embedder: backend class plus model name."""
+    model_name = getattr(embedder, "model_name", None) or getattr(
+        embedder, "model", None
+    )
+    if not isinstance(model_name, str):
+        model_name = ""
+    return f"{type(embedder).__name__}:{model_name}"
+
+
+def point_fingerprint(embedder, payload: dict) -> str:
+    """Fingerprint of what a point would contain if upserted now."""
+    return payload_fingerprint(embedder_key(embedder), payload)
+
+
+def payload_fingerprint(key: str, payload: dict) -> str:
+    """`point_fingerprint` from an embedder key (usable in worker processes)."""
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(f"{key}\n{blob}".encode()).hexdigest()
+
+
+def model_point_id(app_label: str, model_name: str, object_id) -> str:
+    """Deterministic Qdrant point id of an indexed model object."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{app_label}.{model_name}:{object_id}"))
+
+
+def model_point_payload(model_name: str, obj, text: str, folder_id: str) -> dict:
+    from .text import _normalize_model_name
+
+    return {
+        "text": text,
+        "folder_id": str(folder_id),
+        "source_type": "model",
+        "object_type": _normalize_model_name(model_name),
+        "object_id": str(obj.id),
+        "name": str(obj),
+        "ref_id": getattr(obj, "ref_id", "") or "",
+    }
+
+
+def embed_texts(embedder, texts: list[str]) -> list[list[float]]:
+    """
+    Embed `texts`, reusing cached vectors. Misses are embedded in a single
+    ``embedder.embed`` call (deduplicated) and written back to the cache.
+    """
+    from .models import EmbeddingCacheEntry
+
+    if not texts:
+        return []
+    key = embedder_key(embedder)
+    hashes = [text_sha(text) for text in texts]
+    vectors = dict(
+        EmbeddingCacheEntry.objects.filter(
+            embedder=key, text_hash__in=set(hashes)
+        ).values_list("text_hash", "vector")
+    )
+
+    missing = {}
+    for text_hash, text in zip(hashes, texts):
+        if text_hash not in vectors:
+            missing.setdefault(text_hash, text)
+    if missing:
+        embedded = embedder.embed(list(missing.values()))
+        fresh = dict(zip(missing.keys(), embedded))
+        vectors.update(fresh)
+        EmbeddingCacheEntry.objects.bulk_create(
+            [
+                EmbeddingCacheEntry(embedder=key, text_hash=h, vector=v)
+                for h, v in fresh.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+    logger.debug(
+        "embedding_cache_lookup",
+        embedder=key,
+        requested=len(texts),
+        embedded=len(missing),
+    )
+    return [vectors[text_hash] for text_hash in hashes]
+
+
+def unchanged_point_ids(fingerprints: dict) -> set:
+    """Subset of {point_id: fingerprint} whose stored fingerprint matches."""
+    from .models import IndexedPointState
+
+    if not fingerprints:
+        return set()
+    stored = IndexedPointState.objects.filter(
+        point_id__in=list(fingerprints)
+    ).values_list("point_id", "fingerprint")
+    return {
+        str(point_id)
+        for point_id, fingerprint in stored
+        if fingerprints.get(str(point_id)) == fingerprint
+    }
+
+
+def record_points(states: list[tuple[str, str, str]]):
+    """Persist (point_id, fingerprint, text_hash) after a successful upsert."""
+    from .models import IndexedPointState
+
+    if not states:
+        return
+    IndexedPointState.objects.bulk_create(
+        [
+            IndexedPointState(point_id=point_id, fingerprint=fp, text_hash=text_hash)
+            for point_id, fp, text_hash in states
+        ],
+        update_conflicts=True,
+        unique_fields=["point_id"],
+        update_fields=["fingerprint", "text_hash", "updated_at"],
+    )
+
+
+def forget_points(point_ids):
+    """Drop the state of deleted points so a re-created object is re-indexed."""
+    from .models import IndexedPointState
+
+    point_ids = [str(point_id) for point_id in point_ids]
+    if point_ids:
+        IndexedPointState.objects.filter(point_id__in=point_ids).delete()
+
+
+def reset_point_states() -> int:
+    """Forget every point state and library manifest (the collection was dropped)."""
+    from .models import IndexedLibrary, IndexedPointState
+
+    IndexedLibrary.objects.all().delete()
+    deleted, _ = IndexedPointState.objects.all().delete()
+    return deleted
+
+
+def reset_point_states_if_empty(client) -> int:
+    """
+    Reset the point states when the collection holds no point, so an indexing
+    run against fresh Qdrant storage does not skip everything as unchanged.
+    """
+    from .models import IndexedLibrary, IndexedPointState
+    from .rag import COLLECTION_NAME
+
+    points, _ = client.scroll(
+        collection_name=COLLECTION_NAME,
+        limit=1,
+        with_payload=False,
+        with_vectors=False,
+    )
+    if points or not (
+        IndexedPointState.objects.exists() or IndexedLibrary.objects.exists()
+    ):
+        return 0
+    deleted = reset_point_states()
+    logger.warning("point_states_reset_for_empty_collection", deleted=deleted)
+    return deleted
+
+
+def prune_unreferenced_embeddings(embedder=None) -> int:
+    """
+    Delete cached vectors no indexed point references anymore. With an
+    embedder, also drop vectors produced by any other embedder.
+    """
+    from .models import EmbeddingCacheEntry, IndexedPointState
+
+    stale = EmbeddingCacheEntry.objects.exclude(
+        text_hash__in=IndexedPointState.objects.values("text_hash")
+    )
+    deleted, _ = stale.delete()
+    if embedder is not None:
+        others, _ = EmbeddingCacheEntry.objects.exclude(
+            embedder=embedder_key(embedder)
+        ).delete()
+        deleted += others
+    return deleted
+
+
+def upsert_model_points(client, embedder, rows, *, force: bool = False) -> tuple:
+    """
+    Embed and upsert model points in one Qdrant call, skipping points whose
+    fingerprint has not changed since the last upsert (unless `force`).
+
+    `rows` is a list of (app_label, model_name, obj, text, folder_id).
+    Returns (upserted, unchanged).
+    """
+    from qdrant_client.models import PointStruct
+
+    from .rag import COLLECTION_NAME
+
+    candidates = {}
+    for app_label, model_name, obj, text, folder_id in rows:
+        payload = model_point_payload(model_name, obj, text, folder_id)
+        point_id = model_point_id(app_label, model_name, obj.id)
+        candidates[point_id] = (payload, point_fingerprint(embedder, payload))
+
+    unchanged = (
+        set()
+        if force
+        else unchanged_point_ids({pid: fp for pid, (_, fp) in candidates.items()})
+    )
+    pending = [
+        (point_id, payload, fp)
+        for point_id, (payload, fp) in candidates.items()
+        if point_id not in unchanged
+    ]
+    if not pending:
+        return 0, len(unchanged)
+
+    vectors = embed_texts(embedder, [payload["text"] for _, payload, _ in pending])
+    client.upsert(
+        collection_name=COLLECTION_NAME,
+        points=[
+            PointStruct(id=point_id, vector=vector, payload=payload)
+            for (point_id, payload, _), vector in zip(pending, vectors)
+        ],
+    )
+    record_points(
+        [(pid, fp, text_sha(payload["text"])) for pid, payload, fp in pending]
+    )
+    return len(pending), len(unchanged)
@@ -0,0 +1,465 @@
+"""
+Compact, memory-mappable on-disk layout for the knowledge graph.
+
+The store is a single file that every worker process maps read-only, so the
+~60k-node library graph lives once in the page cache instead of once per
+unpickled copy. Layout (native byte order, 8-byte aligned sections):
+
+- a JSON header (format version, counts, section offsets, source digest);
+- node URNs as one UTF-8 blob plus an offsets array; a node's integer id is
+  its insertion index, and ``node_order`` lists ids sorted by URN for binary
+  search lookups;
+- an interned record table: every distinct node or edge attribute dict is
+  stored once as JSON (e.g. ``{"edge_type": "has_requirement"}`` is shared
+  by thousands of edges) and referenced by index;
+- out- and in-adjacency in CSR form (offsets, neighbour ids, record ids),
+  keeping the per-node insertion order of edges;
+- secondary indexes (see ``GraphIndex``): a token inverted index over the
+  searchable text fields, node ids per node type, requirement node ids per
+  framework, and edge counts per edge type.
+
+``CompactGraph`` exposes the read API of ``knowledge_graph.DiGraph`` plus
+its ``GraphIndex`` as ``.index``.
+Stdlib only (mmap + memoryview casts); no external dependency needed.
+"""
+
+import json
+import mmap
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+MAGIC = b"CAKG"
+FORMAT_VERSION = 2
+_ALIGN = 8
+
+# Node attributes covered by the token index.
+INDEXED_FIELDS = ("name", "ref_id", "description", "provider")
+# Query tokens shorter than this only match whole index tokens, not prefixes.
+MIN_PREFIX_LENGTH = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _json(attrs: dict) -> bytes:
+    return json.dumps(attrs, sort_keys=True, ensure_ascii=False, default=str).encode(
+        "utf-8"
+    )
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class _StringTable(Sequence):
+    """Sequence view of UTF-8 strings stored as one blob plus offsets."""
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx: int) -> str:
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+
+class GraphIndex:
+    """
+    Secondary indexes over integer node ids (a node's id is its position in
+    ``graph.nodes()``): token -> posting list, node type -> ids, framework
+    URN -> requirement node ids, plus per-edge-type counts.
+    """
+
+    def __init__(
+        self,
+        urn_of: Callable[[int], str],
+        attrs_of: Callable[[int], dict],
+        tokens: Sequence[str],
+        posting_offsets: Sequence[int],
+        postings: Sequence[int],
+        type_ranges: dict,
+        type_nodes: Sequence[int],
+        framework_ranges: dict,
+        framework_nodes: Sequence[int],
+        edge_type_counts: dict,
+    ):
+        self.urn_of = urn_of
+        self.attrs_of = attrs_of
+        self.tokens = tokens
+        self.posting_offsets = posting_offsets
+        self.postings = postings
+        self.type_ranges = type_ranges
+        self.type_nodes = type_nodes
+        self.framework_ranges = framework_ranges
+        self.framework_nodes = framework_nodes
+        self.edge_type_counts = edge_type_counts
+
+    @classmethod
+    def build(cls, graph) -> "GraphIndex":
+        urns = []
+        attrs_list = []
+        token_postings = defaultdict(list)
+        by_type = defaultdict(list)
+        by_framework = defaultdict(list)
+        for idx, (urn, attrs) in enumerate(graph.nodes(data=True)):
+            urns.append(urn)
+            attrs_list.append(attrs)
+            node_type = attrs.get("node_type", "unknown")
+            by_type[node_type].append(idx)
+            if node_type == "requirement_node" and attrs.get("framework_urn"):
+                by_framework[attrs["framework_urn"]].append(idx)
+            text = " ".join(str(attrs.get(field) or "") for field in INDEXED_FIELDS)
+            for token in set(tokenize(text)):
+                token_postings[token].append(idx)
+
+        tokens = sorted(token_postings)
+        posting_offsets, postings = array("i", [0]), array("i")
+        for token in tokens:
+            postings.extend(token_postings[token])
+            posting_offsets.append(len(postings))
+
+        def flatten(groups):
+            ranges, flat = {}, array("i")
+            for key, ids in groups.items():
+                ranges[key] = [len(flat), len(flat) + len(ids)]
+                flat.extend(ids)
+            return ranges, flat
+
+        type_ranges, type_nodes = flatten(by_type)
+        framework_ranges, framework_nodes = flatten(by_framework)
+
+        edge_type_counts = defaultdict(int)
+        for _, _, edge_attrs in graph.edges(data=True):
+            edge_type_counts[edge_attrs.get("edge_type", "unknown")] += 1
+
+        return cls(
+            urn_of=urns.__getitem__,
+            attrs_of=attrs_list.__getitem__,
+            tokens=tokens,
+            posting_offsets=posting_offsets,
+            postings=postings,
+            type_ranges=type_ranges,
+            type_nodes=type_nodes,
+            framework_ranges=framework_ranges,
+            framework_nodes=framework_nodes,
+            edge_type_counts=dict(edge_type_counts),
+        )
+
+    def _posting(self, token_idx: int) -> Sequence[int]:
+        return self.postings[
+            self.posting_offsets[token_idx] : self.posting_offsets[token_idx + 1]
+        ]
+
+    def token_matches(self, token: str) -> set[int]:
+        """Ids of nodes with an index token equal to, or prefixed by, `token`."""
+        lo = bisect_left(self.tokens, token)
+        if len(token) < MIN_PREFIX_LENGTH:
+            if lo < len(self.tokens) and self.tokens[lo] == token:
+                return set(self._posting(lo))
+            return set()
+        hi = bisect_left(self.tokens, token + "\U0010ffff", lo)
+        if hi - lo == 1:
+            return set(self._posting(lo))
+        return set(self.postings[self.posting_offsets[lo] : self.posting_offsets[hi]])
+
+    def candidates(self, query: str) -> set[int] | None:
+        """
+        Ids of nodes matching every query token (prefix match); None when
+        the query has no token and therefore does not restrict anything.
+        """
+        matched = None
+        for token in sorted(set(tokenize(query)), key=len, reverse=True):
+            ids = self.token_matches(token)
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                return set()
+        return matched
+
+    def nodes_of_type(self, node_type: str) -> Sequence[int]:
+        start, end = self.type_ranges.get(node_type, (0, 0))
+        return self.type_nodes[start:end]
+
+    def requirements_of(self, framework_urn: str) -> Sequence[int]:
+        start, end = self.framework_ranges.get(framework_urn, (0, 0))
+        return self.framework_nodes[start:end]
+
+    def node_type_counts(self) -> dict[str, int]:
+        return {key: end - start for key, (start, end) in self.type_ranges.items()}
+
+
+def write_compact_graph(graph, path: Path, source_digest: str = "") -> None:
+    """Serialize a DiGraph-like graph to `path` (atomically replaced)."""
+    urns = list(graph.nodes())
+    node_index = {urn: idx for idx, urn in enumerate(urns)}
+
+    record_index: dict[bytes, int] = {}
+    record_blob = bytearray()
+    record_offsets = array("q", [0])
+
+    def intern(attrs: dict) -> int:
+        encoded = _json(attrs)
+        idx = record_index.get(encoded)
+        if idx is None:
+            idx = record_index[encoded] = len(record_offsets) - 1
+            record_blob.extend(encoded)
+            record_offsets.append(len(record_blob))
+        return idx
+
+    id_blob = bytearray()
+    id_offsets = array("q", [0])
+    node_records = array("i")
+    for urn, attrs in graph.nodes(data=True):
+        id_blob.extend(urn.encode("utf-8"))
+        id_offsets.append(len(id_blob))
+        node_records.append(intern(attrs))
+    node_order = array(
+        "i", sorted(range(len(urns)), key=lambda idx: urns[idx].encode("utf-8"))
+    )
+
+    def csr(edges_of):
+        offsets, neighbours, records = array("i", [0]), array("i"), array("i")
+        for urn in urns:
+            for neighbour, attrs in edges_of(urn):
+                neighbours.append(node_index[neighbour])
+                records.append(intern(attrs))
+            offsets.append(len(neighbours))
+        return offsets, neighbours, records
+
+    out_offsets, out_targets, out_records = csr(
+        lambda urn: ((dst, d) for _, dst, d in graph.out_edges(urn, data=True))
+    )
+    in_offsets, in_sources, in_records = csr(
+        lambda urn: ((src, d) for src, _, d in graph.in_edges(urn, data=True))
+    )
+
+    index = GraphIndex.build(graph)
+    token_blob = bytearray()
+    token_offsets = array("q", [0])
+    for token in index.tokens:
+        token_blob.extend(token.encode("utf-8"))
+        token_offsets.append(len(token_blob))
+
+    sections = {
+        "id_blob": ("B", bytes(id_blob)),
+        "id_offsets": ("q", id_offsets.tobytes()),
+        "node_order": ("i", node_order.tobytes()),
+        "node_records": ("i", node_records.tobytes()),
+        "record_blob": ("B", bytes(record_blob)),
+        "record_offsets": ("q", record_offsets.tobytes()),
+        "out_offsets": ("i", out_offsets.tobytes()),
+        "out_targets": ("i", out_targets.tobytes()),
+        "out_records": ("i", out_records.tobytes()),
+        "in_offsets": ("i", in_offsets.tobytes()),
+        "in_sources": ("i", in_sources.tobytes()),
+        "in_records": ("i", in_records.tobytes()),
+        "token_blob": ("B", bytes(token_blob)),
+        "token_offsets": ("q", token_offsets.tobytes()),
+        "posting_offsets": ("i", index.posting_offsets.tobytes()),
+        "postings": ("i", index.postings.tobytes()),
+        "type_nodes": ("i", index.type_nodes.tobytes()),
+        "framework_nodes": ("i", index.framework_nodes.tobytes()),
+    }
+
+    # Section offsets are relative to the end of the (padded) header.
+    layout = {}
+    cursor = 0
+    for name, (typecode, data) in sections.items():
+        layout[name] = [cursor, len(data), typecode]
+        cursor += len(data) + (-len(data) % _ALIGN)
+
+    header = _json(
+        {
+            "version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "itemsizes": {"i": array("i").itemsize, "q": array("q").itemsize},
+            "source_digest": source_digest,
+            "node_count": len(urns),
+            "edge_count": len(out_targets),
+            "record_count": len(record_offsets) - 1,
+            "type_ranges": index.type_ranges,
+            "framework_ranges": index.framework_ranges,
+            "edge_type_counts": index.edge_type_counts,
+            "sections": layout,
+        }
+    )
+    prefix_len = len(MAGIC) + 4 + len(header)
+    padding = -prefix_len % _ALIGN
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(4, "little"))
+        f.write(header)
+        f.write(b"\0" * padding)
+        for _, data in sections.values():
+            f.write(data)
+            f.write(b"\0" * (-len(data) % _ALIGN))
+    # Readers that mapped the previous file keep their (unlinked) inode.
+    os.replace(tmp_path, path)
+
+
+class CompactGraph:
+    """Read-only graph backed by a memory-mapped store file."""
+
+    def __init__(self, path: Path, record_cache_size: int = 16384):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        if bytes(view[:4]) != MAGIC:
+            raise ValueError(f"{self.path} is not a knowledge graph store")
+        header_len = int.from_bytes(view[4:8], "little")
+        header = json.loads(bytes(view[8 : 8 + header_len]))
+        if (
+            header.get("version") != FORMAT_VERSION
+            or header.get("byteorder") != sys.byteorder
+            or header.get("itemsizes")
+            != {"i": array("i").itemsize, "q": array("q").itemsize}
+        ):
+            raise ValueError(f"{self.path} has an incompatible store format")
+
+        base = 8 + header_len
+        base += -base % _ALIGN
+        self.header = header
+        self.source_digest = header.get("source_digest", "")
+        self._node_count = header["node_count"]
+        self._edge_count = header["edge_count"]
+
+        def section(name):
+            offset, length, typecode = header["sections"][name]
+            mv = view[base + offset : base + offset + length]
+            return mv if typecode == "B" else mv.cast(typecode)
+
+        self._id_blob = section("id_blob")
+        self._id_offsets = section("id_offsets")
+        self._node_order = section("node_order")
+        self._node_records = section("node_records")
+        self._record_blob = section("record_blob")
+        self._record_offsets = section("record_offsets")
+        self._out = (
+            section("out_offsets"),
+            section("out_targets"),
+            section("out_records"),
+        )
+        self._in = (
+            section("in_offsets"),
+            section("in_sources"),
+            section("in_records"),
+        )
+        self._record = lru_cache(maxsize=record_cache_size)(self._decode_record)
+        self._urn = lru_cache(maxsize=record_cache_size)(self._decode_urn)
+        self.index = GraphIndex(
+            urn_of=self.urn_of,
+            attrs_of=self.attrs_of,
+            tokens=_StringTable(section("token_blob"), section("token_offsets")),
+            posting_offsets=section("posting_offsets"),
+            postings=section("postings"),
+            type_ranges=header["type_ranges"],
+            type_nodes=section("type_nodes"),
+            framework_ranges=header["framework_ranges"],
+            framework_nodes=section("framework_nodes"),
+            edge_type_counts=header["edge_type_counts"],
+        )
+
+    # -- decoding ----------------------------------------------------------
+    def _decode_urn(self, idx: int) -> str:
+        start, end = self._id_offsets[idx], self._id_offsets[idx + 1]
+        return bytes(self._id_blob[start:end]).decode("utf-8")
+
+    def _urn_bytes(self, idx: int) -> bytes:
+        start, end = self._id_offsets[idx], self._id_offsets[idx + 1]
+        return bytes(self._id_blob[start:end])
+
+    def _decode_record(self, idx: int) -> dict[str, Any]:
+        start, end = self._record_offsets[idx], self._record_offsets[idx + 1]
+        return json.loads(bytes(self._record_blob[start:end]))
+
+    def index_of(self, node_id: str) -> int | None:
+        """Integer id of a node URN (binary search over the sorted order)."""
+        target = node_id.encode("utf-8")
+        lo, hi = 0, self._node_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._urn_bytes(self._node_order[mid])
+            if current < target:
+                lo = mid + 1
+            elif current > target:
+                hi = mid
+            else:
+                return self._node_order[mid]
+        return None
+
+    def urn_of(self, idx: int) -> str:
+        return self._urn(idx)
+
+    def record_of(self, record_idx: int) -> dict[str, Any]:
+        """
+        Attribute dict of a record. Decoded records are cached and shared,
+        so callers get a copy they are free to modify.
+        """
+        return dict(self._record(record_idx))
+
+    def attrs_of(self, idx: int) -> dict[str, Any]:
+        return self.record_of(self._node_records[idx])
+
+    def _edges(self, adjacency, node_id: str, data: bool, outgoing: bool):
+        idx = self.index_of(node_id)
+        if idx is None:
+            return
+        offsets, neighbours, records = adjacency
+        for pos in range(offsets[idx], offsets[idx + 1]):
+            other = self._urn(neighbours[pos])
+            pair = (node_id, other) if outgoing else (other, node_id)
+            yield (*pair, self.record_of(records[pos])) if data else pair
+
+    # -- DiGraph read API --------------------------------------------------
+    def nodes(self, data: bool = False) -> Iterator:
+        for idx in range(self._node_count):
+            if data:
+                yield self._urn(idx), self.attrs_of(idx)
+            else:
+                yield self._urn(idx)
+
+    def out_edges(self, node_id: str, data: bool = False) -> Iterator[tuple]:
+        return self._edges(self._out, node_id, data, outgoing=True)
+
+    def in_edges(self, node_id: str, data: bool = False) -> Iterator[tuple]:
+        return self._edges(self._in, node_id, data, outgoing=False)
+
+    def edges(self, data: bool = False) -> Iterator[tuple]:
+        offsets, targets, records = self._out
+        for idx in range(self._node_count):
+            src = self._urn(idx)
+            for pos in range(offsets[idx], offsets[idx + 1]):
+                dst = self._urn(targets[pos])
+                yield (src, dst, self.record_of(records[pos])) if data else (src, dst)
+
+    def number_of_nodes(self) -> int:
+        return self._node_count
+
+    def number_of_edges(self) -> int:
+        return self._edge_count
+
+    def __contains__(self, node_id: str) -> bool:
+        return self.index_of(node_id) is not None
+
+    def __getitem__(self, node_id: str) -> dict[str, Any]:
+        idx = self.index_of(node_id)
+        if idx is None:
+            raise KeyError(node_id)
+        return self.attrs_of(idx)
+
+    def get(self, node_id: str, default=None):
+        idx = self.index_of(node_id)
+        return default if idx is None else self.attrs_of(idx)
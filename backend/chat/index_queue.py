@@ -0,0 +1,286 @@
+"""
+Debounced, coalescing queue for incremental RAG indexing.
+
+Model saves and deletes no longer embed and upsert one object per Huey task.
+The signals record a ``PendingIndexOperation`` row per object instead —
+repeated saves of the same object coalesce into one row carrying the latest
+action — and ``flush`` drains the queue in batches:
+
+- an object is picked up once it has been quiet for ``DEBOUNCE_SECONDS``
+  (or has been waiting for ``MAX_DELAY_SECONDS`` during a long burst);
+- index operations are embedded with one ``embedder.embed`` call per batch
+  and written with one multi-point upsert (see ``upsert_model_points``);
+- remove operations are deleted with one filtered Qdrant delete per batch;
+- failed batches are re-queued up to ``MAX_ATTEMPTS`` times.
+
+Operations are claimed with a lease (``claimed_by`` / ``claimed_at``) and
+only deleted once their batch has been processed, so a worker killed
+mid-batch loses nothing: its operations become claimable again after
+``LEASE_SECONDS``. Re-enqueueing an object releases its lease, so a change
+made while the object is being indexed is picked up by the next flush.
+
+Each flush appends an ``index_queue_flush`` line to the chat metrics log with
+its throughput and the remaining backlog; ``queue_stats`` reports the
+backlog on demand (chat status endpoint, ``index_queue`` command).
+"""
+
+import time
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+import structlog
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from .metrics import record_metric
+
+logger = structlog.get_logger(__name__)
+
+DEBOUNCE_SECONDS = 5
+MAX_DELAY_SECONDS = 60
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 300
+
+_last_scheduled_at = 0.0
+
+
+def enqueue(app_label: str, model_name: str, object_id, action: str = "index"):
+    """Record (or coalesce) a pending operation for one object."""
+    from .models import PendingIndexOperation
+
+    now = timezone.now()
+    PendingIndexOperation.objects.bulk_create(
+        [
+            PendingIndexOperation(
+                app_label=app_label,
+                model_name=model_name,
+                object_id=str(object_id),
+                action=action,
+                first_enqueued_at=now,
+                last_enqueued_at=now,
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["app_label", "model_name", "object_id"],
+        update_fields=[
+            "action",
+            "last_enqueued_at",
+            "attempts",
+            "claimed_at",
+            "claimed_by",
+        ],
+    )
+
+
+def schedule_flush():
+    """Schedule a flush after the debounce window, at most once per window."""
+    global _last_scheduled_at
+    now = time.monotonic()
+    if now - _last_scheduled_at < DEBOUNCE_SECONDS:
+        return
+    _last_scheduled_at = now
+
+    from .tasks import flush_index_queue
+
+    flush_index_queue.schedule(delay=DEBOUNCE_SECONDS)
+
+
+def queue_stats() -> dict:
+    """Backlog size, split by action, and age of the oldest pending operation."""
+    from .models import PendingIndexOperation
+
+    summary = PendingIndexOperation.objects.aggregate(
+        backlog=Count("id"), oldest=Min("first_enqueued_at")
+    )
+    by_action = dict(
+        PendingIndexOperation.objects.values_list("action")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    oldest = summary["oldest"]
+    return {
+        "backlog": summary["backlog"],
+        "backlog_index": by_action.get(PendingIndexOperation.Action.INDEX, 0),
+        "backlog_remove": by_action.get(PendingIndexOperation.Action.REMOVE, 0),
+        "oldest_age_s": (
+            round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0
+        ),
+    }
+
+
+def _claim(limit: int, worker: str, *, ignore_debounce: bool = False) -> list:
+    """Lease up to `limit` ready operations to `worker`, oldest first."""
+    from .models import PendingIndexOperation
+
+    now = timezone.now()
+    queryset = PendingIndexOperation.objects.filter(
+        Q(claimed_at__isnull=True)
+        | Q(claimed_at__lte=now - timedelta(seconds=LEASE_SECONDS))
+    )
+    if not ignore_debounce:
+        queryset = queryset.filter(
+            Q(last_enqueued_at__lte=now - timedelta(seconds=DEBOUNCE_SECONDS))
+            | Q(first_enqueued_at__lte=now - timedelta(seconds=MAX_DELAY_SECONDS))
+        )
+    with transaction.atomic():
+        operations = list(
+            queryset.select_for_update(skip_locked=True).order_by("first_enqueued_at")[
+                :limit
+            ]
+        )
+        PendingIndexOperation.objects.filter(
+            pk__in=[op.pk for op in operations]
+        ).update(claimed_at=now, claimed_by=worker)
+    return operations
+
+
+def _leased(operations: list, worker: str):
+    """Operations still leased to `worker` (not re-enqueued or re-claimed since)."""
+    from .models import PendingIndexOperation
+
+    return PendingIndexOperation.objects.filter(
+        pk__in=[op.pk for op in operations], claimed_by=worker
+    )
+
+
+def _complete(operations: list, worker: str):
+    """Remove processed operations from the queue."""
+    _leased(operations, worker).delete()
+
+
+def _requeue(operations: list, worker: str):
+    """Release failed operations, dropping those out of attempts."""
+    leased = _leased(operations, worker)
+    for op in leased.filter(attempts__gte=MAX_ATTEMPTS - 1):
+        logger.error(
+            "index_queue_operation_dropped",
+            model=f"{op.app_label}.{op.model_name}",
+            object_id=op.object_id,
+            action=op.action,
+        )
+    leased.filter(attempts__gte=MAX_ATTEMPTS - 1).delete()
+    leased.update(attempts=F("attempts") + 1, claimed_at=None, claimed_by="")
+
+
+def _process(operations: list, client, embedder) -> dict:
+    from django.apps import apps
+    from qdrant_client.models import FieldCondition, Filter, MatchAny, MatchValue
+
+    from .embedding_cache import forget_points, model_point_id, upsert_model_points
+    from .models import PendingIndexOperation
+    from .rag import COLLECTION_NAME
+    from .tasks import _resolve_folder_id
+    from .text import _build_object_text
+
+    stats = {"indexed": 0, "unchanged": 0, "removed": 0, "skipped": 0}
+
+    to_index = defaultdict(set)
+    to_remove = []
+    for op in operations:
+        if op.action == PendingIndexOperation.Action.REMOVE:
+            to_remove.append((op.app_label, op.model_name, op.object_id))
+        else:
+            to_index[(op.app_label, op.model_name)].add(op.object_id)
+
+    rows = []
+    for (app_label, model_name), object_ids in to_index.items():
+        try:
+            model_class = apps.get_model(app_label, model_name)
+        except LookupError:
+            stats["skipped"] += len(object_ids)
+            continue
+        found = set()
+        for obj in model_class.objects.filter(id__in=object_ids):
+            found.add(str(obj.id))
+            text = _build_object_text(obj, model_name)
+            folder_id = _resolve_folder_id(obj)
+            if not text or not folder_id:
+                stats["skipped"] += 1
+                continue
+            rows.append((app_label, model_name, obj, text, folder_id))
+        # Deleted after being queued for indexing: drop it from the index too.
+        to_remove.extend(
+            (app_label, model_name, object_id) for object_id in object_ids - found
+        )
+
+    if rows:
+        upserted, unchanged = upsert_model_points(client, embedder, rows)
+        stats["indexed"] += upserted
+        stats["unchanged"] += unchanged
+
+    if to_remove:
+        client.delete(
+            collection_name=COLLECTION_NAME,
+            points_selector=Filter(
+                must=[
+                    FieldCondition(
+                        key="object_id",
+                        match=MatchAny(any=[oid for _, _, oid in to_remove]),
+                    ),
+                    FieldCondition(key="source_type", match=MatchValue(value="model")),
+                ]
+            ),
+        )
+        forget_points(
+            model_point_id(app_label, model_name, object_id)
+            for app_label, model_name, object_id in to_remove
+        )
+        stats["removed"] += len(to_remove)
+
+    return stats
+
+
+def flush(*, batch_size: int = BATCH_SIZE, ignore_debounce: bool = False) -> dict:
+    """
+    Drain every ready operation in batches of `batch_size`.
+    Returns counters, throughput and the remaining backlog.
+    """
+    from .providers import get_embedder
+    from .rag import get_qdrant_client
+
+    started = time.monotonic()
+    stats = {
+        "processed": 0,
+        "indexed": 0,
+        "unchanged": 0,
+        "removed": 0,
+        "skipped": 0,
+        "failed": 0,
+        "batches": 0,
+    }
+    client = embedder = None
+    worker = uuid.uuid4().hex
+    while True:
+        operations = _claim(batch_size, worker, ignore_debounce=ignore_debounce)
+        if not operations:
+            break
+        try:
+            if client is None:
+                client = get_qdrant_client()
+                embedder = get_embedder()
+            result = _process(operations, client, embedder)
+        except Exception as e:
+            logger.error("index_queue_batch_failed", size=len(operations), error=str(e))
+            _requeue(operations, worker)
+            stats["failed"] += len(operations)
+            break
+        _complete(operations, worker)
+        for key, value in result.items():
+            stats[key] += value
+        stats["processed"] += len(operations)
+        stats["batches"] += 1
+
+    duration = time.monotonic() - started
+    stats["duration_s"] = round(duration, 3)
+    stats["throughput_per_s"] = (
+        round(stats["processed"] / duration, 1) if duration else 0.0
+    )
+    stats.update(queue_stats())
+
+    if stats["processed"] or stats["failed"]:
+        logger.info("index_queue_flushed", **stats)
+        record_metric("index_queue_flush", **stats)
+    return stats
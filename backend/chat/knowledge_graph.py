@@ -5,8 +5,10 @@ Provides structural navigation for framework comparison, requirement
 hierarchy traversal, cross-framework mappings, and threat-control tracing.
 
 The graph is built lazily on first use from the same YAML files used by
-the library system. It lives in-process memory (60k+ nodes fits easily)
-and is rebuilt on demand.
+the library system. Each library file is parsed once into a fragment keyed
+by its content hash, so a library update only re-parses the files that
+changed. The assembled graph is persisted as a compact memory-mapped store
+(see ``graph_store.py``) that all worker processes share read-only.
 
 Uses a lightweight DiGraph implementation — no external dependency needed.
 
@@ -15,12 +17,16 @@ Edge types: has_requirement, parent_child, addresses_threat,
             implemented_by, has_mapping, maps_to
 """
 
+import hashlib
+import json
 import structlog
 import threading
 import time
 from pathlib import Path
 from typing import Any, Iterator
 
+from .graph_store import CompactGraph, GraphIndex, tokenize, write_compact_graph
+
 logger = structlog.get_logger(__name__)
 
 
@@ -77,6 +83,11 @@ class DiGraph:
             return ((src, node_id, attrs) for src, attrs in sources.items())
         return ((src, node_id) for src in sources)
 
+    def edges(self, data: bool = False) -> Iterator[tuple]:
+        for src, targets in self._out.items():
+            for dst, attrs in targets.items():
+                yield (src, dst, attrs) if data else (src, dst)
+
     def number_of_nodes(self) -> int:
         return len(self._nodes)
 
@@ -97,14 +108,20 @@ class DiGraph:
 # Singleton graph management
 # ---------------------------------------------------------------------------
 
-_graph: DiGraph | None = None
+_graph: "DiGraph | CompactGraph | None" = None
 _graph_lock = threading.Lock()
 
 _CACHE_DIR = Path(__file__).resolve().parent.parent / "db" / "cache"
-_CACHE_FILE = _CACHE_DIR / "knowledge_graph.pkl"
+_STORE_FILE = _CACHE_DIR / "knowledge_graph.kgs"
+_FRAGMENT_DIR = _CACHE_DIR / "knowledge_graph_fragments"
+_LEGACY_CACHE_FILE = _CACHE_DIR / "knowledge_graph.pkl"
+
+# Bump when _process_library changes what it extracts from a library file:
+# every fragment (and therefore the store) is rebuilt.
+FRAGMENT_FORMAT = 1
 
 
-def get_graph() -> DiGraph:
+def get_graph() -> "DiGraph | CompactGraph":
     """Get or build the singleton knowledge graph, using disk cache when available."""
     global _graph
     if _graph is None:
@@ -114,12 +131,13 @@ def get_graph() -> DiGraph:
     return _graph
 
 
-def rebuild_graph() -> DiGraph:
-    """Force rebuild of the knowledge graph (invalidates cache)."""
+def rebuild_graph() -> "DiGraph | CompactGraph":
+    """Force rebuild of the knowledge graph, re-parsing every library file."""
     global _graph
     with _graph_lock:
-        _graph = _build_graph()
-        _save_cache(_graph)
+        entries = _scan_library()
+        graph = _build_graph(entries, reparse=True)
+        _graph = _save_cache(graph, _sources_digest(entries)) or graph
     return _graph
 
 
@@ -127,66 +145,168 @@ def _get_library_dir() -> Path:
     return Path(__file__).resolve().parent.parent / "library" / "libraries"
 
 
-def _get_library_mtime() -> float:
-    """Get the most recent modification time across all YAML library files."""
-    lib_dir = _get_library_dir()
-    if not lib_dir.exists():
-        return 0.0
-    mtime = lib_dir.stat().st_mtime
-    for f in lib_dir.glob("*.yaml"):
-        mtime = max(mtime, f.stat().st_mtime)
-    return mtime
+def _read_hash_index() -> dict:
+    try:
+        with open(_FRAGMENT_DIR / "index.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 
-def _load_or_build() -> DiGraph:
-    """Try loading from disk cache; rebuild from YAML if stale or missing."""
-    import pickle
+def _scan_library() -> list[tuple[str, str]]:
+    """
+    (file name, sha256) for every library YAML, sorted by name. Hashes of
+    files whose size and mtime did not change are reused from the index.
+    """
+    library_dir = _get_library_dir()
+    if not library_dir.exists():
+        return []
+
+    known = _read_hash_index()
+    index = {}
+    entries = []
+    for path in sorted(library_dir.glob("*.yaml")):
+        stat = path.stat()
+        cached = known.get(path.name)
+        if (
+            cached
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            digest = cached["sha256"]
+        else:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        index[path.name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+        }
+        entries.append((path.name, digest))
+
+    if index != known:
+        try:
+            _FRAGMENT_DIR.mkdir(parents=True, exist_ok=True)
+            with open(_FRAGMENT_DIR / "index.json", "w", encoding="utf-8") as f:
+                json.dump(index, f)
+        except OSError as e:
+            logger.warning("knowledge_graph_hash_index_save_failed", error=e)
+    return entries
+
+
+def _sources_digest(entries: list[tuple[str, str]]) -> str:
+    h = hashlib.sha256(f"format={FRAGMENT_FORMAT}".encode())
+    for name, digest in entries:
+        h.update(f"\n{name}:{digest}".encode())
+    return h.hexdigest()
+
+
+def _load_or_build() -> "DiGraph | CompactGraph":
+    """Map the shared store if it matches the libraries; else rebuild incrementally."""
+    entries = _scan_library()
+    digest = _sources_digest(entries)
 
     try:
-        if _CACHE_FILE.exists():
-            cache_mtime = _CACHE_FILE.stat().st_mtime
-            lib_mtime = _get_library_mtime()
-            if cache_mtime >= lib_mtime:
-                t0 = time.time()
-                with open(_CACHE_FILE, "rb") as f:
-                    # SECURITY: This pickle file is application-generated
-                    # (written by _save_cache below), not user-uploaded.
-                    # The cache directory (db/cache/) is not web-accessible.
-                    graph = pickle.load(f)  # nosec B301
+        if _STORE_FILE.exists():
+            t0 = time.time()
+            store = CompactGraph(_STORE_FILE)
+            if store.source_digest == digest:
                 logger.info(
                     "knowledge_graph_loaded_from_cache",
                     duration=round(time.time() - t0, 2),
-                    nodes=graph.number_of_nodes(),
+                    nodes=store.number_of_nodes(),
                 )
-                return graph
-            else:
-                logger.info("knowledge_graph_cache_stale")
+                return store
+            logger.info("knowledge_graph_cache_stale")
     except Exception as e:
         logger.warning("knowledge_graph_cache_load_failed", error=e)
 
-    graph = _build_graph()
-    _save_cache(graph)
-    return graph
+    graph = _build_graph(entries)
+    return _save_cache(graph, digest) or graph
 
 
-def _save_cache(graph: DiGraph) -> None:
-    """Persist the graph to disk for fast loading."""
-    import pickle
-
+def _save_cache(graph: DiGraph, digest: str) -> "CompactGraph | None":
+    """Persist the graph as the shared store and map it; None on failure."""
     try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(_CACHE_FILE, "wb") as f:
-            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
-        logger.info("knowledge_graph_cache_saved", path=str(_CACHE_FILE))
+        write_compact_graph(graph, _STORE_FILE, source_digest=digest)
+        _LEGACY_CACHE_FILE.unlink(missing_ok=True)
+        logger.info("knowledge_graph_cache_saved", path=str(_STORE_FILE))
+        return CompactGraph(_STORE_FILE)
     except Exception as e:
         logger.warning("knowledge_graph_cache_save_failed", error=e)
+        return None
 
 
-def _build_graph() -> DiGraph:
-    """Parse all YAML library files and build the knowledge graph."""
-    import time
+class _FragmentRecorder:
+    """Records the add_node / add_edge calls of _process_library, in order."""
+
+    __slots__ = ("ops",)
+
+    def __init__(self):
+        self.ops: list[tuple] = []
+
+    def add_node(self, node_id: str, **attrs):
+        self.ops.append(("node", node_id, attrs))
+
+    def add_edge(self, src: str, dst: str, **attrs):
+        self.ops.append(("edge", src, dst, attrs))
+
+
+def _parse_fragment(filepath: Path) -> list[tuple]:
     import yaml
 
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader)  # nosec B506 — safe loader
+    except Exception as e:
+        logger.warning("yaml_parse_failed", file=filepath.name, error=e)
+        return []
+    if not isinstance(data, dict):
+        return []
+    recorder = _FragmentRecorder()
+    _process_library(recorder, data)
+    return recorder.ops
+
+
+def _load_fragment(filepath: Path, digest: str, reparse: bool) -> tuple[list, bool]:
+    """Ops of one library file and whether they had to be parsed."""
+    import pickle
+
+    fragment_file = _FRAGMENT_DIR / f"{digest}.v{FRAGMENT_FORMAT}.pkl"
+    if not reparse and fragment_file.exists():
+        try:
+            with open(fragment_file, "rb") as f:
+                # SECURITY: fragments are application-generated (written
+                # below), not user-uploaded; db/cache/ is not web-accessible.
+                return pickle.load(f), False  # nosec B301
+        except Exception as e:
+            logger.warning("knowledge_graph_fragment_load_failed", error=e)
+
+    ops = _parse_fragment(filepath)
+    try:
+        _FRAGMENT_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = fragment_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(ops, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(fragment_file)
+    except OSError as e:
+        logger.warning("knowledge_graph_fragment_save_failed", error=e)
+    return ops, True
+
+
+def _prune_fragments(live_digests: set[str]) -> None:
+    if not _FRAGMENT_DIR.exists():
+        return
+    for fragment_file in _FRAGMENT_DIR.glob("*.pkl"):
+        digest, _, suffix = fragment_file.name.partition(".")
+        if digest not in live_digests or suffix != f"v{FRAGMENT_FORMAT}.pkl":
+            fragment_file.unlink(missing_ok=True)
+
+
+def _build_graph(
+    entries: list[tuple[str, str]] | None = None, reparse: bool = False
+) -> DiGraph:
+    """Assemble the graph from per-file fragments, parsing only changed files."""
     t0 = time.time()
     G = DiGraph()
     library_dir = _get_library_dir()
@@ -195,32 +315,33 @@ def _build_graph() -> DiGraph:
         logger.warning("library_dir_not_found", path=str(library_dir))
         return G
 
-    yaml_files = sorted(library_dir.glob("*.yaml"))
-    logger.info("knowledge_graph_build_started", file_count=len(yaml_files))
-
-    for filepath in yaml_files:
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except Exception as e:
-            logger.warning("yaml_parse_failed", file=filepath.name, error=e)
-            continue
-
-        if not isinstance(data, dict):
-            continue
-
-        _process_library(G, data)
+    if entries is None:
+        entries = _scan_library()
+    logger.info("knowledge_graph_build_started", file_count=len(entries))
+
+    parsed = 0
+    for name, digest in entries:
+        ops, was_parsed = _load_fragment(library_dir / name, digest, reparse)
+        parsed += was_parsed
+        for op in ops:
+            if op[0] == "node":
+                G.add_node(op[1], **op[2])
+            else:
+                G.add_edge(op[1], op[2], **op[3])
+    _prune_fragments({digest for _, digest in entries})
 
     logger.info(
         "knowledge_graph_build_complete",
         nodes=G.number_of_nodes(),
         edges=G.number_of_edges(),
+        files_parsed=parsed,
+        files_reused=len(entries) - parsed,
         duration=round(time.time() - t0, 2),
     )
     return G
 
 
-def _process_library(G: DiGraph, data: dict):
+def _process_library(G: "DiGraph | _FragmentRecorder", data: dict):
     """Process a single YAML library file into graph nodes and edges."""
     library_urn = data.get("urn", "")
     library_name = data.get("name", "")
@@ -341,6 +462,100 @@ def _process_library(G: DiGraph, data: dict):
                     )
 
 
+# ---------------------------------------------------------------------------
+# Secondary indexes and ranking
+# ---------------------------------------------------------------------------
+
+_memory_index: tuple | None = None  # (graph, GraphIndex) for in-memory graphs
+
+
+def get_graph_index(G: "DiGraph | CompactGraph | None" = None) -> GraphIndex:
+    """Indexes of a graph: persisted with the store, or built once in memory."""
+    global _memory_index
+    G = G if G is not None else get_graph()
+    index = getattr(G, "index", None)
+    if index is not None:
+        return index
+    if _memory_index is None or _memory_index[0] is not G:
+        _memory_index = (G, GraphIndex.build(G))
+    return _memory_index[1]
+
+
+def _match_score(attrs: dict, query_lower: str, query_tokens: list[str]) -> float:
+    """Rank a matching node: exact ref_id/name, then substring, then token overlap."""
+    name = (attrs.get("name", "") or "").lower()
+    ref_id = (attrs.get("ref_id", "") or "").lower()
+    if query_lower == ref_id:
+        return 100.0
+    if query_lower == name:
+        return 90.0
+    if query_lower in ref_id:
+        return 70.0 + 10.0 * len(query_lower) / len(ref_id)
+    if query_lower in name:
+        return 60.0 + 10.0 * len(query_lower) / len(name)
+    if query_lower in (attrs.get("description", "") or "").lower():
+        return 40.0
+    title_tokens = set(tokenize(f"{name} {ref_id}"))
+    covered = sum(1 for token in query_tokens if token in title_tokens)
+    return 10.0 + 20.0 * covered / max(len(query_tokens), 1)
+
+
+def _search_nodes(
+    G: "DiGraph | CompactGraph",
+    node_type: str,
+    query: str,
+    within=None,
+) -> list[tuple[int, dict]]:
+    """
+    (node id, attrs) of `node_type` nodes matching `query`, best match first.
+
+    Candidates come from the token index (every query token must prefix a
+    token of name, ref_id, description or provider). When the index finds
+    nothing, fall back to a substring scan of the node type (e.g. a query
+    that is a fragment of a longer token).
+
+    This differs from the former full substring scan sorted by name:
+    - query words no longer need to be adjacent, nor in the same field;
+    - fragments from the middle of a word only match through the fallback,
+      i.e. when no node matches by prefix;
+    - results are ranked by ``_match_score`` (empty queries keep the node
+      order; callers sort them by name).
+    """
+    index = get_graph_index(G)
+    ids = index.nodes_of_type(node_type) if within is None else within
+    query_lower = query.lower().strip()
+    if not query_lower:
+        return [(idx, index.attrs_of(idx)) for idx in ids]
+
+    query_tokens = tokenize(query_lower)
+    matches = []
+    candidates = index.candidates(query_lower)
+    if candidates:
+        allowed = set(within) if within is not None else None
+        for idx in candidates:
+            if allowed is not None and idx not in allowed:
+                continue
+            attrs = index.attrs_of(idx)
+            if attrs.get("node_type") == node_type:
+                matches.append((idx, attrs))
+    if not matches:
+        for idx in ids:
+            attrs = index.attrs_of(idx)
+            searchable = " ".join(
+                str(attrs.get(field, "") or "")
+                for field in ("name", "ref_id", "description", "provider")
+            ).lower()
+            if query_lower in searchable:
+                matches.append((idx, attrs))
+
+    scored = [
+        (_match_score(attrs, query_lower, query_tokens), idx, attrs)
+        for idx, attrs in matches
+    ]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [(idx, attrs) for _, idx, attrs in scored]
+
+
 # ---------------------------------------------------------------------------
 # Query functions — called by tool dispatch
 # ---------------------------------------------------------------------------
@@ -349,32 +564,17 @@ def _process_library(G: DiGraph, data: dict):
 def find_frameworks(
     query: str = "", provider: str = "", locale: str = ""
 ) -> list[dict]:
-    """Search frameworks by name, provider, or locale."""
+    """Search frameworks by name, provider, or locale (best match first)."""
     G = get_graph()
+    index = get_graph_index(G)
     results = []
-    query_lower = query.lower()
 
-    for node_id, attrs in G.nodes(data=True):
-        if attrs.get("node_type") != "framework":
-            continue
+    for idx, attrs in _search_nodes(G, "framework", query):
         if provider and attrs.get("provider", "").lower() != provider.lower():
             continue
         if locale and attrs.get("locale", "") != locale:
             continue
-        if query_lower:
-            searchable = (
-                f"{attrs.get('name', '')} {attrs.get('ref_id', '')} "
-                f"{attrs.get('description', '')} {attrs.get('provider', '')}"
-            ).lower()
-            if query_lower not in searchable:
-                continue
-
-        req_count = sum(
-            1
-            for _, _, d in G.out_edges(node_id, data=True)
-            if d.get("edge_type") == "has_requirement"
-        )
-
+        node_id = index.urn_of(idx)
         results.append(
             {
                 "urn": node_id,
@@ -383,11 +583,13 @@ def find_frameworks(
                 "description": (attrs.get("description", "") or "")[:200],
                 "provider": attrs.get("provider", ""),
                 "locale": attrs.get("locale", ""),
-                "requirement_count": req_count,
+                "requirement_count": len(index.requirements_of(node_id)),
             }
         )
 
-    return sorted(results, key=lambda x: x["name"])
+    if not query.strip():
+        results.sort(key=lambda x: x["name"])
+    return results
 
 
 def get_framework_detail(identifier: str) -> dict | None:
@@ -518,27 +720,21 @@ def compare_frameworks(identifier_a: str, identifier_b: str) -> dict:
 def search_requirements(query: str, framework: str = "", limit: int = 20) -> list[dict]:
     """Search requirement nodes by text, optionally within a specific framework."""
     G = get_graph()
-    query_lower = query.lower()
-    results = []
+    index = get_graph_index(G)
 
-    fw_urn = _resolve_framework(G, framework) if framework else None
-
-    for node_id, attrs in G.nodes(data=True):
-        if attrs.get("node_type") != "requirement_node":
-            continue
-        if fw_urn and attrs.get("framework_urn") != fw_urn:
-            continue
-
-        searchable = (
-            f"{attrs.get('name', '')} {attrs.get('ref_id', '')} "
-            f"{attrs.get('description', '')}"
-        ).lower()
-        if query_lower not in searchable:
-            continue
+    within = None
+    if framework:
+        fw_urn = _resolve_framework(G, framework)
+        if fw_urn:
+            within = index.requirements_of(fw_urn)
 
+    results = []
+    for idx, attrs in _search_nodes(G, "requirement_node", query, within=within)[
+        :limit
+    ]:
         results.append(
             {
-                "urn": node_id,
+                "urn": index.urn_of(idx),
                 "ref_id": attrs.get("ref_id", ""),
                 "name": attrs.get("name", ""),
                 "description": (attrs.get("description", "") or "")[:200],
@@ -547,10 +743,6 @@ def search_requirements(query: str, framework: str = "", limit: int = 20) -> lis
                 "depth": attrs.get("depth", 1),
             }
         )
-
-        if len(results) >= limit:
-            break
-
     return results
 
 
@@ -605,19 +797,14 @@ def find_mappings(
 def find_controls_for_threat(threat_query: str) -> list[dict]:
     """Given a threat name, find requirements and controls that address it."""
     G = get_graph()
-    query_lower = threat_query.lower()
+    if not threat_query.strip():
+        return []
 
-    # Find matching threats
-    threat_urns = []
-    for node_id, attrs in G.nodes(data=True):
-        if attrs.get("node_type") != "threat":
-            continue
-        searchable = (
-            f"{attrs.get('name', '')} {attrs.get('ref_id', '')} "
-            f"{attrs.get('description', '')}"
-        ).lower()
-        if query_lower in searchable:
-            threat_urns.append(node_id)
+    # Find matching threats, best match first
+    index = get_graph_index(G)
+    threat_urns = [
+        index.urn_of(idx) for idx, _ in _search_nodes(G, "threat", threat_query)
+    ]
 
     if not threat_urns:
         return []
@@ -668,22 +855,12 @@ def find_controls_for_threat(threat_query: str) -> list[dict]:
 def get_graph_stats() -> dict:
     """Return summary statistics about the knowledge graph."""
     G = get_graph()
-    type_counts: dict[str, int] = {}
-    for _, attrs in G.nodes(data=True):
-        nt = attrs.get("node_type", "unknown")
-        type_counts[nt] = type_counts.get(nt, 0) + 1
-
-    edge_counts: dict[str, int] = {}
-    for node_id in G._out:
-        for _, edge_attrs in G._out[node_id].items():
-            et = edge_attrs.get("edge_type", "unknown")
-            edge_counts[et] = edge_counts.get(et, 0) + 1
-
+    index = get_graph_index(G)
     return {
         "total_nodes": G.number_of_nodes(),
         "total_edges": G.number_of_edges(),
-        "node_types": type_counts,
-        "edge_types": edge_counts,
+        "node_types": index.node_type_counts(),
+        "edge_types": dict(index.edge_type_counts),
     }
 
 
@@ -707,9 +884,10 @@ def _resolve_framework(G: DiGraph, identifier: str) -> str | None:
     best_match = None
     best_score = 0.0
 
-    for node_id, attrs in G.nodes(data=True):
-        if attrs.get("node_type") != "framework":
-            continue
+    index = get_graph_index(G)
+    for idx in index.nodes_of_type("framework"):
+        node_id = index.urn_of(idx)
+        attrs = index.attrs_of(idx)
 
         ref_id = (attrs.get("ref_id", "") or "").lower()
         name = (attrs.get("name", "") or "").lower()
@@ -0,0 +1,435 @@
+"""
+Incremental indexing of the YAML libraries into the RAG knowledge base.
+
+Every library file produces a summary point plus one point per requirement
+node, threat and reference control (``source_type="library"``). Re-indexing
+all of them means tens of thousands of embeddings, so each run compares the
+library directory against the ``IndexedLibrary`` manifest:
+
+- files whose content hash (and embedder) did not change are not parsed;
+- changed files are parsed across a process pool, and only entries whose
+  point fingerprint differs from the manifest are embedded and upserted;
+- points of entries (or whole files) that vanished are deleted;
+- a file whose upsert failed keeps its previous manifest, so the next run
+  retries it.
+
+``index_libraries`` returns a report of what was indexed and skipped; it is
+logged and appended to the chat metrics log as ``library_index``.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import structlog
+
+from .embedding_cache import payload_fingerprint
+
+logger = structlog.get_logger(__name__)
+
+BATCH_SIZE = 100
+MAX_WORKERS = 8
+
+LIBRARY_DIR = None  # Resolved lazily
+
+
+def _get_library_dir():
+    """Get the path to the YAML library directory."""
+    global LIBRARY_DIR
+    if LIBRARY_DIR is None:
+        LIBRARY_DIR = Path(__file__).resolve().parent.parent / "library" / "libraries"
+    return LIBRARY_DIR
+
+
+def library_point_id(urn: str) -> str:
+    """Deterministic Qdrant point id of a library entry."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"library:{urn}"))
+
+
+def _file_sha(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _library_entries(data: dict) -> list[dict]:
+    """
+    Extract indexable entries from a parsed library.
+    Returns a list of dicts with: urn, ref_id, name, description, etc.
+    """
+    library_name = data.get("name", "")
+    library_ref_id = data.get("ref_id", "")
+    locale = data.get("locale", "en")
+    provider = data.get("provider", "")
+
+    entries = []
+    objects = data.get("objects", {})
+
+    # Index the library itself as a summary entry
+    if library_name:
+        lib_description = data.get("description", "")
+        entries.append(
+            {
+                "urn": data.get("urn", ""),
+                "ref_id": library_ref_id,
+                "name": library_name,
+                "description": lib_description,
+                "annotation": "",
+                "framework": library_name,
+                "framework_ref_id": library_ref_id,
+                "provider": provider,
+                "locale": locale,
+                "object_type": "framework",
+            }
+        )
+
+    # Extract framework requirement nodes
+    framework = objects.get("framework", {})
+    if isinstance(framework, dict):
+        framework_name = framework.get("name", library_name)
+        framework_ref_id = framework.get("ref_id", library_ref_id)
+        for node in framework.get("requirement_nodes", []):
+            # Skip empty section headers
+            if not node.get("name") and not node.get("description"):
+                continue
+            entries.append(
+                {
+                    "urn": node.get("urn", ""),
+                    "ref_id": node.get("ref_id", ""),
+                    "name": node.get("name", ""),
+                    "description": node.get("description", ""),
+                    "annotation": node.get("annotation", ""),
+                    "framework": framework_name,
+                    "framework_ref_id": framework_ref_id,
+                    "provider": provider,
+                    "locale": locale,
+                    "object_type": "requirement_node",
+                }
+            )
+
+    # Extract threats
+    for threat in objects.get("threats", []):
+        entries.append(
+            {
+                "urn": threat.get("urn", ""),
+                "ref_id": threat.get("ref_id", ""),
+                "name": threat.get("name", ""),
+                "description": threat.get("description", ""),
+                "annotation": "",
+                "framework": library_name,
+                "framework_ref_id": library_ref_id,
+                "provider": provider,
+                "locale": locale,
+                "object_type": "library_threat",
+            }
+        )
+
+    # Extract reference controls
+    for ctrl in objects.get("reference_controls", []):
+        entries.append(
+            {
+                "urn": ctrl.get("urn", ""),
+                "ref_id": ctrl.get("ref_id", ""),
+                "name": ctrl.get("name", ""),
+                "description": ctrl.get("description", ""),
+                "annotation": ctrl.get("annotation", ""),
+                "framework": library_name,
+                "framework_ref_id": library_ref_id,
+                "provider": provider,
+                "locale": locale,
+                "object_type": "reference_control",
+            }
+        )
+
+    return entries
+
+
+def _build_library_entry_text(entry: dict) -> str:
+    """Build searchable text for a library entry."""
+    parts = [f"Framework: {entry['framework']}"]
+    if entry.get("ref_id"):
+        parts.append(f"Reference: {entry['ref_id']}")
+    if entry.get("name"):
+        parts.append(f"Name: {entry['name']}")
+    if entry.get("description"):
+        parts.append(f"Description: {entry['description']}")
+    if entry.get("annotation"):
+        parts.append(f"Guidance: {entry['annotation']}")
+    return "\n".join(parts)
+
+
+def _library_payload(entry: dict) -> dict:
+    return {
+        "text": _build_library_entry_text(entry),
+        "source_type": "library",
+        "object_type": entry["object_type"],
+        "urn": entry["urn"],
+        "ref_id": entry.get("ref_id", ""),
+        "name": entry.get("name", ""),
+        "framework": entry["framework"],
+        "framework_ref_id": entry.get("framework_ref_id", ""),
+        "provider": entry.get("provider", ""),
+        "locale": entry.get("locale", "en"),
+    }
+
+
+def _load_library(path, key: str):
+    """
+    Parse one library file into its points. Runs in a worker process.
+
+    Returns {"urn", "version", "points": {point_id: (fingerprint, payload)},
+    "skipped"} or None when the file cannot be parsed.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader)
+    except Exception as e:
+        logger.warning("failed_to_parse_yaml", file=str(path), error=str(e))
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    points = {}
+    skipped = 0
+    for entry in _library_entries(data):
+        if not entry["urn"]:
+            skipped += 1
+            continue
+        payload = _library_payload(entry)
+        points[library_point_id(entry["urn"])] = (
+            payload_fingerprint(key, payload),
+            payload,
+        )
+
+    version = data.get("version")
+    try:
+        version = int(version) if version is not None else None
+    except (TypeError, ValueError):
+        version = None
+    return {
+        "urn": data.get("urn", "") or "",
+        "version": version,
+        "points": points,
+        "skipped": skipped,
+    }
+
+
+def _parse_libraries(paths: list, key: str, workers: int | None) -> list:
+    """Parse `paths` across a process pool (serially for one file or in a daemon)."""
+    if workers is None:
+        workers = min(MAX_WORKERS, os.cpu_count() or 1)
+    workers = min(workers, len(paths))
+    # Daemonic processes (e.g. process-based Huey workers) cannot fork a pool.
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        return [_load_library(path, key) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_load_library, paths, repeat(key), chunksize=4))
+
+
+def index_libraries(
+    *, force: bool = False, workers: int | None = None, library_dir=None
+) -> dict:
+    """
+    Bring the library partition of the RAG collection in line with the YAML
+    libraries on disk. With `force`, every file is parsed and every entry
+    re-embedded and upserted regardless of the manifest.
+    """
+    from qdrant_client.models import PointIdsList, PointStruct
+
+    from .embedding_cache import (
+        embed_texts,
+        embedder_key,
+        forget_points,
+        record_points,
+        reset_point_states_if_empty,
+        text_sha,
+        unchanged_point_ids,
+    )
+    from .metrics import record_metric
+    from .models import IndexedLibrary
+    from .providers import get_embedder
+    from .rag import COLLECTION_NAME, get_qdrant_client
+
+    started = time.monotonic()
+    library_dir = Path(library_dir) if library_dir else _get_library_dir()
+    report = {
+        "files": 0,
+        "files_unchanged": 0,
+        "files_parsed": 0,
+        "files_removed": 0,
+        "files_failed": [],
+        "entries": 0,
+        "entries_unchanged": 0,
+        "entries_indexed": 0,
+        "entries_skipped": 0,
+        "points_deleted": 0,
+        "unchanged_libraries": [],
+    }
+    if not library_dir.exists():
+        logger.warning("library_dir_not_found", path=str(library_dir))
+        return report
+
+    embedder = get_embedder()
+    client = get_qdrant_client()
+    key = embedder_key(embedder)
+    reset_point_states_if_empty(client)
+
+    manifests = {m.filename: m for m in IndexedLibrary.objects.all()}
+    paths = sorted(library_dir.glob("*.yaml"))
+    report["files"] = len(paths)
+
+    hashes = {}
+    to_parse = []
+    live_ids = set()
+    for path in paths:
+        hashes[path.name] = _file_sha(path)
+        manifest = manifests.get(path.name)
+        if (
+            not force
+            and manifest is not None
+            and manifest.content_hash == hashes[path.name]
+            and manifest.embedder == key
+        ):
+            report["unchanged_libraries"].append(path.name)
+            report["entries"] += len(manifest.entry_hashes)
+            report["entries_unchanged"] += len(manifest.entry_hashes)
+            live_ids.update(manifest.entry_hashes)
+        else:
+            to_parse.append(path)
+    report["files_unchanged"] = len(report["unchanged_libraries"])
+    logger.info(
+        "library_indexing_started",
+        file_count=len(paths),
+        changed=len(to_parse),
+    )
+
+    parsed = {}
+    for path, library in zip(to_parse, _parse_libraries(to_parse, key, workers)):
+        if library is None:
+            report["files_failed"].append(path.name)
+            # Keep serving the previously indexed version of the file.
+            manifest = manifests.get(path.name)
+            if manifest is not None:
+                live_ids.update(manifest.entry_hashes)
+            continue
+        parsed[path.name] = library
+        live_ids.update(library["points"])
+        report["files_parsed"] += 1
+        report["entries"] += len(library["points"])
+        report["entries_skipped"] += library["skipped"]
+
+    # Entries whose fingerprint is unchanged since the last run are skipped;
+    # a duplicated URN is upserted once.
+    pending = {}
+    owners = {}
+    for filename, library in parsed.items():
+        previous = {} if force else getattr(manifests.get(filename), "entry_hashes", {})
+        for point_id, (fingerprint, payload) in library["points"].items():
+            owners.setdefault(point_id, set()).add(filename)
+            if previous.get(point_id) == fingerprint:
+                report["entries_unchanged"] += 1
+            else:
+                pending[point_id] = (fingerprint, payload)
+    if pending and not force:
+        # Points indexed before the manifest existed.
+        unchanged = unchanged_point_ids(
+            {point_id: fingerprint for point_id, (fingerprint, _) in pending.items()}
+        )
+        report["entries_unchanged"] += len(unchanged)
+        for point_id in unchanged:
+            del pending[point_id]
+
+    failed = set()
+    items = list(pending.items())
+    for batch_start in range(0, len(items), BATCH_SIZE):
+        batch = items[batch_start : batch_start + BATCH_SIZE]
+        try:
+            embeddings = embed_texts(embedder, [p["text"] for _, (_, p) in batch])
+            client.upsert(
+                collection_name=COLLECTION_NAME,
+                points=[
+                    PointStruct(id=point_id, vector=embedding, payload=payload)
+                    for (point_id, (_, payload)), embedding in zip(batch, embeddings)
+                ],
+            )
+            record_points(
+                [(point_id, fp, text_sha(p["text"])) for point_id, (fp, p) in batch]
+            )
+        except Exception as e:
+            logger.error("library_upsert_failed", batch_start=batch_start, error=e)
+            for point_id, _ in batch:
+                failed.update(owners[point_id])
+            continue
+        report["entries_indexed"] += len(batch)
+
+    # Points of removed entries and of library files deleted from disk.
+    removed = [name for name in manifests if name not in hashes]
+    vanished = {}
+    for filename in list(parsed) + removed:
+        manifest = manifests.get(filename)
+        if manifest is None or filename in failed:
+            continue
+        for point_id in set(manifest.entry_hashes) - live_ids:
+            vanished.setdefault(point_id, set()).add(filename)
+    if vanished:
+        try:
+            client.delete(
+                collection_name=COLLECTION_NAME,
+                points_selector=PointIdsList(points=sorted(vanished)),
+            )
+            forget_points(vanished)
+            report["points_deleted"] = len(vanished)
+        except Exception as e:
+            logger.error("library_delete_failed", count=len(vanished), error=e)
+            # Keep the old manifests so the next run retries the deletion.
+            for owners_of_point in vanished.values():
+                failed.update(owners_of_point)
+            removed = [name for name in removed if name not in failed]
+
+    IndexedLibrary.objects.filter(filename__in=removed).delete()
+    report["files_removed"] = len(removed)
+    report["files_failed"].extend(sorted(failed))
+    IndexedLibrary.objects.bulk_create(
+        [
+            IndexedLibrary(
+                filename=filename,
+                urn=library["urn"][:255],
+                version=library["version"],
+                content_hash=hashes[filename],
+                embedder=key,
+                entry_hashes={
+                    point_id: fingerprint
+                    for point_id, (fingerprint, _) in library["points"].items()
+                },
+            )
+            for filename, library in parsed.items()
+            if filename not in failed
+        ],
+        update_conflicts=True,
+        unique_fields=["filename"],
+        update_fields=[
+            "urn",
+            "version",
+            "content_hash",
+            "embedder",
+            "entry_hashes",
+            "indexed_at",
+        ],
+    )
+
+    report["duration_s"] = round(time.monotonic() - started, 2)
+    summary = {k: v for k, v in report.items() if k != "unchanged_libraries"}
+    summary["files_failed"] = len(report["files_failed"])
+    logger.info("library_indexing_complete", **summary)
+    record_metric("library_index", **summary)
+    return report
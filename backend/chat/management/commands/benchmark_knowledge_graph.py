@@ -0,0 +1,138 @@
+"""
+Benchmark knowledge-graph queries over the bundled libraries.
+
+Times each indexed query function against a full scan of every node (the
+pre-index implementation) and reports the mean latency per call.
+
+Usage:
+    python manage.py benchmark_knowledge_graph
+    python manage.py benchmark_knowledge_graph --iterations 50 --query ransomware
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from chat import knowledge_graph as kg
+
+DEFAULT_QUERIES = [
+    "access control",
+    "password",
+    "incident response",
+    "ransomware",
+    "encryption",
+    "27001",
+]
+
+
+def _scan(G, node_type: str, query: str) -> list[str]:
+    """Reference full scan: lower-case and concatenate every node per query."""
+    query_lower = query.lower()
+    matches = []
+    for node_id, attrs in G.nodes(data=True):
+        if attrs.get("node_type") != node_type:
+            continue
+        searchable = (
+            f"{attrs.get('name', '')} {attrs.get('ref_id', '')} "
+            f"{attrs.get('description', '')} {attrs.get('provider', '')}"
+        ).lower()
+        if query_lower in searchable:
+            matches.append(node_id)
+    return matches
+
+
+def _scan_stats(G) -> dict:
+    node_types: dict[str, int] = {}
+    for _, attrs in G.nodes(data=True):
+        nt = attrs.get("node_type", "unknown")
+        node_types[nt] = node_types.get(nt, 0) + 1
+    edge_types: dict[str, int] = {}
+    for _, _, attrs in G.edges(data=True):
+        et = attrs.get("edge_type", "unknown")
+        edge_types[et] = edge_types.get(et, 0) + 1
+    return {"node_types": node_types, "edge_types": edge_types}
+
+
+class Command(BaseCommand):
+    help = "Benchmark indexed knowledge-graph queries against a full node scan"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Calls per query and function (default: 20)",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Query to benchmark (repeatable). Defaults to a built-in set.",
+        )
+
+    def _time(self, fn, iterations: int) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - started) / iterations * 1000
+
+    def handle(self, *args, **options):
+        iterations = max(1, options["iterations"])
+        queries = options["queries"] or DEFAULT_QUERIES
+
+        started = time.perf_counter()
+        G = kg.get_graph()
+        kg.get_graph_index(G)
+        self.stdout.write(
+            f"Graph ready in {time.perf_counter() - started:.2f}s: "
+            f"{G.number_of_nodes()} nodes, {G.number_of_edges()} edges "
+            f"({type(G).__name__})"
+        )
+
+        rows = []
+        for query in queries:
+            cases = [
+                (
+                    "search_requirements",
+                    lambda q=query: kg.search_requirements(q),
+                    lambda q=query: _scan(G, "requirement_node", q)[:20],
+                ),
+                (
+                    "find_frameworks",
+                    lambda q=query: kg.find_frameworks(q),
+                    lambda q=query: _scan(G, "framework", q),
+                ),
+                (
+                    "find_controls_for_threat",
+                    lambda q=query: kg.find_controls_for_threat(q),
+                    lambda q=query: _scan(G, "threat", q),
+                ),
+            ]
+            for name, indexed, scan in cases:
+                rows.append(
+                    (
+                        name,
+                        query,
+                        self._time(indexed, iterations),
+                        self._time(scan, iterations),
+                    )
+                )
+        rows.append(
+            (
+                "get_graph_stats",
+                "",
+                self._time(kg.get_graph_stats, iterations),
+                self._time(lambda: _scan_stats(G), max(1, iterations // 10)),
+            )
+        )
+
+        self.stdout.write(
+            f"{'function':<26}{'query':<20}{'indexed ms':>12}"
+            f"{'scan ms':>12}{'speedup':>10}"
+        )
+        for name, query, indexed_ms, scan_ms in rows:
+            speedup = scan_ms / indexed_ms if indexed_ms else float("inf")
+            self.stdout.write(
+                f"{name:<26}{query[:19]:<20}{indexed_ms:>12.2f}{scan_ms:>12.2f}"
+                f"{speedup:>9.1f}x"
+            )
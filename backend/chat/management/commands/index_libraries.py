@@ -1,6 +1,7 @@
 """
 Management command to index all YAML framework libraries into the RAG knowledge base.
 This creates a shared knowledge partition accessible to all authenticated users.
+Only libraries changed since the last run are re-parsed and re-embedded.
 """
 
 from django.core.management.base import BaseCommand
@@ -15,18 +16,53 @@ class Command(BaseCommand):
             action="store_true",
             help="Run synchronously instead of queuing as a background task",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Ignore the manifest: re-parse and re-embed every library",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Processes used to parse changed libraries (with --sync)",
+        )
 
     def handle(self, *args, **options):
         from chat.tasks import index_library_knowledge_base
 
         if options["sync"]:
+            from chat.library_index import index_libraries
+
             self.stdout.write("Indexing libraries synchronously...")
-            # Call the function directly (not as a Huey task)
-            index_library_knowledge_base.call_local()
+            report = index_libraries(force=options["force"], workers=options["workers"])
+            self.stdout.write(
+                f"Files: {report['files']} "
+                f"(unchanged {report['files_unchanged']}, "
+                f"parsed {report['files_parsed']}, "
+                f"removed {report['files_removed']})"
+            )
+            self.stdout.write(
+                f"Entries: {report['entries']} "
+                f"(indexed {report['entries_indexed']}, "
+                f"unchanged {report['entries_unchanged']}, "
+                f"skipped without URN {report['entries_skipped']}), "
+                f"points deleted: {report['points_deleted']}"
+            )
+            if options["verbosity"] > 1:
+                for filename in report["unchanged_libraries"]:
+                    self.stdout.write(f"  unchanged: {filename}")
+            if report["files_failed"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        "Failed (retried on next run): "
+                        + ", ".join(report["files_failed"])
+                    )
+                )
             self.stdout.write(self.style.SUCCESS("Library indexing complete."))
         else:
             self.stdout.write("Queuing library indexing as background task...")
-            index_library_knowledge_base()
+            index_library_knowledge_base(force=options["force"])
             self.stdout.write(
                 self.style.SUCCESS(
                     "Library indexing task queued. Check logs for progress."
@@ -2,21 +2,21 @@
 Management command to bulk-index existing model objects into Qdrant for chat RAG.
 
 Re-runnable; safe to invoke against a populated index — Qdrant upsert replaces
-points by id. Useful to:
+points by id, and points whose text and payload did not change since the last
+run are skipped (use --force to re-upsert everything). Useful to:
   - Backfill the index for a folder after enabling chat for the first time.
   - Refresh the index after extending `_build_object_text` with new fields.
   - Index a single folder ahead of running questionnaire-autopilot on it.
 """
 
-import uuid
-
 from django.apps import apps
 from django.core.management.base import BaseCommand, CommandError
 
+from chat.embedding_cache import reset_point_states_if_empty, upsert_model_points
 from chat.rag import COLLECTION_NAME, get_qdrant_client
 from chat.signals import INDEXED_MODELS
 from chat.tasks import _resolve_folder_id
-from chat.text import _build_object_text, _normalize_model_name
+from chat.text import _build_object_text
 
 
 class Command(BaseCommand):
@@ -48,12 +48,19 @@ class Command(BaseCommand):
             action="store_true",
             help="List what would be indexed without contacting Qdrant or the embedder.",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-embed and upsert every object, even when its indexed text "
+            "and payload are unchanged since the last run.",
+        )
 
     def handle(self, *args, **options):
         models_to_index = options["models"] or INDEXED_MODELS
         batch_size = options["batch_size"]
         folder_filter = options.get("folder")
         dry_run = options.get("dry_run", False)
+        self.force = options.get("force", False)
 
         client = None
         embedder = None
@@ -65,6 +72,12 @@ class Command(BaseCommand):
                     f"Collection '{COLLECTION_NAME}' does not exist. "
                     "Run 'init_qdrant' first."
                 )
+            reset = reset_point_states_if_empty(client)
+            if reset:
+                self.stdout.write(
+                    f"Collection '{COLLECTION_NAME}' is empty: "
+                    f"reset {reset} indexed point states."
+                )
             from chat.providers import get_embedder
 
             embedder = get_embedder()
@@ -75,6 +88,7 @@ class Command(BaseCommand):
 
         grand_total_indexed = 0
         grand_total_skipped = 0
+        grand_total_unchanged = 0
 
         for model_path in models_to_index:
             try:
@@ -96,6 +110,7 @@ class Command(BaseCommand):
             total = queryset.count()
             indexed = 0
             skipped = 0
+            self.unchanged = 0
 
             self.stdout.write(f"  {model_path}: scanning {total} object(s)…")
 
@@ -148,48 +163,30 @@ class Command(BaseCommand):
 
             grand_total_indexed += indexed
             grand_total_skipped += skipped
+            grand_total_unchanged += self.unchanged
             self.stdout.write(
-                f"  {model_path}: indexed {indexed}, skipped {skipped}"
-                + (" [dry-run]" if dry_run else "")
+                f"  {model_path}: indexed {indexed}, unchanged {self.unchanged}, "
+                f"skipped {skipped}" + (" [dry-run]" if dry_run else "")
             )
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"{mode_label}Done — indexed {grand_total_indexed}, "
-                f"skipped {grand_total_skipped}."
+                f"unchanged {grand_total_unchanged}, skipped {grand_total_skipped}."
             )
         )
 
     def _flush_batch(
         self, client, embedder, batch_objects, batch_texts, app_label, model_name
     ):
-        from qdrant_client.models import PointStruct
-
-        embeddings = embedder.embed(batch_texts)
-        points = []
-
-        for (obj, text, folder_id), vector in zip(batch_objects, embeddings):
-            point_id = str(
-                uuid.uuid5(
-                    uuid.NAMESPACE_URL,
-                    f"{app_label}.{model_name}:{obj.id}",
-                )
-            )
-            points.append(
-                PointStruct(
-                    id=point_id,
-                    vector=vector,
-                    payload={
-                        "text": text,
-                        "folder_id": folder_id,
-                        "source_type": "model",
-                        "object_type": _normalize_model_name(model_name),
-                        "object_id": str(obj.id),
-                        "name": str(obj),
-                        "ref_id": getattr(obj, "ref_id", "") or "",
-                    },
-                )
-            )
-
-        client.upsert(collection_name=COLLECTION_NAME, points=points)
-        return len(points)
+        upserted, unchanged = upsert_model_points(
+            client,
+            embedder,
+            [
+                (app_label, model_name, obj, text, folder_id)
+                for obj, text, folder_id in batch_objects
+            ],
+            force=self.force,
+        )
+        self.unchanged += unchanged
+        return upserted
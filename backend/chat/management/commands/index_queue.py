@@ -0,0 +1,57 @@
+"""
+Inspect or drain the coalesced RAG re-indexing queue.
+
+Usage:
+    python manage.py index_queue            # Show backlog
+    python manage.py index_queue --flush    # Drain now, ignoring the debounce window
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from chat.index_queue import BATCH_SIZE, flush, queue_stats
+
+
+class Command(BaseCommand):
+    help = "Show the RAG re-indexing backlog, or flush it immediately."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Drain every pending operation now, ignoring the debounce window.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Operations embedded and upserted per batch (default: {BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Emit stats as JSON",
+        )
+
+    def handle(self, *args, **options):
+        if options["flush"]:
+            stats = flush(batch_size=options["batch_size"], ignore_debounce=True)
+        else:
+            stats = queue_stats()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+
+        if options["flush"]:
+            self.stdout.write(
+                f"Processed {stats['processed']} operations in {stats['batches']} "
+                f"batches ({stats['throughput_per_s']}/s): indexed {stats['indexed']}, "
+                f"unchanged {stats['unchanged']}, removed {stats['removed']}, "
+                f"skipped {stats['skipped']}, failed {stats['failed']}."
+            )
+        self.stdout.write(
+            f"Backlog: {stats['backlog']} ({stats['backlog_index']} index, "
+            f"{stats['backlog_remove']} remove), oldest {stats['oldest_age_s']}s."
+        )
@@ -5,6 +5,7 @@ Creates the collection with proper vector dimensions and payload indexes.
 
 from django.core.management.base import BaseCommand
 
+from chat.embedding_cache import reset_point_states
 from chat.rag import COLLECTION_NAME, get_qdrant_client
 
 
@@ -47,6 +48,12 @@ class Command(BaseCommand):
         dimensions = embedder.dimensions
         self.stdout.write(f"Embedding dimensions: {dimensions}")
 
+        # The new collection is empty: stored point states and library
+        # manifests would make indexing skip everything as already indexed
+        reset = reset_point_states()
+        if reset:
+            self.stdout.write(f"Reset {reset} indexed point states.")
+
         # Create collection
         self.stdout.write(f"Creating collection '{COLLECTION_NAME}'...")
         client.create_collection(
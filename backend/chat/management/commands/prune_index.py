@@ -2,7 +2,8 @@
 
 Companion to ``index_objects`` — that command upserts; this one cleans up.
 Useful after bulk deletes (e.g. dropping a framework or wiping a folder)
-where signals weren't connected and the index drifted.
+where signals weren't connected and the index drifted. Also drops cached
+embeddings that no indexed point references anymore.
 
 Usage:
     # Across all folders, default safety: dry-run shows what would go
@@ -18,6 +19,7 @@ Usage:
 from django.apps import apps
 from django.core.management.base import BaseCommand, CommandError
 
+from chat.embedding_cache import forget_points, prune_unreferenced_embeddings
 from chat.rag import COLLECTION_NAME, get_qdrant_client
 from chat.signals import INDEXED_MODELS
 
@@ -141,8 +143,10 @@ class Command(BaseCommand):
             return
 
         if not stale_point_ids:
+            pruned_embeddings = prune_unreferenced_embeddings()
             self.stdout.write(
-                f"{scope} — scanned {scanned} model points, nothing stale."
+                f"{scope} — scanned {scanned} model points, nothing stale; "
+                f"dropped {pruned_embeddings} unreferenced cached embeddings."
             )
             return
 
@@ -153,9 +157,12 @@ class Command(BaseCommand):
             )
         except Exception as e:
             raise CommandError(f"Qdrant delete failed: {e}")
+        forget_points(stale_point_ids)
+        pruned_embeddings = prune_unreferenced_embeddings()
         self.stdout.write(
             self.style.SUCCESS(
                 f"{scope} — scanned {scanned} model points, "
-                f"deleted {len(stale_point_ids)} stale."
+                f"deleted {len(stale_point_ids)} stale, dropped "
+                f"{pruned_embeddings} unreferenced cached embeddings."
             )
         )
@@ -0,0 +1,74 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chat", "0003_agentrun_agentaction_questionnairerun_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmbeddingCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "embedder",
+                    models.CharField(max_length=255, verbose_name="Embedder"),
+                ),
+                (
+                    "text_hash",
+                    models.CharField(max_length=64, verbose_name="Text hash"),
+                ),
+                ("vector", models.JSONField(verbose_name="Vector")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Embedding cache entry",
+                "verbose_name_plural": "Embedding cache entries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("embedder", "text_hash"),
+                        name="unique_embedding_per_embedder_and_text",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="IndexedPointState",
+            fields=[
+                (
+                    "point_id",
+                    models.UUIDField(
+                        primary_key=True, serialize=False, verbose_name="Point ID"
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(max_length=64, verbose_name="Fingerprint"),
+                ),
+                (
+                    "text_hash",
+                    models.CharField(max_length=64, verbose_name="Text hash"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Indexed point state",
+                "verbose_name_plural": "Indexed point states",
+            },
+        ),
+    ]
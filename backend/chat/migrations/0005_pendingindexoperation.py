@@ -0,0 +1,74 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chat", "0004_embeddingcacheentry_indexedpointstate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingIndexOperation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "app_label",
+                    models.CharField(max_length=100, verbose_name="App label"),
+                ),
+                (
+                    "model_name",
+                    models.CharField(max_length=100, verbose_name="Model name"),
+                ),
+                (
+                    "object_id",
+                    models.CharField(max_length=64, verbose_name="Object ID"),
+                ),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[("index", "Index"), ("remove", "Remove")],
+                        default="index",
+                        max_length=10,
+                        verbose_name="Action",
+                    ),
+                ),
+                (
+                    "first_enqueued_at",
+                    models.DateTimeField(verbose_name="First enqueued at"),
+                ),
+                (
+                    "last_enqueued_at",
+                    models.DateTimeField(verbose_name="Last enqueued at"),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Attempts"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending index operation",
+                "verbose_name_plural": "Pending index operations",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("app_label", "model_name", "object_id"),
+                        name="unique_pending_index_operation_per_object",
+                    )
+                ],
+                "indexes": [
+                    models.Index(
+                        fields=["last_enqueued_at"], name="chat_index_queue_ready_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chat", "0005_pendingindexoperation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IndexedLibrary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "filename",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="Filename"
+                    ),
+                ),
+                (
+                    "urn",
+                    models.CharField(blank=True, max_length=255, verbose_name="URN"),
+                ),
+                (
+                    "version",
+                    models.IntegerField(blank=True, null=True, verbose_name="Version"),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(max_length=64, verbose_name="Content hash"),
+                ),
+                (
+                    "embedder",
+                    models.CharField(max_length=255, verbose_name="Embedder"),
+                ),
+                (
+                    "entry_hashes",
+                    models.JSONField(default=dict, verbose_name="Entry hashes"),
+                ),
+                (
+                    "indexed_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Indexed at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Indexed library",
+                "verbose_name_plural": "Indexed libraries",
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chat", "0006_indexedlibrary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pendingindexoperation",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Claimed at"
+            ),
+        ),
+        migrations.AddField(
+            model_name="pendingindexoperation",
+            name="claimed_by",
+            field=models.CharField(
+                blank=True, default="", max_length=64, verbose_name="Claimed by"
+            ),
+        ),
+    ]
@@ -176,6 +176,126 @@ class IndexedDocument(AbstractBaseModel, FolderMixin):
         return f"{self.filename} ({self.status})"
 
 
+class EmbeddingCacheEntry(models.Model):
+    """Embedding vector for a text, keyed by embedder and SHA-256 of the text.
+
+    Lets re-indexing reuse vectors for text that was already embedded
+    (unchanged objects, reverted edits, duplicated library entries) instead
+    of paying for the embedding model again.
+    """
+
+    embedder = models.CharField(max_length=255, verbose_name=_("Embedder"))
+    text_hash = models.CharField(max_length=64, verbose_name=_("Text hash"))
+    vector = models.JSONField(verbose_name=_("Vector"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created at"))
+
+    class Meta:
+        verbose_name = _("Embedding cache entry")
+        verbose_name_plural = _("Embedding cache entries")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["embedder", "text_hash"],
+                name="unique_embedding_per_embedder_and_text",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.embedder}:{self.text_hash[:12]}"
+
+
+class IndexedPointState(models.Model):
+    """Fingerprint of the last version of a Qdrant point we upserted.
+
+    When a re-index produces the same fingerprint (same embedder, same text,
+    same payload) both the embedding and the upsert are skipped.
+    """
+
+    point_id = models.UUIDField(primary_key=True, verbose_name=_("Point ID"))
+    fingerprint = models.CharField(max_length=64, verbose_name=_("Fingerprint"))
+    text_hash = models.CharField(max_length=64, verbose_name=_("Text hash"))
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Updated at"))
+
+    class Meta:
+        verbose_name = _("Indexed point state")
+        verbose_name_plural = _("Indexed point states")
+
+    def __str__(self):
+        return f"{self.point_id}:{self.fingerprint[:12]}"
+
+
+class PendingIndexOperation(models.Model):
+    """A model object waiting to be (re)indexed into or removed from Qdrant.
+
+    One row per object: repeated saves of the same object coalesce into a
+    single row whose action is the most recent one, and the queue is drained
+    in batches by ``chat.index_queue.flush``. A row is leased to the flush
+    processing it and deleted only once its batch succeeded.
+    """
+
+    class Action(models.TextChoices):
+        INDEX = "index", _("Index")
+        REMOVE = "remove", _("Remove")
+
+    app_label = models.CharField(max_length=100, verbose_name=_("App label"))
+    model_name = models.CharField(max_length=100, verbose_name=_("Model name"))
+    object_id = models.CharField(max_length=64, verbose_name=_("Object ID"))
+    action = models.CharField(
+        max_length=10,
+        choices=Action.choices,
+        default=Action.INDEX,
+        verbose_name=_("Action"),
+    )
+    first_enqueued_at = models.DateTimeField(verbose_name=_("First enqueued at"))
+    last_enqueued_at = models.DateTimeField(verbose_name=_("Last enqueued at"))
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("Attempts"))
+    claimed_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("Claimed at")
+    )
+    claimed_by = models.CharField(
+        max_length=64, blank=True, default="", verbose_name=_("Claimed by")
+    )
+
+    class Meta:
+        verbose_name = _("Pending index operation")
+        verbose_name_plural = _("Pending index operations")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["app_label", "model_name", "object_id"],
+                name="unique_pending_index_operation_per_object",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["last_enqueued_at"], name="chat_index_queue_ready_idx")
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.app_label}.{self.model_name}/{self.object_id}"
+
+
+class IndexedLibrary(models.Model):
+    """Manifest entry for a YAML library indexed into the RAG knowledge base.
+
+    Records the file's content hash and the fingerprint of every point it
+    produced, so re-indexing only parses changed files, only re-embeds
+    changed entries and can delete the points of vanished entries.
+    """
+
+    filename = models.CharField(max_length=255, unique=True, verbose_name=_("Filename"))
+    urn = models.CharField(max_length=255, blank=True, verbose_name=_("URN"))
+    version = models.IntegerField(null=True, blank=True, verbose_name=_("Version"))
+    content_hash = models.CharField(max_length=64, verbose_name=_("Content hash"))
+    embedder = models.CharField(max_length=255, verbose_name=_("Embedder"))
+    entry_hashes = models.JSONField(default=dict, verbose_name=_("Entry hashes"))
+    indexed_at = models.DateTimeField(auto_now=True, verbose_name=_("Indexed at"))
+
+    class Meta:
+        verbose_name = _("Indexed library")
+        verbose_name_plural = _("Indexed libraries")
+
+    def __str__(self):
+        return f"{self.filename} ({len(self.entry_hashes)} entries)"
+
+
 class QuestionnaireRun(AbstractBaseModel, FolderMixin):
     """Experimental: a customer security questionnaire being prefilled.
 
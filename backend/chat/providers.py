@@ -198,6 +198,7 @@ class SentenceTransformerEmbedder:
     def __init__(self, model_name: str = "paraphrase-multilingual-MiniLM-L12-v2"):
         from sentence_transformers import SentenceTransformer
 
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
         self._dimensions = self.model.get_sentence_embedding_dimension()
 
@@ -214,19 +215,44 @@ class SentenceTransformerEmbedder:
 
 
 class OllamaEmbedder:
-    """Embeddings using Ollama server."""
+    """Embeddings using Ollama server.
+
+    ``embed`` sends texts in batches to ``/api/embed`` (one request per
+    ``batch_size`` texts) and runs up to ``max_concurrency`` batch requests
+    in parallel on the shared client. Transport errors, 429 and 5xx
+    responses are retried with exponential backoff. Servers predating
+    ``/api/embed`` fall back to one ``/api/embeddings`` call per text.
+    """
+
+    RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
     def __init__(
         self,
         model: str = "snowflake-arctic-embed2",
         base_url: str = "http://localhost:11434",
+        batch_size: int = 32,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        backoff: float = 0.5,
     ):
         import httpx
 
         self.model = model
         self.base_url = base_url
-        self.client = httpx.Client(timeout=60)
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        # httpx.Client is thread-safe; size the pool to the request concurrency.
+        self.client = httpx.Client(
+            timeout=60,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
         self._dimensions: int | None = None
+        self._batch_supported = True
 
     @property
     def dimensions(self) -> int:
@@ -235,17 +261,69 @@ class OllamaEmbedder:
             self._dimensions = len(test)
         return self._dimensions
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        return [self.embed_query(text) for text in texts]
+    def _post(self, path: str, payload: dict):
+        import time
 
-    def embed_query(self, text: str) -> list[float]:
-        resp = self.client.post(
-            f"{self.base_url}/api/embeddings",
-            json={"model": self.model, "prompt": text},
-        )
+        import httpx
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                resp = self.client.post(f"{self.base_url}{path}", json=payload)
+                if (
+                    resp.status_code in self.RETRYABLE_STATUS_CODES
+                    and attempt < self.max_retries
+                ):
+                    raise httpx.HTTPStatusError(
+                        f"Retryable status {resp.status_code}",
+                        request=resp.request,
+                        response=resp,
+                    )
+                return resp
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff * (2**attempt)
+                logger.warning(
+                    "ollama_embed_retry", path=path, attempt=attempt + 1, error=str(e)
+                )
+                time.sleep(delay)
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if self._batch_supported:
+            resp = self._post("/api/embed", {"model": self.model, "input": texts})
+            if resp.status_code != 404:
+                resp.raise_for_status()
+                return resp.json()["embeddings"]
+            logger.info("ollama_embed_batch_unsupported", base_url=self.base_url)
+            self._batch_supported = False
+        return [self._embed_legacy(text) for text in texts]
+
+    def _embed_legacy(self, text: str) -> list[float]:
+        resp = self._post("/api/embeddings", {"model": self.model, "prompt": text})
         resp.raise_for_status()
         return resp.json()["embedding"]
 
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        if len(batches) == 1 or self.max_concurrency == 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches))
+            ) as pool:
+                results = list(pool.map(self._embed_batch, batches))
+        return [vector for batch in results for vector in batch]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed_batch([text])[0]
+
 
 def _build_messages(
     system_prompt: str,
@@ -19,7 +19,6 @@ from huey.contrib.djhuey import db_task
 from .constants import Verdict
 from .text import (
     _build_object_text,
-    _normalize_model_name,
     _text_for_applied_control,
 )
 
@@ -880,20 +879,19 @@ def refresh_folder_index(folder_id: str) -> dict:
 
     Run as the first step of a questionnaire prefill so the LLM only sees
     citations that resolve to real, current objects. Idempotent —
-    embed+upsert overwrites by deterministic point id.
+    embed+upsert overwrites by deterministic point id, and objects whose
+    indexed text is unchanged are neither re-embedded nor re-upserted.
 
     Returns ``{"pruned": <count>, "indexed": <count>}``.
     """
-    import uuid as _uuid
-
     from django.apps import apps
     from qdrant_client.models import (
         FieldCondition,
         Filter,
         MatchValue,
-        PointStruct,
     )
 
+    from .embedding_cache import forget_points, upsert_model_points
     from .providers import get_embedder
     from .rag import COLLECTION_NAME, get_qdrant_client
     from .signals import INDEXED_MODELS
@@ -969,6 +967,8 @@ def refresh_folder_index(folder_id: str) -> dict:
             )
         except Exception as e:
             logger.warning("refresh_folder_index: delete failed (%s)", e)
+        else:
+            forget_points(stale_point_ids)
 
     # 4. Re-embed and upsert live objects in batches.
     if not indexable_rows:
@@ -988,43 +988,18 @@ def refresh_folder_index(folder_id: str) -> dict:
     def _flush() -> int:
         if not pending_text:
             return 0
-        embeddings = embedder.embed(pending_text)
-        points = []
-        for (app_label, model_name, obj), vector, text in zip(
-            pending_meta, embeddings, pending_text
-        ):
-            point_id = str(
-                _uuid.uuid5(
-                    _uuid.NAMESPACE_URL,
-                    f"{app_label}.{model_name}:{obj.id}",
-                )
-            )
-            points.append(
-                PointStruct(
-                    id=point_id,
-                    vector=vector,
-                    payload={
-                        "text": text,
-                        "folder_id": folder_id_str,
-                        "source_type": "model",
-                        "object_type": _normalize_model_name(model_name),
-                        "object_id": str(obj.id),
-                        "name": str(obj),
-                        "ref_id": getattr(obj, "ref_id", "") or "",
-                    },
-                )
-            )
+        rows = [
+            (app_label, model_name, obj, text, folder_id_str)
+            for (app_label, model_name, obj), text in zip(pending_meta, pending_text)
+        ]
+        pending_text.clear()
+        pending_meta.clear()
         try:
-            client.upsert(collection_name=COLLECTION_NAME, points=points)
+            upserted, unchanged = upsert_model_points(client, embedder, rows)
         except Exception as e:
             logger.warning("refresh_folder_index: upsert failed (%s)", e)
-            pending_text.clear()
-            pending_meta.clear()
             return 0
-        n = len(points)
-        pending_text.clear()
-        pending_meta.clear()
-        return n
+        return upserted + unchanged
 
     for app_label, model_name, obj in indexable_rows:
         text = _build_object_text(obj, model_name)
@@ -6,9 +6,12 @@ and context formatting.
 
 import structlog
 import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
+from core.context import focus_folder_id_var
 from iam.models import Folder, RoleAssignment
 
 logger = structlog.get_logger(__name__)
@@ -19,6 +22,20 @@ QDRANT_URL = os.environ.get("QDRANT_URL", "http://localhost:6333")
 # Cross-encoder re-ranker (cached singleton)
 _reranker = None
 _RERANKER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+# Score every over-fetched candidate in a single forward pass
+_RERANK_BATCH_SIZE = 128
+
+# Query embeddings keyed by (embedder, text), most recently used last
+QUERY_EMBEDDING_CACHE_SIZE = 512
+_query_embeddings: OrderedDict = OrderedDict()
+_query_embeddings_lock = threading.Lock()
+
+# Accessible folder ids keyed by (user, focus folder, IAM cache versions)
+ACCESSIBLE_FOLDERS_CACHE_SIZE = 256
+_accessible_folders: OrderedDict = OrderedDict()
+_accessible_folders_lock = threading.Lock()
+
+_qdrant_client = None
 
 
 def _get_reranker():
@@ -36,21 +53,101 @@ def _get_reranker():
 
 
 def get_qdrant_client():
-    """Get a Qdrant client instance."""
-    from qdrant_client import QdrantClient
+    """
+    Get the shared Qdrant client instance, so its connection pool is reused
+    across requests. QDRANT_URL=":memory:" selects the local in-memory mode.
+    """
+    global _qdrant_client
+    if _qdrant_client is None:
+        from qdrant_client import QdrantClient
+
+        if QDRANT_URL == ":memory:":
+            _qdrant_client = QdrantClient(location=":memory:")
+        else:
+            _qdrant_client = QdrantClient(url=QDRANT_URL)
+    return _qdrant_client
+
+
+def _lru_get(cache: OrderedDict, lock, key):
+    with lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _lru_put(cache: OrderedDict, lock, key, value, maxsize: int):
+    with lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+
+
+def embed_query(embedder, text: str) -> list[float]:
+    """`embedder.embed_query`, memoized in a bounded LRU keyed by (model, text)."""
+    from .embedding_cache import embedder_key
+
+    key = (embedder_key(embedder), text)
+    vector = _lru_get(_query_embeddings, _query_embeddings_lock, key)
+    if vector is None:
+        vector = embedder.embed_query(text)
+        _lru_put(
+            _query_embeddings,
+            _query_embeddings_lock,
+            key,
+            vector,
+            QUERY_EMBEDDING_CACHE_SIZE,
+        )
+    return vector
+
+
+def _iam_cache_versions():
+    from iam.cache_builders import get_cache_versions
 
-    return QdrantClient(url=QDRANT_URL)
+    try:
+        return tuple(sorted(get_cache_versions().items()))
+    except Exception as e:
+        logger.debug("iam_cache_versions_unavailable", error=str(e))
+        return None
 
 
 def get_accessible_folder_ids(user) -> list[str]:
-    """Get all folder IDs the user has access to, as strings for Qdrant filtering."""
+    """
+    Get all folder IDs the user has access to, as strings for Qdrant filtering.
+
+    The result only depends on the IAM snapshot caches (folders, roles,
+    groups, assignments) and the focus folder, so it is memoized per user
+    until one of those cache versions changes.
+    """
+    user_id = getattr(user, "id", None)
+    versions = (
+        _iam_cache_versions()
+        if user_id is not None and getattr(user, "is_authenticated", False)
+        else None
+    )
+    key = (user_id, focus_folder_id_var.get(), versions)
+    if versions is not None:
+        cached = _lru_get(_accessible_folders, _accessible_folders_lock, key)
+        if cached is not None:
+            return list(cached)
+
     root = Folder.get_root_folder()
     folder_ids = RoleAssignment.get_accessible_folder_ids(
         folder=root,
         user=user,
         content_type=Folder.ContentType.DOMAIN,
     )
-    return [str(fid) for fid in folder_ids]
+    folder_ids = [str(fid) for fid in folder_ids]
+    if versions is not None:
+        _lru_put(
+            _accessible_folders,
+            _accessible_folders_lock,
+            key,
+            tuple(folder_ids),
+            ACCESSIBLE_FOLDERS_CACHE_SIZE,
+        )
+    return folder_ids
 
 
 def search(
@@ -63,26 +160,32 @@ def search(
     """
     Permission-aware semantic search over the vector store.
 
-    Searches two partitions and merges results:
+    Searches two partitions in one batched Qdrant request and merges results:
     - User data (models, documents): filtered by accessible folders
     - Library knowledge (frameworks, threats): shared, no folder filter
 
     Results are merged and sorted by score.
     """
-    from qdrant_client.models import Filter, FieldCondition, MatchAny, MatchValue
+    from qdrant_client.models import (
+        FieldCondition,
+        Filter,
+        MatchAny,
+        MatchValue,
+        QueryRequest,
+    )
 
     from .providers import get_embedder
 
     client = get_qdrant_client()
     embedder = get_embedder()
 
-    query_vector = embedder.embed_query(query)
-    all_results = []
+    query_vector = embed_query(embedder, query)
 
     # Over-fetch to have enough candidates for re-ranking
     fetch_limit = top_k * 3
+    requests = []
 
-    # --- Search 1: User data (permission-filtered) ---
+    # --- Partition 1: User data (permission-filtered) ---
     if source_type != "library":
         accessible_folders = get_accessible_folder_ids(user)
         user_conditions = [
@@ -99,19 +202,10 @@ def search(
             user_conditions.append(
                 FieldCondition(key="object_type", match=MatchValue(value=object_type))
             )
+        if accessible_folders:
+            requests.append(("user", Filter(must=user_conditions)))
 
-        try:
-            user_results = client.query_points(
-                collection_name=COLLECTION_NAME,
-                query=query_vector,
-                limit=fetch_limit,
-                query_filter=Filter(must=user_conditions),
-            )
-            all_results.extend(user_results.points)
-        except Exception as e:
-            logger.error("qdrant_user_search_failed", error=e)
-
-    # --- Search 2: Library knowledge (shared, no folder filter) ---
+    # --- Partition 2: Library knowledge (shared, no folder filter) ---
     if source_type in (None, "library"):
         library_conditions = [
             FieldCondition(key="source_type", match=MatchValue(value="library"))
@@ -120,17 +214,40 @@ def search(
             library_conditions.append(
                 FieldCondition(key="object_type", match=MatchValue(value=object_type))
             )
+        requests.append(("library", Filter(must=library_conditions)))
 
+    all_results = []
+    if requests:
         try:
-            library_results = client.query_points(
+            responses = client.query_batch_points(
                 collection_name=COLLECTION_NAME,
-                query=query_vector,
-                limit=fetch_limit,
-                query_filter=Filter(must=library_conditions),
+                requests=[
+                    QueryRequest(
+                        query=query_vector,
+                        filter=query_filter,
+                        limit=fetch_limit,
+                        with_payload=True,
+                    )
+                    for _, query_filter in requests
+                ],
             )
-            all_results.extend(library_results.points)
+            for response in responses:
+                all_results.extend(response.points)
         except Exception as e:
-            logger.error("qdrant_library_search_failed", error=e)
+            # One failing partition must not cost the results of the other:
+            # retry them one by one.
+            logger.warning("qdrant_batch_search_failed", error=e)
+            for partition, query_filter in requests:
+                try:
+                    response = client.query_points(
+                        collection_name=COLLECTION_NAME,
+                        query=query_vector,
+                        limit=fetch_limit,
+                        query_filter=query_filter,
+                    )
+                    all_results.extend(response.points)
+                except Exception as e:
+                    logger.error(f"qdrant_{partition}_search_failed", error=e)
 
     # Merge and deduplicate
     seen_ids = set()
@@ -147,7 +264,9 @@ def search(
         t0 = time.time()
         pairs = [(query, r.payload.get("text", "")[:512]) for r in merged]
         try:
-            scores = reranker.predict(pairs)
+            scores = reranker.predict(
+                pairs, batch_size=min(len(pairs), _RERANK_BATCH_SIZE)
+            )
             ranked = sorted(zip(scores, merged), key=lambda x: x[0], reverse=True)
             merged = [r for _, r in ranked[:top_k]]
             logger.info(
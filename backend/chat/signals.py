@@ -54,30 +54,27 @@ def connect_signals():
     from global_settings.utils import ff_is_enabled
 
     for model_class in _get_model_classes():
-
+        # Saves and deletes are coalesced per object in the index queue (rolled
+        # back with the surrounding transaction) and flushed in batches.
         @receiver(post_save, sender=model_class, weak=False)
         def on_save(sender, instance, **kwargs):
             if not ff_is_enabled("chat_mode"):
                 return
             from django.db import transaction
-            from .tasks import index_model_object
+            from .index_queue import enqueue, schedule_flush
 
-            app = sender._meta.app_label
-            name = sender.__name__
-            obj_id = str(instance.id)
-            transaction.on_commit(lambda: index_model_object(app, name, obj_id))
+            enqueue(sender._meta.app_label, sender.__name__, instance.id, "index")
+            transaction.on_commit(schedule_flush)
 
         @receiver(post_delete, sender=model_class, weak=False)
         def on_delete(sender, instance, **kwargs):
             if not ff_is_enabled("chat_mode"):
                 return
             from django.db import transaction
-            from .tasks import remove_model_object
+            from .index_queue import enqueue, schedule_flush
 
-            app = sender._meta.app_label
-            name = sender.__name__
-            obj_id = str(instance.id)
-            transaction.on_commit(lambda: remove_model_object(app, name, obj_id))
+            enqueue(sender._meta.app_label, sender.__name__, instance.id, "remove")
+            transaction.on_commit(schedule_flush)
 
     # Auto-ingest evidence attachments when a new revision is uploaded
     _connect_evidence_signal(ff_is_enabled)
@@ -6,7 +6,8 @@ import structlog
 import uuid
 
 from django.utils import timezone
-from huey.contrib.djhuey import db_task
+from huey import crontab
+from huey.contrib.djhuey import db_periodic_task, db_task
 
 logger = structlog.get_logger(__name__)
 
@@ -93,7 +94,7 @@ def index_model_object(app_label: str, model_name: str, object_id: str):
     from django.apps import apps
 
     from .providers import get_embedder
-    from .rag import COLLECTION_NAME, get_qdrant_client
+    from .rag import get_qdrant_client
 
     try:
         model_class = apps.get_model(app_label, model_name)
@@ -112,30 +113,17 @@ def index_model_object(app_label: str, model_name: str, object_id: str):
         return
 
     try:
-        embedder = get_embedder()
-        vector = embedder.embed_query(text)
-
-        from qdrant_client.models import PointStruct
+        from .embedding_cache import upsert_model_points
 
-        client = get_qdrant_client()
-        point = PointStruct(
-            id=str(
-                uuid.uuid5(uuid.NAMESPACE_URL, f"{app_label}.{model_name}:{object_id}")
-            ),
-            vector=vector,
-            payload={
-                "text": text,
-                "folder_id": folder_id,
-                "source_type": "model",
-                "object_type": _normalize_model_name(model_name),
-                "object_id": object_id,
-                "name": str(obj),
-                "ref_id": getattr(obj, "ref_id", "") or "",
-            },
+        upserted, _ = upsert_model_points(
+            get_qdrant_client(),
+            get_embedder(),
+            [(app_label, model_name, obj, text, folder_id)],
         )
-
-        client.upsert(collection_name=COLLECTION_NAME, points=[point])
-        logger.debug("Indexed %s.%s/%s", app_label, model_name, object_id)
+        if upserted:
+            logger.debug("Indexed %s.%s/%s", app_label, model_name, object_id)
+        else:
+            logger.debug("Unchanged %s.%s/%s", app_label, model_name, object_id)
 
     except Exception as e:
         logger.error(
@@ -160,6 +148,9 @@ def remove_model_object(app_label: str, model_name: str, object_id: str):
                 ]
             ),
         )
+        from .embedding_cache import forget_points, model_point_id
+
+        forget_points([model_point_id(app_label, model_name, object_id)])
         logger.debug("Removed %s.%s/%s from index", app_label, model_name, object_id)
     except Exception as e:
         logger.error(
@@ -167,6 +158,32 @@ def remove_model_object(app_label: str, model_name: str, object_id: str):
         )
 
 
+@db_task()
+def flush_index_queue():
+    """
+    Async task: drain the coalesced re-indexing queue in batches.
+    Reschedules itself while operations are still inside their debounce window.
+    """
+    from .index_queue import DEBOUNCE_SECONDS, flush
+
+    stats = flush()
+    if stats["backlog"]:
+        flush_index_queue.schedule(delay=DEBOUNCE_SECONDS)
+
+
+@db_periodic_task(crontab(minute="*"))
+def flush_index_queue_periodic():
+    """Safety net for flushes lost with a worker restart."""
+    from django.db import DatabaseError
+
+    from .index_queue import flush
+
+    try:
+        flush()
+    except DatabaseError:
+        logger.warning("Chat tables do not exist yet — skipping index queue flush")
+
+
 def _resolve_folder_id(obj) -> str:
     """Walk the FK chain to find a folder_id for a model object.
 
@@ -203,236 +220,20 @@ from .text import (  # noqa: F401 — re-exported for callers that import via ta
 # Library knowledge base indexing
 # ---------------------------------------------------------------------------
 
-LIBRARY_DIR = None  # Resolved lazily
-
-
-def _get_library_dir():
-    """Get the path to the YAML library directory."""
-    global LIBRARY_DIR
-    if LIBRARY_DIR is None:
-        from pathlib import Path
-
-        LIBRARY_DIR = Path(__file__).resolve().parent.parent / "library" / "libraries"
-    return LIBRARY_DIR
-
-
-def _parse_library_yaml(filepath) -> list[dict]:
-    """
-    Parse a YAML library file and extract indexable entries.
-    Returns a list of dicts with: urn, ref_id, name, description, etc.
-    """
-    import yaml
-
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except Exception as e:
-        logger.warning("failed_to_parse_yaml", file=str(filepath), error=e)
-        return []
-
-    if not isinstance(data, dict):
-        return []
-
-    library_name = data.get("name", "")
-    library_ref_id = data.get("ref_id", "")
-    locale = data.get("locale", "en")
-    provider = data.get("provider", "")
-
-    entries = []
-    objects = data.get("objects", {})
-
-    # Index the library itself as a summary entry
-    if library_name:
-        lib_description = data.get("description", "")
-        entries.append(
-            {
-                "urn": data.get("urn", ""),
-                "ref_id": library_ref_id,
-                "name": library_name,
-                "description": lib_description,
-                "annotation": "",
-                "framework": library_name,
-                "framework_ref_id": library_ref_id,
-                "provider": provider,
-                "locale": locale,
-                "object_type": "framework",
-            }
-        )
-
-    # Extract framework requirement nodes
-    framework = objects.get("framework", {})
-    if isinstance(framework, dict):
-        framework_name = framework.get("name", library_name)
-        framework_ref_id = framework.get("ref_id", library_ref_id)
-        for node in framework.get("requirement_nodes", []):
-            # Skip empty section headers
-            if not node.get("name") and not node.get("description"):
-                continue
-            entries.append(
-                {
-                    "urn": node.get("urn", ""),
-                    "ref_id": node.get("ref_id", ""),
-                    "name": node.get("name", ""),
-                    "description": node.get("description", ""),
-                    "annotation": node.get("annotation", ""),
-                    "framework": framework_name,
-                    "framework_ref_id": framework_ref_id,
-                    "provider": provider,
-                    "locale": locale,
-                    "object_type": "requirement_node",
-                }
-            )
-
-    # Extract threats
-    for threat in objects.get("threats", []):
-        entries.append(
-            {
-                "urn": threat.get("urn", ""),
-                "ref_id": threat.get("ref_id", ""),
-                "name": threat.get("name", ""),
-                "description": threat.get("description", ""),
-                "annotation": "",
-                "framework": library_name,
-                "framework_ref_id": library_ref_id,
-                "provider": provider,
-                "locale": locale,
-                "object_type": "library_threat",
-            }
-        )
-
-    # Extract reference controls
-    for ctrl in objects.get("reference_controls", []):
-        entries.append(
-            {
-                "urn": ctrl.get("urn", ""),
-                "ref_id": ctrl.get("ref_id", ""),
-                "name": ctrl.get("name", ""),
-                "description": ctrl.get("description", ""),
-                "annotation": ctrl.get("annotation", ""),
-                "framework": library_name,
-                "framework_ref_id": library_ref_id,
-                "provider": provider,
-                "locale": locale,
-                "object_type": "reference_control",
-            }
-        )
-
-    return entries
-
-
-def _build_library_entry_text(entry: dict) -> str:
-    """Build searchable text for a library entry."""
-    parts = [f"Framework: {entry['framework']}"]
-    if entry.get("ref_id"):
-        parts.append(f"Reference: {entry['ref_id']}")
-    if entry.get("name"):
-        parts.append(f"Name: {entry['name']}")
-    if entry.get("description"):
-        parts.append(f"Description: {entry['description']}")
-    if entry.get("annotation"):
-        parts.append(f"Guidance: {entry['annotation']}")
-    return "\n".join(parts)
-
 
 @db_task()
-def index_library_knowledge_base():
+def index_library_knowledge_base(force: bool = False):
     """
-    Async task: parse all YAML library files and index requirement nodes,
-    threats, and reference controls into Qdrant as shared knowledge.
+    Async task: index requirement nodes, threats, and reference controls
+    of the YAML libraries into Qdrant as shared knowledge.
 
     Uses source_type="library" — accessible to all authenticated users
-    without folder-based permission filtering.
+    without folder-based permission filtering. Only libraries changed since
+    the last run are parsed and re-embedded (see chat.library_index).
     """
-    import time
-
-    from .providers import get_embedder
-    from .rag import COLLECTION_NAME, get_qdrant_client
-
-    t0 = time.time()
-    library_dir = _get_library_dir()
-    if not library_dir.exists():
-        logger.warning("library_dir_not_found", path=str(library_dir))
-        return
-
-    yaml_files = sorted(library_dir.glob("*.yaml"))
-    logger.info("library_indexing_started", file_count=len(yaml_files))
-
-    # Collect all entries from all YAML files
-    all_entries = []
-    for filepath in yaml_files:
-        entries = _parse_library_yaml(filepath)
-        all_entries.extend(entries)
-
-    if not all_entries:
-        logger.info("library_indexing_no_entries")
-        return
-
-    logger.info(
-        "library_entries_parsed",
-        count=len(all_entries),
-        duration=round(time.time() - t0, 2),
-    )
-
-    # Embed in batches
-    embedder = get_embedder()
-    client = get_qdrant_client()
-
-    from qdrant_client.models import PointStruct
-
-    BATCH_SIZE = 100
-    total_indexed = 0
-
-    for batch_start in range(0, len(all_entries), BATCH_SIZE):
-        batch = all_entries[batch_start : batch_start + BATCH_SIZE]
-        texts = [_build_library_entry_text(e) for e in batch]
-
-        try:
-            embeddings = embedder.embed(texts)
-        except Exception as e:
-            logger.error(
-                "library_embedding_failed",
-                batch_start=batch_start,
-                error=e,
-            )
-            continue
-
-        points = []
-        for entry, embedding in zip(batch, embeddings):
-            point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"library:{entry['urn']}"))
-            points.append(
-                PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload={
-                        "text": _build_library_entry_text(entry),
-                        "source_type": "library",
-                        "object_type": entry["object_type"],
-                        "urn": entry["urn"],
-                        "ref_id": entry.get("ref_id", ""),
-                        "name": entry.get("name", ""),
-                        "framework": entry["framework"],
-                        "framework_ref_id": entry.get("framework_ref_id", ""),
-                        "provider": entry.get("provider", ""),
-                        "locale": entry.get("locale", "en"),
-                    },
-                )
-            )
-
-        try:
-            client.upsert(collection_name=COLLECTION_NAME, points=points)
-            total_indexed += len(points)
-        except Exception as e:
-            logger.error(
-                "library_upsert_failed",
-                batch_start=batch_start,
-                error=e,
-            )
+    from .library_index import index_libraries
 
-    logger.info(
-        "library_indexing_complete",
-        total_indexed=total_indexed,
-        duration=round(time.time() - t0, 2),
-    )
+    return index_libraries(force=force)
 
 
 @db_task()
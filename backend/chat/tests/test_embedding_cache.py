@@ -0,0 +1,91 @@
+"""Tests for the content-hash embedding cache and point change detection."""
+
+import pytest
+
+
+class CountingEmbedder:
+    model_name = "counting"
+
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestKeys:
+    def test_embedder_key_includes_model(self):
+        from chat.embedding_cache import embedder_key
+
+        assert embedder_key(CountingEmbedder()) == "CountingEmbedder:counting"
+
+    def test_fingerprint_changes_with_payload(self):
+        from chat.embedding_cache import point_fingerprint
+
+        embedder = CountingEmbedder()
+        a = point_fingerprint(embedder, {"text": "x", "name": "a"})
+        assert a == point_fingerprint(embedder, {"name": "a", "text": "x"})
+        assert a != point_fingerprint(embedder, {"text": "x", "name": "b"})
+
+
+@pytest.mark.django_db
+class TestEmbedTexts:
+    def test_only_misses_are_embedded_once(self):
+        from chat.embedding_cache import embed_texts
+
+        embedder = CountingEmbedder()
+        first = embed_texts(embedder, ["alpha", "beta", "alpha"])
+        assert embedder.calls == [["alpha", "beta"]]
+        assert first[0] == first[2]
+
+        second = embed_texts(embedder, ["beta", "gamma"])
+        assert embedder.calls[-1] == ["gamma"]
+        assert second[0] == first[1]
+
+    def test_cache_is_scoped_per_embedder(self):
+        from chat.embedding_cache import embed_texts
+
+        embed_texts(CountingEmbedder(), ["alpha"])
+        other = CountingEmbedder()
+        other.model_name = "other"
+        embed_texts(other, ["alpha"])
+        assert other.calls == [["alpha"]]
+
+
+@pytest.mark.django_db
+class TestPointStates:
+    def test_unchanged_points_are_detected(self):
+        from chat.embedding_cache import (
+            forget_points,
+            record_points,
+            unchanged_point_ids,
+        )
+
+        point_id = "3f1c7a52-8f0b-5a4e-9a53-2f4f4d0f1a11"
+        record_points([(point_id, "fp1", "hash")])
+        assert unchanged_point_ids({point_id: "fp1"}) == {point_id}
+        assert unchanged_point_ids({point_id: "fp2"}) == set()
+
+        record_points([(point_id, "fp2", "hash")])
+        assert unchanged_point_ids({point_id: "fp2"}) == {point_id}
+
+        forget_points([point_id])
+        assert unchanged_point_ids({point_id: "fp2"}) == set()
+
+    def test_prune_keeps_referenced_embeddings(self):
+        from chat.embedding_cache import (
+            embed_texts,
+            prune_unreferenced_embeddings,
+            record_points,
+            text_sha,
+        )
+        from chat.models import EmbeddingCacheEntry
+
+        embed_texts(CountingEmbedder(), ["kept", "dropped"])
+        record_points(
+            [("3f1c7a52-8f0b-5a4e-9a53-2f4f4d0f1a11", "fp", text_sha("kept"))]
+        )
+        assert prune_unreferenced_embeddings() == 1
+        remaining = EmbeddingCacheEntry.objects.values_list("text_hash", flat=True)
+        assert list(remaining) == [text_sha("kept")]
@@ -0,0 +1,95 @@
+"""Tests for the coalesced RAG re-indexing queue."""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+
+@pytest.mark.django_db
+class TestIndexQueue:
+    def test_repeated_saves_coalesce_into_one_operation(self):
+        from chat.index_queue import enqueue, queue_stats
+        from chat.models import PendingIndexOperation
+
+        for _ in range(3):
+            enqueue("core", "AppliedControl", "a1")
+        enqueue("core", "AppliedControl", "a2")
+        enqueue("core", "AppliedControl", "a1", "remove")
+
+        assert PendingIndexOperation.objects.count() == 2
+        op = PendingIndexOperation.objects.get(object_id="a1")
+        assert op.action == PendingIndexOperation.Action.REMOVE
+
+        stats = queue_stats()
+        assert stats["backlog"] == 2
+        assert stats["backlog_index"] == 1
+        assert stats["backlog_remove"] == 1
+
+    def test_claim_respects_debounce_window(self):
+        from chat.index_queue import DEBOUNCE_SECONDS, _claim, enqueue
+        from chat.models import PendingIndexOperation
+
+        enqueue("core", "Asset", "fresh")
+        enqueue("core", "Asset", "quiet")
+        PendingIndexOperation.objects.filter(object_id="quiet").update(
+            last_enqueued_at=timezone.now() - timedelta(seconds=DEBOUNCE_SECONDS + 1)
+        )
+
+        claimed = _claim(10, "w1")
+        assert [op.object_id for op in claimed] == ["quiet"]
+        assert [op.object_id for op in _claim(10, "w2", ignore_debounce=True)] == [
+            "fresh"
+        ]
+
+    def test_claimed_operations_are_kept_until_completed(self):
+        from chat.index_queue import _claim, _complete, enqueue
+        from chat.models import PendingIndexOperation
+
+        enqueue("core", "Asset", "a1")
+        claimed = _claim(10, "w1", ignore_debounce=True)
+
+        assert PendingIndexOperation.objects.get(object_id="a1").claimed_by == "w1"
+        assert _claim(10, "w2", ignore_debounce=True) == []
+
+        _complete(claimed, "w1")
+        assert not PendingIndexOperation.objects.exists()
+
+    def test_expired_lease_is_reclaimed_after_a_crash(self):
+        from chat.index_queue import LEASE_SECONDS, _claim, enqueue
+        from chat.models import PendingIndexOperation
+
+        enqueue("core", "Asset", "a1")
+        _claim(10, "crashed", ignore_debounce=True)
+        PendingIndexOperation.objects.update(
+            claimed_at=timezone.now() - timedelta(seconds=LEASE_SECONDS + 1)
+        )
+
+        reclaimed = _claim(10, "w2", ignore_debounce=True)
+        assert [op.object_id for op in reclaimed] == ["a1"]
+        assert PendingIndexOperation.objects.get().claimed_by == "w2"
+
+    def test_enqueue_during_lease_survives_completion(self):
+        from chat.index_queue import _claim, _complete, enqueue
+        from chat.models import PendingIndexOperation
+
+        enqueue("core", "Asset", "a1")
+        claimed = _claim(10, "w1", ignore_debounce=True)
+        enqueue("core", "Asset", "a1", "remove")
+        _complete(claimed, "w1")
+
+        op = PendingIndexOperation.objects.get(object_id="a1")
+        assert op.action == PendingIndexOperation.Action.REMOVE
+        assert op.claimed_at is None
+
+    def test_requeue_drops_after_max_attempts(self):
+        from chat.index_queue import MAX_ATTEMPTS, _claim, _requeue, enqueue
+        from chat.models import PendingIndexOperation
+
+        enqueue("core", "Threat", "t1")
+        for attempt in range(MAX_ATTEMPTS):
+            worker = f"w{attempt}"
+            claimed = _claim(10, worker, ignore_debounce=True)
+            assert len(claimed) == 1
+            _requeue(claimed, worker)
+        assert not PendingIndexOperation.objects.exists()
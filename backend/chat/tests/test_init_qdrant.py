@@ -0,0 +1,82 @@
+"""Tests for the init_qdrant command against the in-memory Qdrant mode."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+pytest.importorskip("qdrant_client")
+
+POINT_ID = "3f1c7a52-8f0b-5a4e-9a53-2f4f4d0f1a11"
+
+
+class FixedEmbedder:
+    model_name = "fixed"
+    dimensions = 3
+
+
+@pytest.fixture
+def qdrant(monkeypatch):
+    from qdrant_client import QdrantClient
+
+    import chat.providers
+    from chat.management.commands import init_qdrant
+
+    client = QdrantClient(location=":memory:")
+    monkeypatch.setattr(init_qdrant, "get_qdrant_client", lambda: client)
+    monkeypatch.setattr(chat.providers, "get_embedder", lambda: FixedEmbedder())
+    return client
+
+
+@pytest.fixture
+def point_states(db):
+    from chat.embedding_cache import record_points
+    from chat.models import IndexedLibrary
+
+    record_points([(POINT_ID, "fp", "hash")])
+    IndexedLibrary.objects.create(
+        filename="alpha.yaml",
+        urn="urn:test:lib:alpha",
+        version=1,
+        content_hash="hash",
+        embedder="FixedEmbedder:fixed",
+    )
+
+
+def run(*args):
+    out = StringIO()
+    call_command("init_qdrant", *args, stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestInitQdrant:
+    def test_new_collection_resets_point_states(self, qdrant, point_states):
+        from chat.embedding_cache import unchanged_point_ids
+        from chat.models import IndexedLibrary
+        from chat.rag import COLLECTION_NAME
+
+        run()
+
+        assert qdrant.collection_exists(COLLECTION_NAME)
+        assert unchanged_point_ids({POINT_ID: "fp"}) == set()
+        assert not IndexedLibrary.objects.exists()
+
+    def test_existing_collection_keeps_point_states(self, qdrant, point_states):
+        from chat.embedding_cache import record_points, unchanged_point_ids
+
+        run()
+        record_points([(POINT_ID, "fp", "hash")])
+
+        assert "already exists" in run()
+        assert unchanged_point_ids({POINT_ID: "fp"}) == {POINT_ID}
+
+    def test_recreate_resets_point_states(self, qdrant, point_states):
+        from chat.embedding_cache import record_points, unchanged_point_ids
+
+        run()
+        record_points([(POINT_ID, "fp", "hash")])
+
+        run("--recreate")
+
+        assert unchanged_point_ids({POINT_ID: "fp"}) == set()
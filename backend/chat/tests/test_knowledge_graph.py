@@ -161,3 +161,251 @@ class TestFormatGraphResult:
         assert "empty" not in result
         assert "null" not in result
         assert "blank" not in result
+
+
+class TestCompactGraph:
+    def test_roundtrip_matches_digraph(self, small_graph, tmp_path):
+        from chat.graph_store import CompactGraph, write_compact_graph
+
+        small_graph.add_edge(
+            "urn:intuitem:risk:framework:iso27001-2022",
+            "urn:intuitem:risk:req:some-requirement",
+            edge_type="has_requirement",
+        )
+        small_graph.add_edge(
+            "urn:intuitem:risk:req:some-requirement",
+            "urn:intuitem:risk:threat:auto-created",
+            edge_type="addresses_threat",
+        )
+        write_compact_graph(small_graph, tmp_path / "kg.kgs", source_digest="abc")
+        store = CompactGraph(tmp_path / "kg.kgs")
+
+        assert store.source_digest == "abc"
+        assert list(store.nodes()) == list(small_graph.nodes())
+        assert store.number_of_edges() == small_graph.number_of_edges()
+        for urn, attrs in small_graph.nodes(data=True):
+            assert store[urn] == attrs
+            assert list(store.out_edges(urn, data=True)) == list(
+                small_graph.out_edges(urn, data=True)
+            )
+            assert list(store.in_edges(urn, data=True)) == list(
+                small_graph.in_edges(urn, data=True)
+            )
+        assert "missing" not in store
+        assert store.get("missing") is None
+
+    def test_returned_attrs_do_not_alias_the_record_cache(self, small_graph, tmp_path):
+        from chat.graph_store import CompactGraph, write_compact_graph
+
+        write_compact_graph(small_graph, tmp_path / "kg.kgs")
+        store = CompactGraph(tmp_path / "kg.kgs")
+        urn, attrs = next(iter(small_graph.nodes(data=True)))
+
+        store[urn]["name"] = "mutated"
+        store.attrs_of(store.index_of(urn)).clear()
+        assert store[urn] == attrs
+        assert _resolve_framework(store, "3CF") == _resolve_framework(
+            small_graph, "3CF"
+        )
+
+
+LIBRARY_YAML = """
+urn: urn:test:library:{name}
+name: {name}
+objects:
+  framework:
+    urn: urn:test:framework:{name}
+    ref_id: {name}
+    name: Framework {name}
+    requirement_nodes:
+      - urn: urn:test:req:{name}:1
+        ref_id: "1"
+        name: {title}
+"""
+
+
+class TestIncrementalBuild:
+    @pytest.fixture
+    def library(self, tmp_path, monkeypatch):
+        import chat.knowledge_graph as kg
+
+        lib_dir = tmp_path / "libraries"
+        lib_dir.mkdir()
+        monkeypatch.setattr(kg, "_get_library_dir", lambda: lib_dir)
+        monkeypatch.setattr(kg, "_STORE_FILE", tmp_path / "cache" / "kg.kgs")
+        monkeypatch.setattr(kg, "_FRAGMENT_DIR", tmp_path / "cache" / "fragments")
+        monkeypatch.setattr(kg, "_LEGACY_CACHE_FILE", tmp_path / "cache" / "kg.pkl")
+        for name in ("alpha", "beta"):
+            (lib_dir / f"{name}.yaml").write_text(
+                LIBRARY_YAML.format(name=name, title="Original")
+            )
+        return lib_dir
+
+    def test_only_changed_files_are_reparsed(self, library, monkeypatch):
+        import chat.knowledge_graph as kg
+
+        graph = kg._load_or_build()
+        assert isinstance(graph, kg.CompactGraph)
+        assert graph["urn:test:req:alpha:1"]["name"] == "Original"
+
+        # Unchanged libraries: the shared store is mapped as-is.
+        assert kg._load_or_build().source_digest == graph.source_digest
+
+        parsed = []
+        original_parse = kg._parse_fragment
+        monkeypatch.setattr(
+            kg,
+            "_parse_fragment",
+            lambda path: parsed.append(path.name) or original_parse(path),
+        )
+        (library / "beta.yaml").write_text(
+            LIBRARY_YAML.format(name="beta", title="Updated")
+        )
+        graph = kg._load_or_build()
+
+        assert parsed == ["beta.yaml"]
+        assert graph["urn:test:req:beta:1"]["name"] == "Updated"
+        assert graph["urn:test:req:alpha:1"]["name"] == "Original"
+        assert len(list(kg._FRAGMENT_DIR.glob("*.pkl"))) == 2
+
+
+@pytest.fixture
+def search_graph():
+    G = DiGraph()
+    G.add_node(
+        "urn:fw:iso",
+        node_type="framework",
+        name="ISO/IEC 27001:2022",
+        ref_id="ISO-27001-2022",
+        provider="ISO",
+    )
+    G.add_node(
+        "urn:fw:nist",
+        node_type="framework",
+        name="NIST CSF",
+        ref_id="NIST-CSF-2.0",
+        provider="NIST",
+    )
+    requirements = [
+        ("urn:req:iso:a51", "urn:fw:iso", "A.5.15", "Access control", ""),
+        ("urn:req:iso:a52", "urn:fw:iso", "A.8.5", "Secure authentication", ""),
+        (
+            "urn:req:nist:pr",
+            "urn:fw:nist",
+            "PR.AA-01",
+            "Identities",
+            "Identities and credentials for authorized users are managed; "
+            "access control is enforced",
+        ),
+    ]
+    for urn, fw, ref_id, name, description in requirements:
+        G.add_node(
+            urn,
+            node_type="requirement_node",
+            ref_id=ref_id,
+            name=name,
+            description=description,
+            framework_urn=fw,
+        )
+        G.add_edge(fw, urn, edge_type="has_requirement")
+    G.add_node(
+        "urn:threat:ransom",
+        node_type="threat",
+        name="Ransomware",
+        ref_id="T1",
+        description="Malware encrypting data",
+    )
+    G.add_edge("urn:req:iso:a52", "urn:threat:ransom", edge_type="addresses_threat")
+    return G
+
+
+class TestGraphIndex:
+    def test_prefix_candidates_and_short_tokens(self, search_graph):
+        from chat.knowledge_graph import get_graph_index
+
+        index = get_graph_index(search_graph)
+        urns = lambda ids: {index.urn_of(i) for i in ids}  # noqa: E731
+        assert urns(index.candidates("authenti")) == {"urn:req:iso:a52"}
+        assert urns(index.candidates("access control")) == {
+            "urn:req:iso:a51",
+            "urn:req:nist:pr",
+        }
+        assert index.candidates("ac") == set()  # too short for a prefix match
+        assert index.candidates("   ") is None
+        assert urns(index.requirements_of("urn:fw:iso")) == {
+            "urn:req:iso:a51",
+            "urn:req:iso:a52",
+        }
+
+    def test_search_ranks_title_matches_first(self, search_graph, monkeypatch):
+        import chat.knowledge_graph as kg
+
+        monkeypatch.setattr(kg, "_graph", search_graph)
+        results = kg.search_requirements("access control")
+        assert [r["urn"] for r in results] == ["urn:req:iso:a51", "urn:req:nist:pr"]
+        assert [r["urn"] for r in kg.search_requirements("access", "NIST CSF")] == [
+            "urn:req:nist:pr"
+        ]
+
+    def test_substring_fallback(self, search_graph, monkeypatch):
+        import chat.knowledge_graph as kg
+
+        monkeypatch.setattr(kg, "_graph", search_graph)
+        # "o" is too short for a prefix match: the substring scan finds "ISO-27001".
+        assert [f["urn"] for f in kg.find_frameworks("O-27001")] == ["urn:fw:iso"]
+
+    def test_query_words_need_not_be_adjacent(self, search_graph, monkeypatch):
+        import chat.knowledge_graph as kg
+
+        monkeypatch.setattr(kg, "_graph", search_graph)
+        # The former substring scan required "control access" verbatim.
+        assert [r["urn"] for r in kg.search_requirements("control access")] == [
+            "urn:req:iso:a51",
+            "urn:req:nist:pr",
+        ]
+        # Words may come from different fields (ref_id and name).
+        assert [r["urn"] for r in kg.search_requirements("A.8.5 secure")] == [
+            "urn:req:iso:a52"
+        ]
+
+    def test_mid_word_fragment_only_matches_without_prefix_hit(
+        self, search_graph, monkeypatch
+    ):
+        import chat.knowledge_graph as kg
+
+        monkeypatch.setattr(kg, "_graph", search_graph)
+        # "thent" prefixes no token: the substring fallback finds it.
+        assert [r["urn"] for r in kg.search_requirements("thent")] == [
+            "urn:req:iso:a52"
+        ]
+        # "ident" prefixes "identities": mid-word hits such as "authentication"
+        # are not added on top of the index matches.
+        assert [r["urn"] for r in kg.search_requirements("ident")] == [
+            "urn:req:nist:pr"
+        ]
+
+    def test_threats_and_stats(self, search_graph, monkeypatch):
+        import chat.knowledge_graph as kg
+
+        monkeypatch.setattr(kg, "_graph", search_graph)
+        results = kg.find_controls_for_threat("ransom")
+        assert [r["requirement"]["urn"] for r in results] == ["urn:req:iso:a52"]
+
+        stats = kg.get_graph_stats()
+        assert stats["node_types"] == {
+            "framework": 2,
+            "requirement_node": 3,
+            "threat": 1,
+        }
+        assert stats["edge_types"] == {"has_requirement": 3, "addresses_threat": 1}
+
+    def test_store_index_matches_memory_index(self, search_graph, tmp_path):
+        from chat.graph_store import CompactGraph, GraphIndex, write_compact_graph
+
+        write_compact_graph(search_graph, tmp_path / "kg.kgs")
+        stored = CompactGraph(tmp_path / "kg.kgs").index
+        memory = GraphIndex.build(search_graph)
+        for query in ("access", "authentication", "ransomware malware", "zzz"):
+            assert stored.candidates(query) == memory.candidates(query)
+        assert stored.node_type_counts() == memory.node_type_counts()
+        assert stored.edge_type_counts == memory.edge_type_counts
@@ -0,0 +1,173 @@
+"""Tests for incremental library knowledge-base indexing."""
+
+import pytest
+
+LIBRARY = """
+urn: urn:test:lib:{name}
+name: {name}
+ref_id: {name}
+version: {version}
+objects:
+  framework:
+    name: {name}
+    requirement_nodes:
+{nodes}
+"""
+
+
+def write_library(directory, name, nodes, version=1):
+    lines = "\n".join(
+        f"      - urn: urn:test:req:{name}:{ref}\n"
+        f"        ref_id: '{ref}'\n"
+        f"        name: {text}"
+        for ref, text in nodes.items()
+    )
+    (directory / f"{name}.yaml").write_text(
+        LIBRARY.format(name=name, version=version, nodes=lines)
+    )
+
+
+class CountingEmbedder:
+    model_name = "counting"
+
+    def __init__(self):
+        self.texts = []
+
+    def embed(self, texts):
+        self.texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeClient:
+    def __init__(self):
+        self.points = {}
+
+    def upsert(self, collection_name, points):
+        for point in points:
+            self.points[point.id] = point.payload
+
+    def delete(self, collection_name, points_selector):
+        for point_id in points_selector.points:
+            self.points.pop(point_id, None)
+
+    def scroll(self, collection_name, limit, **kwargs):
+        return list(self.points)[:limit], None
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    import chat.providers
+    import chat.rag
+
+    embedder = CountingEmbedder()
+    client = FakeClient()
+    monkeypatch.setenv("CHAT_METRICS_LOG_PATH", "off")
+    monkeypatch.setattr(chat.providers, "get_embedder", lambda: embedder)
+    monkeypatch.setattr(chat.rag, "get_qdrant_client", lambda: client)
+    return tmp_path, embedder, client
+
+
+def run(directory, **kwargs):
+    from chat.library_index import index_libraries
+
+    kwargs.setdefault("workers", 1)
+    return index_libraries(library_dir=directory, **kwargs)
+
+
+@pytest.mark.django_db
+class TestIndexLibraries:
+    def test_unchanged_libraries_are_skipped(self, env):
+        directory, embedder, client = env
+        write_library(directory, "alpha", {"1": "One", "2": "Two"})
+        write_library(directory, "beta", {"1": "Uno"})
+
+        first = run(directory)
+        assert first["files_parsed"] == 2
+        assert first["entries_indexed"] == 5
+        assert len(client.points) == 5
+
+        embedder.texts.clear()
+        second = run(directory)
+        assert second["files_parsed"] == 0
+        assert second["unchanged_libraries"] == ["alpha.yaml", "beta.yaml"]
+        assert second["entries_unchanged"] == 5
+        assert embedder.texts == []
+
+    def test_wiped_collection_is_reindexed(self, env):
+        directory, _, client = env
+        write_library(directory, "alpha", {"1": "One", "2": "Two"})
+        run(directory)
+
+        client.points.clear()
+        report = run(directory)
+
+        assert report["files_parsed"] == 1
+        assert report["entries_indexed"] == 3
+        assert len(client.points) == 3
+
+    def test_only_changed_entries_are_reembedded(self, env):
+        from chat.library_index import library_point_id
+
+        directory, embedder, client = env
+        write_library(directory, "alpha", {"1": "One", "2": "Two", "3": "Three"})
+        run(directory)
+
+        embedder.texts.clear()
+        write_library(directory, "alpha", {"1": "One", "2": "Deux"}, version=2)
+        report = run(directory)
+
+        assert report["files_parsed"] == 1
+        assert report["entries_indexed"] == 1
+        assert report["points_deleted"] == 1
+        assert library_point_id("urn:test:req:alpha:3") not in client.points
+        assert any("Deux" in text for text in embedder.texts)
+        assert not any("One" in text for text in embedder.texts)
+
+    def test_removed_library_points_are_deleted(self, env):
+        from chat.models import IndexedLibrary
+
+        directory, _, client = env
+        write_library(directory, "alpha", {"1": "One"})
+        write_library(directory, "beta", {"1": "Uno"})
+        run(directory)
+
+        (directory / "beta.yaml").unlink()
+        report = run(directory)
+
+        assert report["files_removed"] == 1
+        assert report["points_deleted"] == 2
+        assert {p["framework"] for p in client.points.values()} == {"alpha"}
+        assert list(IndexedLibrary.objects.values_list("filename", flat=True)) == [
+            "alpha.yaml"
+        ]
+
+    def test_unparsable_library_keeps_its_points(self, env):
+        directory, _, client = env
+        write_library(directory, "alpha", {"1": "One"})
+        run(directory)
+
+        (directory / "alpha.yaml").write_text("objects: [unclosed")
+        report = run(directory)
+
+        assert report["files_failed"] == ["alpha.yaml"]
+        assert report["points_deleted"] == 0
+        assert len(client.points) == 2
+
+    def test_force_reindexes_everything(self, env):
+        directory, embedder, _ = env
+        write_library(directory, "alpha", {"1": "One", "2": "Two"})
+        run(directory)
+
+        report = run(directory, force=True)
+        assert report["files_parsed"] == 1
+        assert report["entries_indexed"] == 3
+
+    def test_process_pool_matches_serial_parse(self, env):
+        from chat.library_index import _parse_libraries
+
+        directory, _, _ = env
+        for name in ("alpha", "beta", "gamma"):
+            write_library(directory, name, {"1": f"{name} one", "2": f"{name} two"})
+        paths = sorted(directory.glob("*.yaml"))
+
+        assert _parse_libraries(paths, "key", 2) == _parse_libraries(paths, "key", 1)
@@ -0,0 +1,150 @@
+"""Tests for OllamaEmbedder batching, concurrency and retries against a stub server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubOllama:
+    """Minimal Ollama stand-in serving /api/embed and /api/embeddings."""
+
+    def __init__(self, latency=0.0, fail_first=0, batch_supported=True):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.batch_supported = batch_supported
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                payload = json.loads(
+                    self.rfile.read(int(self.headers["Content-Length"]))
+                )
+                with stub._lock:
+                    stub.requests.append((self.path, payload))
+                    failing = len(stub.requests) <= stub.fail_first
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.latency)
+                    if failing:
+                        return self._reply(503, {"error": "busy"})
+                    if self.path == "/api/embed" and stub.batch_supported:
+                        vectors = [[float(len(t)), 1.0] for t in payload["input"]]
+                        return self._reply(200, {"embeddings": vectors})
+                    if self.path == "/api/embeddings":
+                        vector = [float(len(payload["prompt"])), 1.0]
+                        return self._reply(200, {"embedding": vector})
+                    return self._reply(404, {"error": "not found"})
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def embedder_factory():
+    from chat.providers import OllamaEmbedder
+
+    def make(stub, **kwargs):
+        kwargs.setdefault("backoff", 0.01)
+        return OllamaEmbedder(model="stub", base_url=stub.base_url, **kwargs)
+
+    return make
+
+
+class TestOllamaEmbedder:
+    def test_texts_are_sent_in_batches_and_order_is_kept(self, embedder_factory):
+        texts = [f"text-{'x' * i}" for i in range(10)]
+        with StubOllama() as stub:
+            embedder = embedder_factory(stub, batch_size=4, max_concurrency=3)
+            vectors = embedder.embed(texts)
+
+        assert vectors == [[float(len(t)), 1.0] for t in texts]
+        assert [path for path, _ in stub.requests] == ["/api/embed"] * 3
+        assert sorted(len(p["input"]) for _, p in stub.requests) == [2, 4, 4]
+
+    def test_concurrency_is_bounded(self, embedder_factory):
+        with StubOllama(latency=0.05) as stub:
+            embedder = embedder_factory(stub, batch_size=1, max_concurrency=3)
+            embedder.embed([str(i) for i in range(12)])
+
+        assert 1 < stub.max_in_flight <= 3
+
+    def test_retryable_errors_are_retried(self, embedder_factory):
+        with StubOllama(fail_first=2) as stub:
+            embedder = embedder_factory(stub, max_retries=3)
+            assert embedder.embed_query("abc") == [3.0, 1.0]
+        assert len(stub.requests) == 3
+
+    def test_gives_up_after_max_retries(self, embedder_factory):
+        import httpx
+
+        with StubOllama(fail_first=10) as stub:
+            embedder = embedder_factory(stub, max_retries=1)
+            with pytest.raises(httpx.HTTPStatusError):
+                embedder.embed_query("abc")
+        assert len(stub.requests) == 2
+
+    def test_falls_back_to_legacy_endpoint(self, embedder_factory):
+        with StubOllama(batch_supported=False) as stub:
+            embedder = embedder_factory(stub)
+            assert embedder.embed(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+            embedder.embed(["c"])
+        paths = [path for path, _ in stub.requests]
+        assert paths.count("/api/embed") == 1
+        assert paths.count("/api/embeddings") == 3
+
+
+class TestOllamaEmbedderBatching:
+    """Batched embedding sends a few full requests instead of one per text."""
+
+    def test_batched_embedder_needs_fewer_requests(self, embedder_factory):
+        texts = [f"requirement {i}" for i in range(64)]
+        with StubOllama() as stub:
+            embedder_factory(stub, batch_size=1, max_concurrency=1).embed(texts)
+            sequential = list(stub.requests)
+            stub.requests.clear()
+            embedder_factory(stub, batch_size=16, max_concurrency=4).embed(texts)
+            batched = list(stub.requests)
+
+        assert [len(payload["input"]) for _, payload in sequential] == [1] * 64
+        assert [len(payload["input"]) for _, payload in batched] == [16] * 4
+        assert sorted(t for _, payload in batched for t in payload["input"]) == sorted(
+            texts
+        )
@@ -0,0 +1,189 @@
+"""Tests for chat.rag.search against the in-memory Qdrant mode."""
+
+import uuid
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+
+class CountingEmbedder:
+    model_name = "counting"
+
+    def __init__(self):
+        self.queries = []
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return [1.0, float(len(text) % 7), 0.5]
+
+
+FOLDER_A = str(uuid.uuid4())
+FOLDER_B = str(uuid.uuid4())
+
+
+@pytest.fixture
+def qdrant(monkeypatch):
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, PointStruct, VectorParams
+
+    import chat.providers
+    import chat.rag
+
+    client = QdrantClient(location=":memory:")
+    client.create_collection(
+        chat.rag.COLLECTION_NAME,
+        vectors_config=VectorParams(size=3, distance=Distance.COSINE),
+    )
+    points = [
+        ("model", FOLDER_A, "applied_control", "visible control", [1.0, 1.0, 0.5]),
+        ("model", FOLDER_B, "applied_control", "hidden control", [1.0, 1.0, 0.5]),
+        ("library", None, "requirement_node", "shared requirement", [1.0, 0.9, 0.5]),
+        ("library", None, "reference_control", "shared control", [0.2, 1.0, 0.1]),
+    ]
+    client.upsert(
+        chat.rag.COLLECTION_NAME,
+        points=[
+            PointStruct(
+                id=str(uuid.uuid4()),
+                vector=vector,
+                payload={
+                    "source_type": source_type,
+                    "folder_id": folder_id,
+                    "object_type": object_type,
+                    "text": text,
+                    "name": text,
+                },
+            )
+            for source_type, folder_id, object_type, text, vector in points
+        ],
+    )
+    embedder = CountingEmbedder()
+    monkeypatch.setattr(chat.rag, "get_qdrant_client", lambda: client)
+    monkeypatch.setattr(chat.rag, "_get_reranker", lambda: None)
+    monkeypatch.setattr(chat.rag, "get_accessible_folder_ids", lambda u: [FOLDER_A])
+    monkeypatch.setattr(chat.providers, "get_embedder", lambda: embedder)
+    chat.rag._query_embeddings.clear()
+    return client, embedder
+
+
+class TestSearch:
+    def test_both_partitions_in_one_request(self, qdrant, monkeypatch):
+        from chat.rag import search
+
+        client, _ = qdrant
+        calls = []
+        original = client.query_batch_points
+        monkeypatch.setattr(
+            client,
+            "query_batch_points",
+            lambda **kw: calls.append(kw) or original(**kw),
+        )
+
+        results = search("control", user=None, top_k=10)
+
+        assert len(calls) == 1
+        assert len(calls[0]["requests"]) == 2
+        assert {r["text"] for r in results} == {
+            "visible control",
+            "shared requirement",
+            "shared control",
+        }
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_failing_partition_keeps_the_other_results(self, qdrant, monkeypatch):
+        from chat.rag import search
+
+        client, _ = qdrant
+        original = client.query_points
+
+        def query_points(**kw):
+            conditions = kw["query_filter"].must
+            if any(c.key == "folder_id" for c in conditions):
+                raise RuntimeError("user partition unavailable")
+            return original(**kw)
+
+        def query_batch_points(**kw):
+            raise RuntimeError("user partition unavailable")
+
+        monkeypatch.setattr(client, "query_batch_points", query_batch_points)
+        monkeypatch.setattr(client, "query_points", query_points)
+
+        results = search("control", user=None, top_k=10)
+
+        assert {r["text"] for r in results} == {"shared requirement", "shared control"}
+
+    def test_partition_filters(self, qdrant):
+        from chat.rag import search
+
+        library = search("control", user=None, source_type="library")
+        assert {r["source_type"] for r in library} == {"library"}
+
+        controls = search("control", user=None, object_type="applied_control")
+        assert [r["text"] for r in controls] == ["visible control"]
+
+    def test_query_embeddings_are_memoized(self, qdrant, monkeypatch):
+        import chat.rag
+
+        _, embedder = qdrant
+        monkeypatch.setattr(chat.rag, "QUERY_EMBEDDING_CACHE_SIZE", 2)
+        for query in ["a", "b", "a", "c", "b"]:
+            chat.rag.search(query, user=None)
+
+        # "b" was evicted by "c" after "a" was refreshed
+        assert embedder.queries == ["a", "b", "c", "b"]
+
+
+class TestAccessibleFolderCache:
+    @pytest.fixture
+    def iam(self, monkeypatch):
+        from types import SimpleNamespace
+
+        import iam.cache_builders
+        from iam.models import Folder, RoleAssignment
+
+        import chat.rag
+
+        state = {"versions": {"folders": 1}, "calls": 0}
+
+        def accessible(folder, user, content_type):
+            state["calls"] += 1
+            return [uuid.UUID(FOLDER_A)]
+
+        monkeypatch.setattr(
+            iam.cache_builders, "get_cache_versions", lambda: state["versions"]
+        )
+        monkeypatch.setattr(Folder, "get_root_folder", staticmethod(lambda: None))
+        monkeypatch.setattr(
+            RoleAssignment, "get_accessible_folder_ids", staticmethod(accessible)
+        )
+        chat.rag._accessible_folders.clear()
+        user = SimpleNamespace(id=uuid.uuid4(), is_authenticated=True)
+        return state, user
+
+    def test_cached_until_iam_version_changes(self, iam):
+        from chat.rag import get_accessible_folder_ids
+
+        state, user = iam
+        assert get_accessible_folder_ids(user) == [FOLDER_A]
+        assert get_accessible_folder_ids(user) == [FOLDER_A]
+        assert state["calls"] == 1
+
+        state["versions"] = {"folders": 2}
+        get_accessible_folder_ids(user)
+        assert state["calls"] == 2
+
+    def test_cache_is_per_focus_folder(self, iam):
+        from core.context import focus_folder_id_var
+
+        from chat.rag import get_accessible_folder_ids
+
+        state, user = iam
+        get_accessible_folder_ids(user)
+        token = focus_folder_id_var.set(uuid.uuid4())
+        try:
+            get_accessible_folder_ids(user)
+        finally:
+            focus_folder_id_var.reset(token)
+        assert state["calls"] == 2
@@ -1763,6 +1763,7 @@ class AgentActionViewSet(BaseModelViewSet):
 @permission_classes([IsAuthenticated])
 def chat_status(request):
     """Check chat service health: Ollama availability, index status."""
+    from .index_queue import queue_stats
     from .providers import get_chat_settings
 
     settings = get_chat_settings()
@@ -1775,6 +1776,7 @@ def chat_status(request):
             "ollama_url": settings["ollama_base_url"],
             "ollama_model": settings["ollama_model"],
             "embedding_backend": settings["embedding_backend"],
+            "index_queue": queue_stats(),
         }
     )
 
@@ -15,6 +15,33 @@ class CoreConfig(AppConfig):
         import core.webhooks
         import core.mappings.signals
 
+        from django.db.models.signals import m2m_changed, post_delete
+
+        from core.asset_graph import invalidate_asset_graph_cache
+
+        Asset = self.get_model("Asset")
+
+        def _asset_links_changed(sender, instance, action, **kwargs):
+            if action in {"post_add", "post_remove", "post_clear"}:
+                invalidate_asset_graph_cache()
+
+        def _asset_deleted(sender, instance, **kwargs):
+            # The links of a deleted asset go away without an m2m_changed signal
+            invalidate_asset_graph_cache()
+
+        m2m_changed.connect(
+            _asset_links_changed,
+            sender=Asset.parent_assets.through,
+            dispatch_uid="core.asset.parent_assets.m2m.invalidate_asset_graph",
+            weak=False,
+        )
+        post_delete.connect(
+            _asset_deleted,
+            sender=Asset,
+            dispatch_uid="core.asset.post_delete.invalidate_asset_graph",
+            weak=False,
+        )
+
         # avoid post_migrate handler if we are in the main, as it interferes with restore
         if not os.environ.get("RUN_MAIN"):
             # No sender filter: startup() waits for the last app's
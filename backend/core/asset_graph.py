@@ -0,0 +1,123 @@
+"""
+Versioned snapshot of the asset hierarchy (``Asset.parent_assets``).
+
+Walking ancestors or descendants of an asset used to load the whole link
+table on every call, and objectives inheritance walks the ancestors of every
+supporting asset. The link table is loaded once per cache version instead,
+and the transitive closures are memoized on the snapshot as they are asked.
+
+The snapshot is registered with the IAM ``CacheRegistry`` and invalidated
+the same way: any change to the links, or the deletion of an asset, bumps
+its ``CacheVersion`` row so that every process rebuilds it on next access.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, cast
+
+from django.apps import apps
+
+from iam.cache_builders import get_cache_versions
+from iam.snapshot_cache import CacheRegistry
+
+ASSET_GRAPH_KEY = "core.asset_graph"
+
+
+@dataclass(frozen=True, slots=True)
+class AssetGraphState:
+    parents: Mapping[uuid.UUID, Tuple[uuid.UUID, ...]]
+    children: Mapping[uuid.UUID, Tuple[uuid.UUID, ...]]
+    # Transitive closures, filled on first access (same value for every caller)
+    _ancestors: Dict[uuid.UUID, FrozenSet[uuid.UUID]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _descendants: Dict[uuid.UUID, FrozenSet[uuid.UUID]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @staticmethod
+    def _closure(
+        start_id: uuid.UUID, edges: Mapping[uuid.UUID, Tuple[uuid.UUID, ...]]
+    ) -> FrozenSet[uuid.UUID]:
+        # The start node is never part of its own closure, even on a cycle
+        found = set()
+        visited = {start_id}
+        queue = deque([start_id])
+        while queue:
+            for next_id in edges.get(queue.popleft(), ()):
+                if next_id not in visited:
+                    visited.add(next_id)
+                    found.add(next_id)
+                    queue.append(next_id)
+        return frozenset(found)
+
+    def ancestor_ids(self, asset_id: uuid.UUID) -> FrozenSet[uuid.UUID]:
+        """Ids of all the ancestors of ``asset_id``, itself excluded."""
+        closure = self._ancestors.get(asset_id)
+        if closure is None:
+            closure = self._ancestors[asset_id] = self._closure(asset_id, self.parents)
+        return closure
+
+    def descendant_ids(self, asset_id: uuid.UUID) -> FrozenSet[uuid.UUID]:
+        """Ids of all the descendants of ``asset_id``, itself excluded."""
+        closure = self._descendants.get(asset_id)
+        if closure is None:
+            closure = self._descendants[asset_id] = self._closure(
+                asset_id, self.children
+            )
+        return closure
+
+    def related_ids(self, asset_ids: Iterable[uuid.UUID]) -> set[uuid.UUID]:
+        """``asset_ids`` with all their ancestors and descendants."""
+        related = set(asset_ids)
+        for asset_id in list(related):
+            related |= self.ancestor_ids(asset_id)
+            related |= self.descendant_ids(asset_id)
+        return related
+
+
+def build_asset_graph_state() -> AssetGraphState:
+    """
+    Build the asset hierarchy snapshot from the ``parent_assets`` link table.
+    """
+    asset_model = apps.get_model("core", "Asset")
+    parents: Dict[uuid.UUID, list] = {}
+    children: Dict[uuid.UUID, list] = {}
+    for child_id, parent_id in asset_model.parent_assets.through.objects.values_list(
+        "from_asset_id", "to_asset_id"
+    ):
+        parents.setdefault(child_id, []).append(parent_id)
+        children.setdefault(parent_id, []).append(child_id)
+    return AssetGraphState(
+        parents=MappingProxyType({k: tuple(v) for k, v in parents.items()}),
+        children=MappingProxyType({k: tuple(v) for k, v in children.items()}),
+    )
+
+
+def invalidate_asset_graph_cache() -> Optional[int]:
+    return CacheRegistry.invalidate(ASSET_GRAPH_KEY)
+
+
+# Import-time registration (DB-free).
+CacheRegistry.register(ASSET_GRAPH_KEY, build_asset_graph_state)
+
+
+def get_asset_graph() -> AssetGraphState:
+    """
+    Current asset hierarchy snapshot, rebuilt when its version changed.
+    """
+    versions = get_cache_versions()
+    return cast(AssetGraphState, CacheRegistry.get_cache(ASSET_GRAPH_KEY).get(versions))
+
+
+__all__ = [
+    "ASSET_GRAPH_KEY",
+    "AssetGraphState",
+    "build_asset_graph_state",
+    "invalidate_asset_graph_cache",
+    "get_asset_graph",
+]
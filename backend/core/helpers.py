@@ -1,5 +1,7 @@
+import hashlib
 import json
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import MutableMapping
 from datetime import date, datetime, timedelta
 from typing import Optional
@@ -10,8 +12,10 @@ from uuid import UUID
 from django.core.exceptions import NON_FIELD_ERRORS as DJ_NON_FIELD_ERRORS
 from django.core.exceptions import ValidationError as DjValidationError
 from django.conf import settings
-from django.db.models import Count
+from django.db.models import Count, Max, Q
 from django.shortcuts import get_object_or_404
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework.views import api_settings
 from rest_framework.views import exception_handler as drf_exception_handler
@@ -239,56 +243,147 @@ def get_compliance_assessment_stats(
     return requirement_nodes_statistics
 
 
-def get_sorted_requirement_nodes(
-    requirement_nodes: list,
-    requirements_assessed: Optional[list] = None,
-    max_score: int = 0,
-) -> dict:
+REQUIREMENT_SKELETON_CACHE_SIZE = 32
+
+# Requirement tree skeletons by requirement_tree_version(), most recent last
+_requirement_skeletons: OrderedDict = OrderedDict()
+_requirement_skeletons_lock = threading.Lock()
+
+
+def requirement_tree_version(framework) -> tuple:
     """
-    Recursive function to build framework groups tree
-    requirement_nodes: the list of all requirement_nodes
-    requirements_assessed: the list of all requirements_assessed
-    max_score: the maximum score. This is an attribute of the framework
-    Returns a dictionary containing key=name and value={"description": description, "style": "leaf|node"}}
-    Values are correctly sorted based on order_id
-    If order_id is missing, sorting is based on created_at
+    Version of the requirement tree skeleton of a framework in the current
+    language. It changes whenever the framework, one of its requirement nodes,
+    questions or question choices is created, modified or deleted.
     """
 
+    def stamp(queryset) -> tuple:
+        aggregate = queryset.aggregate(count=Count("id"), updated_at=Max("updated_at"))
+        return aggregate["count"], aggregate["updated_at"]
+
+    return (
+        str(framework.id),
+        framework.updated_at,
+        framework.editing_version,
+        *stamp(RequirementNode.objects.filter(framework=framework)),
+        *stamp(Question.objects.filter(requirement_node__framework=framework)),
+        *stamp(
+            QuestionChoice.objects.filter(
+                question__requirement_node__framework=framework
+            )
+        ),
+        get_language(),
+    )
+
+
+def _requirement_node_data(node, style: str) -> dict:
+    """Static data of a requirement node in the tree; style is "node" for
+    top-level nodes and "leaf" for all the others."""
+    return {
+        "urn": node.urn,
+        "parent_urn": node.parent_urn,
+        "ref_id": node.ref_id,
+        "name": get_referential_translation(node, "name"),
+        "implementation_groups": node.implementation_groups or None,
+        "weight": node.weight if node.weight else 1,
+        "questions": node.get_questions_translated,
+        "node_content": node.display_long,
+        "display_mode": node.display_mode,
+        "style": style,
+        "assessable": node.assessable,
+        "description": get_referential_translation(node, "description"),
+    }
+
+
+def build_requirement_skeleton(requirement_nodes) -> tuple:
+    """
+    Static part of the requirement tree: translated names, descriptions and
+    questions of every node, and the ordering of the tree.
+
+    Returns a tuple of (node_id, node_data, children) entries, sorted on
+    order_id (created_at when missing), children having the same shape.
+    """
+    requirement_nodes = list(requirement_nodes)
+
     # Cope for old version not creating order_id correctly
     for req in requirement_nodes:
         if req.order_id is None:
             req.order_id = req.created_at
 
-    requirement_assessment_from_requirement_id = {
-        str(ra.requirement_id): ra for ra in (requirements_assessed or [])
-    }
-
     # Build a dictionary to quickly access children nodes
-    children_dict = {}
+    children_dict = defaultdict(list)
     for node in requirement_nodes:
-        if node.parent_urn not in children_dict:
-            children_dict[node.parent_urn] = []
         children_dict[node.parent_urn].append(node)
 
-    # Sort children nodes by order_id
-    for key in children_dict:
-        children_dict[key].sort(key=lambda x: x.order_id)
+    def build(nodes: list, style: str) -> tuple:
+        skeleton = []
+        for node in sorted(nodes, key=lambda x: x.order_id):
+            children = build(children_dict.get(node.urn, []), "leaf")
+            skeleton.append(
+                (str(node.id), _requirement_node_data(node, style), children)
+            )
+        return tuple(skeleton)
 
-    def get_sorted_requirement_nodes_rec(start: list) -> dict:
-        """
-        Recursive function to build framework groups tree, within get_sorted_requirements_nodes
-        start: the initial list
-        """
+    return build([rn for rn in requirement_nodes if not rn.parent_urn], "node")
+
+
+def get_requirement_skeleton(
+    framework, requirement_nodes=None, version: tuple | None = None
+) -> tuple:
+    """
+    Requirement tree skeleton of a framework, cached per framework version and
+    language. requirement_nodes (e.g. a queryset with prefetched questions) is
+    only evaluated when the skeleton has to be built.
+    """
+    if version is None:
+        version = requirement_tree_version(framework)
+    with _requirement_skeletons_lock:
+        skeleton = _requirement_skeletons.get(version)
+        if skeleton is not None:
+            _requirement_skeletons.move_to_end(version)
+            return skeleton
+
+    if requirement_nodes is None:
+        requirement_nodes = RequirementNode.objects.filter(
+            framework=framework
+        ).prefetch_related("questions", "questions__choices")
+    skeleton = build_requirement_skeleton(requirement_nodes)
+
+    with _requirement_skeletons_lock:
+        # Older versions of the same framework and language are stale
+        for key in list(_requirement_skeletons):
+            if key[0] == version[0] and key[-1] == version[-1]:
+                del _requirement_skeletons[key]
+        _requirement_skeletons[version] = skeleton
+        while len(_requirement_skeletons) > REQUIREMENT_SKELETON_CACHE_SIZE:
+            _requirement_skeletons.popitem(last=False)
+    return skeleton
+
+
+def apply_requirement_overlay(
+    skeleton: tuple,
+    requirements_assessed: Optional[list] = None,
+    max_score: int = 0,
+) -> dict:
+    """
+    Build the requirement tree from a skeleton and the per-audit overlay:
+    results, scores and answers of the requirement assessments.
+    Every node dict is new, so callers may mutate the tree.
+    """
+    requirement_assessment_from_requirement_id = {
+        str(ra.requirement_id): ra for ra in (requirements_assessed or [])
+    }
+
+    def overlay(entries: tuple) -> dict:
         result = {}
-        for node in start:
-            req_as = requirement_assessment_from_requirement_id.get(str(node.id))
-
-            node_data = {
-                "urn": node.urn,
-                "parent_urn": node.parent_urn,
-                "ref_id": node.ref_id,
-                "name": get_referential_translation(node, "name"),
-                "implementation_groups": node.implementation_groups or None,
+        for node_id, node, children in entries:
+            req_as = requirement_assessment_from_requirement_id.get(node_id)
+            result[node_id] = {
+                "urn": node["urn"],
+                "parent_urn": node["parent_urn"],
+                "ref_id": node["ref_id"],
+                "name": node["name"],
+                "implementation_groups": node["implementation_groups"],
                 "ra_id": str(req_as.id) if req_as else None,
                 "status": req_as.status if req_as else None,
                 "result": req_as.result if req_as else None,
@@ -297,8 +392,8 @@ def get_sorted_requirement_nodes(
                 "score": req_as.score if req_as else None,
                 "documentation_score": req_as.documentation_score if req_as else None,
                 "max_score": max_score if req_as else None,
-                "weight": node.weight if node.weight else 1,
-                "questions": node.get_questions_translated,
+                "weight": node["weight"],
+                "questions": node["questions"],
                 "answers": build_answers_dict(req_as.answers.all()) if req_as else None,
                 "mapping_inference": req_as.mapping_inference if req_as else None,
                 "status_display": req_as.get_status_display() if req_as else None,
@@ -306,74 +401,313 @@ def get_sorted_requirement_nodes(
                 "result_i18n": camel_case(req_as.result)
                 if req_as and req_as.result is not None
                 else None,
-                "node_content": node.display_long,
-                "display_mode": node.display_mode,
-                "style": "node",
-                "assessable": node.assessable,
-                "description": get_referential_translation(node, "description"),
-                "children": {},
+                "node_content": node["node_content"],
+                "display_mode": node["display_mode"],
+                "style": node["style"],
+                "assessable": node["assessable"],
+                "description": node["description"],
+                "children": overlay(children),
             }
+        return result
 
-            result[str(node.id)] = node_data
+    return overlay(skeleton)
 
-            # Process children nodes recursively
-            children = children_dict.get(node.urn, [])
-            child_nodes = get_sorted_requirement_nodes_rec(children)
-            result[str(node.id)]["children"] = child_nodes
 
-            # Update each child node with associated requirements
-            for child in children:
-                child_req_as = requirement_assessment_from_requirement_id.get(
-                    str(child.id)
-                )
+def requirement_tree_etag(
+    version: tuple, compliance_assessment, scope: Optional[set] = None
+) -> str:
+    """
+    ETag of a compliance assessment's requirement tree, from aggregates only:
+    the skeleton version, the assessment settings the tree depends on, and
+    the count and latest updated_at of its requirement assessments and their
+    answers. `scope` restricts the overlay to these requirement assessment
+    ids (auditee view); it is part of the tag.
+    """
+    requirement_assessments = RequirementAssessment.objects.filter(
+        compliance_assessment=compliance_assessment
+    )
+    if scope is not None:
+        requirement_assessments = requirement_assessments.filter(id__in=scope)
+
+    def stamp(queryset) -> tuple:
+        aggregate = queryset.aggregate(count=Count("id"), updated_at=Max("updated_at"))
+        return aggregate["count"], aggregate["updated_at"]
+
+    digest = hashlib.sha256()
+    digest.update(
+        repr(
+            (
+                version,
+                str(compliance_assessment.id),
+                compliance_assessment.updated_at,
+                compliance_assessment.selected_implementation_groups,
+                compliance_assessment.score_calculation_method,
+                compliance_assessment.show_documentation_score,
+                compliance_assessment.min_score,
+                compliance_assessment.max_score,
+                *stamp(requirement_assessments),
+                *stamp(
+                    Answer.objects.filter(
+                        requirement_assessment__in=requirement_assessments
+                    )
+                ),
+                sorted(str(ra_id) for ra_id in scope) if scope is not None else None,
+            )
+        ).encode()
+    )
+    return quote_etag(digest.hexdigest())
 
-                child_data = {
-                    "urn": child.urn,
-                    "ref_id": child.ref_id,
-                    "implementation_groups": child.implementation_groups or None,
-                    "name": get_referential_translation(child, "name"),
-                    "description": get_referential_translation(child, "description"),
-                    "ra_id": str(child_req_as.id) if child_req_as else None,
-                    "status": child_req_as.status if child_req_as else None,
-                    "is_scored": child_req_as.is_scored if child_req_as else None,
-                    "score": child_req_as.score if child_req_as else None,
-                    "documentation_score": child_req_as.documentation_score
-                    if child_req_as
-                    else None,
-                    "max_score": max_score if child_req_as else None,
-                    "weight": child.weight if child.weight else 1,
-                    "questions": child.get_questions_translated,
-                    "answers": build_answers_dict(child_req_as.answers.all())
-                    if child_req_as
-                    else None,
-                    "mapping_inference": child_req_as.mapping_inference
-                    if child_req_as
-                    else None,
-                    "status_display": child_req_as.get_status_display()
-                    if child_req_as
-                    else None,
-                    "status_i18n": camel_case(child_req_as.status)
-                    if child_req_as
-                    else None,
-                    "result": child_req_as.result if child_req_as else None,
-                    "extended_result": child_req_as.extended_result
-                    if child_req_as
-                    else None,
-                    "result_i18n": camel_case(child_req_as.result)
-                    if child_req_as and child_req_as.result is not None
-                    else None,
-                    "style": "leaf",
-                }
 
-                result[str(node.id)]["children"][str(child.id)].update(child_data)
+REQUIREMENT_TREE_PAGE_SIZE = 100
+REQUIREMENT_TREE_MAX_PAGE_SIZE = 500
+REQUIREMENT_TREE_SUMMARY_FIELDS = (
+    "aggregated_score",
+    "aggregated_documentation_score",
+    "children_count",
+    "requirements_count",
+    "assessed_count",
+    "result_counts",
+    "status_counts",
+    "scored_weight",
+)
 
-        return result
 
-    top_level_nodes = [rn for rn in requirement_nodes if not rn.parent_urn]
-    top_level_nodes.sort(key=lambda x: x.order_id)
+def summarize_requirement_tree(tree: dict) -> None:
+    """
+    Annotate every node with counts over its subtree (itself included), so
+    a collapsed branch can be rendered without its descendants:
+    children_count, requirements_count (assessable nodes), assessed_count
+    (assessable nodes with a result other than not_assessed), result_counts
+    and status_counts (assessable nodes per result and status) and
+    scored_weight (total weight of the scored, applicable nodes).
+    """
 
-    tree = get_sorted_requirement_nodes_rec(top_level_nodes)
-    return tree
+    def walk(node: dict) -> None:
+        children = node.get("children") or {}
+        requirements_count = 1 if node.get("assessable") else 0
+        result_counts = defaultdict(int)
+        status_counts = defaultdict(int)
+        scored_weight = 0
+        if node.get("assessable"):
+            if node.get("result"):
+                result_counts[node["result"]] += 1
+            if node.get("status"):
+                status_counts[node["status"]] += 1
+            if node.get("is_scored") and node.get("result") != "not_applicable":
+                scored_weight += node.get("weight") or 1
+        for child in children.values():
+            walk(child)
+            requirements_count += child["requirements_count"]
+            for result, count in child["result_counts"].items():
+                result_counts[result] += count
+            for status_, count in child["status_counts"].items():
+                status_counts[status_] += count
+            scored_weight += child["scored_weight"]
+        node["children_count"] = len(children)
+        node["requirements_count"] = requirements_count
+        node["assessed_count"] = sum(result_counts.values()) - result_counts.get(
+            "not_assessed", 0
+        )
+        node["result_counts"] = dict(result_counts)
+        node["status_counts"] = dict(status_counts)
+        node["scored_weight"] = scored_weight
+
+    for node in tree.values():
+        walk(node)
+
+
+def requirement_tree_children(
+    compliance_assessment,
+    parent_id: str | None = None,
+    cursor: str | None = None,
+    limit: int = REQUIREMENT_TREE_PAGE_SIZE,
+    implementation_groups: list | None = None,
+    scope: set | None = None,
+) -> dict:
+    """
+    One page of the children of parent_id (top-level nodes when None) in a
+    compliance assessment tree, without their own children but with the
+    counts and aggregated scores of their subtrees. Only the siblings' ids,
+    the nodes of the page, their descendants' structure and the matching
+    requirement assessments are queried.
+
+    cursor is the id of the last sibling of the previous page; the returned
+    "next" is the cursor of the following page. Siblings left out by the
+    implementation groups filter are skipped, so a page may hold fewer than
+    `limit` nodes. `scope` restricts the overlay to these requirement
+    assessment ids (auditee view).
+    Raises KeyError for an unknown parent or cursor.
+    """
+    framework = compliance_assessment.framework
+    nodes = RequirementNode.objects.filter(framework=framework)
+    if parent_id is None:
+        siblings = nodes.filter(Q(parent_urn__isnull=True) | Q(parent_urn=""))
+    else:
+        try:
+            parent_urn = (
+                nodes.filter(id=UUID(parent_id)).values_list("urn", flat=True).first()
+            )
+        except ValueError:
+            parent_urn = None
+        if parent_urn is None:
+            raise KeyError(parent_id)
+        siblings = nodes.filter(parent_urn=parent_urn)
+
+    # Same ordering as the skeleton: order_id, created_at when missing
+    ordered = sorted(
+        siblings.values_list("id", "order_id", "created_at"),
+        key=lambda row: row[1] if row[1] is not None else row[2],
+    )
+    ids = [str(row[0]) for row in ordered]
+    start = 0
+    if cursor is not None:
+        if cursor not in ids:
+            raise KeyError(cursor)
+        start = ids.index(cursor) + 1
+    page_ids = ids[start : start + limit]
+
+    page_nodes = {
+        str(node.id): node
+        for node in nodes.filter(id__in=page_ids).prefetch_related(
+            "questions", "questions__choices"
+        )
+    }
+
+    # Structure of the page's subtrees, one query per level
+    descendants = []
+    frontier = [node.urn for node in page_nodes.values()]
+    while frontier:
+        level = list(
+            nodes.filter(parent_urn__in=frontier).values(
+                "id",
+                "urn",
+                "parent_urn",
+                "assessable",
+                "implementation_groups",
+                "weight",
+            )
+        )
+        descendants.extend(level)
+        frontier = [row["urn"] for row in level]
+
+    requirement_assessments = RequirementAssessment.objects.filter(
+        compliance_assessment=compliance_assessment
+    )
+    if scope is not None:
+        requirement_assessments = requirement_assessments.filter(id__in=scope)
+    page_ras = list(
+        requirement_assessments.filter(requirement_id__in=page_ids).prefetch_related(
+            "answers", "answers__question", "answers__selected_choices"
+        )
+    )
+    overlay_by_requirement_id = {
+        str(row["requirement_id"]): row
+        for row in requirement_assessments.filter(
+            requirement_id__in=[row["id"] for row in descendants]
+        ).values(
+            "requirement_id",
+            "status",
+            "result",
+            "is_scored",
+            "score",
+            "documentation_score",
+        )
+    }
+    for ra in page_ras:
+        overlay_by_requirement_id[str(ra.requirement_id)] = {
+            "status": ra.status,
+            "result": ra.result,
+            "is_scored": ra.is_scored,
+            "score": ra.score,
+            "documentation_score": ra.documentation_score,
+        }
+
+    def light_node(node_id: str, assessable, groups, weight) -> dict:
+        overlay = overlay_by_requirement_id.get(node_id, {})
+        return {
+            "assessable": assessable,
+            "implementation_groups": groups or None,
+            "weight": weight if weight else 1,
+            "status": overlay.get("status"),
+            "result": overlay.get("result"),
+            "is_scored": overlay.get("is_scored"),
+            "score": overlay.get("score"),
+            "documentation_score": overlay.get("documentation_score"),
+            "children": {},
+        }
+
+    # Counts and scores only need the subtree structure and the overlay
+    light = {}
+    by_urn = {}
+    for node_id in page_ids:
+        node = page_nodes[node_id]
+        light[node_id] = by_urn[node.urn] = light_node(
+            node_id, node.assessable, node.implementation_groups, node.weight
+        )
+    for row in descendants:
+        entry = light_node(
+            str(row["id"]),
+            row["assessable"],
+            row["implementation_groups"],
+            row["weight"],
+        )
+        by_urn[row["parent_urn"]]["children"][str(row["id"])] = entry
+        by_urn[row["urn"]] = entry
+    light = filter_graph_by_implementation_groups(light, implementation_groups)
+    annotate_tree_with_aggregated_scores(light, compliance_assessment)
+    summarize_requirement_tree(light)
+
+    style = "node" if parent_id is None else "leaf"
+    tree = apply_requirement_overlay(
+        tuple(
+            (node_id, _requirement_node_data(page_nodes[node_id], style), ())
+            for node_id in page_ids
+            if node_id in light
+        ),
+        page_ras,
+        framework.max_score,
+    )
+    results = []
+    for node_id, data in tree.items():
+        data.pop("children")
+        data.update(
+            {
+                key: value
+                for key, value in light[node_id].items()
+                if key in REQUIREMENT_TREE_SUMMARY_FIELDS
+            }
+        )
+        results.append({"id": node_id, **data})
+    return {
+        "parent": parent_id,
+        "next": page_ids[-1] if start + limit < len(ids) else None,
+        "results": results,
+    }
+
+
+def get_sorted_requirement_nodes(
+    requirement_nodes: list,
+    requirements_assessed: Optional[list] = None,
+    max_score: int = 0,
+    framework=None,
+) -> dict:
+    """
+    Build the framework groups tree
+    requirement_nodes: the list of all requirement_nodes
+    requirements_assessed: the list of all requirements_assessed
+    max_score: the maximum score. This is an attribute of the framework
+    framework: when given, the static skeleton of the tree is cached for the
+    framework (see get_requirement_skeleton) and requirement_nodes is only
+    evaluated on a cache miss
+    Returns a dictionary containing key=name and value={"description": description, "style": "leaf|node"}}
+    Values are correctly sorted based on order_id
+    If order_id is missing, sorting is based on created_at
+    """
+    if framework is not None:
+        skeleton = get_requirement_skeleton(framework, requirement_nodes)
+    else:
+        skeleton = build_requirement_skeleton(requirement_nodes)
+    return apply_requirement_overlay(skeleton, requirements_assessed, max_score)
 
 
 def annotate_tree_with_aggregated_scores(
@@ -1081,16 +1415,20 @@ def aggregate_risks_per_field(
     if risk_assessments is not None:
         base_scenarios = base_scenarios.filter(risk_assessment__in=risk_assessments)
     for matrix_id, m in parsed_matrices:
-        # Scope scenario counting to scenarios belonging to this specific matrix
-        matrix_scenarios = base_scenarios.filter(
-            risk_assessment__risk_matrix_id=matrix_id,
+        # Scope scenario counting to scenarios belonging to this specific matrix,
+        # counting every level in a single grouped query
+        level_counts = dict(
+            base_scenarios.filter(risk_assessment__risk_matrix_id=matrix_id)
+            .order_by()
+            .values_list(level_field)
+            .annotate(count=Count("id"))
         )
         for i in range(len(m["risk"])):
             k = get_referential_translation(m["risk"][i], field)
             if k not in values:
                 values[k] = dict()
 
-            count = matrix_scenarios.filter(**{level_field: i}).count()
+            count = level_counts.get(i, 0)
 
             if "count" not in values[k]:
                 values[k]["count"] = count
@@ -1797,8 +2135,7 @@ def acceptances_to_review(user: User):
 
 
 def build_scenario_clusters(risk_assessment: RiskAssessment, include_inherent=False):
-    risk_matrix = risk_assessment.risk_matrix.parse_json()
-    grid = risk_matrix["grid"]
+    grid = risk_assessment.risk_matrix.compiled.grid
     risk_matrix_current = [
         [set() for _ in range(len(grid[0]))] for _ in range(len(grid))
     ]
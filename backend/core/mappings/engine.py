@@ -5,18 +5,119 @@ from core.models import (
     ComplianceAssessment,
 )
 from django.db.models.query import QuerySet
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from typing import Optional
+import copy
 import json
 import zlib
 
 
+class MappingClosure:
+    """
+    Transitive closure of the framework mapping graph.
+
+    Built lazily from the engine's ``framework_mappings`` and cached until the
+    engine reloads (i.e. until a mapping or framework library is loaded or
+    unloaded). Per source framework, one BFS gives the hop distance to every
+    reachable framework; shortest paths are then enumerated on the
+    shortest-path DAG in the same order as a breadth-first exploration.
+    """
+
+    def __init__(self, framework_mappings: dict[str, list[str]]):
+        self.adjacency = {src: list(dsts) for src, dsts in framework_mappings.items()}
+        self.reverse: defaultdict[str, list[str]] = defaultdict(list)
+        for src, dsts in self.adjacency.items():
+            for dst in dsts:
+                self.reverse[dst].append(src)
+        self._distances: dict[str, dict[str, int]] = {}
+        self._paths: dict[tuple[str, str], list[tuple[str, ...]]] = {}
+
+    def distances(self, source_urn: str) -> dict[str, int]:
+        """Hop distance from `source_urn` to every reachable framework."""
+        distances = self._distances.get(source_urn)
+        if distances is None:
+            distances = {source_urn: 0}
+            queue = deque([source_urn])
+            while queue:
+                current = queue.popleft()
+                for neighbor in self.adjacency.get(current, []):
+                    if neighbor not in distances:
+                        distances[neighbor] = distances[current] + 1
+                        queue.append(neighbor)
+            self._distances[source_urn] = distances
+        return distances
+
+    def reachable(self, source_urn: str, max_depth: Optional[int] = None) -> list[str]:
+        """
+        Frameworks reachable from `source_urn` (itself included) through paths
+        of at most `max_depth` frameworks, sorted by URN.
+        """
+        return sorted(
+            urn
+            for urn, distance in self.distances(source_urn).items()
+            if not max_depth or distance + 1 <= max_depth
+        )
+
+    def shortest_paths(
+        self, source_urn: str, dest_urn: str, max_depth: Optional[int] = None
+    ) -> list[list[str]]:
+        """All shortest paths from `source_urn` to `dest_urn`, in BFS order."""
+        key = (source_urn, dest_urn)
+        paths = self._paths.get(key)
+        if paths is None:
+            paths = self._enumerate_shortest_paths(source_urn, dest_urn)
+            self._paths[key] = paths
+        if max_depth and paths and len(paths[0]) > max_depth:
+            return []
+        return [list(path) for path in paths]
+
+    def _enumerate_shortest_paths(
+        self, source_urn: str, dest_urn: str
+    ) -> list[tuple[str, ...]]:
+        distances = self.distances(source_urn)
+        if dest_urn not in distances:
+            return []
+
+        # Frameworks lying on at least one shortest path to dest_urn
+        on_path = {dest_urn}
+        frontier = [dest_urn]
+        while frontier:
+            previous = []
+            for urn in frontier:
+                for predecessor in self.reverse.get(urn, []):
+                    if (
+                        distances.get(predecessor) == distances[urn] - 1
+                        and predecessor not in on_path
+                    ):
+                        on_path.add(predecessor)
+                        previous.append(predecessor)
+            frontier = previous
+
+        # Depth-first in adjacency order == the order a BFS discovers them
+        paths = []
+        stack = [(source_urn,)]
+        while stack:
+            path = stack.pop()
+            current = path[-1]
+            if current == dest_urn:
+                paths.append(path)
+                continue
+            next_hops = [
+                neighbor
+                for neighbor in self.adjacency.get(current, [])
+                if neighbor in on_path and distances[neighbor] == distances[current] + 1
+            ]
+            stack.extend(path + (neighbor,) for neighbor in reversed(next_hops))
+        return paths
+
+
 class MappingEngine:
     def __init__(self):
         self._all_rms = None
         self._framework_mappings = None
         self._frameworks = None
         self._direct_mappings = None
+        self._closure = None
 
         self.fields_to_map: list[str] = [
             "result",
@@ -45,6 +146,7 @@ class MappingEngine:
     @all_rms.setter
     def all_rms(self, value):
         self._all_rms = value
+        self._closure = None
 
     @property
     def framework_mappings(self):
@@ -54,6 +156,16 @@ class MappingEngine:
     @framework_mappings.setter
     def framework_mappings(self, value):
         self._framework_mappings = value
+        self._closure = None
+
+    @property
+    def closure(self) -> MappingClosure:
+        """Cached transitive closure of the mapping graph (reset on reload)."""
+        closure = getattr(self, "_closure", None)
+        if closure is None:
+            closure = MappingClosure(self.framework_mappings)
+            self._closure = closure
+        return closure
 
     @property
     def frameworks(self):
@@ -112,6 +224,7 @@ class MappingEngine:
         self._all_rms = local_all_rms
         self._framework_mappings = local_framework_mappings
         self._direct_mappings = local_direct_mappings
+        self._closure = None
 
     def load_rms_data(
         self,
@@ -184,36 +297,8 @@ class MappingEngine:
     def all_paths_between(
         self, source_urn: str, dest_urn: str, max_depth: Optional[int] = None
     ) -> list[list[str]]:
-        # ✅ 1. Return only direct path if it exists
-        if (source_urn, dest_urn) in self.direct_mappings:
-            return [[source_urn, dest_urn]]
-
-        # 🔄 2. BFS for shortest paths
-        queue = deque()
-        queue.append(([source_urn], {source_urn}))
-        shortest_paths = []
-        shortest_length = None
-
-        while queue:
-            path, visited = queue.popleft()
-            current = path[-1]
-
-            if current == dest_urn:
-                if shortest_length is None:
-                    shortest_length = len(path)
-                if len(path) == shortest_length:
-                    shortest_paths.append(path)
-                continue
-
-            if max_depth and len(path) >= max_depth:
-                continue
-
-            for neighbor in self.framework_mappings.get(current, []):
-                if neighbor in visited:
-                    continue
-                queue.append((path + [neighbor], visited | {neighbor}))
-
-        return shortest_paths
+        """All shortest mapping paths between two frameworks (from the closure)."""
+        return self.closure.shortest_paths(source_urn, dest_urn, max_depth)
 
     def get_framework_neighbors(self, source_urn: str) -> list[str]:
         # retruns the second element of the tuple in the direct mapping set if the first one is equal to source_urn
@@ -649,31 +734,125 @@ class MappingEngine:
         dest_urn: str,
         max_depth: Optional[int] = None,
     ) -> tuple[dict, list[str]]:
-        paths = self.all_paths_between(source_urn, dest_urn, max_depth)
-        inferences = {}
-        best_path = []
-
-        for path in paths:
-            tmp_inferences = source_audit.copy()
-            tmp_urn = source_urn
-            hop_index = 1
-            for urn in path[1:]:
-                rms = self.get_rms((tmp_urn, urn))
-                if not rms:
-                    break
-                tmp_inferences = self.map_audit_results(
-                    tmp_inferences,
-                    rms,
-                    hop_index=hop_index,
-                    path=path,
-                )
-                hop_index += 1
-                tmp_urn = urn
+        return self.best_mapping_inferences_many(
+            source_audit, source_urn, [dest_urn], max_depth
+        )[dest_urn]
 
-            if len(tmp_inferences) > len(inferences):
-                inferences = tmp_inferences
-                best_path = path
-        return inferences, best_path
+    def best_mapping_inferences_many(
+        self,
+        source_audit: dict[str, str | dict[str, str]],
+        source_urn: str,
+        dest_urns: list[str],
+        max_depth: Optional[int] = None,
+    ) -> dict[str, tuple[dict, list[str]]]:
+        """
+        Infer `source_audit` into several target frameworks in one pass.
+
+        Candidate paths are the shortest paths of the closure; for each target
+        the first path yielding results wins. Hops shared by several paths
+        (e.g. A -> SCF for both A -> SCF -> B and A -> SCF -> C) are mapped
+        once and handed to each continuation as an independent copy.
+        """
+        paths_by_dest = {
+            dest_urn: [
+                tuple(path)
+                for path in self.all_paths_between(source_urn, dest_urn, max_depth)
+            ]
+            for dest_urn in dest_urns
+        }
+
+        # How many times each intermediate result is consumed: once per
+        # distinct continuation and once per path ending there.
+        uses: Counter = Counter()
+        prefixes = set()
+        for paths in paths_by_dest.values():
+            for path in paths:
+                uses[path] += 1
+                for length in range(3, len(path) + 1):
+                    prefix = path[:length]
+                    if prefix not in prefixes:
+                        prefixes.add(prefix)
+                        uses[prefix[:-1]] += 1
+
+        computed: dict[tuple[str, ...], list] = {}
+
+        def take(prefix: tuple[str, ...]) -> tuple[dict, bool]:
+            # The last consumer gets the original, the others a copy
+            entry = computed.get(prefix)
+            if entry is None:
+                entry = compute(prefix)
+                computed[prefix] = entry
+            entry[2] -= 1
+            if entry[2] > 0:
+                return self._copy_mapped_audit(entry[0]), entry[1]
+            return entry[0], entry[1]
+
+        def compute(prefix: tuple[str, ...]) -> list:
+            if len(prefix) == 2:
+                audit, broken = source_audit.copy(), False
+            else:
+                audit, broken = take(prefix[:-1])
+            rms = None if broken else self.get_rms(prefix[-2:])
+            if not rms:
+                # Like a chain stopping at a missing mapping set
+                return [audit, True, uses[prefix]]
+            audit = self.map_audit_results(
+                audit, rms, hop_index=len(prefix) - 1, path=list(prefix)
+            )
+            return [audit, False, uses[prefix]]
+
+        results = {}
+        for dest_urn, paths in paths_by_dest.items():
+            inferences: dict = {}
+            best_path: list[str] = []
+            for path in paths:
+                if len(path) == 1:
+                    tmp_inferences = source_audit.copy()
+                else:
+                    tmp_inferences, _ = take(path)
+                if len(tmp_inferences) > len(inferences):
+                    inferences = tmp_inferences
+                    best_path = list(path)
+            results[dest_urn] = (inferences, best_path)
+        return results
+
+    @staticmethod
+    def _copy_mapped_audit(audit: dict) -> dict:
+        """
+        Copy of a mapped audit that the next ``map_audit_results`` hop can
+        mutate without affecting the original.
+
+        A hop only mutates the ``mapping_inference`` dicts of its source
+        assessments and their ``source_requirement_assessments`` dicts (both
+        may be shared between several target assessments); everything else
+        is replaced rather than modified. Those dicts are copied once each,
+        keeping the sharing intact, which is much cheaper than a deepcopy.
+        """
+        copies: dict[int, dict] = {}
+
+        def copy_once(value: dict) -> dict:
+            copied = copies.get(id(value))
+            if copied is None:
+                copied = copies[id(value)] = value.copy()
+            return copied
+
+        result = audit.copy()
+        assessments = audit.get("requirement_assessments")
+        if assessments is None:
+            return result
+        assessments = copy.copy(assessments)
+        for urn, assessment in assessments.items():
+            inference = assessment.get("mapping_inference")
+            if inference is None:
+                continue
+            assessment = copy_once(assessment)
+            assessment["mapping_inference"] = inference = copy_once(inference)
+            sources = inference.get("source_requirement_assessments")
+            if sources is not None:
+                inference["source_requirement_assessments"] = copy_once(sources)
+            assessments[urn] = assessment
+        result["requirement_assessments"] = assessments
+        return result
 
     def load_audit_fields(
         self,
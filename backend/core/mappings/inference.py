@@ -0,0 +1,136 @@
+from collections import defaultdict
+
+from core.models import RequirementAssessment, RequirementMapping
+
+# Most restrictive first: when several mappings infer a result for the same
+# target requirement, the first one in this order wins.
+RESULT_ORDER = (
+    RequirementAssessment.Result.NOT_ASSESSED,
+    RequirementAssessment.Result.NOT_APPLICABLE,
+    RequirementAssessment.Result.NON_COMPLIANT,
+    RequirementAssessment.Result.PARTIALLY_COMPLIANT,
+    RequirementAssessment.Result.COMPLIANT,
+)
+
+INFERRED_FIELDS = ("result", "status", "score", "is_scored", "observation")
+
+
+class MappingSetInference:
+    """
+    Infers the results of a target audit from a source audit through one
+    RequirementMappingSet.
+
+    The mapping set and the source audit's requirement assessments are read
+    once into in-memory indexes (mappings by target requirement, source
+    assessments by requirement); every target requirement assessment is then
+    evaluated in a single pass, without further queries.
+    """
+
+    def __init__(self, mapping_set):
+        self.mappings_by_target: dict = defaultdict(list)
+        # Ordered by id so the tie-breaking between mappings is deterministic
+        for mapping in (
+            RequirementMapping.objects.filter(mapping_set=mapping_set)
+            .only(
+                "id",
+                "target_requirement_id",
+                "source_requirement_id",
+                "relationship",
+            )
+            .order_by("id")
+        ):
+            self.mappings_by_target[mapping.target_requirement_id].append(mapping)
+
+        # Full coverage mappings, when a target has any, shadow the others
+        for target_id, mappings in self.mappings_by_target.items():
+            full = [
+                m
+                for m in mappings
+                if m.relationship in RequirementMapping.FULL_COVERAGE_RELATIONSHIPS
+            ]
+            if full:
+                self.mappings_by_target[target_id] = full
+
+    def load_source(self, source_assessment) -> dict:
+        """Source requirement assessments referenced by the mappings, by requirement."""
+        source_ids = {
+            mapping.source_requirement_id
+            for mappings in self.mappings_by_target.values()
+            for mapping in mappings
+        }
+        sources = {}
+        for ra in RequirementAssessment.objects.filter(
+            compliance_assessment=source_assessment,
+            requirement_id__in=source_ids,
+        ).select_related("requirement"):
+            ra.compliance_assessment = source_assessment
+            sources[ra.requirement_id] = ra
+        return sources
+
+    def infer(self, target_assessment, source_assessment) -> tuple[list, dict]:
+        """
+        Assign inferred results to the target audit's requirement assessments.
+
+        Returns the updated requirement assessments (not saved) and, for each,
+        the ids of the source requirement assessments that produced a result.
+        """
+        sources = self.load_source(source_assessment)
+        updated = []
+        assessment_source_dict = {}
+
+        for requirement_assessment in target_assessment.requirement_assessments.all():
+            requirement_id = requirement_assessment.requirement_id
+            mappings = self.mappings_by_target.get(requirement_id)
+            if not mappings:
+                continue
+            requirement_assessment.compliance_assessment = target_assessment
+
+            inferences = []
+            refs = []
+            for mapping in mappings:
+                source_requirement_assessment = sources.get(
+                    mapping.source_requirement_id
+                )
+                if source_requirement_assessment is None:
+                    raise RequirementAssessment.DoesNotExist(
+                        f"No requirement assessment for requirement "
+                        f"{mapping.source_requirement_id} in {source_assessment}"
+                    )
+                inferred_result = requirement_assessment.infer_result(
+                    mapping=mapping,
+                    source_requirement_assessment=source_requirement_assessment,
+                )
+                if inferred_result.get("result") in RESULT_ORDER:
+                    inferences.append(
+                        tuple(inferred_result.get(field) for field in INFERRED_FIELDS)
+                    )
+                    refs.append(source_requirement_assessment)
+
+            if not inferences:
+                continue
+
+            position = min(
+                range(len(inferences)),
+                key=lambda i: RESULT_ORDER.index(inferences[i][0]),
+            )
+            selected_inference = inferences[position]
+            ref = refs[position]
+
+            assessment_source_dict[requirement_assessment] = [str(r.id) for r in refs]
+            for field, value in zip(INFERRED_FIELDS, selected_inference):
+                if value is not None:
+                    setattr(requirement_assessment, field, value)
+            requirement_assessment.mapping_inference = {
+                "result": requirement_assessment.result,
+                "source_requirement_assessment": {
+                    "str": str(ref),
+                    "id": str(ref.id),
+                    "is_scored": ref.is_scored,
+                    "score": ref.score,
+                    # Coverage of the last mapping considered, as before
+                    "coverage": mappings[-1].coverage,
+                },
+            }
+            updated.append(requirement_assessment)
+
+        return updated, assessment_source_dict
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0170_alter_terminology_field_path"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appliedcontrol",
+            index=models.Index(
+                fields=["created_at", "id"], name="core_appliedcontrol_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="requirementassessment",
+            index=models.Index(
+                fields=["created_at", "id"], name="core_reqassessment_keyset_idx"
+            ),
+        ),
+    ]
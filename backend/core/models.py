@@ -69,6 +69,8 @@ from .validators import (
     JSONSchemaInstanceValidator,
 )
 from . import dora
+from .risk_matrix_cache import get_compiled_matrix, not_rated_entry
+from .asset_graph import get_asset_graph
 from collections import defaultdict, deque
 
 logger = get_logger(__name__)
@@ -2320,15 +2322,16 @@ class RiskMatrix(ReferentialObjectMixin, I18nObjectMixin, EditableMixin):
         return self.json_definition
 
     def parse_json_translated(self) -> dict:
-        return update_translations_in_object(self.json_definition)
+        # Shared compiled definition: callers must not mutate it
+        return self.compiled.definition
+
+    @property
+    def compiled(self):
+        return get_compiled_matrix(self)
 
     @property
     def grid(self) -> list[list]:
-        risk_matrix = self.parse_json()
-        grid = []
-        for row in risk_matrix["grid"]:
-            grid.append([item for item in row])
-        return grid
+        return [list(row) for row in self.compiled.grid]
 
     @property
     def probability(self) -> list:
@@ -2351,10 +2354,7 @@ class RiskMatrix(ReferentialObjectMixin, I18nObjectMixin, EditableMixin):
         return risk_matrix.get("strength_of_knowledge")
 
     def render_grid_as_colors(self):
-        risk_matrix = self.parse_json()
-        raw_grid = risk_matrix["grid"]
-        populated_grid = [[risk_matrix["risk"][i] for i in row] for row in raw_grid]
-        return populated_grid
+        return [list(row) for row in self.compiled.colors]
 
     def render_transposed_grid_as_colors(self):
         """Return the transposed version of the grid given by the render_grid_as_colors method."""
@@ -3271,25 +3271,9 @@ class Asset(
     def ancestors_plus_self(self) -> set[Self]:
         """
         Returns a set containing the asset itself and all its ancestors using a
-        constant number of queries (2).
+        single query on top of the cached asset graph.
         """
-        all_links = self.__class__.parent_assets.through.objects.values_list(
-            "from_asset_id", "to_asset_id"
-        )
-        child_to_parents_map = {}
-        for child_id, parent_id in all_links:
-            if child_id not in child_to_parents_map:
-                child_to_parents_map[child_id] = set()
-            child_to_parents_map[child_id].add(parent_id)
-        ancestor_ids = {self.pk}
-        queue = deque([self.pk])  # NOTE: using deque rather than list for O(1) pops
-        while queue:
-            current_id = queue.popleft()
-            parent_ids = child_to_parents_map.get(current_id, set())
-            for parent_id in parent_ids:
-                if parent_id not in ancestor_ids:
-                    ancestor_ids.add(parent_id)
-                    queue.append(parent_id)
+        ancestor_ids = {self.pk, *get_asset_graph().ancestor_ids(self.pk)}
         return set(self.__class__.objects.filter(pk__in=ancestor_ids))
 
     def get_children(self):
@@ -3297,109 +3281,49 @@ class Asset(
 
     def get_descendants(self) -> set[Self]:
         """
-        Returns a set of all descendant assets using a constant number of
-        queries (2).
+        Returns a set of all descendant assets using a single query on top of
+        the cached asset graph.
         """
-        all_links = self.__class__.parent_assets.through.objects.values_list(
-            "from_asset_id", "to_asset_id"
-        )
-        parent_to_children_map = {}
-        for child_id, parent_id in all_links:
-            if parent_id not in parent_to_children_map:
-                parent_to_children_map[parent_id] = set()
-            parent_to_children_map[parent_id].add(child_id)
-        descendant_ids = set()
-        visited_ids = {
-            self.pk
-        }  # NOTE: keeping track of visited ids as a guardrail in the unlikely event of cycles in the assets graph
-        queue = deque([self.pk])  # NOTE: using deque rather than list for O(1) pops
-        while queue:
-            current_id = queue.popleft()
-            child_ids = parent_to_children_map.get(current_id, set())
-            for child_id in child_ids:
-                if child_id not in visited_ids:
-                    visited_ids.add(child_id)
-                    descendant_ids.add(child_id)
-                    queue.append(child_id)
+        descendant_ids = get_asset_graph().descendant_ids(self.pk)
         return set(self.__class__.objects.filter(pk__in=descendant_ids))
 
     @property
     def children_assets(self):
-        descendants = self.get_descendants()
-        descendant_ids = [d.id for d in descendants]
-        return Asset.objects.filter(id__in=descendant_ids).exclude(id=self.id)
+        return Asset.objects.filter(id__in=get_asset_graph().descendant_ids(self.id))
 
     @classmethod
     def _prefetch_graph_data(cls, initial_assets: list) -> dict:
         """
-        Finds all ancestors and descendants of the initial assets using a constant
-        number of database queries (3), ideal for deep or complex hierarchies.
+        Finds all ancestors and descendants of the initial assets using a single
+        database query, ideal for deep or complex hierarchies.
 
-        This method pre-fetches all parent-child links into memory to build a
-        complete graph, then traverses it without any further database calls to
-        identify the relevant subgraph.
+        The parent-child links come from the cached asset graph; the relevant
+        subgraph is identified in memory and only its assets are fetched.
         """
         if not initial_assets:
             return {"child_to_parents": {}, "parent_to_children": {}}
 
-        # First query: fetch all parent-child relationships in the entire table
-        all_links = cls.parent_assets.through.objects.values_list(
-            "from_asset_id", "to_asset_id"
-        )
-
-        # Build in-memory maps of the entire graph
-        child_to_parents_map = {}
-        parent_to_children_map = {}
-        for child_id, parent_id in all_links:
-            child_to_parents_map.setdefault(child_id, set()).add(parent_id)
-            parent_to_children_map.setdefault(parent_id, set()).add(child_id)
+        graph = get_asset_graph()
 
         # find all relevant IDs (ancestors and descendants).
-        initial_ids = {asset.id for asset in initial_assets}
-        all_relevant_ids = set(initial_ids)
+        all_relevant_ids = graph.related_ids(asset.id for asset in initial_assets)
 
-        # find all ancestors
-        queue = deque(initial_ids)
-        visited_ancestors = set(initial_ids)
-        while queue:
-            current_id = queue.popleft()
-            parent_ids = child_to_parents_map.get(current_id, set())
-            for parent_id in parent_ids:
-                if parent_id not in visited_ancestors:
-                    visited_ancestors.add(parent_id)
-                    all_relevant_ids.add(parent_id)
-                    queue.append(parent_id)
-
-        # find all descendants
-        queue = deque(initial_ids)
-        visited_descendants = set(initial_ids)
-        while queue:
-            current_id = queue.popleft()
-            child_ids = parent_to_children_map.get(current_id, set())
-            for child_id in child_ids:
-                if child_id not in visited_descendants:
-                    visited_descendants.add(child_id)
-                    all_relevant_ids.add(child_id)
-                    queue.append(child_id)
-
-        # Second query: fetch all the actual assets
+        # Only query: fetch all the actual assets
         asset_map = {a.id: a for a in cls.objects.filter(id__in=all_relevant_ids)}
 
-        # Third query: fetch only the links connecting the relevant assets
-        # This ensures we only build the subgraph we care about.
-        relevant_links = cls.parent_assets.through.objects.filter(
-            from_asset_id__in=all_relevant_ids, to_asset_id__in=all_relevant_ids
-        ).values_list("from_asset_id", "to_asset_id")
-
-        # Build the final object maps for in-memory traversal by the caller
+        # Build the final object maps for in-memory traversal by the caller,
+        # keeping only the links connecting the relevant assets
         obj_child_to_parents = {}
         obj_parent_to_children = {}
-        for child_id, parent_id in relevant_links:
+        for child_id in all_relevant_ids:
             child_obj = asset_map.get(child_id)
-            parent_obj = asset_map.get(parent_id)
-            if child_obj and parent_obj:
-                obj_child_to_parents.setdefault(child_obj, set()).add(parent_obj)
-                obj_parent_to_children.setdefault(parent_obj, set()).add(child_obj)
+            if child_obj is None:
+                continue
+            for parent_id in graph.parents.get(child_id, ()):
+                parent_obj = asset_map.get(parent_id)
+                if parent_obj:
+                    obj_child_to_parents.setdefault(child_obj, set()).add(parent_obj)
+                    obj_parent_to_children.setdefault(parent_obj, set()).add(child_obj)
 
         return {
             "child_to_parents": obj_child_to_parents,
@@ -3607,6 +3531,58 @@ class Asset(
             return settings.value.get("security_objective_scale", "1-4")
         return "1-4"
 
+    @classmethod
+    def get_inherited_objectives(cls, assets) -> dict:
+        """
+        Security and disaster recovery objectives of a batch of assets, as
+        returned by `get_security_objectives` and
+        `get_disaster_recovery_objectives`, keyed by asset id.
+
+        Ancestors come from the cached asset graph and the primary ones are
+        fetched in a single query for the whole batch.
+        """
+        graph = get_asset_graph()
+        ancestor_ids = {
+            asset.id: graph.ancestor_ids(asset.id)
+            for asset in assets
+            if not asset.is_primary
+        }
+        primary_ancestors = {
+            asset.id: asset
+            for asset in cls.objects.filter(
+                id__in=set().union(*ancestor_ids.values()), type=cls.Type.PRIMARY
+            ).only("id", "type", "security_objectives", "disaster_recovery_objectives")
+        }
+
+        results = {}
+        for asset in assets:
+            if asset.is_primary:
+                results[asset.id] = {
+                    "security_objectives": asset.security_objectives,
+                    "disaster_recovery_objectives": asset.disaster_recovery_objectives,
+                }
+                continue
+            primaries = [
+                primary_ancestors[ancestor_id]
+                for ancestor_id in ancestor_ids[asset.id]
+                if ancestor_id in primary_ancestors
+            ]
+            if not primaries:
+                results[asset.id] = {
+                    "security_objectives": {},
+                    "disaster_recovery_objectives": {},
+                }
+                continue
+            results[asset.id] = {
+                "security_objectives": {
+                    "objectives": cls._aggregate_security_objectives(primaries)
+                },
+                "disaster_recovery_objectives": {
+                    "objectives": cls._aggregate_dro_objectives(primaries)
+                },
+            }
+        return results
+
     def get_security_objectives(self) -> dict[str, dict[str, dict[str, int | bool]]]:
         """
         Gets the security objectives of a given asset.
@@ -3624,24 +3600,7 @@ class Asset(
         if self.is_primary:
             return self.security_objectives
 
-        ancestors = self.ancestors_plus_self()
-        primary_assets = {asset for asset in ancestors if asset.is_primary}
-        if not primary_assets:
-            return {}
-
-        security_objectives = {}
-        for asset in primary_assets:
-            for key, content in asset.security_objectives.get("objectives", {}).items():
-                if not content.get("is_enabled", False):
-                    continue
-                if key not in security_objectives:
-                    security_objectives[key] = content
-                else:
-                    security_objectives[key]["value"] = max(
-                        security_objectives[key].get("value", 0),
-                        content.get("value", 0),
-                    )
-        return {"objectives": security_objectives}
+        return self.get_inherited_objectives([self])[self.id]["security_objectives"]
 
     def get_disaster_recovery_objectives(self) -> dict[str, dict[str, dict[str, int]]]:
         """
@@ -3653,28 +3612,9 @@ class Asset(
         if self.is_primary:
             return self.disaster_recovery_objectives
 
-        ancestors = self.ancestors_plus_self()
-        primary_assets = {asset for asset in ancestors if asset.is_primary}
-        if not primary_assets:
-            return {}
-
-        disaster_recovery_objectives = {}
-        for asset in primary_assets:
-            for key, content in asset.disaster_recovery_objectives.get(
-                "objectives", {}
-            ).items():
-                value = content.get("value")
-                # Skip None or 0 values (treat as "not set")
-                if not value:
-                    continue
-                if key not in disaster_recovery_objectives:
-                    disaster_recovery_objectives[key] = content.copy()
-                else:
-                    current_value = disaster_recovery_objectives[key].get("value")
-                    if current_value is None or value < current_value:
-                        disaster_recovery_objectives[key]["value"] = value
-
-        return {"objectives": disaster_recovery_objectives}
+        return self.get_inherited_objectives([self])[self.id][
+            "disaster_recovery_objectives"
+        ]
 
     def get_security_capabilities(self) -> dict[str, dict[str, dict[str, int | bool]]]:
         """
@@ -5100,6 +5040,12 @@ class AppliedControl(
     class Meta:
         verbose_name = _("Applied control")
         verbose_name_plural = _("Applied controls")
+        # Key of the keyset pagination of the list endpoint
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="core_appliedcontrol_keyset_idx"
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         # Track what changed
@@ -6451,31 +6397,9 @@ class RiskScenario(NameDescriptionMixin, FilteringLabelMixin, FolderMixin):
             value (int): The risk level, impact, or probability value.
             data_key (str): The key to access in the risk matrix ('risk', 'impact', or 'probability').
         """
-        # Handle the "not rated" case
         if value < 0:
-            not_rated_response = {
-                "abbreviation": "--",
-                "name": "--",
-                "description": "not rated",
-                "value": -1,
-            }
-            # Add hexcolor only for the main risk level
-            if data_key == "risk":
-                not_rated_response["hexcolor"] = "#A9A9A9"
-            return not_rated_response
-
-        # Handle the rated case
-        risk_matrix = self.get_matrix()
-        data = {
-            **risk_matrix[data_key][value],
-            "value": value,
-        }
-
-        # Apply translations only for the main risk level
-        if data_key == "risk":
-            update_translations_in_object(data)
-
-        return data
+            return not_rated_entry(data_key)
+        return self.risk_assessment.risk_matrix.compiled.lookup(data_key, value)
 
     # --- Inherent Methods ---
     def get_inherent_risk(self):
@@ -7857,89 +7781,15 @@ class ComplianceAssessment(Assessment):
     def compute_requirement_assessments_results(
         self, mapping_set: RequirementMappingSet, source_assessment: Self
     ) -> tuple[list["RequirementAssessment"], dict["RequirementAssessment", list[str]]]:
-        requirement_assessments: list[RequirementAssessment] = []
-        assessment_source_dict: dict[RequirementAssessment, list[str]] = {}
-        result_order = (
-            RequirementAssessment.Result.NOT_ASSESSED,
-            RequirementAssessment.Result.NOT_APPLICABLE,
-            RequirementAssessment.Result.NON_COMPLIANT,
-            RequirementAssessment.Result.PARTIALLY_COMPLIANT,
-            RequirementAssessment.Result.COMPLIANT,
-        )
-
-        def assign_attributes(target, attributes):
-            """
-            Helper function to assign attributes to a target object.
-            Only assigns if the attribute is not None.
-            """
-            keys = ["result", "status", "score", "is_scored", "observation"]
-            for key, value in zip(keys, attributes):
-                if value is not None:
-                    setattr(target, key, value)
-
-        for requirement_assessment in self.requirement_assessments.all():
-            mappings = mapping_set.mappings.filter(
-                target_requirement=requirement_assessment.requirement
-            )
-            inferences = []
-            refs = []
-
-            # Filter for full coverage relationships if applicable
-            if mappings.filter(
-                relationship__in=RequirementMapping.FULL_COVERAGE_RELATIONSHIPS
-            ).exists():
-                mappings = mappings.filter(
-                    relationship__in=RequirementMapping.FULL_COVERAGE_RELATIONSHIPS
-                )
-
-            for mapping in mappings:
-                source_requirement_assessment = RequirementAssessment.objects.get(
-                    compliance_assessment=source_assessment,
-                    requirement=mapping.source_requirement,
-                )
-                inferred_result = requirement_assessment.infer_result(
-                    mapping=mapping,
-                    source_requirement_assessment=source_requirement_assessment,
-                )
-                if inferred_result.get("result") in result_order:
-                    inferences.append(
-                        (
-                            inferred_result.get("result"),
-                            inferred_result.get("status"),
-                            inferred_result.get("score"),
-                            inferred_result.get("is_scored"),
-                            inferred_result.get("observation"),
-                        )
-                    )
-                    refs.append(source_requirement_assessment)
-
-            if inferences:
-                if len(inferences) == 1:
-                    selected_inference = inferences[0]
-                    ref = refs[0]
-                else:
-                    selected_inference = min(
-                        inferences, key=lambda x: result_order.index(x[0])
-                    )
-                    ref = refs[inferences.index(selected_inference)]
-
-                assessment_source_dict[requirement_assessment] = [
-                    str(ref.id) for ref in refs
-                ]
+        """
+        Infer this audit's results from `source_assessment` through
+        `mapping_set` and save them. See core.mappings.inference.
+        """
+        from core.mappings.inference import MappingSetInference
 
-                assign_attributes(requirement_assessment, selected_inference)
-                requirement_assessment.mapping_inference = {
-                    "result": requirement_assessment.result,
-                    "source_requirement_assessment": {
-                        "str": str(ref),
-                        "id": str(ref.id),
-                        "is_scored": ref.is_scored,
-                        "score": ref.score,
-                        "coverage": mapping.coverage,
-                    },
-                    # "mappings": [mapping.id for mapping in mappings],
-                }
-                requirement_assessments.append(requirement_assessment)
+        requirement_assessments, assessment_source_dict = MappingSetInference(
+            mapping_set
+        ).infer(self, source_assessment)
 
         RequirementAssessment.objects.bulk_update(
             requirement_assessments,
@@ -8336,6 +8186,12 @@ class RequirementAssessment(AbstractBaseModel, FolderMixin, ETADueDateMixin):
     class Meta:
         verbose_name = _("Requirement assessment")
         verbose_name_plural = _("Requirement assessments")
+        # Key of the keyset pagination of the list endpoint
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="core_reqassessment_keyset_idx"
+            ),
+        ]
 
     def has_evidence(self) -> bool:
         """
@@ -8479,7 +8335,7 @@ class RequirementAssessment(AbstractBaseModel, FolderMixin, ETADueDateMixin):
     def compute_score_and_result(self):
         self.recompute_assessment()
         # Atomic update and save
-        self.save(update_fields=["score", "result", "is_scored"])
+        self.save(update_fields=["score", "result", "is_scored", "updated_at"])
 
     _CEL_RELEVANT_FIELDS = frozenset({"score", "result", "status"})
 
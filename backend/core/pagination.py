@@ -1,20 +1,130 @@
-from rest_framework.pagination import LimitOffsetPagination
+import json
+
+from django.db import connections
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from urllib.parse import urlparse
 
 
+def strip_link(link):
+    """Keep only the path and query components of a pagination link"""
+    if link is None:
+        return None
+    parsed = urlparse(link)
+    return f"{parsed.path}?{parsed.query}"
+
+
+def estimate_count(queryset):
+    """
+    Row count of a queryset from the query planner, without running a COUNT(*).
+    Falls back to an exact count on databases other than PostgreSQL.
+    """
+    queryset = queryset.order_by()
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.count()
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on a stable indexed key: each page is fetched with a
+    WHERE on the last key seen instead of an OFFSET, and no COUNT(*) is run.
+
+    The total is only returned when asked for with ?count=exact or
+    ?count=estimate (planner estimate, cheap on large tables).
+    ?limit= is capped at the default page size.
+    """
+
+    page_size_query_param = "limit"
+    max_page_size = api_settings.PAGE_SIZE
+    count_query_param = "count"
+
+    def __init__(self, ordering):
+        self.ordering = ordering
+
+    def get_ordering(self, request, queryset, view):
+        # Client-side ?ordering= is ignored: the cursor needs a stable key
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        count_mode = request.query_params.get(self.count_query_param)
+        if count_mode == "exact":
+            self.count = queryset.count()
+        elif count_mode == "estimate":
+            self.count = estimate_count(queryset)
+        else:
+            self.count = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_next_link(self):
+        return strip_link(super().get_next_link())
+
+    def get_previous_link(self):
+        return strip_link(super().get_previous_link())
+
+    def get_paginated_response(self, data):
+        response = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+        }
+        if self.count is not None:
+            response["count"] = self.count
+        response["results"] = data
+        return Response(response)
+
+
 class CustomLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination, or keyset pagination when the request has a
+    ?cursor= parameter (empty for the first page) and the view declares a
+    keyset_ordering.
+    """
+
+    cursor_query_param = "cursor"
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        keyset_ordering = getattr(view, "keyset_ordering", None)
+        if keyset_ordering and self.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination(ordering=keyset_ordering)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
     def get_next_link(self):
-        next_link = super().get_next_link()
-        if next_link is None:
-            return None
-        # Extract just the path and query components
-        parsed = urlparse(next_link)
-        return f"{parsed.path}?{parsed.query}"
+        if self.keyset is not None:
+            return self.keyset.get_next_link()
+        return strip_link(super().get_next_link())
 
     def get_previous_link(self):
-        previous_link = super().get_previous_link()
-        if previous_link is None:
-            return None
-        # Extract just the path and query components
-        parsed = urlparse(previous_link)
-        return f"{parsed.path}?{parsed.query}"
+        if self.keyset is not None:
+            return self.keyset.get_previous_link()
+        return strip_link(super().get_previous_link())
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if not getattr(view, "keyset_ordering", None):
+            return parameters
+        return parameters + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Keyset pagination cursor (empty for the first page).",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": KeysetPagination.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "With a cursor, also return the total count.",
+                "schema": {"type": "string", "enum": ["exact", "estimate"]},
+            },
+        ]
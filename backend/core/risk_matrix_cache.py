@@ -0,0 +1,126 @@
+"""
+Process-level cache of compiled risk matrices.
+
+Reading a level, impact or probability of a risk scenario used to translate
+the whole ``RiskMatrix.json_definition`` on every call. A compiled matrix is
+translated once per (matrix, version, locale) and keeps ready-made lookup
+tuples, so serializing thousands of scenarios only does tuple indexing.
+
+Entries are keyed on the matrix ``updated_at``/``editing_version`` (so a
+matrix saved by another process is recompiled on next access) and dropped
+from this process as soon as the matrix is saved or deleted.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import get_language
+
+from library.helpers import update_translations_in_object
+
+COMPILED_MATRIX_CACHE_SIZE = 256
+
+
+def not_rated_entry(data_key: str) -> dict:
+    not_rated = {
+        "abbreviation": "--",
+        "name": "--",
+        "description": "not rated",
+        "value": -1,
+    }
+    # Add hexcolor only for the main risk level
+    if data_key == "risk":
+        not_rated["hexcolor"] = "#A9A9A9"
+    return not_rated
+
+
+class CompiledRiskMatrix:
+    """
+    Translated, read-only view of a risk matrix definition.
+
+    ``definition`` and the lookup entries are shared between callers and must
+    not be mutated; ``lookup`` returns a fresh dict for each call.
+    """
+
+    __slots__ = (
+        "definition",
+        "probability",
+        "impact",
+        "risk",
+        "grid",
+        "colors",
+        "strength_of_knowledge",
+    )
+
+    def __init__(self, json_definition: dict):
+        definition = update_translations_in_object(copy.deepcopy(json_definition))
+        self.definition = definition
+        self.probability = self._levels(definition.get("probability", []))
+        self.impact = self._levels(definition.get("impact", []))
+        self.risk = self._levels(definition.get("risk", []))
+        self.grid = tuple(tuple(row) for row in definition.get("grid", []))
+        risk = definition.get("risk", [])
+        self.colors = tuple(tuple(risk[i] for i in row) for row in self.grid)
+        self.strength_of_knowledge = definition.get("strength_of_knowledge")
+
+    @staticmethod
+    def _levels(items: list) -> tuple:
+        return tuple({**item, "value": index} for index, item in enumerate(items))
+
+    def lookup(self, data_key: str, value: int) -> dict:
+        """
+        Entry of ``data_key`` ('risk', 'impact' or 'probability') at ``value``,
+        with its index under "value". Negative values are "not rated".
+        """
+        if value < 0:
+            return not_rated_entry(data_key)
+        return dict(getattr(self, data_key)[value])
+
+
+_compiled: OrderedDict = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_compiled_matrix(risk_matrix) -> CompiledRiskMatrix:
+    """Compiled matrix for the current language, built on first access."""
+    if risk_matrix.pk is None:
+        return CompiledRiskMatrix(risk_matrix.json_definition)
+
+    key = (
+        risk_matrix.pk,
+        risk_matrix.updated_at,
+        getattr(risk_matrix, "editing_version", None),
+        get_language(),
+    )
+    with _lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            _compiled.move_to_end(key)
+            return compiled
+
+    compiled = CompiledRiskMatrix(risk_matrix.json_definition)
+    with _lock:
+        _compiled[key] = compiled
+        while len(_compiled) > COMPILED_MATRIX_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return compiled
+
+
+def invalidate_compiled_matrix(matrix_id) -> None:
+    with _lock:
+        for key in [key for key in _compiled if key[0] == matrix_id]:
+            del _compiled[key]
+
+
+def clear_compiled_matrices() -> None:
+    with _lock:
+        _compiled.clear()
+
+
+@receiver(post_save, sender="core.RiskMatrix")
+@receiver(post_delete, sender="core.RiskMatrix")
+def drop_compiled_matrix(sender, instance, **kwargs):
+    invalidate_compiled_matrix(instance.pk)
@@ -3156,7 +3156,7 @@ class RequirementAssessmentWriteSerializer(BaseModelSerializer):
                         else:
                             answer.selected_choices.clear()
                         answer.value = None
-                        answer.save(update_fields=["value"])
+                        answer.save(update_fields=["value", "updated_at"])
                     elif question.type == Question.Type.MULTIPLE_CHOICE:
                         if isinstance(answer_value, list) and answer_value:
                             choices = question.choices.filter(urn__in=answer_value)
@@ -3175,10 +3175,10 @@ class RequirementAssessmentWriteSerializer(BaseModelSerializer):
                         else:
                             answer.selected_choices.clear()
                         answer.value = None
-                        answer.save(update_fields=["value"])
+                        answer.save(update_fields=["value", "updated_at"])
                     else:
                         answer.value = answer_value
-                        answer.save(update_fields=["value"])
+                        answer.save(update_fields=["value", "updated_at"])
 
                 # Check if any choice has scoring or result logic
                 from core.models import QuestionChoice
@@ -3219,7 +3219,7 @@ class RequirementAssessmentWriteSerializer(BaseModelSerializer):
                 new_alignment = validated_data.get("respondent_alignment")
                 if new_alignment and new_alignment in ALIGNMENT_TO_RESULT:
                     instance.result = ALIGNMENT_TO_RESULT[new_alignment]
-                    instance.save(update_fields=["result"])
+                    instance.save(update_fields=["result", "updated_at"])
                 elif not new_alignment:
                     # Deselection: reset result and scores so the RA is truly
                     # unassessed (progress() flags an RA as assessed when score
@@ -0,0 +1,148 @@
+import pytest
+
+from core.asset_graph import get_asset_graph
+from core.models import Asset
+from iam.models import Folder
+
+
+def objectives(confidentiality, availability, rto):
+    return {
+        "security_objectives": {
+            "objectives": {
+                "confidentiality": {"value": confidentiality, "is_enabled": True},
+                "availability": {"value": availability, "is_enabled": True},
+                "integrity": {"value": 4, "is_enabled": False},
+            }
+        },
+        "disaster_recovery_objectives": {"objectives": {"rto": {"value": rto}}},
+    }
+
+
+@pytest.fixture
+def hierarchy():
+    """
+    p1   p2
+     \\  / \\
+      s1   s3
+      |
+      s2         orphan
+    """
+    folder = Folder.get_root_folder()
+
+    def asset(name, asset_type, **kwargs):
+        return Asset.objects.create(name=name, type=asset_type, folder=folder, **kwargs)
+
+    assets = {
+        "p1": asset("p1", Asset.Type.PRIMARY, **objectives(1, 3, 3600)),
+        "p2": asset("p2", Asset.Type.PRIMARY, **objectives(2, 1, 600)),
+        "s1": asset("s1", Asset.Type.SUPPORT),
+        "s2": asset("s2", Asset.Type.SUPPORT),
+        "s3": asset("s3", Asset.Type.SUPPORT),
+        "orphan": asset("orphan", Asset.Type.SUPPORT),
+    }
+    assets["s1"].parent_assets.add(assets["p1"], assets["p2"])
+    assets["s2"].parent_assets.add(assets["s1"])
+    assets["s3"].parent_assets.add(assets["p2"])
+    return assets
+
+
+@pytest.mark.django_db
+class TestAssetGraph:
+    def test_closures(self, hierarchy):
+        ids = {name: asset.id for name, asset in hierarchy.items()}
+        graph = get_asset_graph()
+        assert graph.ancestor_ids(ids["s2"]) == {ids["s1"], ids["p1"], ids["p2"]}
+        assert graph.descendant_ids(ids["p2"]) == {ids["s1"], ids["s2"], ids["s3"]}
+        assert graph.descendant_ids(ids["orphan"]) == set()
+        assert graph.related_ids([ids["s1"]]) == {
+            ids["s1"],
+            ids["s2"],
+            ids["p1"],
+            ids["p2"],
+        }
+
+    def test_link_changes_invalidate_the_graph(self, hierarchy):
+        s2, s3, orphan = hierarchy["s2"], hierarchy["s3"], hierarchy["orphan"]
+        assert orphan.get_descendants() == set()
+
+        s3.parent_assets.add(orphan)
+        assert orphan.get_descendants() == {s3}
+
+        s3.parent_assets.remove(orphan)
+        assert orphan.get_descendants() == set()
+
+        hierarchy["s1"].delete()
+        assert s2.ancestors_plus_self() == {s2}
+
+    def test_cycles_terminate(self, hierarchy):
+        hierarchy["p1"].parent_assets.add(hierarchy["s2"])
+        assert hierarchy["s2"].get_descendants() == {
+            hierarchy["p1"],
+            hierarchy["s1"],
+        }
+        assert hierarchy["s2"] not in hierarchy["s2"].get_descendants()
+
+
+@pytest.mark.django_db
+class TestInheritedObjectives:
+    def test_batch_matches_hand_built_expectations(self, hierarchy):
+        def inherited_from(confidentiality, availability, rto):
+            return {
+                "security_objectives": {
+                    "objectives": {
+                        "confidentiality": {
+                            "value": confidentiality,
+                            "is_enabled": True,
+                        },
+                        "availability": {"value": availability, "is_enabled": True},
+                    }
+                },
+                "disaster_recovery_objectives": {"objectives": {"rto": {"value": rto}}},
+            }
+
+        ids = {name: asset.id for name, asset in hierarchy.items()}
+        graph = get_asset_graph()
+        assert graph.ancestor_ids(ids["s1"]) == {ids["p1"], ids["p2"]}
+        assert graph.ancestor_ids(ids["s3"]) == {ids["p2"]}
+        assert graph.ancestor_ids(ids["orphan"]) == set()
+
+        inherited = Asset.get_inherited_objectives(list(hierarchy.values()))
+        assert inherited == {
+            # Primary assets keep their own objectives, disabled ones included
+            ids["p1"]: objectives(1, 3, 3600),
+            ids["p2"]: objectives(2, 1, 600),
+            # p1 and p2: max(1, 2), max(3, 1), min(3600, 600)
+            ids["s1"]: inherited_from(2, 3, 600),
+            ids["s2"]: inherited_from(2, 3, 600),
+            # p2 only
+            ids["s3"]: inherited_from(2, 1, 600),
+            ids["orphan"]: {
+                "security_objectives": {},
+                "disaster_recovery_objectives": {},
+            },
+        }
+
+    def test_aggregation(self, hierarchy):
+        inherited = Asset.get_inherited_objectives(list(hierarchy.values()))
+        # Highest security objective and lowest recovery objective win
+        assert inherited[hierarchy["s2"].id] == {
+            "security_objectives": {
+                "objectives": {
+                    "confidentiality": {"value": 2, "is_enabled": True},
+                    "availability": {"value": 3, "is_enabled": True},
+                }
+            },
+            "disaster_recovery_objectives": {"objectives": {"rto": {"value": 600}}},
+        }
+        assert inherited[hierarchy["orphan"].id] == {
+            "security_objectives": {},
+            "disaster_recovery_objectives": {},
+        }
+
+    def test_query_count_does_not_grow_with_assets(
+        self, hierarchy, django_assert_max_num_queries
+    ):
+        assets = list(Asset.objects.all())
+        get_asset_graph()
+        with django_assert_max_num_queries(2):
+            Asset.get_inherited_objectives(assets)
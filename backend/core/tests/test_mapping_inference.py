@@ -0,0 +1,225 @@
+import random
+
+import pytest
+
+from core.models import (
+    ComplianceAssessment,
+    Framework,
+    Perimeter,
+    RequirementAssessment,
+    RequirementMapping,
+    RequirementMappingSet,
+    RequirementNode,
+)
+from iam.models import Folder
+
+RESULTS = [choice for choice, _ in RequirementAssessment.Result.choices]
+STATUSES = [choice for choice, _ in RequirementAssessment.Status.choices]
+RELATIONSHIPS = [choice for choice, _ in RequirementMapping.Relationship.choices]
+
+
+def legacy_compute(target, mapping_set, source_assessment):
+    """Per-requirement implementation the inference engine replaced (no save)."""
+    requirement_assessments = []
+    assessment_source_dict = {}
+    result_order = (
+        RequirementAssessment.Result.NOT_ASSESSED,
+        RequirementAssessment.Result.NOT_APPLICABLE,
+        RequirementAssessment.Result.NON_COMPLIANT,
+        RequirementAssessment.Result.PARTIALLY_COMPLIANT,
+        RequirementAssessment.Result.COMPLIANT,
+    )
+
+    def assign_attributes(target, attributes):
+        keys = ["result", "status", "score", "is_scored", "observation"]
+        for key, value in zip(keys, attributes):
+            if value is not None:
+                setattr(target, key, value)
+
+    for requirement_assessment in target.requirement_assessments.all():
+        mappings = mapping_set.mappings.filter(
+            target_requirement=requirement_assessment.requirement
+        ).order_by("id")
+        inferences = []
+        refs = []
+        if mappings.filter(
+            relationship__in=RequirementMapping.FULL_COVERAGE_RELATIONSHIPS
+        ).exists():
+            mappings = mappings.filter(
+                relationship__in=RequirementMapping.FULL_COVERAGE_RELATIONSHIPS
+            )
+        for mapping in mappings:
+            source_requirement_assessment = RequirementAssessment.objects.get(
+                compliance_assessment=source_assessment,
+                requirement=mapping.source_requirement,
+            )
+            inferred_result = requirement_assessment.infer_result(
+                mapping=mapping,
+                source_requirement_assessment=source_requirement_assessment,
+            )
+            if inferred_result.get("result") in result_order:
+                inferences.append(
+                    (
+                        inferred_result.get("result"),
+                        inferred_result.get("status"),
+                        inferred_result.get("score"),
+                        inferred_result.get("is_scored"),
+                        inferred_result.get("observation"),
+                    )
+                )
+                refs.append(source_requirement_assessment)
+        if inferences:
+            selected_inference = min(inferences, key=lambda x: result_order.index(x[0]))
+            ref = refs[inferences.index(selected_inference)]
+            assessment_source_dict[requirement_assessment] = [
+                str(ref.id) for ref in refs
+            ]
+            assign_attributes(requirement_assessment, selected_inference)
+            requirement_assessment.mapping_inference = {
+                "result": requirement_assessment.result,
+                "source_requirement_assessment": {
+                    "str": str(ref),
+                    "id": str(ref.id),
+                    "is_scored": ref.is_scored,
+                    "score": ref.score,
+                    "coverage": mapping.coverage,
+                },
+            }
+            requirement_assessments.append(requirement_assessment)
+    return requirement_assessments, assessment_source_dict
+
+
+def snapshot(requirement_assessments, assessment_source_dict):
+    return (
+        {
+            str(ra.id): (
+                ra.result,
+                ra.status,
+                ra.score,
+                ra.is_scored,
+                ra.observation,
+                ra.mapping_inference,
+            )
+            for ra in requirement_assessments
+        },
+        {str(ra.id): refs for ra, refs in assessment_source_dict.items()},
+    )
+
+
+@pytest.fixture
+def mapping_setup():
+    rng = random.Random(27001)
+    root_folder = Folder.get_root_folder()
+    folder = Folder.objects.create(parent_folder=root_folder, name="mapping folder")
+    perimeter = Perimeter.objects.create(name="mapping perimeter", folder=folder)
+
+    def framework(name, size):
+        fw = Framework.objects.create(
+            name=name,
+            urn=f"urn:test:framework:{name}",
+            min_score=0,
+            max_score=100,
+            folder=root_folder,
+        )
+        nodes = [
+            RequirementNode.objects.create(
+                name=f"{name} {i}",
+                urn=f"urn:test:req:{name}:{i}",
+                ref_id=f"{name}.{i}",
+                framework=fw,
+                assessable=True,
+                folder=root_folder,
+            )
+            for i in range(size)
+        ]
+        return fw, nodes
+
+    def assessment(fw, nodes, name, max_score=100, filled=False):
+        ca = ComplianceAssessment.objects.create(
+            name=name,
+            framework=fw,
+            folder=folder,
+            perimeter=perimeter,
+            min_score=0,
+            max_score=max_score,
+        )
+        for node in nodes:
+            RequirementAssessment.objects.create(
+                compliance_assessment=ca,
+                requirement=node,
+                folder=folder,
+                result=rng.choice(RESULTS) if filled else "not_assessed",
+                status=rng.choice(STATUSES) if filled else "to_do",
+                score=rng.choice([None, 0, 40, 75, 100]) if filled else None,
+                is_scored=rng.random() < 0.5 if filled else False,
+                observation=rng.choice([None, "", "observed"]) if filled else None,
+            )
+        return ca
+
+    source_fw, source_nodes = framework("source", 40)
+    target_fw, target_nodes = framework("target", 30)
+    mapping_set = RequirementMappingSet.objects.create(
+        name="source to target",
+        source_framework=source_fw,
+        target_framework=target_fw,
+    )
+    for target_node in target_nodes[:-3]:  # a few targets stay unmapped
+        for source_node in rng.sample(source_nodes, rng.randint(1, 4)):
+            RequirementMapping.objects.create(
+                mapping_set=mapping_set,
+                source_requirement=source_node,
+                target_requirement=target_node,
+                relationship=rng.choice(RELATIONSHIPS),
+            )
+
+    return {
+        "mapping_set": mapping_set,
+        "source": assessment(source_fw, source_nodes, "source audit", filled=True),
+        "same_scale": assessment(target_fw, target_nodes, "target audit"),
+        "other_scale": assessment(
+            target_fw, target_nodes, "target audit 10", max_score=10
+        ),
+    }
+
+
+@pytest.mark.django_db
+class TestMappingSetInference:
+    @pytest.mark.parametrize("target_key", ["same_scale", "other_scale"])
+    def test_matches_legacy_implementation(self, mapping_setup, target_key):
+        mapping_set = mapping_setup["mapping_set"]
+        source = mapping_setup["source"]
+        target = mapping_setup[target_key]
+
+        expected = snapshot(*legacy_compute(target, mapping_set, source))
+        updated, sources = target.compute_requirement_assessments_results(
+            mapping_set, source
+        )
+
+        assert expected[0], "fixture should produce inferences"
+        assert snapshot(updated, sources) == expected
+        # and the results were persisted
+        persisted = RequirementAssessment.objects.filter(
+            id__in=[ra.id for ra in updated]
+        )
+        assert snapshot(persisted, {})[0] == expected[0]
+
+    def test_query_count_does_not_grow_with_requirements(
+        self, mapping_setup, django_assert_max_num_queries
+    ):
+        with django_assert_max_num_queries(10):
+            mapping_setup["same_scale"].compute_requirement_assessments_results(
+                mapping_setup["mapping_set"], mapping_setup["source"]
+            )
+
+    def test_missing_source_assessment_raises(self, mapping_setup):
+        source = mapping_setup["source"]
+        mapping_set = mapping_setup["mapping_set"]
+        mapping = mapping_set.mappings.order_by("id").first()
+        source.requirement_assessments.filter(
+            requirement=mapping.source_requirement
+        ).delete()
+
+        with pytest.raises(RequirementAssessment.DoesNotExist):
+            mapping_setup["same_scale"].compute_requirement_assessments_results(
+                mapping_set, source
+            )
@@ -0,0 +1,301 @@
+from typing import Optional
+
+import pytest
+
+from core.helpers import (
+    _requirement_skeletons,
+    get_requirement_skeleton,
+    get_sorted_requirement_nodes,
+    requirement_tree_version,
+)
+from core.models import (
+    Answer,
+    ComplianceAssessment,
+    Framework,
+    Perimeter,
+    Question,
+    QuestionChoice,
+    RequirementAssessment,
+    RequirementNode,
+)
+from core.utils import build_answers_dict, camel_case
+from iam.models import Folder
+from library.helpers import get_referential_translation
+
+
+def legacy_sorted_requirement_nodes(
+    requirement_nodes: list,
+    requirements_assessed: Optional[list] = None,
+    max_score: int = 0,
+) -> dict:
+    """Recursive implementation the skeleton/overlay split replaced."""
+
+    # Cope for old version not creating order_id correctly
+    for req in requirement_nodes:
+        if req.order_id is None:
+            req.order_id = req.created_at
+
+    requirement_assessment_from_requirement_id = {
+        str(ra.requirement_id): ra for ra in (requirements_assessed or [])
+    }
+
+    # Build a dictionary to quickly access children nodes
+    children_dict = {}
+    for node in requirement_nodes:
+        if node.parent_urn not in children_dict:
+            children_dict[node.parent_urn] = []
+        children_dict[node.parent_urn].append(node)
+
+    # Sort children nodes by order_id
+    for key in children_dict:
+        children_dict[key].sort(key=lambda x: x.order_id)
+
+    def get_sorted_requirement_nodes_rec(start: list) -> dict:
+        result = {}
+        for node in start:
+            req_as = requirement_assessment_from_requirement_id.get(str(node.id))
+
+            node_data = {
+                "urn": node.urn,
+                "parent_urn": node.parent_urn,
+                "ref_id": node.ref_id,
+                "name": get_referential_translation(node, "name"),
+                "implementation_groups": node.implementation_groups or None,
+                "ra_id": str(req_as.id) if req_as else None,
+                "status": req_as.status if req_as else None,
+                "result": req_as.result if req_as else None,
+                "extended_result": req_as.extended_result if req_as else None,
+                "is_scored": req_as.is_scored if req_as else None,
+                "score": req_as.score if req_as else None,
+                "documentation_score": req_as.documentation_score if req_as else None,
+                "max_score": max_score if req_as else None,
+                "weight": node.weight if node.weight else 1,
+                "questions": node.get_questions_translated,
+                "answers": build_answers_dict(req_as.answers.all()) if req_as else None,
+                "mapping_inference": req_as.mapping_inference if req_as else None,
+                "status_display": req_as.get_status_display() if req_as else None,
+                "status_i18n": camel_case(req_as.status) if req_as else None,
+                "result_i18n": camel_case(req_as.result)
+                if req_as and req_as.result is not None
+                else None,
+                "node_content": node.display_long,
+                "display_mode": node.display_mode,
+                "style": "node",
+                "assessable": node.assessable,
+                "description": get_referential_translation(node, "description"),
+                "children": {},
+            }
+
+            result[str(node.id)] = node_data
+
+            # Process children nodes recursively
+            children = children_dict.get(node.urn, [])
+            child_nodes = get_sorted_requirement_nodes_rec(children)
+            result[str(node.id)]["children"] = child_nodes
+
+            # Update each child node with associated requirements
+            for child in children:
+                child_req_as = requirement_assessment_from_requirement_id.get(
+                    str(child.id)
+                )
+
+                child_data = {
+                    "urn": child.urn,
+                    "ref_id": child.ref_id,
+                    "implementation_groups": child.implementation_groups or None,
+                    "name": get_referential_translation(child, "name"),
+                    "description": get_referential_translation(child, "description"),
+                    "ra_id": str(child_req_as.id) if child_req_as else None,
+                    "status": child_req_as.status if child_req_as else None,
+                    "is_scored": child_req_as.is_scored if child_req_as else None,
+                    "score": child_req_as.score if child_req_as else None,
+                    "documentation_score": child_req_as.documentation_score
+                    if child_req_as
+                    else None,
+                    "max_score": max_score if child_req_as else None,
+                    "weight": child.weight if child.weight else 1,
+                    "questions": child.get_questions_translated,
+                    "answers": build_answers_dict(child_req_as.answers.all())
+                    if child_req_as
+                    else None,
+                    "mapping_inference": child_req_as.mapping_inference
+                    if child_req_as
+                    else None,
+                    "status_display": child_req_as.get_status_display()
+                    if child_req_as
+                    else None,
+                    "status_i18n": camel_case(child_req_as.status)
+                    if child_req_as
+                    else None,
+                    "result": child_req_as.result if child_req_as else None,
+                    "extended_result": child_req_as.extended_result
+                    if child_req_as
+                    else None,
+                    "result_i18n": camel_case(child_req_as.result)
+                    if child_req_as and child_req_as.result is not None
+                    else None,
+                    "style": "leaf",
+                }
+
+                result[str(node.id)]["children"][str(child.id)].update(child_data)
+
+        return result
+
+    top_level_nodes = [rn for rn in requirement_nodes if not rn.parent_urn]
+    top_level_nodes.sort(key=lambda x: x.order_id)
+
+    tree = get_sorted_requirement_nodes_rec(top_level_nodes)
+    return tree
+
+
+class ExplodingNodes:
+    """Stands for a requirement node queryset that must not be evaluated."""
+
+    def __iter__(self):
+        raise AssertionError("requirement nodes loaded despite a cached skeleton")
+
+
+@pytest.fixture
+def tree_setup():
+    _requirement_skeletons.clear()
+    root_folder = Folder.get_root_folder()
+    folder = Folder.objects.create(parent_folder=root_folder, name="tree folder")
+    perimeter = Perimeter.objects.create(name="tree perimeter", folder=folder)
+    framework = Framework.objects.create(
+        name="Tree framework",
+        urn="urn:test:tree-framework",
+        min_score=0,
+        max_score=100,
+        folder=root_folder,
+    )
+
+    def node(ref_id, parent=None, assessable=False, order_id=None, **kwargs):
+        return RequirementNode.objects.create(
+            name=f"node {ref_id}",
+            description=f"description {ref_id}",
+            urn=f"urn:test:tree:{ref_id.lower()}",
+            parent_urn=parent.urn if parent else None,
+            ref_id=ref_id,
+            framework=framework,
+            assessable=assessable,
+            order_id=order_id,
+            folder=root_folder,
+            translations={"fr": {"name": f"noeud {ref_id}"}},
+            **kwargs,
+        )
+
+    s1 = node("S1", order_id=2)
+    s2 = node("S2", order_id=1)
+    c1 = node("C1", s1, order_id=1)
+    r1 = node("R1", c1, assessable=True, order_id=2, implementation_groups=["G1"])
+    r2 = node("R2", c1, assessable=True, order_id=1, weight=3)
+    r3 = node("R3", s2, assessable=True)
+    question = Question.objects.create(
+        requirement_node=r1,
+        urn="urn:test:tree:q1",
+        ref_id="Q1",
+        text="Pick one",
+        type=Question.Type.UNIQUE_CHOICE,
+        order=0,
+        folder=root_folder,
+    )
+    choice = QuestionChoice.objects.create(
+        question=question,
+        urn="urn:test:tree:q1:c1",
+        ref_id="C1",
+        value="Yes",
+        order=0,
+        folder=root_folder,
+    )
+
+    audit = ComplianceAssessment.objects.create(
+        name="tree audit", framework=framework, folder=folder, perimeter=perimeter
+    )
+    for requirement, result in ((r1, "compliant"), (r2, "non_compliant")):
+        ra = RequirementAssessment.objects.create(
+            compliance_assessment=audit,
+            requirement=requirement,
+            folder=folder,
+            result=result,
+            score=42,
+            is_scored=True,
+        )
+        if requirement == r1:
+            answer = Answer.objects.create(
+                requirement_assessment=ra, question=question, folder=folder
+            )
+            answer.selected_choices.add(choice)
+    return framework, audit, r3
+
+
+def load(framework, audit):
+    nodes = RequirementNode.objects.filter(framework=framework).prefetch_related(
+        "questions", "questions__choices"
+    )
+    ras = list(
+        RequirementAssessment.objects.filter(
+            compliance_assessment=audit
+        ).prefetch_related("answers", "answers__question", "answers__selected_choices")
+    )
+    return nodes, ras
+
+
+@pytest.mark.django_db
+class TestRequirementTree:
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_matches_legacy_implementation(self, tree_setup, cached):
+        framework, audit, _ = tree_setup
+        nodes, ras = load(framework, audit)
+        expected = legacy_sorted_requirement_nodes(list(nodes), ras, 100)
+
+        kwargs = {"framework": framework} if cached else {}
+        tree = get_sorted_requirement_nodes(nodes, ras, 100, **kwargs)
+        assert tree == expected
+        # Same ordering at every level
+        assert list(tree) == list(expected)
+        for key, value in tree.items():
+            assert list(value["children"]) == list(expected[key]["children"])
+
+    def test_skeleton_reused_until_framework_changes(self, tree_setup):
+        framework, audit, r3 = tree_setup
+        nodes, ras = load(framework, audit)
+        first = get_sorted_requirement_nodes(nodes, ras, 100, framework=framework)
+
+        # A cached skeleton never evaluates the nodes, and trees stay independent
+        second = get_sorted_requirement_nodes(
+            ExplodingNodes(), ras, 100, framework=framework
+        )
+        assert second == first
+        next(iter(second.values()))["children"].clear()
+        assert (
+            get_sorted_requirement_nodes(
+                ExplodingNodes(), ras, 100, framework=framework
+            )
+            == first
+        )
+
+        version = requirement_tree_version(framework)
+        r3.name = "renamed"
+        r3.save()
+        assert requirement_tree_version(framework) != version
+        tree = get_sorted_requirement_nodes(
+            RequirementNode.objects.filter(framework=framework),
+            ras,
+            100,
+            framework=framework,
+        )
+        s2 = tree[str(r3.framework.requirement_nodes.get(ref_id="S2").id)]
+        assert s2["children"][str(r3.id)]["name"] == "renamed"
+        # The stale version of the framework was dropped
+        assert len(_requirement_skeletons) == 1
+
+    def test_skeleton_is_per_language(self, tree_setup):
+        from django.utils import translation
+
+        framework, _, _ = tree_setup
+        with translation.override("fr"):
+            fr = get_requirement_skeleton(framework)
+        with translation.override("en"):
+            en = get_requirement_skeleton(framework)
+        assert [data["name"] for _, data, _ in fr] == ["noeud S2", "noeud S1"]
+        assert [data["name"] for _, data, _ in en] == ["node S2", "node S1"]
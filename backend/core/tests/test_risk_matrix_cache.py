@@ -0,0 +1,148 @@
+import copy
+
+import pytest
+from django.utils import translation
+from test_fixtures import RISK_MATRIX_JSON_DEFINITION
+
+import core.risk_matrix_cache
+from core.models import Perimeter, RiskAssessment, RiskMatrix, RiskScenario
+from core.risk_matrix_cache import clear_compiled_matrices
+from iam.models import Folder
+from library.helpers import update_translations_in_object
+
+LEVELS = ("probability", "impact", "risk")
+
+
+def translated_definition():
+    definition = copy.deepcopy(RISK_MATRIX_JSON_DEFINITION)
+    for key in LEVELS:
+        for item in definition[key]:
+            item["translations"] = {
+                "fr": {
+                    "name": f"{item['name']} (fr)",
+                    "description": f"{item['description']} (fr)",
+                }
+            }
+    return definition
+
+
+def legacy_risk_data(scenario, value, data_key):
+    """Per-call implementation the compiled matrix replaced."""
+    if value < 0:
+        data = {
+            "abbreviation": "--",
+            "name": "--",
+            "description": "not rated",
+            "value": -1,
+        }
+        if data_key == "risk":
+            data["hexcolor"] = "#A9A9A9"
+        return data
+    risk_matrix = update_translations_in_object(
+        copy.deepcopy(scenario.risk_assessment.risk_matrix.json_definition)
+    )
+    data = {**risk_matrix[data_key][value], "value": value}
+    if data_key == "risk":
+        update_translations_in_object(data)
+    return data
+
+
+@pytest.fixture
+def scenarios():
+    clear_compiled_matrices()
+    folder = Folder.objects.create(name="risk folder")
+    matrix = RiskMatrix.objects.create(
+        name="translated matrix",
+        json_definition=translated_definition(),
+        folder=folder,
+    )
+    perimeter = Perimeter.objects.create(name="risk perimeter", folder=folder)
+    risk_assessment = RiskAssessment.objects.create(
+        name="risk assessment", perimeter=perimeter, risk_matrix=matrix
+    )
+    result = []
+    for proba in range(-1, 3):
+        for impact in range(-1, 3):
+            result.append(
+                RiskScenario.objects.create(
+                    name=f"scenario {proba} {impact}",
+                    risk_assessment=risk_assessment,
+                    current_proba=proba,
+                    current_impact=impact,
+                    residual_proba=impact,
+                    residual_impact=proba,
+                )
+            )
+    return matrix, result
+
+
+@pytest.mark.django_db
+class TestCompiledRiskMatrix:
+    GETTERS = {
+        "get_current_proba": ("current_proba", "probability"),
+        "get_current_impact": ("current_impact", "impact"),
+        "get_current_risk": ("current_level", "risk"),
+        "get_residual_proba": ("residual_proba", "probability"),
+        "get_residual_impact": ("residual_impact", "impact"),
+        "get_residual_risk": ("residual_level", "risk"),
+        "get_inherent_risk": ("inherent_level", "risk"),
+    }
+
+    @pytest.mark.parametrize("language", ["en", "fr"])
+    def test_getters_match_legacy_implementation(self, scenarios, language):
+        _, scenario_list = scenarios
+        with translation.override(language):
+            for scenario in RiskScenario.objects.select_related(
+                "risk_assessment__risk_matrix"
+            ).filter(id__in=[s.id for s in scenario_list]):
+                for getter, (field, data_key) in self.GETTERS.items():
+                    expected = legacy_risk_data(
+                        scenario, getattr(scenario, field), data_key
+                    )
+                    assert getattr(scenario, getter)() == expected
+
+    def test_matrix_is_translated_once_per_locale(self, scenarios, monkeypatch):
+        matrix, scenario_list = scenarios
+        calls = []
+        original = core.risk_matrix_cache.update_translations_in_object
+        monkeypatch.setattr(
+            core.risk_matrix_cache,
+            "update_translations_in_object",
+            lambda obj, *args: calls.append(obj) or original(obj, *args),
+        )
+        clear_compiled_matrices()
+        for language in ("en", "fr", "en"):
+            with translation.override(language):
+                for scenario in scenario_list:
+                    scenario.get_current_risk()
+                    scenario.get_residual_impact()
+
+        assert len(calls) == 2
+        with translation.override("fr"):
+            assert scenario_list[-1].get_current_impact()["name"] == "High (fr)"
+        # The stored definition is never translated in place
+        assert matrix.json_definition == translated_definition()
+
+    def test_save_invalidates_compiled_matrix(self, scenarios):
+        matrix, scenario_list = scenarios
+        scenario = scenario_list[-1]
+        assert scenario.get_current_risk()["name"] == "High"
+
+        definition = translated_definition()
+        definition["risk"][2]["name"] = "Critical"
+        matrix.json_definition = definition
+        matrix.save()
+
+        assert scenario.risk_assessment.risk_matrix.compiled.risk[2]["name"] == (
+            "Critical"
+        )
+        assert RiskMatrix.objects.get(id=matrix.id).grid == definition["grid"]
+
+    def test_colour_grid(self, scenarios):
+        matrix, _ = scenarios
+        colors = matrix.render_grid_as_colors()
+        grid = RISK_MATRIX_JSON_DEFINITION["grid"]
+        assert [[cell["hexcolor"] for cell in row] for row in colors] == [
+            [RISK_MATRIX_JSON_DEFINITION["risk"][i]["hexcolor"] for i in row]
+            for row in grid
+        ]
@@ -69,6 +69,7 @@ from .generators import gen_audit_context
 from .serializer_fields import FieldsRelatedField
 
 from django.utils import timezone
+from django.utils.http import parse_etags
 from django.utils.text import slugify
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
@@ -739,6 +740,12 @@ class BaseModelViewSet(viewsets.ModelViewSet):
     ]
     ordering = ["created_at"]
     ordering_fields = "__all__"
+    # Key of the opt-in keyset pagination (?cursor=), see core.pagination.
+    # The cursor positions on created_at only: rows sharing a timestamp are
+    # paged with an offset kept in the cursor. The large tables (applied
+    # controls, requirement assessments, metric samples) have a
+    # (created_at, id) index for it
+    keyset_ordering = ("created_at", "id")
     search_fields = ["name", "description"]
     filterset_fields = []
     model: type[models.Model] | None = None
@@ -1156,6 +1163,9 @@ class BaseModelViewSet(viewsets.ModelViewSet):
 
         Payload: { "action": "delete"|"change_field"|"change_m2m"|"add_m2m"|"remove_m2m"|"change_folder",
                    "ids": [...], "field": "<field_name>", "value": ... }
+
+        The "update" action applies "value", a dict of field values, to every
+        object through partial_update, as a PATCH of each object would.
         """
         action_type = request.data.get("action")
         ids = request.data.get("ids", [])
@@ -1169,6 +1179,7 @@ class BaseModelViewSet(viewsets.ModelViewSet):
             "add_m2m",
             "remove_m2m",
             "change_folder",
+            "update",
         )
         if action_type not in valid_actions:
             return Response(
@@ -1182,6 +1193,12 @@ class BaseModelViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if action_type == "update" and not (value and isinstance(value, dict)):
+            return Response(
+                {"error": "No values provided"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         BATCH_SIZE_LIMIT = 100
         if len(ids) > BATCH_SIZE_LIMIT:
             return Response(
@@ -1205,6 +1222,9 @@ class BaseModelViewSet(viewsets.ModelViewSet):
         if action_type != "delete":
             serializer_class = self.get_serializer_class(action="partial_update")
 
+        # Permissions are checked once per folder
+        allowed_by_folder = {}
+
         succeeded = []
         failed = []
 
@@ -1219,11 +1239,12 @@ class BaseModelViewSet(viewsets.ModelViewSet):
                 )
                 continue
 
-            if not RoleAssignment.is_access_allowed(
-                user=request.user,
-                perm=required_perm,
-                folder=Folder.get_folder(obj),
-            ):
+            folder = Folder.get_folder(obj)
+            if folder not in allowed_by_folder:
+                allowed_by_folder[folder] = RoleAssignment.is_access_allowed(
+                    user=request.user, perm=required_perm, folder=folder
+                )
+            if not allowed_by_folder[folder]:
                 failed.append(
                     {
                         "id": str(obj_id),
@@ -1252,6 +1273,18 @@ class BaseModelViewSet(viewsets.ModelViewSet):
                         )
                     obj.delete()
 
+                elif action_type == "update":
+                    response = self._partial_update_in_batch(request, obj_id, value)
+                    if response.status_code >= 400:
+                        failed.append(
+                            {
+                                "id": str(obj_id),
+                                "name": str(obj),
+                                "error": response.data,
+                            }
+                        )
+                        continue
+
                 elif action_type in ("add_m2m", "remove_m2m"):
                     ids_to_modify = value if isinstance(value, list) else [value]
                     m2m_field = getattr(obj, field_name)
@@ -1300,7 +1333,7 @@ class BaseModelViewSet(viewsets.ModelViewSet):
 
                 succeeded.append({"id": str(obj_id), "name": str(obj)})
 
-            except PermissionDenied as e:
+            except (PermissionDenied, DRFValidationError) as e:
                 failed.append(
                     {
                         "id": str(obj_id),
@@ -1322,6 +1355,30 @@ class BaseModelViewSet(viewsets.ModelViewSet):
 
         return Response({"succeeded": succeeded, "failed": failed})
 
+    def _partial_update_in_batch(self, request, obj_id, data) -> Response:
+        """
+        Run partial_update on one object of a batch action, as a PATCH of
+        'data' on its detail route would: the update guards of the viewset
+        apply, and nothing is saved for the object if it fails.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        saved = self.action, self.kwargs, request._full_data, request._request.method
+        self.action = "partial_update"
+        self.kwargs = {**self.kwargs, lookup_url_kwarg: str(obj_id)}
+        request._full_data = dict(data)
+        # Object permissions are resolved from the method (change for PATCH)
+        request._request.method = "PATCH"
+        try:
+            with transaction.atomic():
+                return self.partial_update(request, **self.kwargs)
+        finally:
+            (
+                self.action,
+                self.kwargs,
+                request._full_data,
+                request._request.method,
+            ) = saved
+
     @action(detail=True, methods=["get"], url_path="cascade-info")
     def cascade_info(self, request, pk=None):
         """
@@ -1931,15 +1988,37 @@ class AssetViewSet(ExportMixin, BaseModelViewSet):
         if not initial_assets:
             return optimized_data
 
+        scale = Asset._get_security_objective_scale()
+
+        # The list view only renders objectives (not capabilities nor
+        # descendants): inherit them for the whole page in one pass.
+        if self.action == "list":
+            inherited = Asset.get_inherited_objectives(initial_assets)
+            optimized_data.update(
+                {
+                    "security_objectives": {
+                        asset_id: self._format_security_objectives(
+                            objectives["security_objectives"].get("objectives", {}),
+                            scale,
+                        )
+                        for asset_id, objectives in inherited.items()
+                    },
+                    "disaster_recovery_objectives": {
+                        asset_id: self._format_disaster_recovery_objectives(
+                            objectives["disaster_recovery_objectives"].get(
+                                "objectives", {}
+                            )
+                        )
+                        for asset_id, objectives in inherited.items()
+                    },
+                }
+            )
+            return optimized_data
+
         graph_data = Asset._prefetch_graph_data(initial_assets)
         child_to_parents = graph_data["child_to_parents"]
         parent_to_children = graph_data["parent_to_children"]
 
-        # The list view only renders objectives (not capabilities), so skip the
-        # capability aggregation there to halve the per-asset work.
-        compute_capabilities = self.action != "list"
-
-        scale = Asset._get_security_objective_scale()
         sec_obj_results = {}
         dro_obj_results = {}
         sec_cap_results = {}
@@ -1954,50 +2033,41 @@ class AssetViewSet(ExportMixin, BaseModelViewSet):
             ]
 
             # Calculate and store objectives.
-            sec_cap = {}
-            rec_cap = {}
             if asset.is_primary:
                 sec_obj = asset.security_objectives.get("objectives", {})
                 dro_obj = asset.disaster_recovery_objectives.get("objectives", {})
 
-                if compute_capabilities:
-                    # For primary assets, aggregate capabilities from supporting descendants.
-                    # Reuse the already-built parent_to_children to avoid a fresh prefetch per asset.
-                    supporting_descendants = {
-                        d for d in descendants if not d.is_primary
-                    }
-                    sec_cap = Asset._aggregate_security_capabilities(
-                        supporting_descendants,
-                        asset,
-                        parent_to_children=parent_to_children,
-                    )
-                    rec_cap = Asset._aggregate_recovery_capabilities(
-                        supporting_descendants,
-                        asset,
-                        parent_to_children=parent_to_children,
-                    )
+                # For primary assets, aggregate capabilities from supporting descendants.
+                # Reuse the already-built parent_to_children to avoid a fresh prefetch per asset.
+                supporting_descendants = {d for d in descendants if not d.is_primary}
+                sec_cap = Asset._aggregate_security_capabilities(
+                    supporting_descendants,
+                    asset,
+                    parent_to_children=parent_to_children,
+                )
+                rec_cap = Asset._aggregate_recovery_capabilities(
+                    supporting_descendants,
+                    asset,
+                    parent_to_children=parent_to_children,
+                )
             else:
                 ancestors = Asset._get_all_ancestors(asset, child_to_parents)
                 primary_ancestors = {anc for anc in ancestors if anc.is_primary}
                 sec_obj = Asset._aggregate_security_objectives(primary_ancestors)
                 dro_obj = Asset._aggregate_dro_objectives(primary_ancestors)
 
-                if compute_capabilities:
-                    # For supporting assets, use stored capabilities
-                    sec_cap = asset.security_capabilities.get("objectives", {})
-                    rec_cap = asset.recovery_capabilities.get("objectives", {})
+                # For supporting assets, use stored capabilities
+                sec_cap = asset.security_capabilities.get("objectives", {})
+                rec_cap = asset.recovery_capabilities.get("objectives", {})
 
             sec_obj_results[asset.id] = self._format_security_objectives(sec_obj, scale)
             dro_obj_results[asset.id] = self._format_disaster_recovery_objectives(
                 dro_obj
             )
-            if compute_capabilities:
-                sec_cap_results[asset.id] = self._format_security_objectives(
-                    sec_cap, scale
-                )
-                rec_cap_results[asset.id] = self._format_disaster_recovery_objectives(
-                    rec_cap
-                )
+            sec_cap_results[asset.id] = self._format_security_objectives(sec_cap, scale)
+            rec_cap_results[asset.id] = self._format_disaster_recovery_objectives(
+                rec_cap
+            )
 
         optimized_data.update(
             {
@@ -4737,7 +4807,7 @@ class RiskAssessmentViewSet(BaseModelViewSet):
     def risk_timeline(self, request, pk=None):
         """Returns risk metrics over time from BuiltinMetricSample snapshots."""
         from django.contrib.contenttypes.models import ContentType
-        from metrology.models import BuiltinMetricSample
+        from metrology.rollups import builtin_metric_series
 
         risk_assessment = self.get_object()
         content_type = ContentType.objects.get_for_model(risk_assessment)
@@ -4754,21 +4824,15 @@ class RiskAssessmentViewSet(BaseModelViewSet):
             except (KeyError, TypeError, AttributeError):
                 pass
 
-        samples = (
-            BuiltinMetricSample.objects.filter(
-                content_type=content_type,
-                object_id=risk_assessment.id,
-            )
-            .order_by("date")
-            .values("date", "metrics")
-        )
+        # Compacted weekly/monthly history is stitched in transparently
+        samples = reversed(builtin_metric_series(content_type, risk_assessment.id))
 
         timeline = []
         for sample in samples:
-            metrics = sample["metrics"]
+            metrics = sample.metrics
             timeline.append(
                 {
-                    "date": sample["date"].isoformat(),
+                    "date": sample.date.isoformat(),
                     "total_scenarios": metrics.get("total_scenarios", 0),
                     "current_level_breakdown": metrics.get(
                         "current_level_breakdown", {}
@@ -8245,6 +8309,7 @@ class FrameworkViewSet(BaseModelViewSet):
                 .all(),
                 None,
                 _framework.max_score,
+                framework=_framework,
             )
         )
 
@@ -12080,21 +12145,15 @@ class ComplianceAssessmentViewSet(BaseModelViewSet):
 
         audit_from_results = engine.load_audit_fields(audit)
         max_depth = get_mapping_max_depth()
+        source_urn = audit.framework.urn
+        inferences = engine.best_mapping_inferences_many(
+            audit_from_results,
+            source_urn,
+            engine.closure.reachable(source_urn, max_depth=max_depth),
+            max_depth=max_depth,
+        )
         data = []
-        for dest_urn in sorted(
-            [
-                p[-1]
-                for p in engine.all_paths_from(
-                    source_urn=audit.framework.urn, max_depth=max_depth
-                )
-            ]
-        ):
-            best_results, _ = engine.best_mapping_inferences(
-                audit_from_results,
-                audit.framework.urn,
-                dest_urn,
-                max_depth=max_depth,
-            )
+        for dest_urn, (best_results, _) in inferences.items():
             if best_results:
                 framework = Framework.objects.filter(urn=dest_urn).first()
                 if framework and str(framework) not in str(data):
@@ -12458,9 +12517,12 @@ class ComplianceAssessmentViewSet(BaseModelViewSet):
         audit_obj = self.get_object()
         _framework = audit_obj.framework
         tree = get_sorted_requirement_nodes(
-            RequirementNode.objects.filter(framework=_framework).all(),
+            RequirementNode.objects.filter(framework=_framework).prefetch_related(
+                "questions", "questions__choices"
+            ),
             RequirementAssessment.objects.filter(compliance_assessment=audit_obj).all(),
             _framework.max_score,
+            framework=_framework,
         )
         implementation_groups = audit_obj.selected_implementation_groups
         # Don't reassign the return value: the Word spider chart depends on
@@ -13071,65 +13133,119 @@ class ComplianceAssessmentViewSet(BaseModelViewSet):
         else:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
-    @action(detail=True, methods=["get"])
-    def tree(self, request, pk):
-        compliance_assessment = self.get_object()
-        _framework = compliance_assessment.framework
-        requirement_assessments = list(
-            compliance_assessment.get_requirement_assessments(
-                include_non_assessable=True,
-                lightweight=True,
-                skip_ig_filter=True,
-            )
-        )
-        # Auditee filtering: scope to assigned requirements only
+    def _tree_scope(self, request, compliance_assessment) -> set | None:
+        """Requirement assessment ids an auditee is assigned, None otherwise."""
         auditee_folders = get_auditee_filtered_folder_ids(request.user)
         if auditee_folders and compliance_assessment.folder_id in auditee_folders:
             user_actors = Actor.get_all_for_user(request.user)
-            ra_ids = set(
+            return set(
                 RequirementAssignment.objects.filter(
                     compliance_assessment=compliance_assessment,
                     actor__in=user_actors,
                 ).values_list("requirement_assessments__id", flat=True)
             )
-            requirement_assessments = [
-                ra for ra in requirement_assessments if ra.id in ra_ids
-            ]
+        return None
 
-        requirement_nodes = list(
-            RequirementNode.objects.filter(framework=_framework)
-            .select_related("framework")
-            .prefetch_related(
-                "reference_controls", "threats", "questions", "questions__choices"
+    def _tree_requirement_assessments(self, compliance_assessment, scope) -> list:
+        requirement_assessments = list(
+            compliance_assessment.get_requirement_assessments(
+                include_non_assessable=True,
+                lightweight=True,
+                skip_ig_filter=True,
             )
-            .all(),
         )
-        nodes_by_urn = {node.urn: node for node in requirement_nodes}
-        for node in requirement_nodes:
-            parent = nodes_by_urn.get(node.parent_urn)
-            if parent:
-                node._parent_requirement_obj = parent
-        for ra in requirement_assessments:
-            req = getattr(ra, "requirement", None)
-            if req:
-                parent = nodes_by_urn.get(req.parent_urn)
-                if parent:
-                    req._parent_requirement_obj = parent
+        # Auditee filtering: scope to assigned requirements only
+        if scope is not None:
+            requirement_assessments = [
+                ra for ra in requirement_assessments if ra.id in scope
+            ]
+        return requirement_assessments
 
-        tree = get_sorted_requirement_nodes(
-            requirement_nodes,
-            requirement_assessments,
-            _framework.max_score,
+    def _build_tree(
+        self, compliance_assessment, requirement_assessments, version
+    ) -> dict:
+        _framework = compliance_assessment.framework
+        skeleton = get_requirement_skeleton(
+            _framework,
+            RequirementNode.objects.filter(framework=_framework).prefetch_related(
+                "questions", "questions__choices"
+            ),
+            version=version,
+        )
+        tree = apply_requirement_overlay(
+            skeleton, requirement_assessments, _framework.max_score
         )
+        tree = filter_graph_by_implementation_groups(
+            tree, self._tree_implementation_groups(compliance_assessment)
+        )
+        annotate_tree_with_aggregated_scores(tree, compliance_assessment)
+        return tree
+
+    def _tree_implementation_groups(self, compliance_assessment):
         implementation_groups = compliance_assessment.selected_implementation_groups
         if (
             compliance_assessment.framework.is_dynamic()
             and not compliance_assessment.selected_implementation_groups
         ):
             implementation_groups = None
-        tree = filter_graph_by_implementation_groups(tree, implementation_groups)
-        annotate_tree_with_aggregated_scores(tree, compliance_assessment)
-        return Response(tree)
+        return implementation_groups
+
+    @action(detail=True, methods=["get"])
+    def tree(self, request, pk):
+        compliance_assessment = self.get_object()
+        scope = self._tree_scope(request, compliance_assessment)
+
+        # The framework skeleton is cached per version; only the overlay of
+        # this audit is computed per request, and not at all when unchanged
+        version = requirement_tree_version(compliance_assessment.framework)
+        etag = requirement_tree_etag(version, compliance_assessment, scope)
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        requirement_assessments = self._tree_requirement_assessments(
+            compliance_assessment, scope
+        )
+        tree = self._build_tree(compliance_assessment, requirement_assessments, version)
+        return Response(tree, headers={"ETag": etag})
+
+    @action(detail=True, methods=["get"], url_path="tree/children")
+    def tree_children(self, request, pk):
+        """
+        Lazy loading of the requirement tree: one page of the children of
+        ?node=<requirement node id> (top-level nodes when omitted), without
+        their descendants but with subtree counts and aggregated scores.
+        Pass the returned "next" as ?cursor= to get the following siblings.
+        """
+        compliance_assessment = self.get_object()
+        scope = self._tree_scope(request, compliance_assessment)
+        version = requirement_tree_version(compliance_assessment.framework)
+        etag = requirement_tree_etag(version, compliance_assessment, scope)
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        try:
+            limit = int(request.query_params.get("limit", REQUIREMENT_TREE_PAGE_SIZE))
+        except ValueError:
+            raise DRFValidationError({"limit": "Must be an integer."})
+        if not 0 < limit <= REQUIREMENT_TREE_MAX_PAGE_SIZE:
+            raise DRFValidationError(
+                {"limit": f"Must be between 1 and {REQUIREMENT_TREE_MAX_PAGE_SIZE}."}
+            )
+
+        try:
+            page = requirement_tree_children(
+                compliance_assessment,
+                parent_id=request.query_params.get("node"),
+                cursor=request.query_params.get("cursor"),
+                limit=limit,
+                implementation_groups=self._tree_implementation_groups(
+                    compliance_assessment
+                ),
+                scope=scope,
+            )
+        except KeyError:
+            raise NotFound("Unknown requirement node or cursor.")
+        return Response(page, headers={"ETag": etag})
 
     @action(detail=True, methods=["get"])
     def soa(self, request, pk):
@@ -14015,19 +14131,16 @@ class ComplianceAssessmentViewSet(BaseModelViewSet):
 
     @action(detail=True, methods=["get"], url_path="progress_ts")
     def progress_ts(self, request, pk):
+        from metrology.rollups import historical_metric_series
+
         try:
-            raw = (
-                HistoricalMetric.objects.filter(
-                    model="ComplianceAssessment", object_id=pk
-                )
-                .annotate(progress=F("data__reqs__progress_perc"))
-                .values("date", "progress")
-                .order_by("date")
-            )
+            # Compacted weekly/monthly history followed by raw daily rows
+            series = historical_metric_series("ComplianceAssessment", pk)
 
             # Transform the data into the required format
             formatted_data = [
-                [entry["date"].isoformat(), entry["progress"]] for entry in raw
+                [day.isoformat(), (data.get("reqs") or {}).get("progress_perc")]
+                for day, data in series
             ]
 
             return Response({"data": formatted_data})
@@ -14515,19 +14628,19 @@ class ComplianceAssessmentViewSet(BaseModelViewSet):
     @action(detail=True, methods=["get"], url_path="compliance_timeline")
     def compliance_timeline(self, request, pk):
         """Returns compliance metrics over time from HistoricalMetric snapshots."""
+        from metrology.rollups import historical_metric_series
+
         compliance_assessment = self.get_object()
 
-        # Get historical data for this assessment
-        metrics = HistoricalMetric.objects.filter(
-            model="ComplianceAssessment", object_id=pk
-        ).order_by("date")
+        # Get historical data for this assessment (rollups + raw daily rows)
+        metrics = historical_metric_series("ComplianceAssessment", pk)
 
         timeline = []
-        for m in metrics:
-            data = m.data.get("reqs", {})
+        for day, snapshot in metrics:
+            data = snapshot.get("reqs", {})
             timeline.append(
                 {
-                    "date": m.date.isoformat(),
+                    "date": day.isoformat(),
                     "progress_perc": data.get("progress_perc", 0),
                     "score": data.get("score", 0),
                     "per_result": data.get("per_result", {}),
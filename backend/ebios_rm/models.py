@@ -394,11 +394,11 @@ class FearedEvent(NameDescriptionMixin, FolderMixin):
                 "value": -1,
                 "hexcolor": "#f9fafb",
             }
-        risk_matrix = parsed_matrix
-        if not risk_matrix["impact"][gravity].get("hexcolor"):
-            risk_matrix["impact"][gravity]["hexcolor"] = "#f9fafb"
+        # The parsed matrix is shared between callers: don't mutate it
+        level = parsed_matrix["impact"][gravity]
         return {
-            **risk_matrix["impact"][gravity],
+            **level,
+            "hexcolor": level.get("hexcolor") or "#f9fafb",
             "value": gravity,
         }
 
@@ -1118,11 +1118,11 @@ class OperationalScenario(AbstractBaseModel, FolderMixin):
                 "value": -1,
                 "hexcolor": "#f9fafb",
             }
-        risk_matrix = parsed_matrix
-        if not risk_matrix["probability"][likelihood].get("hexcolor"):
-            risk_matrix["probability"][likelihood]["hexcolor"] = "#f9fafb"
+        # The parsed matrix is shared between callers: don't mutate it
+        level = parsed_matrix["probability"][likelihood]
         return {
-            **risk_matrix["probability"][likelihood],
+            **level,
+            "hexcolor": level.get("hexcolor") or "#f9fafb",
             "value": likelihood,
         }
 
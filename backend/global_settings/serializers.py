@@ -48,6 +48,9 @@ GENERAL_SETTINGS_KEYS = [
     "allow_self_validation",
     "show_warning_external_links",
     "builtin_metrics_retention_days",
+    "metrics_rollup_weekly_after_days",
+    "metrics_rollup_monthly_after_days",
+    "metrics_rollup_retention_days",
     "allow_assignments_to_entities",
     "enforce_mfa",
     "default_language",
@@ -125,6 +128,13 @@ class GeneralSettingsSerializer(serializers.ModelSerializer):
                             "builtin_metrics_retention_days": "Retention days must be at least 1"
                         }
                     )
+            if key in (
+                "metrics_rollup_weekly_after_days",
+                "metrics_rollup_monthly_after_days",
+                "metrics_rollup_retention_days",
+            ):
+                if not isinstance(value, int) or value < 1:
+                    raise serializers.ValidationError({key: "Must be at least 1 day"})
             if key == "default_language":
                 valid_codes = [code for code, _ in django_settings.LANGUAGES]
                 if value not in valid_codes:
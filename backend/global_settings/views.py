@@ -157,6 +157,9 @@ class GeneralSettingsViewSet(viewsets.ModelViewSet):
             "allow_self_validation": False,
             "show_warning_external_links": True,
             "builtin_metrics_retention_days": 730,  # 2 years default, minimum is 1
+            "metrics_rollup_weekly_after_days": 90,
+            "metrics_rollup_monthly_after_days": 365,
+            "metrics_rollup_retention_days": 1825,
             "allow_assignments_to_entities": False,
             "enforce_mfa": False,
             "default_language": "en",
@@ -389,6 +389,14 @@ def get_assignments_state(*, force_reload: bool = False) -> AssignmentsCacheStat
     return cast(AssignmentsCacheState, state_map[IAM_ASSIGNMENTS_KEY])
 
 
+def get_cache_versions() -> Mapping[str, int]:
+    """
+    Current CacheVersion numbers for every registered snapshot cache.
+    """
+    _ensure_cache_ready()
+    return CacheRegistry.current_versions()
+
+
 __all__ = [
     "FOLDER_CACHE_KEY",
     "IAM_ROLES_KEY",
@@ -417,4 +425,5 @@ __all__ = [
     "get_roles_state",
     "get_groups_state",
     "get_assignments_state",
+    "get_cache_versions",
 ]
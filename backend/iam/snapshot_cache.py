@@ -220,6 +220,17 @@ class CacheRegistry:
             for key, cache in cls._caches.items()
         }
 
+    @classmethod
+    def current_versions(cls) -> Mapping[str, int]:
+        """
+        Return the version snapshot the registered caches are hydrated against.
+
+        Derived caches (e.g. per-user payloads computed from IAM state) can key
+        on this mapping to invalidate whenever any underlying snapshot changes.
+        """
+        cls.hydrate_all()
+        return dict(cls._last_versions or {})
+
     @classmethod
     def get_cache(cls, key: str) -> VersionedSnapshotCache:
         try:
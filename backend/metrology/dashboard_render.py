@@ -0,0 +1,338 @@
+"""
+Dashboard rendering
+
+Resolves every widget of a Dashboard in a single pass instead of one API call
+per widget:
+
+- widgets are grouped by target content type, and read permissions are
+  computed once per content type rather than once per widget;
+- builtin and custom samples are fetched with one query per sample model;
+- the widget aggregation (avg, sum, min, max, count, last) is computed
+  server-side over the widget time range;
+- the rendered payload is cached per dashboard version, user and IAM snapshot.
+"""
+
+import hashlib
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from iam.cache_builders import get_cache_versions
+from iam.models import Folder, RoleAssignment
+from metrology.models import (
+    BuiltinMetricSample,
+    CustomMetricSample,
+    DashboardWidget,
+)
+from metrology.rollups import builtin_rollup_samples
+from metrology.serializers import (
+    BuiltinMetricSampleReadSerializer,
+    CustomMetricSampleReadSerializer,
+    DashboardWidgetReadSerializer,
+)
+
+DASHBOARD_RENDER_CACHE_PREFIX = "metrology:dashboard_render"
+DASHBOARD_RENDER_CACHE_TTL = 60 * 60  # seconds
+
+# None means "no lower bound".
+TIME_RANGE_DELTAS = {
+    DashboardWidget.TimeRange.LAST_HOUR: timedelta(hours=1),
+    DashboardWidget.TimeRange.LAST_24_HOURS: timedelta(hours=24),
+    DashboardWidget.TimeRange.LAST_7_DAYS: timedelta(days=7),
+    DashboardWidget.TimeRange.LAST_30_DAYS: timedelta(days=30),
+    DashboardWidget.TimeRange.LAST_90_DAYS: timedelta(days=90),
+    DashboardWidget.TimeRange.LAST_YEAR: timedelta(days=365),
+    DashboardWidget.TimeRange.ALL_TIME: None,
+    DashboardWidget.TimeRange.CUSTOM: None,
+}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def aggregate_values(values: list, aggregation: str):
+    """
+    Aggregate a chronologically ordered (oldest first) list of sample values.
+
+    Non-numeric values (breakdowns, statuses) only support COUNT and LAST.
+    Returns None when the aggregation does not apply.
+    """
+    values = [v for v in values if v is not None]
+    if aggregation == DashboardWidget.Aggregation.COUNT:
+        return len(values)
+    if aggregation == DashboardWidget.Aggregation.LAST:
+        return values[-1] if values else None
+
+    numbers = [v for v in values if _is_number(v)]
+    if not numbers:
+        return None
+    if aggregation == DashboardWidget.Aggregation.AVG:
+        return round(sum(numbers) / len(numbers), 2)
+    if aggregation == DashboardWidget.Aggregation.SUM:
+        return sum(numbers)
+    if aggregation == DashboardWidget.Aggregation.MIN:
+        return min(numbers)
+    if aggregation == DashboardWidget.Aggregation.MAX:
+        return max(numbers)
+    return None
+
+
+def _readable_ids(user, content_type: ContentType, object_ids: set) -> set:
+    """Subset of object_ids the user can read, with one RBAC pass per type."""
+    model_class = content_type.model_class()
+    if model_class is None or not object_ids:
+        return set()
+    try:
+        viewable, _, _ = RoleAssignment.get_accessible_object_ids(
+            Folder.get_root_folder(), user, model_class
+        )
+    except NotImplementedError:
+        return set()
+    return object_ids & set(viewable)
+
+
+def _object_names(content_type: ContentType, object_ids: set) -> dict:
+    model_class = content_type.model_class()
+    if model_class is None or not object_ids:
+        return {}
+    return {obj.id: str(obj) for obj in model_class.objects.filter(id__in=object_ids)}
+
+
+class DashboardRenderer:
+    """
+    Render all widgets of a dashboard for a given user.
+
+    Usage: DashboardRenderer(dashboard, request).render()
+    """
+
+    def __init__(self, dashboard, request):
+        self.dashboard = dashboard
+        self.request = request
+        self.user = request.user
+        self.widgets = list(
+            dashboard.widgets.select_related(
+                "folder",
+                "dashboard",
+                "target_content_type",
+                "metric_instance__metric_definition__unit",
+            ).order_by("position_y", "position_x")
+        )
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    def _targets(self) -> dict:
+        """content_type_id -> set of target object ids for builtin widgets."""
+        targets = defaultdict(set)
+        for widget in self.widgets:
+            if widget.target_content_type_id and widget.target_object_id:
+                targets[widget.target_content_type_id].add(widget.target_object_id)
+        return targets
+
+    def _metric_instance_ids(self) -> set:
+        return {w.metric_instance_id for w in self.widgets if w.metric_instance_id}
+
+    def version(self) -> str:
+        """
+        Fingerprint of everything the rendered payload depends on: the
+        dashboard and its widgets, the samples they display, the IAM
+        snapshot and the current date (time ranges slide daily).
+        """
+        parts = [
+            str(self.dashboard.id),
+            self.dashboard.updated_at.isoformat(),
+            timezone.now().date().isoformat(),
+            str(getattr(self.user, "id", None)),
+        ]
+        parts.extend(
+            f"{w.id}:{w.updated_at.isoformat()}"
+            for w in sorted(self.widgets, key=lambda w: str(w.id))
+        )
+
+        targets = self._targets()
+        if targets:
+            query = Q()
+            for content_type_id, object_ids in targets.items():
+                query |= Q(content_type_id=content_type_id, object_id__in=object_ids)
+            builtin_state = BuiltinMetricSample.objects.filter(query).aggregate(
+                count=Count("id"), last=Max("updated_at")
+            )
+            parts.append(f"b:{builtin_state['count']}:{builtin_state['last']}")
+
+        metric_instance_ids = self._metric_instance_ids()
+        if metric_instance_ids:
+            custom_state = CustomMetricSample.objects.filter(
+                metric_instance_id__in=metric_instance_ids
+            ).aggregate(count=Count("id"), last=Max("updated_at"))
+            parts.append(f"c:{custom_state['count']}:{custom_state['last']}")
+
+        parts.extend(f"{k}={v}" for k, v in sorted(get_cache_versions().items()))
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def cache_key(self) -> str:
+        return f"{DASHBOARD_RENDER_CACHE_PREFIX}:{self.dashboard.id}:{self.version()}"
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def render(self, *, use_cache: bool = True) -> dict:
+        cache_key = self.cache_key() if use_cache else None
+        if cache_key:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        payload = self._render()
+        if cache_key:
+            cache.set(cache_key, payload, DASHBOARD_RENDER_CACHE_TTL)
+        return payload
+
+    def _render(self) -> dict:
+        content_types = {
+            w.target_content_type_id: w.target_content_type
+            for w in self.widgets
+            if w.target_content_type_id
+        }
+
+        readable_targets: dict[int, set] = {}
+        object_names: dict[uuid.UUID, str] = {}
+        for content_type_id, object_ids in self._targets().items():
+            content_type = content_types[content_type_id]
+            readable = _readable_ids(self.user, content_type, object_ids)
+            readable_targets[content_type_id] = readable
+            object_names.update(_object_names(content_type, readable))
+
+        builtin_samples = self._fetch_builtin_samples(readable_targets, content_types)
+        custom_samples = self._fetch_custom_samples()
+
+        builtin_context = {"request": self.request, "object_names": object_names}
+        builtin_data = {
+            key: BuiltinMetricSampleReadSerializer(
+                samples, many=True, context=builtin_context
+            ).data
+            for key, samples in builtin_samples.items()
+        }
+        custom_data = {
+            instance_id: CustomMetricSampleReadSerializer(
+                samples, many=True, context={"request": self.request}
+            ).data
+            for instance_id, samples in custom_samples.items()
+        }
+
+        widget_data = DashboardWidgetReadSerializer(
+            self.widgets,
+            many=True,
+            context={"request": self.request, "object_names": object_names},
+        ).data
+
+        now = timezone.now()
+        rendered = []
+        for widget, data in zip(self.widgets, widget_data):
+            entry = dict(data)
+            entry["samples"] = []
+            entry["builtinSamples"] = []
+            entry["aggregated_value"] = None
+            delta = TIME_RANGE_DELTAS.get(widget.time_range)
+            since = now - delta if delta else None
+
+            if widget.target_content_type_id and widget.target_object_id:
+                key = (widget.target_content_type_id, widget.target_object_id)
+                if widget.target_object_id not in readable_targets.get(
+                    widget.target_content_type_id, set()
+                ):
+                    entry["target_object_name"] = None
+                    rendered.append(entry)
+                    continue
+                entry["builtinSamples"] = builtin_data.get(key, [])
+                values = [
+                    (sample.metrics or {}).get(widget.metric_key)
+                    for sample in reversed(builtin_samples.get(key, []))
+                    if since is None or sample.date >= since.date()
+                ]
+                entry["aggregated_value"] = aggregate_values(values, widget.aggregation)
+            elif widget.metric_instance_id:
+                entry["samples"] = custom_data.get(widget.metric_instance_id, [])
+                values = [
+                    sample.raw_value()
+                    for sample in reversed(
+                        custom_samples.get(widget.metric_instance_id, [])
+                    )
+                    if since is None or sample.timestamp >= since
+                ]
+                entry["aggregated_value"] = aggregate_values(values, widget.aggregation)
+            rendered.append(entry)
+
+        return {
+            "id": str(self.dashboard.id),
+            "rendered_at": now.isoformat(),
+            "widgets": rendered,
+        }
+
+    def _fetch_builtin_samples(
+        self, readable_targets: dict, content_types: dict
+    ) -> dict:
+        """
+        (content_type_id, object_id) -> samples, most recent first, including
+        compacted history exposed as samples.
+        """
+        query = Q()
+        for content_type_id, object_ids in readable_targets.items():
+            if object_ids:
+                query |= Q(content_type_id=content_type_id, object_id__in=object_ids)
+        grouped = defaultdict(list)
+        if not query:
+            return grouped
+        samples = (
+            BuiltinMetricSample.objects.filter(query)
+            .select_related("content_type")
+            .order_by("-date")
+        )
+        for sample in samples:
+            grouped[(sample.content_type_id, sample.object_id)].append(sample)
+
+        rollups = builtin_rollup_samples(
+            {
+                content_types[content_type_id]: object_ids
+                for content_type_id, object_ids in readable_targets.items()
+            }
+        )
+        for key, rollup_samples in rollups.items():
+            raw_dates = {sample.date for sample in grouped[key]}
+            grouped[key].extend(r for r in rollup_samples if r.date not in raw_dates)
+            grouped[key].sort(key=lambda sample: sample.date, reverse=True)
+        return grouped
+
+    def _fetch_custom_samples(self) -> dict:
+        """metric_instance_id -> samples readable by the user, most recent first."""
+        grouped = defaultdict(list)
+        metric_instance_ids = self._metric_instance_ids()
+        if not metric_instance_ids:
+            return grouped
+        folder_ids = RoleAssignment.get_accessible_folder_ids(
+            Folder.get_root_folder(),
+            self.user,
+            None,
+            codename="view_custommetricsample",
+        )
+        samples = (
+            CustomMetricSample.objects.filter(
+                metric_instance_id__in=metric_instance_ids,
+                folder_id__in=folder_ids,
+            )
+            .select_related(
+                "folder",
+                "evidence_revision",
+                "metric_instance__metric_definition__unit",
+            )
+            .prefetch_related("metric_instance__evidences")
+            .order_by("-timestamp")
+        )
+        for sample in samples:
+            grouped[sample.metric_instance_id].append(sample)
+        return grouped
@@ -0,0 +1,50 @@
+"""
+Management command to compact daily metric history into weekly/monthly rollups.
+
+Usage:
+    python manage.py compact_metrics                          # Use the global settings horizons
+    python manage.py compact_metrics --weekly-after-days 30   # Override the weekly horizon
+    python manage.py compact_metrics --monthly-after-days 180 # Override the monthly horizon
+    python manage.py compact_metrics --retention-days 1095    # Override the rollup retention
+"""
+
+from django.core.management.base import BaseCommand
+
+from metrology.rollups import compact_metric_history
+
+
+class Command(BaseCommand):
+    help = "Fold old daily HistoricalMetric/BuiltinMetricSample rows into rollups"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--weekly-after-days",
+            type=int,
+            help="Fold daily rows older than this many days into weekly rollups",
+        )
+        parser.add_argument(
+            "--monthly-after-days",
+            type=int,
+            help="Fold weekly rollups older than this many days into monthly rollups",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            help="Delete rollups whose period ended more than this many days ago",
+        )
+
+    def handle(self, *args, **options):
+        report = compact_metric_history(
+            weekly_after_days=options.get("weekly_after_days"),
+            monthly_after_days=options.get("monthly_after_days"),
+            retention_days=options.get("retention_days"),
+        )
+        for source, stages in report.items():
+            pruned = stages.pop("pruned")
+            self.stdout.write(f"  {source}: {pruned['rows']} expired rollups deleted")
+            for resolution, stats in stages.items():
+                self.stdout.write(
+                    f"  {source} -> {resolution}: {stats['rows']} rows of "
+                    f"{stats['objects']} objects folded into {stats['rollups']} rollups"
+                )
+        self.stdout.write(self.style.SUCCESS("Compaction completed!"))
@@ -0,0 +1,86 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("metrology", "0004_custommetricsample_evidence_revision_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MetricRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("historical_metric", "Historical metric"),
+                            ("builtin_metric_sample", "Builtin metric sample"),
+                        ],
+                        max_length=30,
+                        verbose_name="Source",
+                    ),
+                ),
+                ("model", models.CharField(max_length=100, verbose_name="Model")),
+                ("object_id", models.UUIDField(verbose_name="Object ID")),
+                (
+                    "resolution",
+                    models.CharField(
+                        choices=[("weekly", "Weekly"), ("monthly", "Monthly")],
+                        max_length=10,
+                        verbose_name="Resolution",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="Period start")),
+                ("period_end", models.DateField(verbose_name="Period end")),
+                (
+                    "last_date",
+                    models.DateField(
+                        help_text="Date of the last daily snapshot folded into this rollup",
+                        verbose_name="Last date",
+                    ),
+                ),
+                (
+                    "sample_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Sample count"),
+                ),
+                (
+                    "data",
+                    models.JSONField(default=dict, verbose_name="Last snapshot"),
+                ),
+                ("stats", models.JSONField(default=dict, verbose_name="Statistics")),
+            ],
+            options={
+                "verbose_name": "Metric rollup",
+                "verbose_name_plural": "Metric rollups",
+                "ordering": ["period_start"],
+                "indexes": [
+                    models.Index(
+                        fields=["source", "model", "object_id", "period_start"],
+                        name="metrology_rollup_lookup_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "source",
+                            "model",
+                            "object_id",
+                            "resolution",
+                            "period_start",
+                        ),
+                        name="unique_metric_rollup_per_object_per_period",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("metrology", "0005_metricrollup"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="custommetricsample",
+            index=models.Index(
+                fields=["created_at", "id"], name="metrology_cms_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="builtinmetricsample",
+            index=models.Index(
+                fields=["created_at", "id"], name="metrology_bms_keyset_idx"
+            ),
+        ),
+    ]
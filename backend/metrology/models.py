@@ -275,6 +275,10 @@ class CustomMetricSample(AbstractBaseModel, FolderMixin):
         verbose_name = _("Custom metric sample")
         verbose_name_plural = _("Custom metric samples")
         ordering = ["-timestamp"]  # Most recent first
+        # Key of the keyset pagination of the list endpoint
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="metrology_cms_keyset_idx"),
+        ]
 
     def __str__(self):
         return f"{self.metric_instance} - {self.timestamp}"
@@ -406,6 +410,8 @@ class BuiltinMetricSample(AbstractBaseModel):
         ]
         indexes = [
             models.Index(fields=["content_type", "object_id", "date"]),
+            # Key of the keyset pagination of the list endpoint
+            models.Index(fields=["created_at", "id"], name="metrology_bms_keyset_idx"),
         ]
 
     def __str__(self):
@@ -911,6 +917,65 @@ class BuiltinMetricSample(AbstractBaseModel):
         }
 
 
+class MetricRollup(models.Model):
+    """
+    Compacted history: one row per object and week/month, folded from daily
+    HistoricalMetric or BuiltinMetricSample rows older than the rollup horizon.
+
+    `data` is the last daily snapshot of the period, so readers can use a
+    rollup exactly like a raw row dated `last_date`. `stats` holds
+    {dotted.numeric.key: {"last", "min", "max", "avg", "n"}} for the period.
+    """
+
+    class Source(models.TextChoices):
+        HISTORICAL_METRIC = "historical_metric", _("Historical metric")
+        BUILTIN_METRIC_SAMPLE = "builtin_metric_sample", _("Builtin metric sample")
+
+    class Resolution(models.TextChoices):
+        WEEKLY = "weekly", _("Weekly")
+        MONTHLY = "monthly", _("Monthly")
+
+    source = models.CharField(
+        max_length=30, choices=Source.choices, verbose_name=_("Source")
+    )
+    model = models.CharField(max_length=100, verbose_name=_("Model"))
+    object_id = models.UUIDField(verbose_name=_("Object ID"))
+    resolution = models.CharField(
+        max_length=10, choices=Resolution.choices, verbose_name=_("Resolution")
+    )
+    period_start = models.DateField(verbose_name=_("Period start"))
+    period_end = models.DateField(verbose_name=_("Period end"))
+    last_date = models.DateField(
+        verbose_name=_("Last date"),
+        help_text=_("Date of the last daily snapshot folded into this rollup"),
+    )
+    sample_count = models.PositiveIntegerField(
+        default=0, verbose_name=_("Sample count")
+    )
+    data = models.JSONField(default=dict, verbose_name=_("Last snapshot"))
+    stats = models.JSONField(default=dict, verbose_name=_("Statistics"))
+
+    class Meta:
+        verbose_name = _("Metric rollup")
+        verbose_name_plural = _("Metric rollups")
+        ordering = ["period_start"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "model", "object_id", "resolution", "period_start"],
+                name="unique_metric_rollup_per_object_per_period",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["source", "model", "object_id", "period_start"],
+                name="metrology_rollup_lookup_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} - {self.resolution} {self.period_start}"
+
+
 class Dashboard(NameDescriptionMixin, FolderMixin, FilteringLabelMixin):
     ref_id = models.CharField(
         max_length=100, null=True, blank=True, verbose_name=_("reference id")
@@ -1214,3 +1279,33 @@ def get_builtin_metrics_retention_days():
         return max(1, int(retention))
     except (GlobalSettings.DoesNotExist, TypeError, ValueError):
         return 730
+
+
+def get_metrics_rollup_horizons():
+    """
+    Return (weekly_after_days, monthly_after_days).
+
+    Daily history older than the first horizon is folded into weekly rollups,
+    weekly rollups older than the second into monthly rollups. Defaults to
+    90 and 365 days; the monthly horizon is never shorter than the weekly one.
+    """
+    try:
+        settings = GlobalSettings.objects.get(name="general")
+        weekly = max(1, int(settings.value.get("metrics_rollup_weekly_after_days", 90)))
+        monthly = int(settings.value.get("metrics_rollup_monthly_after_days", 365))
+    except (GlobalSettings.DoesNotExist, TypeError, ValueError):
+        weekly, monthly = 90, 365
+    return weekly, max(weekly, monthly)
+
+
+def get_metrics_rollup_retention_days():
+    """
+    Return how many days MetricRollup rows are kept, counted from the end of
+    their period. Defaults to 1825 days (5 years), minimum 1 day.
+    """
+    try:
+        settings = GlobalSettings.objects.get(name="general")
+        retention = settings.value.get("metrics_rollup_retention_days", 1825)
+        return max(1, int(retention))
+    except (GlobalSettings.DoesNotExist, TypeError, ValueError):
+        return 1825
@@ -0,0 +1,407 @@
+"""
+Metric history rollups
+
+Daily history (HistoricalMetric and BuiltinMetricSample, one JSON row per
+object per day) is compacted into MetricRollup rows:
+
+- daily rows older than the weekly horizon are folded into weekly rollups;
+- weekly rollups older than the monthly horizon are folded into monthly ones;
+- rollups whose period ended before the retention horizon are deleted.
+
+Each rollup keeps the last daily snapshot of its period plus last/min/max/avg
+for every numeric key, so readers can stitch rollups (older) and raw rows
+(recent) into a single chronological series with the helpers at the bottom
+of this module.
+"""
+
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+
+from core.models import HistoricalMetric
+from metrology.models import (
+    BuiltinMetricSample,
+    MetricRollup,
+    get_builtin_metrics_retention_days,
+    get_metrics_rollup_horizons,
+    get_metrics_rollup_retention_days,
+)
+
+# Namespace for the stable ids given to rollups exposed as BuiltinMetricSample.
+ROLLUP_SAMPLE_NAMESPACE = uuid.UUID("5d0b7e0e-5f2a-4c8e-9b8e-0c6f6a3f2d11")
+
+
+# --------------------------------------------------------------------
+# Statistics
+# --------------------------------------------------------------------
+def flatten_numeric(data, prefix: str = "") -> dict:
+    """{"reqs": {"total": 3}} -> {"reqs.total": 3}; non-numeric leaves are dropped."""
+    flat = {}
+    if not isinstance(data, dict):
+        return flat
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_numeric(value, prefix=f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compute_stats(snapshots: list) -> dict:
+    """Per numeric key last/min/max/avg/n over snapshots ordered oldest first."""
+    values = defaultdict(list)
+    for snapshot in snapshots:
+        for key, value in flatten_numeric(snapshot).items():
+            values[key].append(value)
+    return {
+        key: {
+            "last": series[-1],
+            "min": min(series),
+            "max": max(series),
+            "avg": sum(series) / len(series),
+            "n": len(series),
+        }
+        for key, series in values.items()
+    }
+
+
+def merge_stats(stats_list: list) -> dict:
+    """Merge stats dicts ordered oldest first; averages are weighted by n."""
+    merged = {}
+    for stats in stats_list:
+        for key, entry in stats.items():
+            current = merged.get(key)
+            if current is None:
+                merged[key] = dict(entry)
+                continue
+            n = current["n"] + entry["n"]
+            merged[key] = {
+                "last": entry["last"],
+                "min": min(current["min"], entry["min"]),
+                "max": max(current["max"], entry["max"]),
+                "avg": (current["avg"] * current["n"] + entry["avg"] * entry["n"]) / n,
+                "n": n,
+            }
+    return merged
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def month_end(day: date) -> date:
+    next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return next_month - timedelta(days=1)
+
+
+# --------------------------------------------------------------------
+# Compaction
+# --------------------------------------------------------------------
+class _DailySource:
+    """Adapter exposing HistoricalMetric and BuiltinMetricSample uniformly."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self._content_types = {}
+
+    def old_rows(self, before: date):
+        if self.source == MetricRollup.Source.HISTORICAL_METRIC:
+            return HistoricalMetric.objects.filter(date__lt=before)
+        return BuiltinMetricSample.objects.filter(date__lt=before)
+
+    def objects_with_old_rows(self, before: date):
+        """Yield (model_name, object_id, queryset_of_old_rows) per object."""
+        if self.source == MetricRollup.Source.HISTORICAL_METRIC:
+            keys = (
+                self.old_rows(before)
+                .values_list("model", "object_id")
+                .distinct()
+                .order_by()
+            )
+            for model_name, object_id in list(keys):
+                yield (
+                    model_name,
+                    object_id,
+                    self.old_rows(before).filter(model=model_name, object_id=object_id),
+                )
+            return
+
+        keys = (
+            self.old_rows(before)
+            .values_list("content_type_id", "object_id")
+            .distinct()
+            .order_by()
+        )
+        for content_type_id, object_id in list(keys):
+            model_name = self._model_name(content_type_id)
+            if model_name is None:
+                continue
+            yield (
+                model_name,
+                object_id,
+                self.old_rows(before).filter(
+                    content_type_id=content_type_id, object_id=object_id
+                ),
+            )
+
+    def _model_name(self, content_type_id):
+        if content_type_id not in self._content_types:
+            model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+            self._content_types[content_type_id] = (
+                model_class.__name__ if model_class else None
+            )
+        return self._content_types[content_type_id]
+
+    def payload(self, row) -> dict:
+        if self.source == MetricRollup.Source.HISTORICAL_METRIC:
+            return row.data or {}
+        return row.metrics or {}
+
+
+def _upsert_rollup(source, model_name, object_id, resolution, start, end, parts):
+    """
+    Create or extend a rollup. `parts` is a list, oldest first, of
+    (last_date, last_snapshot, stats, sample_count) tuples.
+    """
+    rollup = MetricRollup.objects.filter(
+        source=source,
+        model=model_name,
+        object_id=object_id,
+        resolution=resolution,
+        period_start=start,
+    ).first()
+    if rollup is not None:
+        parts = [
+            (rollup.last_date, rollup.data, rollup.stats, rollup.sample_count)
+        ] + parts
+        parts.sort(key=lambda part: part[0])
+    else:
+        rollup = MetricRollup(
+            source=source,
+            model=model_name,
+            object_id=object_id,
+            resolution=resolution,
+            period_start=start,
+        )
+
+    last_date, last_snapshot, _, _ = parts[-1]
+    rollup.period_end = end
+    rollup.last_date = last_date
+    rollup.data = last_snapshot
+    rollup.stats = merge_stats([part[2] for part in parts])
+    rollup.sample_count = sum(part[3] for part in parts)
+    rollup.save()
+    return rollup
+
+
+def compact_daily_rows(source: str, before: date) -> dict:
+    """Fold daily rows dated before `before` into weekly rollups."""
+    adapter = _DailySource(source)
+    report = {"objects": 0, "rows": 0, "rollups": 0}
+    for model_name, object_id, rows in adapter.objects_with_old_rows(before):
+        with transaction.atomic():
+            by_week = defaultdict(list)
+            row_ids = []
+            for row in rows.order_by("date"):
+                by_week[week_start(row.date)].append((row.date, adapter.payload(row)))
+                row_ids.append(row.pk)
+            for start, entries in by_week.items():
+                snapshots = [payload for _, payload in entries]
+                _upsert_rollup(
+                    source,
+                    model_name,
+                    object_id,
+                    MetricRollup.Resolution.WEEKLY,
+                    start,
+                    start + timedelta(days=6),
+                    [
+                        (
+                            entries[-1][0],
+                            snapshots[-1],
+                            compute_stats(snapshots),
+                            len(entries),
+                        )
+                    ],
+                )
+                report["rollups"] += 1
+            rows.filter(pk__in=row_ids).delete()
+        report["objects"] += 1
+        report["rows"] += len(row_ids)
+    return report
+
+
+def compact_weekly_rollups(source: str, before: date) -> dict:
+    """Fold weekly rollups ending before `before` into monthly rollups."""
+    weekly = MetricRollup.objects.filter(
+        source=source,
+        resolution=MetricRollup.Resolution.WEEKLY,
+        period_end__lt=before,
+    )
+    report = {"objects": 0, "rows": 0, "rollups": 0}
+    keys = weekly.values_list("model", "object_id").distinct().order_by()
+    for model_name, object_id in list(keys):
+        with transaction.atomic():
+            rollups = list(
+                weekly.filter(model=model_name, object_id=object_id).order_by(
+                    "period_start"
+                )
+            )
+            by_month = defaultdict(list)
+            for rollup in rollups:
+                by_month[month_start(rollup.period_start)].append(rollup)
+            for start, weeks in by_month.items():
+                _upsert_rollup(
+                    source,
+                    model_name,
+                    object_id,
+                    MetricRollup.Resolution.MONTHLY,
+                    start,
+                    max(month_end(start), weeks[-1].period_end),
+                    [(w.last_date, w.data, w.stats, w.sample_count) for w in weeks],
+                )
+                report["rollups"] += 1
+            MetricRollup.objects.filter(pk__in=[r.pk for r in rollups]).delete()
+        report["objects"] += 1
+        report["rows"] += len(rollups)
+    return report
+
+
+def prune_rollups(source: str, before: date) -> dict:
+    """Delete rollups whose period ended before `before`."""
+    deleted, _ = MetricRollup.objects.filter(
+        source=source, period_end__lt=before
+    ).delete()
+    return {"rows": deleted}
+
+
+def compact_metric_history(
+    weekly_after_days: int | None = None,
+    monthly_after_days: int | None = None,
+    retention_days: int | None = None,
+    today: date | None = None,
+) -> dict:
+    """
+    Run both compaction stages and the rollup retention on both daily sources.
+    Only whole weeks / months older than the horizons are compacted.
+
+    Builtin metric rollups also honour the builtin metrics retention, which
+    used to apply to the raw samples they replace.
+    """
+    if weekly_after_days is None or monthly_after_days is None:
+        default_weekly, default_monthly = get_metrics_rollup_horizons()
+        if weekly_after_days is None:
+            weekly_after_days = default_weekly
+        if monthly_after_days is None:
+            monthly_after_days = default_monthly
+    if retention_days is None:
+        retention_days = get_metrics_rollup_retention_days()
+    today = today or date.today()
+    weekly_before = week_start(today - timedelta(days=weekly_after_days))
+    monthly_before = month_start(today - timedelta(days=monthly_after_days))
+
+    retention = {
+        MetricRollup.Source.HISTORICAL_METRIC: retention_days,
+        MetricRollup.Source.BUILTIN_METRIC_SAMPLE: min(
+            retention_days, get_builtin_metrics_retention_days()
+        ),
+    }
+
+    report = {}
+    for source in MetricRollup.Source.values:
+        report[source] = {
+            "weekly": compact_daily_rows(source, weekly_before),
+            "monthly": compact_weekly_rollups(source, monthly_before),
+            "pruned": prune_rollups(source, today - timedelta(days=retention[source])),
+        }
+    return report
+
+
+# --------------------------------------------------------------------
+# Readers
+# --------------------------------------------------------------------
+def historical_metric_series(model_name: str, object_id) -> list:
+    """[(date, data)] oldest first, rollups followed by raw HistoricalMetric rows."""
+    series = {
+        rollup.last_date: rollup.data
+        for rollup in MetricRollup.objects.filter(
+            source=MetricRollup.Source.HISTORICAL_METRIC,
+            model=model_name,
+            object_id=object_id,
+        ).only("last_date", "data")
+    }
+    # Raw rows win over a rollup that reports the same day.
+    series.update(
+        HistoricalMetric.objects.filter(model=model_name, object_id=object_id)
+        .values_list("date", "data")
+        .order_by("date")
+    )
+    return sorted(series.items())
+
+
+def rollup_as_sample(rollup: MetricRollup, content_type: ContentType):
+    """Unsaved BuiltinMetricSample standing for a rollup (never saved)."""
+    sample = BuiltinMetricSample(
+        id=uuid.uuid5(ROLLUP_SAMPLE_NAMESPACE, str(rollup.pk)),
+        content_type=content_type,
+        object_id=rollup.object_id,
+        date=rollup.last_date,
+        metrics=rollup.data,
+        created_at=None,
+        updated_at=None,
+    )
+    sample.resolution = rollup.resolution
+    sample.stats = rollup.stats
+    return sample
+
+
+def builtin_rollup_samples(targets: dict) -> dict:
+    """
+    Batch variant: {content_type: iterable of object ids} ->
+    {(content_type_id, object_id): [rollup samples, most recent first]}.
+    """
+    by_name = {}
+    query = Q()
+    for content_type, object_ids in targets.items():
+        model_class = content_type.model_class()
+        if model_class is None or not object_ids:
+            continue
+        by_name[model_class.__name__] = content_type
+        query |= Q(model=model_class.__name__, object_id__in=list(object_ids))
+
+    grouped = defaultdict(list)
+    if not query:
+        return grouped
+    rollups = MetricRollup.objects.filter(
+        query, source=MetricRollup.Source.BUILTIN_METRIC_SAMPLE
+    ).order_by("-last_date")
+    for rollup in rollups:
+        content_type = by_name[rollup.model]
+        grouped[(content_type.id, rollup.object_id)].append(
+            rollup_as_sample(rollup, content_type)
+        )
+    return grouped
+
+
+def builtin_metric_series(content_type: ContentType, object_id) -> list:
+    """Raw samples then rollups for one object, most recent first."""
+    samples = list(
+        BuiltinMetricSample.objects.filter(
+            content_type=content_type, object_id=object_id
+        ).order_by("-date")
+    )
+    rollups = builtin_rollup_samples({content_type: [object_id]}).get(
+        (content_type.id, uuid.UUID(str(object_id))), []
+    )
+    raw_dates = {sample.date for sample in samples}
+    merged = samples + [r for r in rollups if r.date not in raw_dates]
+    merged.sort(key=lambda sample: sample.date, reverse=True)
+    return merged
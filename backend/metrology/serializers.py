@@ -404,6 +404,9 @@ class DashboardWidgetReadSerializer(BaseModelSerializer):
 
     def get_target_object_name(self, obj):
         """Get the name of the target object for builtin metrics"""
+        object_names = self.context.get("object_names")
+        if object_names is not None:
+            return object_names.get(obj.target_object_id)
         if obj.target_content_type and obj.target_object_id:
             try:
                 model_class = obj.target_content_type.model_class()
@@ -432,6 +435,7 @@ class BuiltinMetricSampleReadSerializer(BaseModelSerializer):
     content_type_display = serializers.SerializerMethodField()
     object_name = serializers.SerializerMethodField()
     available_metrics = serializers.SerializerMethodField()
+    resolution = serializers.SerializerMethodField()
 
     class Meta:
         model = BuiltinMetricSample
@@ -442,6 +446,7 @@ class BuiltinMetricSampleReadSerializer(BaseModelSerializer):
             "object_id",
             "object_name",
             "date",
+            "resolution",
             "metrics",
             "available_metrics",
             "created_at",
@@ -454,6 +459,9 @@ class BuiltinMetricSampleReadSerializer(BaseModelSerializer):
 
     def get_object_name(self, obj):
         """Get the name of the target object"""
+        object_names = self.context.get("object_names")
+        if object_names is not None:
+            return object_names.get(obj.object_id)
         try:
             target_obj = obj.object
             if target_obj:
@@ -462,6 +470,10 @@ class BuiltinMetricSampleReadSerializer(BaseModelSerializer):
             pass
         return None
 
+    def get_resolution(self, obj):
+        """Return "daily" for raw samples, "weekly"/"monthly" for compacted history"""
+        return getattr(obj, "resolution", "daily")
+
     def get_available_metrics(self, obj):
         """Get the list of available metrics for this object type"""
         model_name = obj.content_type.model_class().__name__
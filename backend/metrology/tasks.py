@@ -68,6 +68,34 @@ def check_daily_and_longer_metric_staleness():
     )
 
 
+@db_periodic_task(crontab(hour="3", minute="30"))
+def compact_metric_history():
+    """
+    Fold daily HistoricalMetric / BuiltinMetricSample rows older than the
+    rollup horizons into weekly and monthly MetricRollup rows, and delete
+    rollups older than the rollup retention.
+    Runs daily at 3:30 AM, before the retention cleanup.
+    """
+    from metrology.rollups import compact_metric_history as compact
+
+    try:
+        report = compact()
+        for source, stages in report.items():
+            pruned = stages.pop("pruned")["rows"]
+            if pruned:
+                logger.info(f"Deleted {pruned} expired {source} rollups")
+            for resolution, stats in stages.items():
+                if stats["rows"]:
+                    logger.info(
+                        f"Compacted {stats['rows']} {source} rows of {stats['objects']} objects "
+                        f"into {stats['rollups']} {resolution} rollups"
+                    )
+    except DatabaseError:
+        logger.warning(
+            "Metrology tables do not exist yet — skipping metric history compaction"
+        )
+
+
 @db_periodic_task(crontab(hour="3", minute="45"))
 def cleanup_old_builtin_metric_samples():
     """
@@ -0,0 +1,38 @@
+"""Tests for server-side widget aggregation used by the dashboard render endpoint."""
+
+from metrology.dashboard_render import TIME_RANGE_DELTAS, aggregate_values
+from metrology.models import DashboardWidget
+
+Aggregation = DashboardWidget.Aggregation
+
+
+class TestAggregateValues:
+    def test_numeric_aggregations(self):
+        values = [10, 20, 30, None]
+        assert aggregate_values(values, Aggregation.AVG) == 20
+        assert aggregate_values(values, Aggregation.SUM) == 60
+        assert aggregate_values(values, Aggregation.MIN) == 10
+        assert aggregate_values(values, Aggregation.MAX) == 30
+        assert aggregate_values(values, Aggregation.COUNT) == 3
+        assert aggregate_values(values, Aggregation.LAST) == 30
+
+    def test_none_aggregation_returns_none(self):
+        assert aggregate_values([1, 2, 3], Aggregation.NONE) is None
+
+    def test_breakdowns_only_support_last_and_count(self):
+        values = [{"compliant": 1}, {"compliant": 2}]
+        assert aggregate_values(values, Aggregation.LAST) == {"compliant": 2}
+        assert aggregate_values(values, Aggregation.COUNT) == 2
+        assert aggregate_values(values, Aggregation.AVG) is None
+
+    def test_booleans_are_not_numbers(self):
+        assert aggregate_values([True, False], Aggregation.SUM) is None
+
+    def test_empty_values(self):
+        assert aggregate_values([], Aggregation.AVG) is None
+        assert aggregate_values([], Aggregation.LAST) is None
+        assert aggregate_values([], Aggregation.COUNT) == 0
+
+
+def test_every_time_range_has_a_window():
+    assert set(TIME_RANGE_DELTAS) == set(DashboardWidget.TimeRange.values)
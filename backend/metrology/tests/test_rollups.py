@@ -0,0 +1,121 @@
+"""Tests for metric history compaction and stitched readers."""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from core.models import HistoricalMetric
+from metrology.models import MetricRollup
+from metrology.rollups import (
+    compact_metric_history,
+    compute_stats,
+    flatten_numeric,
+    historical_metric_series,
+    merge_stats,
+    month_end,
+    week_start,
+)
+
+
+class TestStats:
+    def test_flatten_numeric_keeps_numbers_only(self):
+        data = {"reqs": {"total": 3, "per_status": {"done": 2}, "label": "x"}}
+        assert flatten_numeric(data) == {"reqs.total": 3, "reqs.per_status.done": 2}
+
+    def test_compute_stats(self):
+        stats = compute_stats([{"a": 1}, {"a": 3}, {"a": 2}])
+        assert stats == {"a": {"last": 2, "min": 1, "max": 3, "avg": 2, "n": 3}}
+
+    def test_merge_stats_weights_averages(self):
+        merged = merge_stats(
+            [
+                {"a": {"last": 1, "min": 1, "max": 1, "avg": 1, "n": 1}},
+                {"a": {"last": 4, "min": 2, "max": 4, "avg": 3, "n": 3}},
+            ]
+        )
+        assert merged["a"] == {"last": 4, "min": 1, "max": 4, "avg": 2.5, "n": 4}
+
+    def test_calendar_helpers(self):
+        assert week_start(date(2026, 3, 5)) == date(2026, 3, 2)
+        assert month_end(date(2026, 2, 10)) == date(2026, 2, 28)
+        assert month_end(date(2026, 12, 1)) == date(2026, 12, 31)
+
+
+@pytest.mark.django_db
+class TestCompaction:
+    def _seed(self, object_id, today, days):
+        for offset in range(days):
+            HistoricalMetric.objects.create(
+                model="ComplianceAssessment",
+                object_id=object_id,
+                date=today - timedelta(days=offset),
+                data={"reqs": {"progress_perc": offset, "total": 10}},
+            )
+
+    def test_old_rows_are_folded_and_series_is_stitched(self):
+        object_id = uuid.uuid4()
+        today = date(2026, 6, 15)
+        self._seed(object_id, today, 400)
+
+        compact_metric_history(
+            weekly_after_days=30, monthly_after_days=180, today=today
+        )
+
+        raw_dates = list(
+            HistoricalMetric.objects.filter(object_id=object_id).values_list(
+                "date", flat=True
+            )
+        )
+        assert min(raw_dates) >= week_start(today - timedelta(days=30))
+
+        rollups = MetricRollup.objects.filter(object_id=object_id)
+        assert rollups.filter(resolution=MetricRollup.Resolution.WEEKLY).exists()
+        assert rollups.filter(resolution=MetricRollup.Resolution.MONTHLY).exists()
+        assert sum(r.sample_count for r in rollups) + len(raw_dates) == 400
+
+        series = historical_metric_series("ComplianceAssessment", object_id)
+        dates = [day for day, _ in series]
+        assert dates == sorted(dates)
+        assert series[-1] == (today, {"reqs": {"progress_perc": 0, "total": 10}})
+
+    def test_recompaction_is_idempotent(self):
+        object_id = uuid.uuid4()
+        today = date(2026, 6, 15)
+        self._seed(object_id, today, 120)
+
+        compact_metric_history(weekly_after_days=30, monthly_after_days=60, today=today)
+        before = list(MetricRollup.objects.filter(object_id=object_id).values())
+        compact_metric_history(weekly_after_days=30, monthly_after_days=60, today=today)
+        after = list(MetricRollup.objects.filter(object_id=object_id).values())
+
+        assert before == after
+
+    def test_explicit_zero_horizon_is_not_replaced_by_default(self):
+        object_id = uuid.uuid4()
+        today = date(2026, 6, 15)
+        self._seed(object_id, today, 20)
+
+        compact_metric_history(weekly_after_days=0, monthly_after_days=365, today=today)
+
+        raw_dates = HistoricalMetric.objects.filter(object_id=object_id).values_list(
+            "date", flat=True
+        )
+        assert min(raw_dates) >= week_start(today)
+
+    def test_expired_rollups_are_pruned(self):
+        object_id = uuid.uuid4()
+        today = date(2026, 6, 15)
+        self._seed(object_id, today, 400)
+
+        report = compact_metric_history(
+            weekly_after_days=30,
+            monthly_after_days=60,
+            retention_days=200,
+            today=today,
+        )
+
+        rollups = MetricRollup.objects.filter(object_id=object_id)
+        assert rollups.exists()
+        assert not rollups.filter(period_end__lt=today - timedelta(days=200)).exists()
+        assert report[MetricRollup.Source.HISTORICAL_METRIC]["pruned"]["rows"] > 0
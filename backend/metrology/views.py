@@ -18,6 +18,8 @@ from metrology.models import (
     DashboardWidget,
 )
 from metrology.builtin_metrics import BUILTIN_METRICS, METRIC_TYPE_CHART_TYPES
+from metrology.dashboard_render import DashboardRenderer
+from metrology.rollups import builtin_metric_series
 from metrology.serializers import BuiltinMetricSampleReadSerializer
 
 
@@ -108,6 +110,22 @@ class DashboardViewSet(BaseModelViewSet):
     filterset_fields = ["folder", "filtering_labels"]
     search_fields = ["name", "description", "ref_id"]
 
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="render",
+        name="Render dashboard widgets",
+    )
+    def render_widgets(self, request, pk=None):
+        # All widgets with their samples and server-side aggregations in one call.
+        dashboard = self.get_object()
+        renderer = DashboardRenderer(dashboard, request)
+        use_cache = request.query_params.get("refresh", "").lower() not in (
+            "1",
+            "true",
+        )
+        return Response(renderer.render(use_cache=use_cache))
+
 
 class DashboardWidgetViewSet(BaseModelViewSet):
     model = DashboardWidget
@@ -210,9 +228,7 @@ class BuiltinMetricSampleViewSet(BaseModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        samples = BuiltinMetricSample.objects.filter(
-            content_type=content_type, object_id=object_id
-        ).order_by("-date")
+        samples = builtin_metric_series(content_type, object_id)
 
         serializer = BuiltinMetricSampleReadSerializer(samples, many=True)
         return Response(serializer.data)
@@ -272,13 +272,13 @@ class EscalationThreshold(AbstractBaseModel, FolderMixin):
                 "value": -1,
                 "hexcolor": "#f9fafb",
             }
-        risk_matrix = parsed_matrix
-        max_index = len(risk_matrix["impact"]) - 1
+        # The parsed matrix is shared between callers: don't mutate it
+        max_index = len(parsed_matrix["impact"]) - 1
         clamped = min(impact, max_index)
-        if not risk_matrix["impact"][clamped].get("hexcolor"):
-            risk_matrix["impact"][clamped]["hexcolor"] = "#f9fafb"
+        level = parsed_matrix["impact"][clamped]
         return {
-            **risk_matrix["impact"][clamped],
+            **level,
+            "hexcolor": level.get("hexcolor") or "#f9fafb",
             "value": clamped,
         }
 
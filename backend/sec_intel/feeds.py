@@ -1,12 +1,15 @@
+import codecs
 import csv
-import gzip
-import io
+import hashlib
 import json
+import tempfile
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
-from decimal import InvalidOperation
+from decimal import ROUND_HALF_UP, InvalidOperation
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, Optional
 
 import httpx
 import structlog
@@ -144,6 +147,50 @@ class KEVFeed:
 
 EPSS_URL = "https://epss.empiricalsecurity.com/epss_scores-current.csv.gz"
 EPSS_API_URL = "https://api.first.org/data/v1/epss"
+EPSS_CHUNK_SIZE = 64 * 1024
+EPSS_UPDATE_BATCH_SIZE = 1000
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _decompressed_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode a stream of byte chunks into text lines, gunzipping it on the fly
+    when it starts with the gzip magic number. A gzip stream may hold several
+    members, which are decompressed one after the other. Only one chunk is
+    held at once."""
+    decompressor = None
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    head = b""
+
+    def gunzip(data: bytes) -> bytes:
+        nonlocal decompressor
+        out = []
+        while data:
+            out.append(decompressor.decompress(data))
+            if not decompressor.eof:
+                break
+            # End of a member: what follows is the next member, if any
+            data = decompressor.unused_data
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        return b"".join(out)
+
+    for chunk in chunks:
+        if decompressor is None:
+            head += chunk
+            if len(head) < len(GZIP_MAGIC):
+                continue
+            chunk, head = head, b""
+            decompressor = (
+                zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+                if chunk.startswith(GZIP_MAGIC)
+                else False
+            )
+        if decompressor:
+            chunk = gunzip(chunk)
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        yield from lines
+    tail = decompressor.flush() if decompressor else head
+    yield from (pending + decoder.decode(tail, final=True)).split("\n")
 
 
 class EPSSFeed:
@@ -174,67 +221,127 @@ class EPSSFeed:
             logger.warning("EPSS lookup failed", cve_id=cve_id, exc_info=True)
             return None
 
-    def fetch(self) -> bytes:
-        """Fetch gzipped EPSS CSV from Empirical Security (canonical FIRST EPSS host) or read local file."""
+    @contextmanager
+    def fetch(self) -> Iterator[Iterator[bytes]]:
+        """Stream the gzipped EPSS CSV from Empirical Security (canonical FIRST EPSS
+        host) or the local file, as an iterator of byte chunks."""
         if self.file_path:
-            return self.file_path.read_bytes()
-        resp = httpx.get(EPSS_URL, timeout=_get_timeout(), follow_redirects=True)
-        resp.raise_for_status()
-        return resp.content
+            with self.file_path.open("rb") as f:
+                yield iter(lambda: f.read(EPSS_CHUNK_SIZE), b"")
+            return
+        with httpx.stream(
+            "GET", EPSS_URL, timeout=_get_timeout(), follow_redirects=True
+        ) as resp:
+            resp.raise_for_status()
+            yield resp.iter_bytes(EPSS_CHUNK_SIZE)
 
-    def parse(self, raw_gz: bytes) -> list[dict]:
-        """Decompress and parse CSV. Returns list of {cve_id, epss, percentile}."""
-        text = gzip.decompress(raw_gz).decode("utf-8")
+    def parse(self, chunks: Iterable[bytes]) -> Iterator[dict]:
+        """Decompress and parse CSV chunks. Yields {cve_id, epss, percentile}."""
         # Skip comment lines (EPSS CSV starts with a # comment line)
-        lines = [line for line in text.splitlines() if not line.startswith("#")]
-        reader = csv.DictReader(io.StringIO("\n".join(lines)))
-        results = []
-        for row in reader:
+        lines = (
+            line for line in _decompressed_lines(chunks) if not line.startswith("#")
+        )
+        for row in csv.DictReader(lines):
             cve_id = row.get("cve", "")
             if not cve_id.startswith("CVE-"):
                 continue
             try:
-                results.append(
-                    {
-                        "cve_id": cve_id,
-                        "epss": Decimal(row["epss"]),
-                        "percentile": Decimal(row["percentile"]),
-                    }
-                )
-            except (KeyError, ValueError, InvalidOperation) as e:
+                yield {
+                    "cve_id": cve_id,
+                    "epss": Decimal(row["epss"]),
+                    "percentile": Decimal(row["percentile"]),
+                }
+            except (KeyError, TypeError, ValueError, InvalidOperation) as e:
                 logger.warning(
                     "Skipping malformed EPSS entry", cve=cve_id, error=str(e)
                 )
-        return results
 
-    def sync(self) -> int:
-        """Full sync: fetch, parse, bulk-update existing advisories."""
-        from itertools import islice
+    @staticmethod
+    def _current_scores(scale: int) -> dict:
+        """ref_id → (score, percentile) of every CVE advisory, as integers in units
+        of 10**-scale (None when unset). Advisories sharing a ref_id with
+        different scores map to None so that they are always rewritten."""
+        from sec_intel.models import SecurityAdvisory
+
+        current = {}
+        for ref_id, score, percentile in SecurityAdvisory.objects.filter(
+            ref_id__startswith="CVE-"
+        ).values_list("ref_id", "epss_score", "epss_percentile"):
+            value = (
+                None if score is None else int(score.scaleb(scale)),
+                None if percentile is None else int(percentile.scaleb(scale)),
+            )
+            if current.setdefault(ref_id, value) != value:
+                current[ref_id] = None
+        return current
+
+    @staticmethod
+    def _write_scores(changes: dict) -> int:
+        """Set the score and percentile of every advisory in ``changes``
+        ({ref_id: (score, percentile)}) with one UPDATE."""
+        from django.db.models import Case, Value, When
 
         from sec_intel.models import SecurityAdvisory
 
-        raw = self.fetch()
-        entries = self.parse(raw)
-        epss_map = {e["cve_id"]: e for e in entries}
+        score_field = SecurityAdvisory._meta.get_field("epss_score")
+        percentile_field = SecurityAdvisory._meta.get_field("epss_percentile")
+        return SecurityAdvisory.objects.filter(ref_id__in=changes.keys()).update(
+            epss_score=Case(
+                *[
+                    When(ref_id=ref_id, then=Value(score, output_field=score_field))
+                    for ref_id, (score, _) in changes.items()
+                ],
+                output_field=score_field,
+            ),
+            epss_percentile=Case(
+                *[
+                    When(
+                        ref_id=ref_id,
+                        then=Value(percentile, output_field=percentile_field),
+                    )
+                    for ref_id, (_, percentile) in changes.items()
+                ],
+                output_field=percentile_field,
+            ),
+        )
 
-        updated = 0
-        keys = iter(list(epss_map.keys()))
-        while True:
-            batch_keys = list(islice(keys, 5000))
-            if not batch_keys:
-                break
-            to_update = []
-            for sa in SecurityAdvisory.objects.filter(ref_id__in=batch_keys):
-                data = epss_map[sa.ref_id]
-                sa.epss_score = data["epss"]
-                sa.epss_percentile = data["percentile"]
-                to_update.append(sa)
-            if to_update:
-                SecurityAdvisory.objects.bulk_update(
-                    to_update, ["epss_score", "epss_percentile"], batch_size=1000
+    def sync(self) -> dict:
+        """Stream the feed and update the advisories whose score or percentile
+        changed, in set-based batches. Unknown CVEs and unchanged scores are
+        skipped. Returns {"seen": N, "changed": N, "skipped": N}."""
+        from sec_intel.models import SecurityAdvisory
+
+        scale = SecurityAdvisory._meta.get_field("epss_score").decimal_places
+        quantum = Decimal(1).scaleb(-scale)
+        current = self._current_scores(scale)
+
+        seen = written = changed = 0
+        changes = {}
+        with self.fetch() as chunks:
+            for entry in self.parse(chunks):
+                seen += 1
+                cve_id = entry["cve_id"]
+                if cve_id not in current:
+                    continue
+                # Round like the database would, so that unchanged scores compare
+                # equal to the stored ones on the next sync.
+                score = entry["epss"].quantize(quantum, rounding=ROUND_HALF_UP)
+                percentile = entry["percentile"].quantize(
+                    quantum, rounding=ROUND_HALF_UP
                 )
-                updated += len(to_update)
-        return updated
+                value = (int(score.scaleb(scale)), int(percentile.scaleb(scale)))
+                if current[cve_id] == value:
+                    continue
+                current[cve_id] = value
+                changes[cve_id] = (score, percentile)
+                written += 1
+                if len(changes) >= EPSS_UPDATE_BATCH_SIZE:
+                    changed += self._write_scores(changes)
+                    changes = {}
+        if changes:
+            changed += self._write_scores(changes)
+
+        return {"seen": seen, "changed": changed, "skipped": seen - written}
 
 
 # --- NVD Single-CVE Lookup ---
@@ -540,108 +647,172 @@ class EUVDFeed:
 # --- CWE Feed ---
 
 CWE_URL = "https://cwe.mitre.org/data/xml/cwec_latest.xml.zip"
+CWE_CHUNK_SIZE = 64 * 1024
+CWE_SPOOL_SIZE = 8 * 1024 * 1024
+CWE_BATCH_SIZE = 1000
+
+
+def _cwe_content_hash(entry: dict) -> str:
+    return hashlib.sha256(
+        f"{entry['name']}\x00{entry['description']}".encode("utf-8")
+    ).hexdigest()
 
 
 class CWEFeed:
     def __init__(self, file_path: Optional[Path] = None):
         self.file_path = file_path
 
-    def fetch(self) -> bytes:
-        """Fetch zipped CWE JSON from MITRE or read local file."""
+    @contextmanager
+    def fetch(self) -> Iterator[BinaryIO]:
+        """Zipped CWE XML from MITRE or the local file, as a binary file object.
+        Downloads are spooled to disk past CWE_SPOOL_SIZE."""
         if self.file_path:
-            return self.file_path.read_bytes()
-        resp = httpx.get(CWE_URL, timeout=_get_timeout(), follow_redirects=True)
-        resp.raise_for_status()
-        return resp.content
-
-    def parse(self, raw_zip: bytes) -> list[dict]:
-        """Extract CWE entries from zipped XML."""
+            with self.file_path.open("rb") as f:
+                yield f
+            return
+        with tempfile.SpooledTemporaryFile(max_size=CWE_SPOOL_SIZE) as spool:
+            with httpx.stream(
+                "GET", CWE_URL, timeout=_get_timeout(), follow_redirects=True
+            ) as resp:
+                resp.raise_for_status()
+                for chunk in resp.iter_bytes(CWE_CHUNK_SIZE):
+                    spool.write(chunk)
+            spool.seek(0)
+            yield spool
+
+    def parse(self, raw_zip: BinaryIO) -> Iterator[dict]:
+        """Extract CWE entries from zipped XML, one weakness at a time.
+
+        Every top-level entry (weakness, category, view...) is dropped from the
+        tree once read, so memory does not grow with the catalogue."""
         import zipfile
 
         import defusedxml.ElementTree as ET
 
-        with zipfile.ZipFile(io.BytesIO(raw_zip)) as zf:
+        with zipfile.ZipFile(raw_zip) as zf:
             xml_files = [n for n in zf.namelist() if n.endswith(".xml")]
             if not xml_files:
                 logger.error("No XML file found in CWE zip archive")
-                return []
-            tree = ET.parse(zf.open(xml_files[0]))
-
-        root = tree.getroot()
-        ns = {"cwe": root.tag.split("}")[0] + "}"} if "}" in root.tag else {"cwe": ""}
-        prefix = ns["cwe"]
+                return
+            with zf.open(xml_files[0]) as xml_file:
+                prefix = None
+                parents = []
+                for event, element in ET.iterparse(xml_file, events=("start", "end")):
+                    if event == "start":
+                        if prefix is None:
+                            tag = element.tag
+                            prefix = tag.split("}")[0] + "}" if "}" in tag else ""
+                        parents.append(element)
+                        continue
+                    parents.pop()
+                    if len(parents) != 2:
+                        continue
+                    # Entries are the children of the catalogue sections
+                    if element.tag == f"{prefix}Weakness":
+                        entry = self._parse_weakness(element, prefix)
+                        if entry is not None:
+                            yield entry
+                    parents[-1].remove(element)
 
-        results = []
-        for weakness in root.iter(f"{prefix}Weakness"):
-            cwe_id = weakness.get("ID")
-            if not cwe_id:
-                continue
+    @staticmethod
+    def _parse_weakness(weakness, prefix: str) -> Optional[dict]:
+        cwe_id = weakness.get("ID")
+        if not cwe_id:
+            return None
 
-            name = weakness.get("Name", f"CWE-{cwe_id}")
+        name = weakness.get("Name", f"CWE-{cwe_id}")
 
-            description = ""
-            desc_el = weakness.find(f"{prefix}Description")
-            if desc_el is not None and desc_el.text:
-                description = desc_el.text.strip()
-            if not description:
-                ext_el = weakness.find(f"{prefix}Extended_Description")
-                if ext_el is not None:
-                    description = "".join(ext_el.itertext()).strip()
+        description = ""
+        desc_el = weakness.find(f"{prefix}Description")
+        if desc_el is not None and desc_el.text:
+            description = desc_el.text.strip()
+        if not description:
+            ext_el = weakness.find(f"{prefix}Extended_Description")
+            if ext_el is not None:
+                description = "".join(ext_el.itertext()).strip()
 
-            results.append(
-                {
-                    "cwe_id": f"CWE-{cwe_id}",
-                    "name": _truncate_name(name),
-                    "description": description,
-                }
-            )
-        return results
+        return {
+            "cwe_id": f"CWE-{cwe_id}",
+            "name": _truncate_name(name),
+            "description": description,
+        }
 
     def sync(self) -> dict:
         """Full sync: fetch, parse, create new + update existing CWEs.
-        Returns {"created": N, "updated": N}."""
+
+        Weaknesses whose content hash matches the one recorded by the last sync
+        are skipped, so re-syncing an unchanged catalogue writes nothing.
+        Returns {"created": N, "updated": N, "unchanged": N}."""
         from iam.models import Folder
         from sec_intel.models import CWE
 
-        raw = self.fetch()
-        entries = self.parse(raw)
-        cwe_map = {e["cwe_id"]: e for e in entries}
+        synced_hashes = dict(CWE.objects.values_list("ref_id", "content_hash"))
+        root_folder = None
+        created = updated = unchanged = 0
+        to_create = []
+        changed = {}
+
+        def flush():
+            nonlocal created, updated
+            if to_create:
+                CWE.objects.bulk_create(
+                    to_create, batch_size=CWE_BATCH_SIZE, ignore_conflicts=True
+                )
+                created += len(to_create)
+                to_create.clear()
+            if changed:
+                updated += self._update_existing(changed)
+                changed.clear()
+
+        with self.fetch() as raw:
+            for entry in self.parse(raw):
+                cwe_id = entry["cwe_id"]
+                content_hash = _cwe_content_hash(entry)
+                if cwe_id not in synced_hashes:
+                    if root_folder is None:
+                        root_folder = Folder.get_root_folder()
+                    to_create.append(
+                        CWE(
+                            ref_id=cwe_id,
+                            name=entry["name"],
+                            description=entry["description"],
+                            content_hash=content_hash,
+                            folder=root_folder,
+                        )
+                    )
+                elif synced_hashes[cwe_id] == content_hash:
+                    unchanged += 1
+                    continue
+                else:
+                    changed[cwe_id] = (entry, content_hash)
+                # Duplicates in the catalogue are handled once
+                synced_hashes[cwe_id] = content_hash
+                if len(to_create) + len(changed) >= CWE_BATCH_SIZE:
+                    flush()
+        flush()
+
+        return {"created": created, "updated": updated, "unchanged": unchanged}
+
+    @staticmethod
+    def _update_existing(changed: dict) -> int:
+        """Fill the blank name/description of existing CWEs and record the
+        content hash of their catalogue entry."""
+        from sec_intel.models import CWE
 
-        # Update existing
-        existing = CWE.objects.filter(ref_id__in=cwe_map.keys())
-        existing_ids = set()
         to_update = []
-        for cwe in existing:
-            existing_ids.add(cwe.ref_id)
-            entry = cwe_map[cwe.ref_id]
-            changed = False
+        for cwe in CWE.objects.filter(ref_id__in=changed.keys()):
+            entry, content_hash = changed[cwe.ref_id]
             if not cwe.name and entry["name"]:
                 cwe.name = entry["name"]
-                changed = True
             if not cwe.description and entry["description"]:
                 cwe.description = entry["description"]
-                changed = True
-            if changed:
-                to_update.append(cwe)
+            cwe.content_hash = content_hash
+            to_update.append(cwe)
 
         if to_update:
-            CWE.objects.bulk_update(to_update, ["name", "description"], batch_size=1000)
-
-        # Create new
-        root_folder = Folder.get_root_folder()
-        to_create = []
-        for cwe_id, entry in cwe_map.items():
-            if cwe_id not in existing_ids:
-                to_create.append(
-                    CWE(
-                        ref_id=cwe_id,
-                        name=entry["name"],
-                        description=entry["description"],
-                        folder=root_folder,
-                    )
-                )
-
-        if to_create:
-            CWE.objects.bulk_create(to_create, batch_size=1000, ignore_conflicts=True)
-
-        return {"created": len(to_create), "updated": len(to_update)}
+            CWE.objects.bulk_update(
+                to_update,
+                ["name", "description", "content_hash"],
+                batch_size=CWE_BATCH_SIZE,
+            )
+        return len(to_update)
@@ -23,7 +23,8 @@ class Command(BaseCommand):
             result = feed.sync()
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"CWE sync complete: {result['created']} created, {result['updated']} updated"
+                    f"CWE sync complete: {result['created']} created, {result['updated']} updated, "
+                    f"{result['unchanged']} unchanged"
                 )
             )
         except FileNotFoundError:
@@ -1,3 +1,4 @@
+import time
 from pathlib import Path
 
 from django.core.management.base import BaseCommand
@@ -11,7 +12,7 @@ class Command(BaseCommand):
             "--file",
             type=str,
             default=None,
-            help="Path to local EPSS CSV/gzip file (for air-gapped environments)",
+            help="Path to local EPSS CSV/gzip file (for air-gapped environments or benchmarks)",
         )
 
     def handle(self, *args, **options):
@@ -20,9 +21,14 @@ class Command(BaseCommand):
         file_path = Path(options["file"]) if options["file"] else None
         try:
             feed = EPSSFeed(file_path=file_path)
-            count = feed.sync()
+            start = time.perf_counter()
+            result = feed.sync()
+            elapsed = time.perf_counter() - start
             self.stdout.write(
-                self.style.SUCCESS(f"EPSS sync complete: {count} CVEs updated")
+                self.style.SUCCESS(
+                    f"EPSS sync complete in {elapsed:.1f}s: {result['seen']} CVEs seen, "
+                    f"{result['changed']} updated, {result['skipped']} skipped"
+                )
             )
         except FileNotFoundError:
             self.stderr.write(self.style.ERROR(f"File not found: {file_path}"))
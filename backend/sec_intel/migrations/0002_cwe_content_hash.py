@@ -0,0 +1,19 @@
+# Generated by Django 6.0.3 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sec_intel", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cwe",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+    ]
@@ -100,6 +100,10 @@ class CWE(
         related_name="cwes",
     )
     is_published = models.BooleanField(_("published"), default=True)
+    # Hash of the MITRE catalogue entry this CWE was last synced from
+    content_hash = models.CharField(
+        max_length=64, blank=True, default="", editable=False
+    )
 
     fields_to_check = ["ref_id"]
 
@@ -47,7 +47,7 @@ class SecurityAdvisoryReadSerializer(ReferentialSerializer):
 class CWEWriteSerializer(BaseModelSerializer):
     class Meta:
         model = CWE
-        exclude = ["translations"]
+        exclude = ["translations", "content_hash"]
 
 
 class CWEReadSerializer(ReferentialSerializer):
@@ -58,4 +58,4 @@ class CWEReadSerializer(ReferentialSerializer):
 
     class Meta:
         model = CWE
-        exclude = ["translations"]
+        exclude = ["translations", "content_hash"]
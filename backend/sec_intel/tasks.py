@@ -71,7 +71,7 @@ def sync_epss_feed():
         return
 
     try:
-        count = EPSSFeed().sync()
-        logger.info("EPSS feed sync completed", updated_count=count)
+        result = EPSSFeed().sync()
+        logger.info("EPSS feed sync completed", **result)
     except Exception:
         logger.warning("EPSS feed sync failed", exc_info=True)
@@ -0,0 +1,122 @@
+import gzip
+import zipfile
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from sec_intel.feeds import CWEFeed, EPSSFeed, _decompressed_lines
+from sec_intel.models import CWE
+
+CSV = (
+    "#model_version:v2025.03.14,score_date:2026-10-19T00:00:00+0000\n"
+    "cve,epss,percentile\n"
+    "CVE-2024-0001,0.00043,0.11833\n"
+    "CVE-2024-0002,0.97521,0.99981\n"
+    "CVE-2024-0003,0.01234,0.75000\n"
+)
+
+
+def split(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestDecompressedLines:
+    def test_plain_stream(self):
+        assert list(_decompressed_lines(split(CSV.encode(), 16))) == CSV.split("\n")
+
+    def test_gzip_stream_split_across_chunks(self):
+        data = gzip.compress(CSV.encode())
+        # The magic number itself is split across the first two chunks
+        for size in (1, 7, len(data)):
+            assert list(_decompressed_lines(split(data, size))) == CSV.split("\n")
+
+    def test_multi_member_gzip_stream(self):
+        first, second = CSV[:70], CSV[70:]
+        data = gzip.compress(first.encode()) + gzip.compress(second.encode())
+        for size in (5, len(data)):
+            assert list(_decompressed_lines(split(data, size))) == CSV.split("\n")
+
+    def test_line_split_across_chunk_boundaries(self):
+        text = "CVE-2024-0001,é,0.1\nCVE-2024-0002,ü,0.2\n"
+        data = text.encode()
+        # Cuts inside lines and inside the two-byte UTF-8 characters
+        chunks = [data[:5], data[5:15], data[15:16], data[16:34], data[34:]]
+        assert list(_decompressed_lines(chunks)) == [
+            "CVE-2024-0001,é,0.1",
+            "CVE-2024-0002,ü,0.2",
+            "",
+        ]
+
+
+class TestEPSSParse:
+    def test_parses_multi_member_gzip(self):
+        data = gzip.compress(CSV[:100].encode()) + gzip.compress(CSV[100:].encode())
+        rows = list(EPSSFeed().parse(split(data, 32)))
+        assert [row["cve_id"] for row in rows] == [
+            "CVE-2024-0001",
+            "CVE-2024-0002",
+            "CVE-2024-0003",
+        ]
+        assert str(rows[1]["epss"]) == "0.97521"
+
+
+def cwe_catalogue(path, weaknesses: dict) -> None:
+    """Zipped CWE catalogue with {id: (name, description)} weaknesses."""
+    entries = "".join(
+        f'<Weakness ID="{cwe_id}" Name="{name}">'
+        f"<Description>{description}</Description></Weakness>"
+        for cwe_id, (name, description) in weaknesses.items()
+    )
+    xml = (
+        '<Weakness_Catalog xmlns="http://cwe.mitre.org/cwe-7">'
+        f"<Weaknesses>{entries}</Weaknesses>"
+        '<Categories><Category ID="1" Name="Category"/></Categories>'
+        "</Weakness_Catalog>"
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("cwec_v4.15.xml", xml)
+
+
+def writes(queries) -> list[str]:
+    return [
+        query["sql"]
+        for query in queries
+        if query["sql"].lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))
+    ]
+
+
+@pytest.mark.django_db
+class TestCWESync:
+    WEAKNESSES = {
+        "79": ("Cross-site Scripting", "Improper neutralization of input."),
+        "89": ("SQL Injection", "Improper neutralization of SQL."),
+    }
+
+    def test_unchanged_catalogue_makes_no_writes(self, tmp_path):
+        path = tmp_path / "cwec.xml.zip"
+        cwe_catalogue(path, self.WEAKNESSES)
+        assert CWEFeed(path).sync() == {"created": 2, "updated": 0, "unchanged": 0}
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = CWEFeed(path).sync()
+        assert result == {"created": 0, "updated": 0, "unchanged": 2}
+        assert writes(ctx.captured_queries) == []
+
+    def test_changed_entry_is_updated(self, tmp_path):
+        path = tmp_path / "cwec.xml.zip"
+        cwe_catalogue(path, self.WEAKNESSES)
+        CWEFeed(path).sync()
+        CWE.objects.filter(ref_id="CWE-79").update(description="")
+        xss_hash = CWE.objects.get(ref_id="CWE-79").content_hash
+
+        cwe_catalogue(
+            path,
+            {**self.WEAKNESSES, "79": ("Cross-site Scripting", "New description.")},
+        )
+        assert CWEFeed(path).sync() == {"created": 0, "updated": 1, "unchanged": 1}
+        xss = CWE.objects.get(ref_id="CWE-79")
+        assert xss.description == "New description."
+        assert xss.content_hash != xss_hash
+        # The new hash is recorded: the next sync has nothing to do
+        assert CWEFeed(path).sync() == {"created": 0, "updated": 0, "unchanged": 2}
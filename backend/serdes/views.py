@@ -3,6 +3,7 @@ import io
 import json
 import struct
 import sys
+import uuid
 from datetime import datetime
 
 import structlog
@@ -710,10 +711,17 @@ class AttachmentMetadataView(APIView):
 class BatchDownloadAttachmentsView(APIView):
     """
     POST endpoint that streams multiple attachments in a custom binary format.
-    Request body: {"revision_ids": ["id1", "id2", ...]}
-    Response format: for each file: [4-byte length][JSON header][file bytes]
+    Request body: {"revision_ids": ["id1", "id2", ...], "framing": "header-length"}
+    Response format: for each file: [4-byte block length][JSON header][file bytes]
+    With "framing": "header-length", the prefix is the header length instead
+    and the JSON header carries the file size, so each frame can be parsed
+    incrementally. The framing used is echoed in the X-Attachment-Framing
+    response header. Files are read from storage in chunks, never buffered whole.
     """
 
+    chunk_size = 1024 * 1024
+    framings = ("block-length", "header-length")
+
     def post(self, request, *args, **kwargs):
         if not request.user.has_backup_permission:
             logger.warning(
@@ -730,6 +738,14 @@ class BatchDownloadAttachmentsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Older clients don't send it and expect the block-length framing
+        framing = request.data.get("framing", "block-length")
+        if framing not in self.framings:
+            return Response(
+                {"error": "InvalidFraming", "allowed": list(self.framings)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         # Check batch size limit
         max_batch_size = getattr(settings, "BACKUP_BATCH_SIZE", 200)
 
@@ -750,69 +766,86 @@ class BatchDownloadAttachmentsView(APIView):
             revision_count=len(revision_ids),
         )
 
+        valid_ids = []
+        for revision_id in revision_ids:
+            try:
+                valid_ids.append(uuid.UUID(str(revision_id)))
+            except ValueError:
+                logger.warning("Invalid revision id", revision_id=revision_id)
+
+        # One query for the whole batch
+        revisions = EvidenceRevision.objects.in_bulk(valid_ids)
+        chunk_size = self.chunk_size
+
         def stream_attachments():
             """Generator that yields attachment data in custom binary format."""
             processed = 0
-            errors = 0
+            errors = len(revision_ids) - len(valid_ids)
 
-            for revision_id in revision_ids:
-                try:
-                    revision = EvidenceRevision.objects.select_related("evidence").get(
-                        id=revision_id
+            for revision_id in valid_ids:
+                revision = revisions.get(revision_id)
+                if revision is None:
+                    errors += 1
+                    logger.warning(
+                        "Revision not found",
+                        revision_id=revision_id,
                     )
+                    continue
 
-                    if not revision.attachment or not default_storage.exists(
-                        revision.attachment.name
-                    ):
-                        errors += 1
-                        logger.warning(
-                            "Attachment not found for revision",
-                            revision_id=revision_id,
-                        )
-                        continue
+                if not revision.attachment:
+                    errors += 1
+                    logger.warning(
+                        "Attachment not found for revision",
+                        revision_id=revision_id,
+                    )
+                    continue
 
+                try:
+                    f = default_storage.open(revision.attachment.name, "rb")
+                    size = f.size
+                except Exception as e:
+                    errors += 1
+                    logger.warning(
+                        "Attachment not found for revision",
+                        revision_id=revision_id,
+                        error=str(e),
+                    )
+                    continue
+
+                with f:
                     header = {
                         "id": str(revision.id),
                         "evidence_id": str(revision.evidence_id),
                         "version": revision.version,
                         "filename": revision.filename(),
                         "hash": revision.attachment_hash,
-                        "size": default_storage.size(revision.attachment.name),
+                        "size": size,
                     }
                     header_bytes = json.dumps(header).encode("utf-8")
 
-                    # Read file in chunks
-                    file_buffer = io.BytesIO()
-                    with default_storage.open(revision.attachment.name, "rb") as f:
-                        for chunk in iter(lambda: f.read(10240 * 1024), b""):
-                            file_buffer.write(chunk)
-
-                    file_bytes = file_buffer.getvalue()
-
-                    # Calculate total size: header_length + header + file
-                    total_size = len(header_bytes) + len(file_bytes)
-
-                    # Yield: [4-byte total size][header bytes][file bytes]
-                    yield struct.pack(">I", total_size)
+                    if framing == "header-length":
+                        yield struct.pack(">I", len(header_bytes))
+                    else:
+                        yield struct.pack(">I", len(header_bytes) + size)
                     yield header_bytes
-                    yield file_bytes
 
-                    processed += 1
+                    # Once the header is sent, exactly `size` bytes must follow:
+                    # an error past this point aborts the stream, and the client
+                    # detects the truncated frame.
+                    remaining = size
+                    while remaining > 0:
+                        chunk = f.read(min(chunk_size, remaining))
+                        if not chunk:
+                            logger.error(
+                                "Attachment shorter than its announced size",
+                                revision_id=revision_id,
+                                missing=remaining,
+                            )
+                            raise OSError(f"Truncated attachment {revision_id}")
+                        remaining -= len(chunk)
+                        yield chunk
 
-                except EvidenceRevision.DoesNotExist:
-                    errors += 1
-                    logger.warning(
-                        "Revision not found",
-                        revision_id=revision_id,
-                    )
-                except Exception as e:
-                    errors += 1
-                    logger.error(
-                        "Error streaming attachment",
-                        revision_id=revision_id,
-                        error=str(e),
-                        exc_info=True,
-                    )
+                processed += 1
 
             logger.info(
                 "Batch download completed",
@@ -827,6 +860,7 @@ class BatchDownloadAttachmentsView(APIView):
         response["Content-Disposition"] = (
             f'attachment; filename="attachments-batch-{datetime.now().strftime("%Y%m%d-%H%M%S")}.dat"'
         )
+        response["X-Attachment-Framing"] = framing
 
         return response
 
@@ -834,7 +868,8 @@ class BatchDownloadAttachmentsView(APIView):
 class BatchUploadAttachmentsView(APIView):
     """
     POST endpoint that accepts multiple attachments in custom binary format.
-    Request body: same format as batch download (4-byte length, JSON header, file bytes)
+    Request body: for each file: [4-byte block length][JSON header][file bytes]
+    (the block-length framing; the header-length framing is download-only)
     Response: {"processed": N, "restored": N, "skipped": N, "errors": [...]}
     """
 
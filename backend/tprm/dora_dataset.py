@@ -0,0 +1,342 @@
+"""
+In-memory snapshot of the data behind the DORA Register of Information.
+
+The ROI export reports and the linter rules read the same object graph:
+entities and their ``parent_entity`` chains, contracts, the solutions they
+cover, the assets those solutions support and the subcontracting chains
+behind them. Walking that graph through lazy relations costs a query per
+hop, per report and per rule.
+
+A DoraDataset loads each table once, links the objects to each other in
+memory (``entity.parent_entity``, ``contract.provider_entity``,
+``subcontractor.recipient``... all point into the same entity map) and
+precomputes the derived data: ultimate parents, subcontracting chain ranks
+and the business function scope. Reports and rules then run over the
+snapshot without further queries.
+"""
+
+import copy
+from collections import defaultdict
+from functools import cached_property
+from typing import Dict, List, Optional
+
+from django.db.models import QuerySet
+
+from core.asset_graph import get_asset_graph
+from core.models import Asset
+from tprm.models import Contract, Entity, Solution, SolutionSubcontractor
+
+
+def compute_chain_depths(chain_rows):
+    """Compute rank (depth) for each SolutionSubcontractor from the recipient tree.
+
+    Returns a dict mapping subcontractor_id → rank (int, >= 2).
+    - recipient=NULL → rank 2 (direct child of the provider)
+    - recipient=X → rank_of(X) + 1
+
+    Cycles in corrupt data are broken by treating the back-edge as a root
+    (depth 2) instead of recursing infinitely.
+    """
+    by_sub = {sc.subcontractor_id: sc for sc in chain_rows}
+    depths = {}
+    visiting = set()
+
+    def _depth(sc):
+        sid = sc.subcontractor_id
+        if sid in depths:
+            return depths[sid]
+        if sid in visiting:
+            # Cycle detected — break it by treating this node as a root.
+            depths[sid] = 2
+            return 2
+        visiting.add(sid)
+        if sc.recipient_id is None or sc.recipient_id not in by_sub:
+            depths[sid] = 2
+        else:
+            depths[sid] = _depth(by_sub[sc.recipient_id]) + 1
+        visiting.discard(sid)
+        return depths[sid]
+
+    for sc in chain_rows:
+        _depth(sc)
+    return depths
+
+
+def get_ultimate_parent(entity):
+    """Walk parent_entity chain to the root. Returns None if no parent."""
+    current = entity.parent_entity
+    seen = {entity.pk}
+    while current is not None:
+        if current.pk in seen:
+            break  # cycle guard
+        seen.add(current.pk)
+        if current.parent_entity is None:
+            return current
+        current = current.parent_entity
+    return current
+
+
+def get_provider_chain(entity):
+    """
+    Walk parent_entity from entity to root.
+    Returns list from root to leaf, e.g. [A, B, C] where A is root.
+    If entity has no parent, returns [entity].
+    """
+    chain = [entity]
+    seen = {entity.pk}
+    current = entity
+    while current.parent_entity is not None:
+        parent = current.parent_entity
+        if parent.pk in seen:
+            break  # cycle guard
+        seen.add(parent.pk)
+        chain.append(parent)
+        current = parent
+    chain.reverse()  # root first
+    return chain
+
+
+def exportable_contracts() -> QuerySet:
+    """Contracts in the scope of the ROI: neither drafts nor excluded from DORA."""
+    return Contract.objects.exclude(status=Contract.Status.DRAFT).exclude(
+        dora_exclude=True
+    )
+
+
+def is_subsidiary(entity: Entity) -> bool:
+    """Subsidiaries have a provider person type set, branches do not."""
+    return bool(entity.dora_provider_person_type)
+
+
+class DoraDataset:
+    """
+    Entities, contracts, solutions, business functions and subcontracting
+    chains of one ROI, loaded once and linked in memory.
+
+    Args:
+        contracts: contracts in scope (default: all exportable contracts).
+        business_functions: business function assets in scope (default: all
+            assets flagged as business function).
+    """
+
+    def __init__(
+        self,
+        contracts: Optional[QuerySet] = None,
+        business_functions: Optional[QuerySet] = None,
+    ):
+        if contracts is None:
+            contracts = exportable_contracts()
+        if business_functions is None:
+            business_functions = Asset.objects.filter(is_business_function=True)
+
+        self.entities: Dict = {entity.id: entity for entity in Entity.objects.all()}
+        for entity in self.entities.values():
+            entity.parent_entity = self.entities.get(entity.parent_entity_id)
+
+        self.contracts: List[Contract] = list(contracts)
+        contracts_by_id = {contract.id: contract for contract in self.contracts}
+        overarching_ids = {
+            contract.overarching_contract_id
+            for contract in self.contracts
+            if contract.overarching_contract_id is not None
+        }
+        contracts_by_id.update(
+            Contract.objects.in_bulk(overarching_ids - contracts_by_id.keys())
+        )
+        for contract in self.contracts:
+            contract.provider_entity = self.entities.get(contract.provider_entity_id)
+            contract.beneficiary_entity = self.entities.get(
+                contract.beneficiary_entity_id
+            )
+            contract.overarching_contract = contracts_by_id.get(
+                contract.overarching_contract_id
+            )
+
+        self.solutions: Dict = {
+            solution.id: solution for solution in Solution.objects.all()
+        }
+        for solution in self.solutions.values():
+            solution.provider_entity = self.entities.get(solution.provider_entity_id)
+
+        # Links of every contract, drafts included: the linter scopes solutions
+        # on the status of all their contracts.
+        self.contract_solutions: Dict = defaultdict(list)
+        self.solution_contract_ids: Dict = defaultdict(list)
+        for contract_id, solution_id in Contract.solutions.through.objects.order_by(
+            "id"
+        ).values_list("contract_id", "solution_id"):
+            self.contract_solutions[contract_id].append(self.solutions[solution_id])
+            self.solution_contract_ids[solution_id].append(contract_id)
+
+        self.solution_asset_ids: Dict = defaultdict(list)
+        for solution_id, asset_id in Solution.assets.through.objects.order_by(
+            "id"
+        ).values_list("solution_id", "asset_id"):
+            self.solution_asset_ids[solution_id].append(asset_id)
+
+        self.business_functions: List[Asset] = list(business_functions)
+        # Every business function asset, in or out of scope, by id: b_02.02
+        # reports the business functions a solution supports.
+        self.business_function_assets: Dict = {
+            asset.id: asset for asset in Asset.objects.filter(is_business_function=True)
+        }
+
+        self.subcontracting_rows: List[SolutionSubcontractor] = list(
+            SolutionSubcontractor.objects.all()
+        )
+        self.chains: Dict = defaultdict(list)
+        for sc in self.subcontracting_rows:
+            sc.subcontractor = self.entities[sc.subcontractor_id]
+            sc.recipient = self.entities.get(sc.recipient_id)
+            sc.solution = self.solutions[sc.solution_id]
+            self.chains[sc.solution_id].append(sc)
+        self.chain_depths: Dict = {
+            solution_id: compute_chain_depths(rows)
+            for solution_id, rows in self.chains.items()
+        }
+
+        self._ultimate_parents: Dict = {}
+
+    @classmethod
+    def of(cls, contracts) -> "DoraDataset":
+        """``contracts`` itself if it is a dataset, else a snapshot of that queryset."""
+        if isinstance(contracts, cls):
+            return contracts
+        return cls(contracts)
+
+    def with_contracts(self, contracts: List[Contract]) -> "DoraDataset":
+        """The same snapshot, restricted to ``contracts`` (taken from this one)."""
+        subset = copy.copy(self)
+        subset.contracts = contracts
+        return subset
+
+    # Entities
+
+    @cached_property
+    def main_entity(self) -> Optional[Entity]:
+        main_entity = Entity.get_main_entity()
+        if main_entity is None:
+            return None
+        return self.entities.get(main_entity.id, main_entity)
+
+    def subsidiaries(self, main_entity: Entity) -> List[Entity]:
+        return [
+            entity
+            for entity in self.entities.values()
+            if entity.parent_entity_id == main_entity.id and is_subsidiary(entity)
+        ]
+
+    def branches(self, main_entity: Entity) -> List[Entity]:
+        return [
+            entity
+            for entity in self.entities.values()
+            if entity.parent_entity_id == main_entity.id and not is_subsidiary(entity)
+        ]
+
+    def ultimate_parent(self, entity: Entity) -> Optional[Entity]:
+        if entity.id not in self._ultimate_parents:
+            self._ultimate_parents[entity.id] = get_ultimate_parent(entity)
+        return self._ultimate_parents[entity.id]
+
+    @cached_property
+    def _contract_flags(self) -> Dict:
+        """(status, dora_exclude, is_intragroup, provider id) of every contract."""
+        return {
+            contract_id: flags
+            for contract_id, *flags in Contract.objects.values_list(
+                "id", "status", "dora_exclude", "is_intragroup", "provider_entity_id"
+            )
+        }
+
+    def third_party_providers(self) -> List[Entity]:
+        """
+        Providers of a non-intragroup contract that is not excluded from DORA,
+        left out when they provide any draft contract.
+        """
+        providers = set()
+        drafting = set()
+        for (
+            status,
+            dora_exclude,
+            is_intragroup,
+            provider_id,
+        ) in self._contract_flags.values():
+            if provider_id is None:
+                continue
+            if status == Contract.Status.DRAFT:
+                drafting.add(provider_id)
+            if not is_intragroup and not dora_exclude:
+                providers.add(provider_id)
+        return [
+            entity
+            for entity in self.entities.values()
+            if entity.id in providers and entity.id not in drafting
+        ]
+
+    # Contracts and solutions
+
+    def solutions_of(self, contract: Contract) -> List[Solution]:
+        return self.contract_solutions.get(contract.id, [])
+
+    def solution_business_functions(
+        self, solution: Solution, asset_ids: Optional[set] = None
+    ) -> List[Asset]:
+        """Business functions ``solution`` supports, among ``asset_ids`` if given."""
+        return [
+            self.business_function_assets[asset_id]
+            for asset_id in self.solution_asset_ids.get(solution.id, [])
+            if asset_id in self.business_function_assets
+            and (asset_ids is None or asset_id in asset_ids)
+        ]
+
+    @cached_property
+    def business_function_asset_ids(self) -> set:
+        """Business functions in scope and all their descendant assets."""
+        graph = get_asset_graph()
+        asset_ids = set()
+        for asset in self.business_functions:
+            asset_ids.add(asset.id)
+            asset_ids |= graph.descendant_ids(asset.id)
+        return asset_ids
+
+    def supports_business_function(self, solution: Solution) -> bool:
+        asset_ids = self.business_function_asset_ids
+        return any(
+            asset_id in asset_ids
+            for asset_id in self.solution_asset_ids.get(solution.id, [])
+        )
+
+    def business_function_contracts(self) -> List[Contract]:
+        """Contracts with a solution linked to a business function or its children."""
+        return [
+            contract
+            for contract in self.contracts
+            if any(
+                self.supports_business_function(solution)
+                for solution in self.solutions_of(contract)
+            )
+        ]
+
+    def reportable_solutions(self) -> List[Solution]:
+        """Solutions none of whose contracts is a draft or excluded from DORA."""
+        flags = self._contract_flags
+        return [
+            solution
+            for solution in self.solutions.values()
+            if not any(
+                flags[contract_id][0] == Contract.Status.DRAFT or flags[contract_id][1]
+                for contract_id in self.solution_contract_ids.get(solution.id, [])
+            )
+        ]
+
+    def supply_chain_solutions(self) -> List[Solution]:
+        """Reportable solutions on a contract with a provider (b_05.02, b_07.01)."""
+        flags = self._contract_flags
+        return [
+            solution
+            for solution in self.reportable_solutions()
+            if any(
+                flags[contract_id][3] is not None
+                for contract_id in self.solution_contract_ids.get(solution.id, [])
+            )
+        ]
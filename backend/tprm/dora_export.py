@@ -9,11 +9,13 @@ import csv
 import io
 import json
 import logging
+from collections import Counter
 from datetime import date, datetime
 from typing import Dict, List, Optional, Any
 
 from django.db.models import QuerySet
-from tprm.models import Entity, Contract, Solution
+from tprm.models import Entity, Contract
+from tprm.dora_dataset import DoraDataset
 from core.models import Asset
 
 
@@ -23,41 +25,6 @@ logger = logging.getLogger(__name__)
 # Helper Functions
 
 
-def compute_chain_depths(chain_rows):
-    """Compute rank (depth) for each SolutionSubcontractor from the recipient tree.
-
-    Returns a dict mapping subcontractor_id → rank (int, >= 2).
-    - recipient=NULL → rank 2 (direct child of the provider)
-    - recipient=X → rank_of(X) + 1
-
-    Cycles in corrupt data are broken by treating the back-edge as a root
-    (depth 2) instead of recursing infinitely.
-    """
-    by_sub = {sc.subcontractor_id: sc for sc in chain_rows}
-    depths = {}
-    visiting = set()
-
-    def _depth(sc):
-        sid = sc.subcontractor_id
-        if sid in depths:
-            return depths[sid]
-        if sid in visiting:
-            # Cycle detected — break it by treating this node as a root.
-            depths[sid] = 2
-            return 2
-        visiting.add(sid)
-        if sc.recipient_id is None or sc.recipient_id not in by_sub:
-            depths[sid] = 2
-        else:
-            depths[sid] = _depth(by_sub[sc.recipient_id]) + 1
-        visiting.discard(sid)
-        return depths[sid]
-
-    for sc in chain_rows:
-        _depth(sc)
-    return depths
-
-
 IDENTIFIER_PRIORITY = ["LEI", "EUID", "KBO", "CRN", "VAT", "PNR", "NIN", "DUNS"]
 
 
@@ -117,40 +84,6 @@ def get_dora_export_metadata(
     }
 
 
-def get_ultimate_parent(entity):
-    """Walk parent_entity chain to the root. Returns None if no parent."""
-    current = entity.parent_entity
-    seen = {entity.pk}
-    while current is not None:
-        if current.pk in seen:
-            break  # cycle guard
-        seen.add(current.pk)
-        if current.parent_entity is None:
-            return current
-        current = current.parent_entity
-    return current
-
-
-def get_provider_chain(entity):
-    """
-    Walk parent_entity from entity to root.
-    Returns list from root to leaf, e.g. [A, B, C] where A is root.
-    If entity has no parent, returns [entity].
-    """
-    chain = [entity]
-    seen = {entity.pk}
-    current = entity
-    while current.parent_entity is not None:
-        parent = current.parent_entity
-        if parent.pk in seen:
-            break  # cycle guard
-        seen.add(parent.pk)
-        chain.append(parent)
-        current = parent
-    chain.reverse()  # root first
-    return chain
-
-
 def get_entity_identifier(
     entity: Entity, priority: List[str] = None
 ) -> tuple[str, str, str]:
@@ -415,7 +348,7 @@ def generate_b_01_03_branches(
 
 
 def generate_b_02_01_contracts(
-    zip_file, contracts: QuerySet, folder_prefix: str = ""
+    zip_file, contracts: QuerySet | DoraDataset, folder_prefix: str = ""
 ) -> None:
     """
     Generate b_02.01.csv - Contractual arrangements – General Information.
@@ -432,7 +365,7 @@ def generate_b_02_01_contracts(
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects
+        contracts: QuerySet of Contract objects, or a DoraDataset
     """
     csv_buffer = io.StringIO()
     csv_writer = csv.writer(csv_buffer)
@@ -449,10 +382,10 @@ def generate_b_02_01_contracts(
     )
 
     # RT.02.01 must include ALL contracts — other tabs reference it via FK (Rule 807)
-    filtered_contracts = contracts.select_related("overarching_contract")
+    dataset = DoraDataset.of(contracts)
 
     # Write contract data
-    for contract in filtered_contracts:
+    for contract in dataset.contracts:
         # b_02.01.0010: Contractual arrangement reference number
         contract_ref = contract.ref_id or str(contract.id)
 
@@ -499,7 +432,7 @@ def generate_b_02_01_contracts(
 
 def generate_b_02_02_ict_services(
     zip_file,
-    contracts: QuerySet,
+    contracts: QuerySet | DoraDataset,
     folder_prefix: str = "",
     business_function_asset_ids: set = None,
 ) -> None:
@@ -512,7 +445,7 @@ def generate_b_02_02_ict_services(
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects with solutions
+        contracts: QuerySet of Contract objects with solutions, or a DoraDataset
         folder_prefix: Optional folder prefix to prepend to file path
         business_function_asset_ids: Set of asset IDs related to business functions (including children)
     """
@@ -543,43 +476,24 @@ def generate_b_02_02_ict_services(
         ]
     )
 
-    # Filter contracts: only those with solutions linked to business function assets or their children
-    if business_function_asset_ids:
-        filtered_contracts = (
-            contracts.filter(
-                solutions__isnull=False,
-                solutions__assets__id__in=business_function_asset_ids,
-            )
-            .distinct()
-            .select_related("provider_entity", "beneficiary_entity")
-            .prefetch_related("solutions__assets")
-        )
-    else:
-        # Fallback to old behavior if business_function_asset_ids not provided
-        filtered_contracts = (
-            contracts.filter(
-                solutions__isnull=False, solutions__assets__is_business_function=True
-            )
-            .distinct()
-            .select_related("provider_entity", "beneficiary_entity")
-            .prefetch_related("solutions__assets")
-        )
+    # Only contracts with solutions linked to business function assets or their
+    # children produce rows. Without business_function_asset_ids, fall back to
+    # every business function asset.
+    dataset = DoraDataset.of(contracts)
+    asset_ids = business_function_asset_ids or None
 
     # Write contract-solution-function data
     # Track written dimension keys to avoid XBRL duplicate fact errors.
     # The XBRL key for b_02.02 is (c0010, c0020, c0030, c0050, c0060, c0130, c0150, c0160).
     seen_keys = set()
 
-    for contract in filtered_contracts:
+    for contract in dataset.contracts:
         # Iterate through all solutions in this contract
-        for solution in contract.solutions.all():
+        for solution in dataset.solutions_of(contract):
             # Get business functions associated with this solution (directly or through children)
-            if business_function_asset_ids:
-                business_functions = solution.assets.filter(
-                    id__in=business_function_asset_ids, is_business_function=True
-                )
-            else:
-                business_functions = solution.assets.filter(is_business_function=True)
+            business_functions = dataset.solution_business_functions(
+                solution, asset_ids
+            )
 
             for function in business_functions:
                 # c0010: Contract reference
@@ -721,7 +635,7 @@ def generate_b_02_02_ict_services(
 
 
 def generate_b_02_03_intragroup_contracts(
-    zip_file, contracts: QuerySet, folder_prefix: str = ""
+    zip_file, contracts: QuerySet | DoraDataset, folder_prefix: str = ""
 ) -> None:
     """
     Generate b_02.03.csv - Intra-group contractual arrangements.
@@ -735,7 +649,7 @@ def generate_b_02_03_intragroup_contracts(
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects
+        contracts: QuerySet of Contract objects, or a DoraDataset
         folder_prefix: Optional folder prefix to prepend to file path
     """
     csv_buffer = io.StringIO()
@@ -745,9 +659,11 @@ def generate_b_02_03_intragroup_contracts(
     csv_writer.writerow(["c0010", "c0020", "c0030"])
 
     # Filter intragroup contracts with overarching contract
-    intragroup_contracts = contracts.filter(
-        is_intragroup=True, overarching_contract__isnull=False
-    ).select_related("overarching_contract")
+    intragroup_contracts = [
+        contract
+        for contract in DoraDataset.of(contracts).contracts
+        if contract.is_intragroup and contract.overarching_contract is not None
+    ]
 
     # Write intra-group contract relationships
     for contract in intragroup_contracts:
@@ -773,7 +689,10 @@ def generate_b_02_03_intragroup_contracts(
 
 
 def generate_b_03_01_signing_entities(
-    zip_file, main_entity: Entity, contracts: QuerySet, folder_prefix: str = ""
+    zip_file,
+    main_entity: Entity,
+    contracts: QuerySet | DoraDataset,
+    folder_prefix: str = "",
 ) -> None:
     """
     Generate b_03.01.csv - Signing entities (main entity for all contracts).
@@ -786,7 +705,7 @@ def generate_b_03_01_signing_entities(
     Args:
         zip_file: ZIP file object to write to
         main_entity: The main builtin entity
-        contracts: QuerySet of Contract objects
+        contracts: QuerySet of Contract objects, or a DoraDataset
         folder_prefix: Optional folder prefix to prepend to file path
     """
     csv_buffer = io.StringIO()
@@ -799,7 +718,7 @@ def generate_b_03_01_signing_entities(
     main_code, _, _ = get_entity_identifier(main_entity)
 
     # Write contract-entity data (main entity signs all contracts)
-    for contract in contracts:
+    for contract in DoraDataset.of(contracts).contracts:
         # c0010: Contract reference
         contract_ref = contract.ref_id or str(contract.id)
 
@@ -820,7 +739,7 @@ def generate_b_03_01_signing_entities(
 
 
 def generate_b_03_02_ict_providers(
-    zip_file, contracts: QuerySet, folder_prefix: str = ""
+    zip_file, contracts: QuerySet | DoraDataset, folder_prefix: str = ""
 ) -> None:
     """
     Generate b_03.02.csv - ICT third-party service providers.
@@ -832,7 +751,7 @@ def generate_b_03_02_ict_providers(
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects with providers
+        contracts: QuerySet of Contract objects with providers, or a DoraDataset
     """
     csv_buffer = io.StringIO()
     csv_writer = csv.writer(csv_buffer)
@@ -841,9 +760,11 @@ def generate_b_03_02_ict_providers(
     csv_writer.writerow(["c0010", "c0020", "c0030"])
 
     # Get third-party contracts with providers
-    third_party_contracts = contracts.filter(
-        is_intragroup=False, provider_entity__isnull=False
-    ).select_related("provider_entity")
+    third_party_contracts = [
+        contract
+        for contract in DoraDataset.of(contracts).contracts
+        if not contract.is_intragroup and contract.provider_entity is not None
+    ]
 
     # Write provider data
     for contract in third_party_contracts:
@@ -867,7 +788,10 @@ def generate_b_03_02_ict_providers(
 
 
 def generate_b_03_03_intragroup_providers(
-    zip_file, main_entity: Entity, contracts: QuerySet, folder_prefix: str = ""
+    zip_file,
+    main_entity: Entity,
+    contracts: QuerySet | DoraDataset,
+    folder_prefix: str = "",
 ) -> None:
     """
     Generate b_03.03.csv - Entities signing the Contractual arrangements for providing ICT service(s)
@@ -881,7 +805,7 @@ def generate_b_03_03_intragroup_providers(
     Args:
         zip_file: ZIP file object to write to
         main_entity: The main builtin entity
-        contracts: QuerySet of Contract objects
+        contracts: QuerySet of Contract objects, or a DoraDataset
     """
     csv_buffer = io.StringIO()
     csv_writer = csv.writer(csv_buffer)
@@ -890,9 +814,11 @@ def generate_b_03_03_intragroup_providers(
     csv_writer.writerow(["c0010", "c0020", "c0031"])
 
     # Get intra-group contracts
-    intragroup_contracts = contracts.filter(is_intragroup=True).select_related(
-        "provider_entity"
-    )
+    intragroup_contracts = [
+        contract
+        for contract in DoraDataset.of(contracts).contracts
+        if contract.is_intragroup
+    ]
 
     # Write provider data for each intra-group contract
     for contract in intragroup_contracts:
@@ -915,7 +841,7 @@ def generate_b_03_03_intragroup_providers(
 def generate_b_04_01_service_users(
     zip_file,
     branches: List[Entity],
-    contracts: QuerySet,
+    contracts: QuerySet | DoraDataset,
     folder_prefix: str = "",
 ) -> None:
     """
@@ -934,7 +860,7 @@ def generate_b_04_01_service_users(
     Args:
         zip_file: ZIP file object to write to
         branches: List of branch entities
-        contracts: QuerySet of Contract objects
+        contracts: QuerySet of Contract objects, or a DoraDataset
         folder_prefix: Optional folder prefix to prepend to file path
     """
     csv_buffer = io.StringIO()
@@ -943,14 +869,16 @@ def generate_b_04_01_service_users(
     # Write CSV headers
     csv_writer.writerow(["c0010", "c0020", "c0030", "c0040"])
 
-    # Select related beneficiary_entity for performance
-    contracts = contracts.select_related("beneficiary_entity")
+    # Branches grouped by head office, in their original order
+    branches_by_parent = {}
+    for branch in branches:
+        branches_by_parent.setdefault(branch.parent_entity_id, []).append(branch)
 
     # Track written combinations to avoid duplicates
     written_combinations = set()
 
     # Write user data for each contract
-    for contract in contracts:
+    for contract in DoraDataset.of(contracts).contracts:
         # c0010: Contract reference
         contract_ref = contract.ref_id or str(contract.id)
 
@@ -976,11 +904,7 @@ def generate_b_04_01_service_users(
             written_combinations.add(combination)
 
         # Write rows for branches of the beneficiary entity only
-        for branch in branches:
-            if branch.parent_entity_id != getattr(
-                contract.beneficiary_entity, "id", None
-            ):
-                continue
+        for branch in branches_by_parent.get(contract.beneficiary_entity_id, []):
             # c0040: Branch code (typed dimension eba_typ:IS — use "0" if empty)
             branch_code, _, _ = get_entity_identifier(branch)
             branch_code = branch_code or "0"
@@ -1003,7 +927,10 @@ def generate_b_04_01_service_users(
 
 
 def generate_b_05_01_provider_details(
-    zip_file, main_entity: Entity, contracts: QuerySet, folder_prefix: str = ""
+    zip_file,
+    main_entity: Entity,
+    contracts: QuerySet | DoraDataset,
+    folder_prefix: str = "",
 ) -> None:
     """
     Generate b_05.01.csv - Details of ICT third-party service providers.
@@ -1011,7 +938,7 @@ def generate_b_05_01_provider_details(
     Args:
         zip_file: ZIP file object to write to
         main_entity: The main builtin entity
-        contracts: QuerySet of Contract objects with providers
+        contracts: QuerySet of Contract objects with providers, or a DoraDataset
     """
     csv_buffer = io.StringIO()
     csv_writer = csv.writer(csv_buffer)
@@ -1037,9 +964,12 @@ def generate_b_05_01_provider_details(
     # Aggregate expenses by provider
     providers_data = {}
 
-    third_party_contracts = contracts.filter(
-        is_intragroup=False, provider_entity__isnull=False
-    ).select_related("provider_entity")
+    dataset = DoraDataset.of(contracts)
+    third_party_contracts = [
+        contract
+        for contract in dataset.contracts
+        if not contract.is_intragroup and contract.provider_entity is not None
+    ]
 
     for contract in third_party_contracts:
         provider = contract.provider_entity
@@ -1060,11 +990,9 @@ def generate_b_05_01_provider_details(
     # is not a direct provider of any contract, so it has no entry yet. Emit a
     # zero-expense, empty-currency row per subcontractor. Runs BEFORE the
     # parent-entity walker so ancestors of subcontractors are also registered.
-    for contract in third_party_contracts.prefetch_related(
-        "solutions__subcontracting_chain__subcontractor"
-    ):
-        for solution in contract.solutions.all():
-            for sc in solution.subcontracting_chain.all():
+    for contract in third_party_contracts:
+        for solution in dataset.solutions_of(contract):
+            for sc in dataset.chains.get(solution.id, []):
                 if sc.subcontractor_id not in providers_data:
                     providers_data[sc.subcontractor_id] = {
                         "provider": sc.subcontractor,
@@ -1124,7 +1052,7 @@ def generate_b_05_01_provider_details(
         # FK constraint: c0110 must reference a valid c0010 in B_05.01
         # If no parent, self-reference the provider (it IS its own ultimate parent)
         parent_code, parent_code_type = "", ""
-        ultimate_parent = get_ultimate_parent(provider)
+        ultimate_parent = dataset.ultimate_parent(provider)
         if ultimate_parent:
             parent_code, parent_code_type, _ = get_entity_identifier(ultimate_parent)
         if not parent_code:
@@ -1158,7 +1086,7 @@ def generate_b_05_01_provider_details(
 
 
 def generate_b_05_02_supply_chains(
-    zip_file, contracts: QuerySet, folder_prefix: str = ""
+    zip_file, contracts: QuerySet | DoraDataset, folder_prefix: str = ""
 ) -> None:
     """
     Generate b_05.02.csv - ICT service supply chains.
@@ -1174,7 +1102,7 @@ def generate_b_05_02_supply_chains(
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects with solutions
+        contracts: QuerySet of Contract objects with solutions, or a DoraDataset
         folder_prefix: Optional folder prefix to prepend to file path
     """
     csv_buffer = io.StringIO()
@@ -1195,18 +1123,12 @@ def generate_b_05_02_supply_chains(
 
     # Get contracts with both provider and solutions
     # NOTE: intragroup providers ARE included per EBA FAQ #70, #82, #84
-    supply_chain_contracts = (
-        contracts.filter(
-            provider_entity__isnull=False,
-            solutions__isnull=False,
-        )
-        .select_related("provider_entity", "beneficiary_entity")
-        .prefetch_related(
-            "solutions__provider_entity",
-            "solutions__subcontracting_chain__subcontractor",
-            "solutions__subcontracting_chain__recipient",
-        )
-    )
+    dataset = DoraDataset.of(contracts)
+    supply_chain_contracts = [
+        contract
+        for contract in dataset.contracts
+        if contract.provider_entity is not None and dataset.solutions_of(contract)
+    ]
 
     # Write supply chain data
     # Track written dimension keys to avoid XBRL duplicate fact errors.
@@ -1221,7 +1143,7 @@ def generate_b_05_02_supply_chains(
     # (fan-out / tree), e.g. Zscaler subcontracting to both AWS and Azure at
     # rank 2. At rank=1, recipient = provider (direct service relationship).
     for contract in supply_chain_contracts:
-        for solution in contract.solutions.all():
+        for solution in dataset.solutions_of(contract):
             contract_ref = contract.ref_id or str(contract.id)
             ict_service_type = solution.dora_ict_service_type
             if not ict_service_type:
@@ -1256,10 +1178,9 @@ def generate_b_05_02_supply_chains(
                 rows_by_rank[1] = rows_by_rank.get(1, 0) + 1
 
             # Ranks 2..N: depth computed from the recipient tree.
-            chain_rows = list(solution.subcontracting_chain.all())
-            depths = compute_chain_depths(chain_rows)
+            depths = dataset.chain_depths.get(solution.id, {})
 
-            for sc in chain_rows:
+            for sc in dataset.chains.get(solution.id, []):
                 rank = depths[sc.subcontractor_id]
                 provider_code, provider_code_type, _ = get_entity_identifier(
                     sc.subcontractor
@@ -1399,14 +1320,14 @@ def generate_b_06_01_functions(
 
 
 def generate_b_07_01_assessment(
-    zip_file, contracts: QuerySet, folder_prefix: str = ""
+    zip_file, contracts: QuerySet | DoraDataset, folder_prefix: str = ""
 ) -> None:
     """
     Generate b_07.01.csv - Assessment of ICT services.
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects with solutions
+        contracts: QuerySet of Contract objects with solutions, or a DoraDataset
     """
     csv_buffer = io.StringIO()
     csv_writer = csv.writer(csv_buffer)
@@ -1431,14 +1352,12 @@ def generate_b_07_01_assessment(
 
     # Get contracts with both provider and solutions
     # NOTE: intragroup providers ARE included per EBA FAQ #70, #82, #84
-    assessment_contracts = (
-        contracts.filter(
-            provider_entity__isnull=False,
-            solutions__isnull=False,
-        )
-        .select_related("provider_entity")
-        .prefetch_related("solutions")
-    )
+    dataset = DoraDataset.of(contracts)
+    assessment_contracts = [
+        contract
+        for contract in dataset.contracts
+        if contract.provider_entity is not None and dataset.solutions_of(contract)
+    ]
 
     # Write assessment data
     # Track written dimension keys to avoid XBRL duplicate fact errors.
@@ -1447,7 +1366,7 @@ def generate_b_07_01_assessment(
 
     for contract in assessment_contracts:
         # Iterate through all solutions in this contract
-        for solution in contract.solutions.all():
+        for solution in dataset.solutions_of(contract):
             contract_ref = contract.ref_id or str(contract.id)
 
             # c0020 is typed dimension eba_typ:IS — use "0" if empty
@@ -1505,7 +1424,10 @@ def generate_b_07_01_assessment(
 
 
 def generate_b_99_01_aggregation(
-    zip_file, contracts: QuerySet, business_functions: QuerySet, folder_prefix: str = ""
+    zip_file,
+    contracts: QuerySet | DoraDataset,
+    business_functions: QuerySet,
+    folder_prefix: str = "",
 ) -> None:
     """
     Generate b_99.01.csv - Definitions from Entities making use of ICT Services.
@@ -1515,7 +1437,7 @@ def generate_b_99_01_aggregation(
 
     Args:
         zip_file: ZIP file object to write to
-        contracts: QuerySet of Contract objects with solutions
+        contracts: QuerySet of Contract objects with solutions, or a DoraDataset
         business_functions: QuerySet of Asset objects with is_business_function=True
     """
     csv_buffer = io.StringIO()
@@ -1546,38 +1468,51 @@ def generate_b_99_01_aggregation(
     )
 
     # c0010-c0030: Count contracts by type
-    c0010 = contracts.filter(dora_contractual_arrangement="eba_CO:x1").count()
-    c0020 = contracts.filter(dora_contractual_arrangement="eba_CO:x2").count()
-    c0030 = contracts.filter(dora_contractual_arrangement="eba_CO:x3").count()
+    dataset = DoraDataset.of(contracts)
+    arrangements = Counter(
+        contract.dora_contractual_arrangement for contract in dataset.contracts
+    )
+    c0010 = arrangements["eba_CO:x1"]
+    c0020 = arrangements["eba_CO:x2"]
+    c0030 = arrangements["eba_CO:x3"]
 
     # Get distinct solutions linked to these contracts
-    solutions = Solution.objects.filter(contracts__in=contracts).distinct()
+    solutions = {
+        solution.id: solution
+        for contract in dataset.contracts
+        for solution in dataset.solutions_of(contract)
+    }.values()
 
     # c0040-c0060: Data sensitiveness (solutions)
-    c0040 = solutions.filter(dora_data_sensitiveness="eba_ZZ:x791").count()
-    c0050 = solutions.filter(dora_data_sensitiveness="eba_ZZ:x792").count()
-    c0060 = solutions.filter(dora_data_sensitiveness="eba_ZZ:x793").count()
+    sensitiveness = Counter(s.dora_data_sensitiveness for s in solutions)
+    c0040 = sensitiveness["eba_ZZ:x791"]
+    c0050 = sensitiveness["eba_ZZ:x792"]
+    c0060 = sensitiveness["eba_ZZ:x793"]
 
     # c0070-c0090: Impact of discontinuing function (business functions)
-    c0070 = business_functions.filter(dora_discontinuing_impact="eba_ZZ:x791").count()
-    c0080 = business_functions.filter(dora_discontinuing_impact="eba_ZZ:x792").count()
-    c0090 = business_functions.filter(dora_discontinuing_impact="eba_ZZ:x793").count()
+    function_impact = Counter(f.dora_discontinuing_impact for f in business_functions)
+    c0070 = function_impact["eba_ZZ:x791"]
+    c0080 = function_impact["eba_ZZ:x792"]
+    c0090 = function_impact["eba_ZZ:x793"]
 
     # c0100-c0130: Substitutability (solutions)
-    c0100 = solutions.filter(dora_substitutability="eba_ZZ:x959").count()
-    c0110 = solutions.filter(dora_substitutability="eba_ZZ:x960").count()
-    c0120 = solutions.filter(dora_substitutability="eba_ZZ:x961").count()
-    c0130 = solutions.filter(dora_substitutability="eba_ZZ:x962").count()
+    substitutability = Counter(s.dora_substitutability for s in solutions)
+    c0100 = substitutability["eba_ZZ:x959"]
+    c0110 = substitutability["eba_ZZ:x960"]
+    c0120 = substitutability["eba_ZZ:x961"]
+    c0130 = substitutability["eba_ZZ:x962"]
 
     # c0140-c0160: Reintegration possibility (solutions)
-    c0140 = solutions.filter(dora_reintegration_possibility="eba_ZZ:x798").count()
-    c0150 = solutions.filter(dora_reintegration_possibility="eba_ZZ:x966").count()
-    c0160 = solutions.filter(dora_reintegration_possibility="eba_ZZ:x967").count()
+    reintegration = Counter(s.dora_reintegration_possibility for s in solutions)
+    c0140 = reintegration["eba_ZZ:x798"]
+    c0150 = reintegration["eba_ZZ:x966"]
+    c0160 = reintegration["eba_ZZ:x967"]
 
     # c0170-c0190: Impact of discontinuing ICT services (solutions)
-    c0170 = solutions.filter(dora_discontinuing_impact="eba_ZZ:x791").count()
-    c0180 = solutions.filter(dora_discontinuing_impact="eba_ZZ:x792").count()
-    c0190 = solutions.filter(dora_discontinuing_impact="eba_ZZ:x793").count()
+    service_impact = Counter(s.dora_discontinuing_impact for s in solutions)
+    c0170 = service_impact["eba_ZZ:x791"]
+    c0180 = service_impact["eba_ZZ:x792"]
+    c0190 = service_impact["eba_ZZ:x793"]
 
     csv_writer.writerow(
         [
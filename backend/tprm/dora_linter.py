@@ -6,14 +6,15 @@ It checks for mandatory and recommended fields before generating the actual repo
 """
 
 from typing import List, Dict, Any
-from tprm.models import Entity, Contract, Solution, SolutionSubcontractor
+from tprm.models import Entity
+from tprm.dora_dataset import DoraDataset
 from tprm.dora_export import IDENTIFIER_PRIORITY, get_entity_identifier
-from core.models import Asset
-from django.db.models import Q
 import re
 
 
-def lint_provider_entities() -> List[Dict[str, Any]]:
+def lint_provider_entities(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate provider entities used in DORA ROI reports.
 
@@ -23,23 +24,19 @@ def lint_provider_entities() -> List[Dict[str, Any]]:
     - DORA provider person type set (mandatory for b_05.01 c0040)
     - Parent entity with legal identifier (if parent exists)
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
     # Get all provider entities from non-draft third-party contracts
-    provider_entities = (
-        Entity.objects.filter(
-            contracts__is_intragroup=False,
-            contracts__isnull=False,
-            contracts__dora_exclude=False,
-        )
-        .exclude(contracts__status=Contract.Status.DRAFT)
-        .distinct()
-    )
+    dataset = dataset or DoraDataset()
+    provider_entities = dataset.third_party_providers()
 
-    if not provider_entities.exists():
+    if not provider_entities:
         return results
 
     providers_with_errors = 0
@@ -128,13 +125,13 @@ def lint_provider_entities() -> List[Dict[str, Any]]:
             providers_with_errors += 1
 
     # Add success message if all providers are valid
-    valid_providers = provider_entities.count() - providers_with_errors
-    if valid_providers == provider_entities.count():
+    valid_providers = len(provider_entities) - providers_with_errors
+    if valid_providers == len(provider_entities):
         results.append(
             {
                 "severity": "ok",
                 "category": "Provider Entities",
-                "message": f"All {provider_entities.count()} provider entities have required fields set",
+                "message": f"All {len(provider_entities)} provider entities have required fields set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -146,7 +143,7 @@ def lint_provider_entities() -> List[Dict[str, Any]]:
             {
                 "severity": "ok",
                 "category": "Provider Entities",
-                "message": f"{valid_providers} of {provider_entities.count()} provider entities have all required fields set",
+                "message": f"{valid_providers} of {len(provider_entities)} provider entities have all required fields set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -339,7 +336,9 @@ def lint_main_entity(entity: Entity) -> List[Dict[str, Any]]:
     return results
 
 
-def lint_subsidiaries(main_entity: Entity) -> List[Dict[str, Any]]:
+def lint_subsidiaries(
+    main_entity: Entity, dataset: DoraDataset | None = None
+) -> List[Dict[str, Any]]:
     """
     Validate subsidiaries for DORA ROI requirements.
 
@@ -347,6 +346,7 @@ def lint_subsidiaries(main_entity: Entity) -> List[Dict[str, Any]]:
 
     Args:
         main_entity: The main Entity instance
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
 
     Returns:
         List of validation results with severity levels (error, warning, ok)
@@ -354,11 +354,10 @@ def lint_subsidiaries(main_entity: Entity) -> List[Dict[str, Any]]:
     results = []
 
     # Get all subsidiaries (entities with parent=main_entity and dora_provider_person_type set)
-    subsidiaries = Entity.objects.filter(
-        parent_entity=main_entity, dora_provider_person_type__isnull=False
-    ).exclude(dora_provider_person_type="")
+    dataset = dataset or DoraDataset()
+    subsidiaries = dataset.subsidiaries(main_entity)
 
-    if not subsidiaries.exists():
+    if not subsidiaries:
         # No subsidiaries found - this is OK, not an error
         return results
 
@@ -459,12 +458,12 @@ def lint_subsidiaries(main_entity: Entity) -> List[Dict[str, Any]]:
             )
 
     # If we have subsidiaries and no errors, add a success message
-    if subsidiaries.exists() and not results:
+    if subsidiaries and not results:
         results.append(
             {
                 "severity": "ok",
                 "category": "Subsidiaries",
-                "message": f"All {subsidiaries.count()} subsidiaries have required fields set",
+                "message": f"All {len(subsidiaries)} subsidiaries have required fields set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -475,7 +474,9 @@ def lint_subsidiaries(main_entity: Entity) -> List[Dict[str, Any]]:
     return results
 
 
-def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
+def lint_branches(
+    main_entity: Entity, dataset: DoraDataset | None = None
+) -> List[Dict[str, Any]]:
     """
     Validate branches for DORA ROI requirements.
 
@@ -484,6 +485,7 @@ def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
 
     Args:
         main_entity: The main Entity instance
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
 
     Returns:
         List of validation results with severity levels (error, warning, ok)
@@ -491,11 +493,10 @@ def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
     results = []
 
     # Get all branches (entities with main entity as parent and no dora_provider_person_type)
-    branches = Entity.objects.filter(parent_entity=main_entity).filter(
-        Q(dora_provider_person_type__isnull=True) | Q(dora_provider_person_type="")
-    )
+    dataset = dataset or DoraDataset()
+    branches = dataset.branches(main_entity)
 
-    if not branches.exists():
+    if not branches:
         # No branches found - this is OK, not an error
         return results
 
@@ -510,7 +511,7 @@ def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
                 main_has_identifier = True
                 break
 
-    if not main_has_identifier and branches.exists():
+    if not main_has_identifier and branches:
         results.append(
             {
                 "severity": "error",
@@ -546,13 +547,13 @@ def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
             branches_with_errors += 1
 
     # If we have branches and no errors, add a success message
-    valid_branches = branches.count() - branches_with_errors
-    if valid_branches == branches.count():
+    valid_branches = len(branches) - branches_with_errors
+    if valid_branches == len(branches):
         results.append(
             {
                 "severity": "ok",
                 "category": "Branches",
-                "message": f"All {branches.count()} branch(es) have required fields set",
+                "message": f"All {len(branches)} branch(es) have required fields set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -564,7 +565,7 @@ def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
             {
                 "severity": "ok",
                 "category": "Branches",
-                "message": f"{valid_branches} of {branches.count()} branch(es) have all required fields set",
+                "message": f"{valid_branches} of {len(branches)} branch(es) have all required fields set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -575,22 +576,28 @@ def lint_branches(main_entity: Entity) -> List[Dict[str, Any]]:
     return results
 
 
-def lint_business_functions() -> List[Dict[str, Any]]:
+def lint_business_functions(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate that business function assets exist in the system.
 
     DORA ROI requires at least one asset with is_business_function flag set.
     Additionally checks that ref_id follows the pattern 'F' + number (e.g., F1, F2, F100).
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
     # Check if there are any business function assets
-    business_functions = Asset.objects.filter(is_business_function=True)
+    dataset = dataset or DoraDataset()
+    business_functions = dataset.business_functions
 
-    if not business_functions.exists():
+    if not business_functions:
         results.append(
             {
                 "severity": "error",
@@ -676,12 +683,12 @@ def lint_business_functions() -> List[Dict[str, Any]]:
             )
 
     # Add success message if all business functions have valid ref_ids
-    if valid_count == business_functions.count():
+    if valid_count == len(business_functions):
         results.append(
             {
                 "severity": "ok",
                 "category": "Business Functions",
-                "message": f"All {business_functions.count()} business function(s) have valid ref_id pattern",
+                "message": f"All {len(business_functions)} business function(s) have valid ref_id pattern",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -693,7 +700,7 @@ def lint_business_functions() -> List[Dict[str, Any]]:
             {
                 "severity": "ok",
                 "category": "Business Functions",
-                "message": f"{valid_count} of {business_functions.count()} business function(s) have valid ref_id pattern",
+                "message": f"{valid_count} of {len(business_functions)} business function(s) have valid ref_id pattern",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -707,7 +714,7 @@ def lint_business_functions() -> List[Dict[str, Any]]:
             {
                 "severity": "ok",
                 "category": "Business Functions",
-                "message": f"All {business_functions.count()} business function(s) have licensed activity set",
+                "message": f"All {len(business_functions)} business function(s) have licensed activity set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -718,7 +725,7 @@ def lint_business_functions() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_contracts() -> List[Dict[str, Any]]:
+def lint_contracts(dataset: DoraDataset | None = None) -> List[Dict[str, Any]]:
     """
     Validate contracts for DORA ROI requirements.
 
@@ -730,19 +737,19 @@ def lint_contracts() -> List[Dict[str, Any]]:
     - beneficiary_entity (with legal identifier)
     - start_date
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
     # Get all contracts
-    contracts = (
-        Contract.objects.exclude(status=Contract.Status.DRAFT)
-        .exclude(dora_exclude=True)
-        .select_related("beneficiary_entity")
-    )
+    dataset = dataset or DoraDataset()
+    contracts = dataset.contracts
 
-    if not contracts.exists():
+    if not contracts:
         # No contracts found - this could be OK, but let's inform the user
         results.append(
             {
@@ -758,7 +765,7 @@ def lint_contracts() -> List[Dict[str, Any]]:
         return results
 
     # Track validation statistics
-    total_contracts = contracts.count()
+    total_contracts = len(contracts)
     contracts_with_errors = 0
 
     # Check each contract
@@ -911,7 +918,9 @@ def lint_contracts() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_b_02_02_contracts() -> List[Dict[str, Any]]:
+def lint_b_02_02_contracts(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate contracts for DORA b_02.02 (ICT services supporting functions) requirements.
 
@@ -923,42 +932,28 @@ def lint_b_02_02_contracts() -> List[Dict[str, Any]]:
     - provider_entity set
     - provider_entity has at least one legal identifier (LEI, EUID, VAT, DUNS)
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
-    # Get business function assets
-    business_functions = Asset.objects.filter(is_business_function=True)
-
     # Collect all assets related to business functions (including children)
-    business_function_asset_ids = set(business_functions.values_list("id", flat=True))
-    for business_function in business_functions:
-        # Get all descendant (child) assets for each business function
-        # Note: get_descendants() returns Asset objects, not IDs
-        descendants = business_function.get_descendants()
-        business_function_asset_ids.update(asset.id for asset in descendants)
+    dataset = dataset or DoraDataset()
+    business_function_asset_ids = dataset.business_function_asset_ids
 
     # Get contracts that will be included in b_02.02:
     # those with solutions linked to business function assets or their children
-    b_02_02_contracts = (
-        Contract.objects.filter(
-            solutions__isnull=False,
-            solutions__assets__id__in=business_function_asset_ids,
-        )
-        .exclude(status=Contract.Status.DRAFT)
-        .exclude(dora_exclude=True)
-        .distinct()
-        .select_related("provider_entity", "beneficiary_entity")
-        .prefetch_related("solutions")
-    )
-
-    if not b_02_02_contracts.exists():
+    b_02_02_contracts = dataset.business_function_contracts()
+
+    if not b_02_02_contracts:
         # No contracts found for b_02.02
         return results
 
     # Track validation statistics
-    total_contracts = b_02_02_contracts.count()
+    total_contracts = len(b_02_02_contracts)
     contracts_with_errors = 0
 
     # Check each contract
@@ -1042,13 +1037,12 @@ def lint_b_02_02_contracts() -> List[Dict[str, Any]]:
         # c0060 is a PK/typed dimension in b_02.02 (Nullable=No per the DORA
         # data model) and must not be empty per OneGate protocol §4.6. Solutions
         # without it produce an empty key column that the XBRL filer rejects.
-        for solution in contract.solutions.all():
-            if business_function_asset_ids:
-                has_biz_fn = solution.assets.filter(
-                    id__in=business_function_asset_ids, is_business_function=True
-                ).exists()
-            else:
-                has_biz_fn = solution.assets.filter(is_business_function=True).exists()
+        for solution in dataset.solutions_of(contract):
+            has_biz_fn = bool(
+                dataset.solution_business_functions(
+                    solution, business_function_asset_ids or None
+                )
+            )
             if not has_biz_fn:
                 continue
             if not solution.dora_ict_service_type:
@@ -1104,7 +1098,7 @@ def lint_b_02_02_contracts() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_solutions() -> List[Dict[str, Any]]:
+def lint_solutions(dataset: DoraDataset | None = None) -> List[Dict[str, Any]]:
     """
     Validate solutions for DORA ROI requirements.
 
@@ -1118,34 +1112,24 @@ def lint_solutions() -> List[Dict[str, Any]]:
     - provider_entity must have country set
     - contract associated with solution (warning if missing)
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
-    # Get business function assets
-    business_functions = Asset.objects.filter(is_business_function=True)
-
-    # Collect all assets related to business functions (including children)
-    business_function_asset_ids = set(business_functions.values_list("id", flat=True))
-    for business_function in business_functions:
-        # Get all descendant (child) assets for each business function
-        # Note: get_descendants() returns Asset objects, not IDs
-        descendants = business_function.get_descendants()
-        business_function_asset_ids.update(asset.id for asset in descendants)
-
     # Get solutions associated with business function assets or their children,
-    # only if they belong to at least one non-draft contract
-    solutions = (
-        Solution.objects.filter(assets__id__in=business_function_asset_ids)
-        .exclude(contracts__status=Contract.Status.DRAFT)
-        .exclude(contracts__dora_exclude=True)
-        .distinct()
-        .select_related("provider_entity")
-        .prefetch_related("contracts")
-    )
-
-    if not solutions.exists():
+    # leaving out those on a draft or DORA-excluded contract
+    dataset = dataset or DoraDataset()
+    solutions = [
+        solution
+        for solution in dataset.reportable_solutions()
+        if dataset.supports_business_function(solution)
+    ]
+
+    if not solutions:
         # No solutions found linked to business functions
         results.append(
             {
@@ -1161,7 +1145,7 @@ def lint_solutions() -> List[Dict[str, Any]]:
         return results
 
     # Track validation statistics
-    total_solutions = solutions.count()
+    total_solutions = len(solutions)
     solutions_with_errors = 0
 
     # Check each solution
@@ -1258,7 +1242,7 @@ def lint_solutions() -> List[Dict[str, Any]]:
             solution_has_error = True
 
         # Check if solution has at least one contract (mandatory for DORA reporting)
-        if not solution.contracts.exists():
+        if not dataset.solution_contract_ids.get(solution.id):
             results.append(
                 {
                     "severity": "error",
@@ -1305,7 +1289,9 @@ def lint_solutions() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_supply_chain_solutions() -> List[Dict[str, Any]]:
+def lint_supply_chain_solutions(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate solutions that appear in b_05.02 and b_07.01.
 
@@ -1317,28 +1303,22 @@ def lint_supply_chain_solutions() -> List[Dict[str, Any]]:
     Also checks b_07.01 for duplicate XBRL keys within a contract (same
     ict_service_type on multiple solutions).
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (warning, ok)
     """
     results = []
 
     # Solutions on non-draft contracts with provider (same scope as generate_b_05_02)
-    solutions = (
-        Solution.objects.filter(
-            contracts__provider_entity__isnull=False,
-        )
-        .exclude(contracts__status=Contract.Status.DRAFT)
-        .exclude(contracts__dora_exclude=True)
-        .distinct()
-        .select_related("provider_entity")
-    )
+    dataset = dataset or DoraDataset()
+    solutions = dataset.supply_chain_solutions()
 
-    if not solutions.exists():
+    if not solutions:
         return results
 
-    missing = solutions.filter(
-        Q(dora_ict_service_type__isnull=True) | Q(dora_ict_service_type="")
-    )
+    missing = [solution for solution in solutions if not solution.dora_ict_service_type]
 
     for solution in missing:
         results.append(
@@ -1356,12 +1336,12 @@ def lint_supply_chain_solutions() -> List[Dict[str, Any]]:
             }
         )
 
-    if not missing.exists():
+    if not missing:
         results.append(
             {
                 "severity": "ok",
                 "category": "Supply Chain (B_05.02)",
-                "message": f"All {solutions.count()} supply-chain solutions have ICT service type set",
+                "message": f"All {len(solutions)} supply-chain solutions have ICT service type set",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -1372,7 +1352,9 @@ def lint_supply_chain_solutions() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_subcontracting_chains() -> List[Dict[str, Any]]:
+def lint_subcontracting_chains(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate SolutionSubcontractor chains for b_05.02 / b_05.01 integrity.
 
@@ -1392,6 +1374,9 @@ def lint_subcontracting_chains() -> List[Dict[str, Any]]:
     Category: "Supply Chain (B_05.02)" (same bucket as lint_supply_chain_solutions
     so the existing dashboard aggregates them together).
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
@@ -1399,18 +1384,11 @@ def lint_subcontracting_chains() -> List[Dict[str, Any]]:
 
     # Scope: chains on solutions attached to non-draft, non-dora_exclude contracts
     # with a provider. Same scope as generate_b_05_02_supply_chains.
-    chains = (
-        SolutionSubcontractor.objects.filter(
-            solution__contracts__provider_entity__isnull=False,
-        )
-        .exclude(solution__contracts__status=Contract.Status.DRAFT)
-        .exclude(solution__contracts__dora_exclude=True)
-        .select_related("subcontractor", "solution", "solution__provider_entity")
-        .distinct()
-    )
-
-    # Materialize once to avoid repeated DB round-trips.
-    chain_list = list(chains)
+    dataset = dataset or DoraDataset()
+    solution_ids = {solution.id for solution in dataset.supply_chain_solutions()}
+    chain_list = [
+        sc for sc in dataset.subcontracting_rows if sc.solution_id in solution_ids
+    ]
     if not chain_list:
         return results
 
@@ -1493,7 +1471,9 @@ def lint_subcontracting_chains() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_unique_leis(main_entity: Entity) -> List[Dict[str, Any]]:
+def lint_unique_leis(
+    main_entity: Entity, dataset: DoraDataset | None = None
+) -> List[Dict[str, Any]]:
     """
     Validate that LEIs are unique across entities included in DORA ROI report.
 
@@ -1501,6 +1481,7 @@ def lint_unique_leis(main_entity: Entity) -> List[Dict[str, Any]]:
 
     Args:
         main_entity: The main Entity instance
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
 
     Returns:
         List of validation results with severity levels (error, warning, ok)
@@ -1508,11 +1489,8 @@ def lint_unique_leis(main_entity: Entity) -> List[Dict[str, Any]]:
     results = []
 
     # Get all entities for b_01.02: main entity + subsidiaries
-    subsidiaries = Entity.objects.filter(
-        parent_entity=main_entity, dora_provider_person_type__isnull=False
-    ).exclude(dora_provider_person_type="")
-
-    all_entities = [main_entity] + list(subsidiaries)
+    dataset = dataset or DoraDataset()
+    all_entities = [main_entity] + dataset.subsidiaries(main_entity)
 
     # Collect LEIs
     lei_map = {}  # lei -> list of entities with that LEI
@@ -1557,7 +1535,9 @@ def lint_unique_leis(main_entity: Entity) -> List[Dict[str, Any]]:
     return results
 
 
-def lint_cross_table_consistency() -> List[Dict[str, Any]]:
+def lint_cross_table_consistency(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate cross-table consistency for DORA ROI export.
 
@@ -1566,62 +1546,36 @@ def lint_cross_table_consistency() -> List[Dict[str, Any]]:
     - 02.01_05.02_0010: Every contract in B_02.01 must appear in B_05.02
     - 03.02_02.02_COMBINATION: B_03.02/B_02.02 provider combinations must match
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
     # Get all non-draft contracts (same scope as B_02.01)
-    all_contracts = (
-        Contract.objects.exclude(status=Contract.Status.DRAFT)
-        .exclude(dora_exclude=True)
-        .select_related("provider_entity")
-        .prefetch_related("solutions")
-    )
-
-    if not all_contracts.exists():
+    dataset = dataset or DoraDataset()
+    all_contracts = dataset.contracts
+
+    if not all_contracts:
         return results
 
     # --- Compute B_02.02 scope ---
-    business_functions = Asset.objects.filter(is_business_function=True)
-    business_function_asset_ids = set(business_functions.values_list("id", flat=True))
-    for bf in business_functions:
-        descendants = bf.get_descendants()
-        business_function_asset_ids.update(asset.id for asset in descendants)
-
-    b_02_02_contract_ids = (
-        set(
-            Contract.objects.filter(
-                solutions__isnull=False,
-                solutions__assets__id__in=business_function_asset_ids,
-            )
-            .exclude(status=Contract.Status.DRAFT)
-            .exclude(dora_exclude=True)
-            .distinct()
-            .values_list("id", flat=True)
-        )
-        if business_function_asset_ids
-        else set()
-    )
+    business_function_asset_ids = dataset.business_function_asset_ids
+    b_02_02_contract_ids = {
+        contract.id for contract in dataset.business_function_contracts()
+    }
 
     # --- Compute B_05.02 scope ---
     # B_05.02 includes non-intragroup contracts with provider, solutions,
     # and at least one solution with dora_ict_service_type set
-    b_05_02_candidates = (
-        Contract.objects.filter(
-            provider_entity__isnull=False,
-            solutions__isnull=False,
-        )
-        .exclude(status=Contract.Status.DRAFT)
-        .exclude(dora_exclude=True)
-        .distinct()
-    )
-    # Further filter: at least one solution must have dora_ict_service_type
-    # Use Python filtering to avoid .exclude() bypassing prefetch cache
-    b_05_02_contract_ids = set()
-    for contract in b_05_02_candidates.prefetch_related("solutions"):
-        if any(s.dora_ict_service_type for s in contract.solutions.all()):
-            b_05_02_contract_ids.add(contract.id)
+    b_05_02_contract_ids = {
+        contract.id
+        for contract in all_contracts
+        if contract.provider_entity is not None
+        and any(s.dora_ict_service_type for s in dataset.solutions_of(contract))
+    }
 
     # --- Check 02.01_02.02: every B_02.01 contract should be in B_02.02 ---
     missing_b_02_02 = []
@@ -1632,7 +1586,7 @@ def lint_cross_table_consistency() -> List[Dict[str, Any]]:
     if missing_b_02_02:
         # Diagnose why each contract is missing
         for contract in missing_b_02_02:
-            has_solutions = contract.solutions.exists()
+            has_solutions = bool(dataset.solutions_of(contract))
             if not has_solutions:
                 reason = "has no solutions linked"
             elif not business_function_asset_ids:
@@ -1657,7 +1611,7 @@ def lint_cross_table_consistency() -> List[Dict[str, Any]]:
             {
                 "severity": "ok",
                 "category": "Cross-table (B_02.01 \u2194 B_02.02)",
-                "message": f"All {all_contracts.count()} contracts will appear in the ICT services report",
+                "message": f"All {len(all_contracts)} contracts will appear in the ICT services report",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -1678,11 +1632,10 @@ def lint_cross_table_consistency() -> List[Dict[str, Any]]:
                 reasons.append("is intragroup")
             if not contract.provider_entity:
                 reasons.append("has no provider entity")
-            if not contract.solutions.exists():
+            solutions = dataset.solutions_of(contract)
+            if not solutions:
                 reasons.append("has no solutions")
-            elif not contract.solutions.exclude(
-                Q(dora_ict_service_type__isnull=True) | Q(dora_ict_service_type="")
-            ).exists():
+            elif not any(s.dora_ict_service_type for s in solutions):
                 reasons.append("all its solutions are missing ICT service type")
             reason = "; ".join(reasons) if reasons else "unknown reason"
             # Contracts excluded from B_05.02 scope by design (intragroup,
@@ -1705,7 +1658,7 @@ def lint_cross_table_consistency() -> List[Dict[str, Any]]:
             {
                 "severity": "ok",
                 "category": "Cross-table (B_02.01 \u2194 B_05.02)",
-                "message": f"All {all_contracts.count()} contracts will appear in the supply chain report",
+                "message": f"All {len(all_contracts)} contracts will appear in the supply chain report",
                 "field": None,
                 "object_type": None,
                 "object_id": None,
@@ -1716,7 +1669,9 @@ def lint_cross_table_consistency() -> List[Dict[str, Any]]:
     return results
 
 
-def lint_conditional_fields() -> List[Dict[str, Any]]:
+def lint_conditional_fields(
+    dataset: DoraDataset | None = None,
+) -> List[Dict[str, Any]]:
     """
     Validate conditional field requirements (EBA formula validation rules).
 
@@ -1725,20 +1680,22 @@ def lint_conditional_fields() -> List[Dict[str, Any]]:
     - v8804: If entity type is not eba_CT:x318 or eba_CT:x317, assets value must be set
     - v8884: Solutions in B_07.01 must have substitutability set
 
+    Args:
+        dataset: Snapshot to validate (default: a fresh DoraDataset)
+
     Returns:
         List of validation results with severity levels (error, warning, ok)
     """
     results = []
 
     # --- v8805: sub-contracting contracts must have overarching contract ---
-    subcontracting_contracts = (
-        Contract.objects.filter(
-            dora_contractual_arrangement="eba_CO:x3",
-            overarching_contract__isnull=True,
-        )
-        .exclude(status=Contract.Status.DRAFT)
-        .exclude(dora_exclude=True)
-    )
+    dataset = dataset or DoraDataset()
+    subcontracting_contracts = [
+        contract
+        for contract in dataset.contracts
+        if contract.dora_contractual_arrangement == "eba_CO:x3"
+        and contract.overarching_contract_id is None
+    ]
 
     for contract in subcontracting_contracts:
         contract_ref = contract.ref_id or contract.name
@@ -1756,13 +1713,10 @@ def lint_conditional_fields() -> List[Dict[str, Any]]:
 
     # --- v8804: entity type not x318/x317 requires assets value ---
     # Get entities in B_01.02 scope (main entity + subsidiaries)
-    main_entity = Entity.get_main_entity()
+    main_entity = dataset.main_entity
     if main_entity:
         exempt_types = {"eba_CT:x318", "eba_CT:x317"}
-        subsidiaries = Entity.objects.filter(
-            parent_entity=main_entity, dora_provider_person_type__isnull=False
-        ).exclude(dora_provider_person_type="")
-        b_01_02_entities = [main_entity] + list(subsidiaries)
+        b_01_02_entities = [main_entity] + dataset.subsidiaries(main_entity)
 
         for entity in b_01_02_entities:
             if (
@@ -1784,18 +1738,11 @@ def lint_conditional_fields() -> List[Dict[str, Any]]:
 
     # --- v8884: solutions in B_07.01 must have substitutability ---
     # B_07.01 includes solutions on non-draft contracts with provider
-    b_07_01_solutions = (
-        Solution.objects.filter(
-            contracts__provider_entity__isnull=False,
-        )
-        .exclude(contracts__status=Contract.Status.DRAFT)
-        .exclude(contracts__dora_exclude=True)
-        .distinct()
-    )
-
-    missing_substitutability = b_07_01_solutions.filter(
-        Q(dora_substitutability__isnull=True) | Q(dora_substitutability="")
-    )
+    missing_substitutability = [
+        solution
+        for solution in dataset.supply_chain_solutions()
+        if not solution.dora_substitutability
+    ]
 
     for solution in missing_substitutability:
         results.append(
@@ -1836,8 +1783,12 @@ def lint_dora_roi() -> Dict[str, Any]:
     """
     results = []
 
+    # Entities, contracts, solutions and chains are loaded once and shared by
+    # every check below
+    dataset = DoraDataset()
+
     # Get the main entity
-    main_entity = Entity.get_main_entity()
+    main_entity = dataset.main_entity
 
     if not main_entity:
         return {
@@ -1857,18 +1808,18 @@ def lint_dora_roi() -> Dict[str, Any]:
 
     # Run all validation checks
     results.extend(lint_main_entity(main_entity))
-    results.extend(lint_subsidiaries(main_entity))
-    results.extend(lint_branches(main_entity))
-    results.extend(lint_unique_leis(main_entity))
-    results.extend(lint_business_functions())
-    results.extend(lint_contracts())
-    results.extend(lint_b_02_02_contracts())
-    results.extend(lint_solutions())
-    results.extend(lint_supply_chain_solutions())
-    results.extend(lint_subcontracting_chains())
-    results.extend(lint_provider_entities())
-    results.extend(lint_cross_table_consistency())
-    results.extend(lint_conditional_fields())
+    results.extend(lint_subsidiaries(main_entity, dataset))
+    results.extend(lint_branches(main_entity, dataset))
+    results.extend(lint_unique_leis(main_entity, dataset))
+    results.extend(lint_business_functions(dataset))
+    results.extend(lint_contracts(dataset))
+    results.extend(lint_b_02_02_contracts(dataset))
+    results.extend(lint_solutions(dataset))
+    results.extend(lint_supply_chain_solutions(dataset))
+    results.extend(lint_subcontracting_chains(dataset))
+    results.extend(lint_provider_entities(dataset))
+    results.extend(lint_cross_table_consistency(dataset))
+    results.extend(lint_conditional_fields(dataset))
 
     # Calculate summary
     summary = {
@@ -0,0 +1,266 @@
+"""
+Tests for tprm.dora_dataset.
+
+The snapshot must give the export reports and the linter rules the same view
+of the ROI data as the querysets it replaced, and walking it must not query
+the database again.
+"""
+
+import io
+import zipfile
+
+from django.test import TestCase
+
+from core.models import Asset
+from iam.models import Folder
+from tprm import dora_export, dora_linter
+from tprm.dora_dataset import DoraDataset, get_provider_chain
+from tprm.models import Contract, Entity, Solution, SolutionSubcontractor
+
+
+class DoraDatasetBase(TestCase):
+    def setUp(self):
+        self.folder = Folder.objects.create(name="Test Folder")
+        self.main_entity = Entity.objects.create(
+            name="Main FE",
+            folder=self.folder,
+            builtin=True,
+            legal_identifiers={"LEI": "MAIN1234567890123456"},
+        )
+        self.subsidiary = Entity.objects.create(
+            name="Subsidiary",
+            folder=self.folder,
+            parent_entity=self.main_entity,
+            dora_provider_person_type="eba_CT:x212",
+            legal_identifiers={"LEI": "SUBS1234567890123456"},
+        )
+        self.branch = Entity.objects.create(
+            name="Branch",
+            folder=self.folder,
+            parent_entity=self.main_entity,
+            legal_identifiers={"VAT": "BE0123456789"},
+        )
+        # Group → Holding → Provider
+        self.group = Entity.objects.create(
+            name="Group",
+            folder=self.folder,
+            legal_identifiers={"LEI": "GRUP1234567890123456"},
+        )
+        self.holding = Entity.objects.create(
+            name="Holding",
+            folder=self.folder,
+            parent_entity=self.group,
+            legal_identifiers={"LEI": "HOLD1234567890123456"},
+        )
+        self.provider = Entity.objects.create(
+            name="Provider",
+            folder=self.folder,
+            parent_entity=self.holding,
+            legal_identifiers={"LEI": "PROV1234567890123456"},
+        )
+        self.sub_a = Entity.objects.create(
+            name="Sub A",
+            folder=self.folder,
+            legal_identifiers={"LEI": "SUBA1234567890123456"},
+        )
+        self.sub_b = Entity.objects.create(
+            name="Sub B",
+            folder=self.folder,
+            legal_identifiers={"LEI": "SUBB1234567890123456"},
+        )
+
+        self.function = Asset.objects.create(
+            name="Payments",
+            ref_id="F1",
+            folder=self.folder,
+            is_business_function=True,
+        )
+        self.child_asset = Asset.objects.create(
+            name="Payment server", folder=self.folder
+        )
+        self.child_asset.parent_assets.add(self.function)
+
+        self.solution = Solution.objects.create(
+            name="Hosting",
+            provider_entity=self.provider,
+            dora_ict_service_type="eba_TA:S09",
+        )
+        self.solution.assets.add(self.child_asset)
+        self.other_solution = Solution.objects.create(
+            name="Helpdesk", provider_entity=self.provider
+        )
+        SolutionSubcontractor.objects.create(
+            solution=self.solution, subcontractor=self.sub_a
+        )
+        SolutionSubcontractor.objects.create(
+            solution=self.solution, subcontractor=self.sub_b, recipient=self.sub_a
+        )
+
+        self.contract = Contract.objects.create(
+            name="Hosting contract",
+            ref_id="C1",
+            folder=self.folder,
+            provider_entity=self.provider,
+            beneficiary_entity=self.main_entity,
+            status=Contract.Status.ACTIVE,
+            currency="EUR",
+            annual_expense=1000,
+        )
+        self.contract.solutions.add(self.solution)
+        self.helpdesk_contract = Contract.objects.create(
+            name="Helpdesk contract",
+            ref_id="C2",
+            folder=self.folder,
+            provider_entity=self.provider,
+            beneficiary_entity=self.main_entity,
+            status=Contract.Status.ACTIVE,
+            overarching_contract=self.contract,
+        )
+        self.helpdesk_contract.solutions.add(self.other_solution)
+
+
+class TestDoraDataset(DoraDatasetBase):
+    def test_entity_graph_is_walked_in_memory(self):
+        dataset = DoraDataset()
+        provider = dataset.entities[self.provider.id]
+        with self.assertNumQueries(0):
+            self.assertEqual(dataset.ultimate_parent(provider), self.group)
+            self.assertEqual(
+                [e.name for e in get_provider_chain(provider)],
+                ["Group", "Holding", "Provider"],
+            )
+            contract = next(c for c in dataset.contracts if c.ref_id == "C2")
+            self.assertEqual(contract.overarching_contract.ref_id, "C1")
+            self.assertIs(contract.provider_entity, provider)
+
+    def test_subsidiaries_and_branches(self):
+        dataset = DoraDataset()
+        self.assertEqual(dataset.subsidiaries(self.main_entity), [self.subsidiary])
+        self.assertEqual(dataset.branches(self.main_entity), [self.branch])
+
+    def test_chain_depths_are_precomputed(self):
+        dataset = DoraDataset()
+        self.assertEqual(
+            dataset.chain_depths[self.solution.id],
+            {self.sub_a.id: 2, self.sub_b.id: 3},
+        )
+        self.assertNotIn(self.other_solution.id, dataset.chain_depths)
+
+    def test_business_function_scope_includes_child_assets(self):
+        dataset = DoraDataset()
+        self.assertEqual(
+            dataset.business_function_asset_ids, {self.function.id, self.child_asset.id}
+        )
+        self.assertEqual(dataset.business_function_contracts(), [self.contract])
+
+        subset = dataset.with_contracts(dataset.business_function_contracts())
+        self.assertEqual(subset.contracts, [self.contract])
+        self.assertEqual(len(dataset.contracts), 2)
+
+    def test_solutions_on_a_draft_contract_are_not_reportable(self):
+        draft = Contract.objects.create(
+            name="Draft", folder=self.folder, status=Contract.Status.DRAFT
+        )
+        draft.solutions.add(self.other_solution)
+
+        dataset = DoraDataset()
+        self.assertEqual(dataset.reportable_solutions(), [self.solution])
+        self.assertNotIn(draft, dataset.contracts)
+
+
+class TestDoraDatasetReports(DoraDatasetBase):
+    def _csv(self, func, *args):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zip_file:
+            func(zip_file, *args)
+        with zipfile.ZipFile(buf) as zip_file:
+            return zip_file.read(zip_file.namelist()[0])
+
+    def test_reports_match_queryset_input(self):
+        contracts = Contract.objects.all()
+        dataset = DoraDataset(contracts)
+        for func, args in [
+            (dora_export.generate_b_02_01_contracts, ()),
+            (dora_export.generate_b_02_03_intragroup_contracts, ()),
+            (dora_export.generate_b_03_02_ict_providers, ()),
+            (dora_export.generate_b_05_02_supply_chains, ()),
+            (dora_export.generate_b_07_01_assessment, ()),
+        ]:
+            self.assertEqual(
+                self._csv(func, dataset, *args), self._csv(func, contracts, *args)
+            )
+        self.assertEqual(
+            self._csv(
+                dora_export.generate_b_05_01_provider_details,
+                self.main_entity,
+                dataset,
+            ),
+            self._csv(
+                dora_export.generate_b_05_01_provider_details,
+                self.main_entity,
+                contracts,
+            ),
+        )
+
+    def test_reports_do_not_query_the_snapshot_again(self):
+        dataset = DoraDataset()
+        asset_ids = dataset.business_function_asset_ids
+        main_entity = dataset.entities[self.main_entity.id]
+        branches = dataset.branches(main_entity)
+        with self.assertNumQueries(0):
+            self._csv(dora_export.generate_b_02_01_contracts, dataset)
+            self._csv(dora_export.generate_b_02_02_ict_services, dataset, "", asset_ids)
+            self._csv(dora_export.generate_b_04_01_service_users, branches, dataset)
+            self._csv(
+                dora_export.generate_b_05_01_provider_details, main_entity, dataset
+            )
+            self._csv(dora_export.generate_b_05_02_supply_chains, dataset)
+            self._csv(
+                dora_export.generate_b_99_01_aggregation,
+                dataset,
+                dataset.business_functions,
+            )
+
+    def test_b_05_01_registers_ancestors_and_subcontractors(self):
+        rows = self._csv(
+            dora_export.generate_b_05_01_provider_details,
+            self.main_entity,
+            DoraDataset(),
+        ).decode()
+        for entity in (self.provider, self.holding, self.group, self.sub_a):
+            self.assertIn(entity.legal_identifiers["LEI"], rows)
+
+
+class TestDoraDatasetLinter(DoraDatasetBase):
+    def test_linters_share_one_snapshot(self):
+        dataset = DoraDataset()
+        # Resolved once, as lint_dora_roi does
+        dataset.main_entity
+        dataset.business_function_asset_ids
+        # The status of every contract is loaded on first use; nothing else
+        # is queried.
+        with self.assertNumQueries(1):
+            dora_linter.lint_subsidiaries(self.main_entity, dataset)
+            dora_linter.lint_branches(self.main_entity, dataset)
+            dora_linter.lint_unique_leis(self.main_entity, dataset)
+            dora_linter.lint_business_functions(dataset)
+            dora_linter.lint_contracts(dataset)
+            dora_linter.lint_b_02_02_contracts(dataset)
+            dora_linter.lint_solutions(dataset)
+            dora_linter.lint_supply_chain_solutions(dataset)
+            dora_linter.lint_subcontracting_chains(dataset)
+            dora_linter.lint_provider_entities(dataset)
+            dora_linter.lint_cross_table_consistency(dataset)
+            dora_linter.lint_conditional_fields(dataset)
+
+    def test_provider_with_a_draft_contract_is_skipped(self):
+        results = dora_linter.lint_provider_entities()
+        self.assertIn(str(self.provider.id), {r["object_id"] for r in results})
+
+        Contract.objects.create(
+            name="Draft",
+            folder=self.folder,
+            provider_entity=self.provider,
+            status=Contract.Status.DRAFT,
+        )
+        self.assertEqual(dora_linter.lint_provider_entities(), [])
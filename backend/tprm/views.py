@@ -264,6 +264,7 @@ class EntityViewSet(ExportMixin, BaseModelViewSet):
         - reports/report.json: XBRL CSV configuration and taxonomy references
         """
         from tprm import dora_export
+        from tprm.dora_dataset import DoraDataset
 
         # Get the main entity
         main_entity = Entity.get_main_entity()
@@ -290,31 +291,6 @@ class EntityViewSet(ExportMixin, BaseModelViewSet):
             object_type=Asset,
         )
 
-        # Prepare entity lists
-        # Subsidiaries: entities with main entity as parent AND dora_provider_person_type set (legal person)
-        # Branches: entities with main entity as parent AND dora_provider_person_type not set
-        subsidiaries = list(
-            Entity.objects.filter(
-                id__in=viewable_entities,
-                parent_entity=main_entity,
-                dora_provider_person_type__isnull=False,
-            ).exclude(dora_provider_person_type="")
-        )
-        branches = list(
-            Entity.objects.filter(
-                id__in=viewable_entities,
-                parent_entity=main_entity,
-                dora_provider_person_type__isnull=True,
-            )
-            | Entity.objects.filter(
-                id__in=viewable_entities,
-                parent_entity=main_entity,
-                dora_provider_person_type="",
-            )
-        )
-        # b_01.02 includes only main entity and subsidiaries (not branches)
-        entities_for_b_01_02 = [main_entity] + subsidiaries
-
         # Prepare contract QuerySets
         contracts = (
             Contract.objects.filter(id__in=viewable_contracts)
@@ -327,30 +303,38 @@ class EntityViewSet(ExportMixin, BaseModelViewSet):
             id__in=viewable_assets, is_business_function=True
         )
 
-        # Collect all assets related to business functions (including child assets)
-        # This ensures that solutions linked to child assets are also captured in DORA reports
-        business_function_asset_ids = set(
-            business_functions.values_list("id", flat=True)
+        # Load entities, contracts, solutions and supply chains once; every
+        # report below reads this snapshot instead of querying on its own.
+        dataset = DoraDataset(contracts, business_functions)
+        main_entity = dataset.entities.get(main_entity.id, main_entity)
+
+        # Prepare entity lists
+        # Subsidiaries: entities with main entity as parent AND dora_provider_person_type set (legal person)
+        # Branches: entities with main entity as parent AND dora_provider_person_type not set
+        viewable_entities = set(viewable_entities)
+        subsidiaries = [
+            entity
+            for entity in dataset.subsidiaries(main_entity)
+            if entity.id in viewable_entities
+        ]
+        branches = [
+            entity
+            for entity in dataset.branches(main_entity)
+            if entity.id in viewable_entities
+        ]
+        # b_01.02 includes only main entity and subsidiaries (not branches)
+        entities_for_b_01_02 = [main_entity] + subsidiaries
+
+        # Business functions and their child assets: solutions linked to child
+        # assets are also captured in DORA reports
+        business_function_asset_ids = dataset.business_function_asset_ids
+
+        # Contracts with solutions related to business functions. This subset is
+        # used for reports that focus on ICT services supporting critical
+        # functions (b_07.01, b_99.01)
+        business_function_dataset = dataset.with_contracts(
+            dataset.business_function_contracts()
         )
-        for business_function in business_functions:
-            # Get all descendant (child) assets for each business function
-            # Note: get_descendants() returns Asset objects, not IDs
-            descendants = business_function.get_descendants()
-            business_function_asset_ids.update(asset.id for asset in descendants)
-
-        # Get all solutions related to business functions and their child assets
-        # These are the ICT services that support critical business functions
-        related_solutions = Solution.objects.filter(
-            assets__id__in=business_function_asset_ids
-        ).distinct()
-
-        # Filter contracts to only those with solutions related to business functions
-        # This subset is used for reports that focus on ICT services supporting critical functions
-        # (b_02.02, b_07.01, b_99.01)
-        related_solution_ids = set(related_solutions.values_list("id", flat=True))
-        business_function_contracts = contracts.filter(
-            solutions__id__in=related_solution_ids
-        ).distinct()
 
         # Get export metadata (naming, identifiers)
         identifier_type = request.query_params.get("identifier_type", None)
@@ -388,49 +372,47 @@ class EntityViewSet(ExportMixin, BaseModelViewSet):
             )
             dora_export.generate_b_01_03_branches(zip_file, branches, base_folder_name)
 
-            dora_export.generate_b_02_01_contracts(
-                zip_file, contracts, base_folder_name
-            )
+            dora_export.generate_b_02_01_contracts(zip_file, dataset, base_folder_name)
             dora_export.generate_b_02_02_ict_services(
-                zip_file, contracts, base_folder_name, business_function_asset_ids
+                zip_file, dataset, base_folder_name, business_function_asset_ids
             )
             dora_export.generate_b_02_03_intragroup_contracts(
-                zip_file, contracts, base_folder_name
+                zip_file, dataset, base_folder_name
             )
 
             dora_export.generate_b_03_01_signing_entities(
-                zip_file, main_entity, contracts, base_folder_name
+                zip_file, main_entity, dataset, base_folder_name
             )
             dora_export.generate_b_03_02_ict_providers(
-                zip_file, contracts, base_folder_name
+                zip_file, dataset, base_folder_name
             )
             dora_export.generate_b_03_03_intragroup_providers(
-                zip_file, main_entity, contracts, base_folder_name
+                zip_file, main_entity, dataset, base_folder_name
             )
 
             dora_export.generate_b_04_01_service_users(
-                zip_file, branches, contracts, base_folder_name
+                zip_file, branches, dataset, base_folder_name
             )
 
             dora_export.generate_b_05_01_provider_details(
-                zip_file, main_entity, contracts, base_folder_name
+                zip_file, main_entity, dataset, base_folder_name
             )
             dora_export.generate_b_05_02_supply_chains(
-                zip_file, contracts, base_folder_name
+                zip_file, dataset, base_folder_name
             )
 
             dora_export.generate_b_06_01_functions(
-                zip_file, main_entity, business_functions, base_folder_name
+                zip_file, main_entity, dataset.business_functions, base_folder_name
             )
 
             dora_export.generate_b_07_01_assessment(
-                zip_file, business_function_contracts, base_folder_name
+                zip_file, business_function_dataset, base_folder_name
             )
 
             dora_export.generate_b_99_01_aggregation(
                 zip_file,
-                business_function_contracts,
-                business_functions,
+                business_function_dataset,
+                dataset.business_functions,
                 base_folder_name,
             )
 
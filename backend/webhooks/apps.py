@@ -4,3 +4,56 @@ from django.apps import AppConfig
 class WebhooksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "webhooks"
+
+    def ready(self):
+        from django.apps import apps
+        from django.db.models.signals import m2m_changed, post_delete, post_save
+
+        from webhooks.routing import invalidate_webhook_routing_cache
+
+        WebhookEndpoint = self.get_model("WebhookEndpoint")
+        WebhookEventType = self.get_model("WebhookEventType")
+        Folder = apps.get_model("iam", "Folder")
+        GlobalSettings = apps.get_model("global_settings", "GlobalSettings")
+
+        def _routing_changed(sender, **kwargs):
+            invalidate_webhook_routing_cache()
+
+        def _links_changed(sender, instance, action, **kwargs):
+            if action in {"post_add", "post_remove", "post_clear"}:
+                invalidate_webhook_routing_cache()
+
+        def _settings_saved(sender, instance, **kwargs):
+            if instance.name == GlobalSettings.Names.FEATURE_FLAGS:
+                invalidate_webhook_routing_cache()
+
+        # Renaming an event type changes the key of its routes
+        for model in (WebhookEndpoint, WebhookEventType):
+            post_save.connect(
+                _routing_changed,
+                sender=model,
+                dispatch_uid=f"webhooks.{model._meta.model_name}.post_save.routing",
+                weak=False,
+            )
+        # Deleting an endpoint, an event type or a folder drops links without
+        # an m2m_changed signal
+        for model in (WebhookEndpoint, WebhookEventType, Folder):
+            post_delete.connect(
+                _routing_changed,
+                sender=model,
+                dispatch_uid=f"webhooks.{model._meta.model_name}.post_delete.routing",
+                weak=False,
+            )
+        for field in ("event_types", "target_folders"):
+            m2m_changed.connect(
+                _links_changed,
+                sender=getattr(WebhookEndpoint, field).through,
+                dispatch_uid=f"webhooks.endpoint.{field}.m2m.invalidate_routing",
+                weak=False,
+            )
+        post_save.connect(
+            _settings_saved,
+            sender=GlobalSettings,
+            dispatch_uid="webhooks.globalsettings.post_save.invalidate_routing",
+            weak=False,
+        )
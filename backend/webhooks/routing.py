@@ -0,0 +1,121 @@
+"""
+Versioned routing table of outgoing webhooks: event type → subscribed endpoints.
+
+Finding the endpoints of an event used to run a query per model event, so
+bulk operations paid one query per changed object. The table is built once
+per cache version from the active endpoints, their event types and their
+target folders, and it is empty while the ``outgoing_webhooks`` feature flag
+is off.
+
+The snapshot is registered with the IAM ``CacheRegistry`` and invalidated the
+same way: saving or deleting an endpoint, an event type or a folder, changing
+the subscriptions or target folders of an endpoint, or saving the feature
+flags bumps its ``CacheVersion`` row so that every process rebuilds it on
+next access (see ``WebhooksConfig.ready``).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple, cast
+
+from django.apps import apps
+
+from iam.cache_builders import get_cache_versions
+from iam.snapshot_cache import CacheRegistry
+
+WEBHOOK_ROUTING_KEY = "webhooks.routing"
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointRoute:
+    id: str
+    payload_format: str
+    # Folders the endpoint is scoped to; empty for all folders
+    folder_ids: FrozenSet
+
+    def matches(self, folder_id) -> bool:
+        return not self.folder_ids or folder_id in self.folder_ids
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookRoutingState:
+    routes: Mapping[str, Tuple[EndpointRoute, ...]]
+
+    def endpoints_for(self, event_type: str) -> Tuple[EndpointRoute, ...]:
+        return self.routes.get(event_type, ())
+
+
+def build_webhook_routing_state() -> WebhookRoutingState:
+    """
+    Build the routing table of the active endpoints (3 queries).
+    """
+    from global_settings.utils import ff_is_enabled
+
+    if not ff_is_enabled("outgoing_webhooks"):
+        return WebhookRoutingState(routes=MappingProxyType({}))
+
+    endpoint_model = apps.get_model("webhooks", "WebhookEndpoint")
+    endpoints = dict(
+        endpoint_model.objects.filter(is_active=True).values_list(
+            "id", "payload_format"
+        )
+    )
+
+    folder_ids = defaultdict(set)
+    for endpoint_id, folder_id in endpoint_model.target_folders.through.objects.filter(
+        webhookendpoint_id__in=endpoints.keys()
+    ).values_list("webhookendpoint_id", "folder_id"):
+        folder_ids[endpoint_id].add(folder_id)
+
+    endpoint_routes = {
+        endpoint_id: EndpointRoute(
+            id=str(endpoint_id),
+            payload_format=payload_format,
+            folder_ids=frozenset(folder_ids.get(endpoint_id, ())),
+        )
+        for endpoint_id, payload_format in endpoints.items()
+    }
+
+    routes = defaultdict(list)
+    for endpoint_id, event_type in endpoint_model.event_types.through.objects.filter(
+        webhookendpoint_id__in=endpoints.keys()
+    ).values_list("webhookendpoint_id", "webhookeventtype__name"):
+        routes[event_type].append(endpoint_routes[endpoint_id])
+
+    return WebhookRoutingState(
+        routes=MappingProxyType(
+            {event_type: tuple(routes_) for event_type, routes_ in routes.items()}
+        )
+    )
+
+
+def invalidate_webhook_routing_cache() -> Optional[int]:
+    return CacheRegistry.invalidate(WEBHOOK_ROUTING_KEY)
+
+
+# Import-time registration (DB-free).
+CacheRegistry.register(WEBHOOK_ROUTING_KEY, build_webhook_routing_state)
+
+
+def get_webhook_routing() -> WebhookRoutingState:
+    """
+    Current routing table, rebuilt when its version changed.
+    """
+    versions = get_cache_versions()
+    return cast(
+        WebhookRoutingState,
+        CacheRegistry.get_cache(WEBHOOK_ROUTING_KEY).get(versions),
+    )
+
+
+__all__ = [
+    "WEBHOOK_ROUTING_KEY",
+    "EndpointRoute",
+    "WebhookRoutingState",
+    "build_webhook_routing_state",
+    "invalidate_webhook_routing_cache",
+    "get_webhook_routing",
+]
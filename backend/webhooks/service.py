@@ -1,12 +1,88 @@
-from django.db import transaction
-from django.db.models import Q, Count
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
 
-from global_settings.utils import ff_is_enabled
 from iam.models import Folder
 
 from .models import WebhookEndpoint
 from .registry import webhook_registry
-from .tasks import send_webhook_request
+from .routing import get_webhook_routing
+from .tasks import build_webhook_body, deliver_webhooks
+
+# Deliveries of the transaction being committed, by endpoint
+_outbox = threading.local()
+
+
+class _QueuedDelivery:
+    """
+    Commit hook of one delivery. Every delivery gets its own hook, so that a
+    rolled back savepoint drops its events; the hooks only fill the outbox,
+    which the flush hook of the transaction then enqueues.
+    """
+
+    __slots__ = ("endpoint_id", "event_type", "body")
+
+    def __init__(self, endpoint_id, event_type, body):
+        self.endpoint_id = endpoint_id
+        self.event_type = event_type
+        self.body = body
+
+    def __call__(self):
+        pending = getattr(_outbox, "pending", None)
+        if pending is None:
+            pending = _outbox.pending = defaultdict(list)
+        pending[self.endpoint_id].append((self.event_type, self.body))
+
+
+def _flush_outbox():
+    pending = getattr(_outbox, "pending", None)
+    _outbox.pending = None
+    if pending:
+        _enqueue_deliveries(pending)
+
+
+def _defer_flush():
+    """
+    Keep a single flush hook per transaction, behind its last delivery hook.
+
+    Commit hooks run in the order they were registered, so the flush hook is
+    moved to the end of the queue on every dispatch. It keeps the savepoints
+    it was registered in: it is only dropped with the deliveries queued
+    before it, and the next dispatch then registers a new one.
+    """
+    if not connection.in_atomic_block:
+        # Outside a transaction, commit hooks run right away
+        transaction.on_commit(_flush_outbox)
+        return
+    hooks = connection.run_on_commit
+    # The flush hook sits just before the deliveries of the last dispatch
+    for index in range(len(hooks) - 1, -1, -1):
+        if hooks[index][1] is _flush_outbox:
+            hooks.append(hooks.pop(index))
+            return
+    transaction.on_commit(_flush_outbox)
+
+
+def _enqueue_deliveries(pending):
+    batch_size = max(1, settings.WEBHOOK_BATCH_SIZE)
+    for endpoint_id, deliveries in pending.items():
+        for start in range(0, len(deliveries), batch_size):
+            deliver_webhooks.schedule(
+                args=(endpoint_id, deliveries[start : start + batch_size]),
+                delay=1,
+            )
+
+
+def _get_folder_id(instance):
+    if isinstance(instance, Folder):
+        return instance.id
+    folder_id = getattr(instance, "folder_id", None)
+    if folder_id is not None:
+        return folder_id
+    folder = Folder.get_folder(instance)
+    return folder.id if folder is not None else None
 
 
 def dispatch_webhook_event(instance, action, serializer=None):
@@ -15,9 +91,14 @@ def dispatch_webhook_event(instance, action, serializer=None):
 
     - 'instance' is the model object (e.g., an AppliedControl)
     - 'action' is a string (e.g., "created", "updated", "deleted")
+
+    Subscribed endpoints come from the cached routing table, which is empty
+    while the outgoing webhooks feature flag is off. The event body is built
+    and serialized once per payload format and signed per endpoint.
+
+    Deliveries are sent once the transaction is committed, in one task per
+    endpoint for all the events of the transaction (see deliver_webhooks).
     """
-    if not ff_is_enabled("outgoing_webhooks"):
-        return
     # Check if the model is registered
     config = webhook_registry.get_config(instance)
 
@@ -27,32 +108,29 @@ def dispatch_webhook_event(instance, action, serializer=None):
     event_type = config.get_event_type(instance, action)
 
     # Find all active endpoints subscribed to this event
-    folder = Folder.get_folder(instance)
-    endpoints = (
-        WebhookEndpoint.objects.annotate(folder_count=Count("target_folders"))
-        .filter(
-            Q(folder_count=0) | Q(target_folders=folder),
-            is_active=True,
-            event_types__name=event_type,
-        )
-        .distinct()
-    )
+    endpoints = get_webhook_routing().endpoints_for(event_type)
+    if not endpoints:
+        return
+    if any(endpoint.folder_ids for endpoint in endpoints):
+        folder_id = _get_folder_id(instance)
+        endpoints = [endpoint for endpoint in endpoints if endpoint.matches(folder_id)]
 
-    payloads = {}
+    bodies = {}
     for endpoint in endpoints:
-        _serializer = (
-            serializer
-            if endpoint.payload_format == WebhookEndpoint.PayloadFormats.FULL
-            else None
-        )
-        payloads[str(endpoint.id)] = config.get_payload(instance, _serializer)
+        payload_format = endpoint.payload_format
+        if payload_format not in bodies:
+            _serializer = (
+                serializer
+                if payload_format == WebhookEndpoint.PayloadFormats.FULL
+                else None
+            )
+            bodies[payload_format] = build_webhook_body(
+                event_type, config.get_payload(instance, _serializer)
+            )
 
-    # Enqueue tasks
+    # Queue deliveries
     for endpoint in endpoints:
         transaction.on_commit(
-            (
-                lambda e_id=str(endpoint.id): send_webhook_request.schedule(
-                    args=(e_id, event_type, payloads[e_id]), delay=1
-                )
-            )
+            _QueuedDelivery(endpoint.id, event_type, bodies[endpoint.payload_format])
         )
+    _defer_flush()
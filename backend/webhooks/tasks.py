@@ -3,11 +3,16 @@ import hashlib
 import hmac
 import json
 import secrets
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from huey.contrib.djhuey import db_task
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 
 from .models import WebhookEndpoint
@@ -16,20 +21,60 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Same schedule as the Huey retries of send_webhook_request: 60s, 120s, 240s...
+DELIVERY_RETRIES = 5
+DELIVERY_RETRY_DELAY = 60
+DELIVERY_RETRY_BACKOFF = 2.0
+DELIVERY_TIMEOUT = 15
 
-@db_task(retries=5, retry_delay=60, retry_backoff=2.0)
-def send_webhook_request(endpoint_id, event_type, data_payload):
+# Keep-alive sessions, one per target scheme and host, shared by the worker
+# threads of the process
+_sessions = {}
+_sessions_lock = threading.Lock()
+# Bounds the requests in flight to an endpoint across the worker threads
+_endpoint_slots = {}
+_endpoint_slots_lock = threading.Lock()
+
+
+def _max_concurrency() -> int:
+    return max(1, settings.WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT)
+
+
+def get_session(url) -> requests.Session:
     """
-    Huey task to send a single webhook event.
-    This task will be retried on failure.
+    Pooled session for the host of 'url'. Connections are kept alive between
+    deliveries, so consecutive events to a host skip the TLS handshake.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=_max_concurrency()
+                )
+                session.mount(f"{parts.scheme}://", adapter)
+                _sessions[key] = session
+    return session
+
+
+def _endpoint_slot(endpoint_id) -> threading.BoundedSemaphore:
+    key = str(endpoint_id)
+    with _endpoint_slots_lock:
+        slot = _endpoint_slots.get(key)
+        if slot is None:
+            slot = _endpoint_slots[key] = threading.BoundedSemaphore(_max_concurrency())
+    return slot
+
+
+def build_webhook_body(event_type, data_payload) -> str:
+    """
+    Serialized body of a webhook event, shared by all the endpoints it is
+    sent to (each one signs it with its own secret).
     """
-    try:
-        endpoint = WebhookEndpoint.objects.get(id=endpoint_id, is_active=True)
-    except WebhookEndpoint.DoesNotExist:
-        logger.warning("Endpoint deleted. Task aborted.", endpoint_id=endpoint_id)
-        return
-
-    # Build payload
     timestamp_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     full_payload = {
         "type": event_type,
@@ -38,45 +83,139 @@ def send_webhook_request(endpoint_id, event_type, data_payload):
     }
 
     # Send minified JSON, as recommended
-    json_payload = json.dumps(
-        full_payload, separators=(",", ":"), cls=DjangoJSONEncoder
-    )
+    return json.dumps(full_payload, separators=(",", ":"), cls=DjangoJSONEncoder)
+
 
-    # Generate headers & signature
+def sign_webhook_body(secret, json_payload) -> dict:
+    """
+    Headers of a delivery of 'json_payload' signed with the endpoint secret.
+    Every delivery, retries included, gets a new message id and timestamp.
+    """
     webhook_id = f"msg_{secrets.token_hex(16)}"
     timestamp_unix = str(int(time.time()))
 
     content_to_sign = f"{webhook_id}.{timestamp_unix}.{json_payload}"
 
     digest = hmac.new(
-        endpoint.secret.encode("utf-8"), content_to_sign.encode("utf-8"), hashlib.sha256
+        secret.encode("utf-8"), content_to_sign.encode("utf-8"), hashlib.sha256
     ).digest()
 
     signature = base64.b64encode(digest).decode("utf-8")
 
-    headers = {
+    return {
         "Content-Type": "application/json",
         "webhook-id": webhook_id,
         "webhook-timestamp": timestamp_unix,
         "webhook-signature": f"v1,{signature}",
     }
 
+
+def post_webhook(endpoint, json_payload):
+    """
+    Send a signed body to the endpoint on the pooled session of its host.
+    Raises an exception on a network error or a non-2xx status.
+    """
+    headers = sign_webhook_body(endpoint.secret, json_payload)
+
     # Send request (15s timeout)
     try:
-        response = requests.post(
-            endpoint.url, data=json_payload.encode("utf-8"), headers=headers, timeout=15
+        with _endpoint_slot(endpoint.id):
+            response = get_session(endpoint.url).post(
+                endpoint.url,
+                data=json_payload.encode("utf-8"),
+                headers=headers,
+                timeout=DELIVERY_TIMEOUT,
+            )
+            # Give the connection back to the pool
+            response.close()
+    except requests.exceptions.RequestException as e:
+        # Network error, timeout, etc.
+        raise Exception(f"Webhook network error for {endpoint.id}: {e}")
+
+    # Any non-2xx status code is a failure
+    if not 200 <= response.status_code < 300:
+        raise Exception(
+            f"Webhook failed for {endpoint.id} with status {response.status_code}."
         )
 
-        # Any non-2xx status code is a failure
-        if 200 <= response.status_code < 300:
-            return f"Success: Sent {event_type} to {endpoint.url}"
-        else:
-            # Raise exception to trigger Huey retry
-            raise Exception(
-                f"Webhook failed for {endpoint_id} with status {response.status_code}."
+
+@db_task()
+def deliver_webhooks(endpoint_id, deliveries, attempt=0):
+    """
+    Huey task to send a batch of webhook events to one endpoint.
+
+    'deliveries' is a list of (event_type, body) pairs. The endpoint is loaded
+    once and the events are sent on the pooled session of its host, at most
+    WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT at a time. Only the failed deliveries
+    are rescheduled, on the retry schedule of send_webhook_request.
+    """
+    try:
+        endpoint = WebhookEndpoint.objects.get(id=endpoint_id, is_active=True)
+    except WebhookEndpoint.DoesNotExist:
+        logger.warning("Endpoint deleted. Task aborted.", endpoint_id=endpoint_id)
+        return
+
+    def send(delivery):
+        event_type, json_payload = delivery
+        try:
+            post_webhook(endpoint, json_payload)
+        except Exception as e:
+            logger.warning(
+                "Webhook delivery failed",
+                endpoint_id=endpoint_id,
+                event_type=event_type,
+                attempt=attempt,
+                error=str(e),
             )
+            return False
+        return True
+
+    workers = min(_max_concurrency(), len(deliveries))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(send, deliveries))
+    else:
+        results = [send(delivery) for delivery in deliveries]
+
+    failed = [delivery for delivery, sent in zip(deliveries, results) if not sent]
+    if not failed:
+        return f"Success: Sent {len(deliveries)} events to {endpoint.url}"
+
+    if attempt < DELIVERY_RETRIES:
+        deliver_webhooks.schedule(
+            args=(endpoint_id, failed, attempt + 1),
+            delay=DELIVERY_RETRY_DELAY * DELIVERY_RETRY_BACKOFF**attempt,
+        )
+    else:
+        logger.error(
+            "Webhook deliveries dropped after retries",
+            endpoint_id=endpoint_id,
+            failed=len(failed),
+        )
+    sent = len(deliveries) - len(failed)
+    return f"Sent {sent} of {len(deliveries)} events to {endpoint.url}"
 
-    except requests.exceptions.RequestException as e:
-        # Network error, timeout, etc.
-        # Raise exception to trigger Huey retry
-        raise Exception(f"Webhook network error for {endpoint_id}: {e}")
+
+@db_task(retries=5, retry_delay=60, retry_backoff=2.0)
+def send_webhook_request(endpoint_id, event_type, data_payload, body=None):
+    """
+    Huey task to send a single webhook event.
+    This task will be retried on failure.
+
+    'body' is the event body built at dispatch time; tasks enqueued without
+    it build it from 'data_payload'. Events are now sent in batches by
+    deliver_webhooks; this task still runs the ones already queued.
+    """
+    try:
+        endpoint = WebhookEndpoint.objects.get(id=endpoint_id, is_active=True)
+    except WebhookEndpoint.DoesNotExist:
+        logger.warning("Endpoint deleted. Task aborted.", endpoint_id=endpoint_id)
+        return
+
+    json_payload = body
+    if json_payload is None:
+        json_payload = build_webhook_body(event_type, data_payload)
+
+    # Raises to trigger Huey retry
+    post_webhook(endpoint, json_payload)
+    return f"Success: Sent {event_type} to {endpoint.url}"
@@ -0,0 +1,35 @@
+import pytest
+
+from global_settings.models import GlobalSettings
+from iam.models import Folder
+from webhooks.models import WebhookEndpoint, WebhookEventType
+
+
+def set_webhooks_flag(enabled: bool) -> None:
+    # Saving the feature flags also invalidates the routing table
+    GlobalSettings.objects.update_or_create(
+        name=GlobalSettings.Names.FEATURE_FLAGS,
+        defaults={"value": {"outgoing_webhooks": enabled}},
+    )
+
+
+def create_endpoint(*event_types, folders=(), **kwargs) -> WebhookEndpoint:
+    endpoint = WebhookEndpoint.objects.create(
+        name=kwargs.pop("name", "endpoint"),
+        folder=Folder.get_root_folder(),
+        url=kwargs.pop("url", "https://hooks.example.com/"),
+        secret="secret",
+        **kwargs,
+    )
+    endpoint.event_types.set(event_types)
+    endpoint.target_folders.set(folders)
+    return endpoint
+
+
+@pytest.fixture
+def event_types(db):
+    set_webhooks_flag(True)
+    return {
+        name: WebhookEventType.objects.create(name=name)
+        for name in ("appliedcontrol.created", "appliedcontrol.updated")
+    }
@@ -0,0 +1,142 @@
+import base64
+import hashlib
+import hmac
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from django.db import transaction
+
+from core.models import AppliedControl
+from iam.models import Folder
+from webhooks import service
+from webhooks.models import WebhookEndpoint
+from webhooks.service import dispatch_webhook_event
+from webhooks.tasks import deliver_webhooks
+
+from .fixtures import *
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    """Webhook consumer stand-in: records every POST and keeps connections alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append(
+            (self.client_address, dict(self.headers), body.decode())
+        )
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def hook_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    """deliver_webhooks tasks enqueued at commit, as (endpoint_id, deliveries)."""
+    tasks = []
+    monkeypatch.setattr(
+        service,
+        "deliver_webhooks",
+        SimpleNamespace(schedule=lambda args, delay: tasks.append(args)),
+    )
+    return tasks
+
+
+def create_controls(count: int) -> list[AppliedControl]:
+    return [
+        AppliedControl.objects.create(
+            name=f"Control {i}", folder=Folder.get_root_folder()
+        )
+        for i in range(count)
+    ]
+
+
+def delivered_ids(deliveries) -> list[str]:
+    return [json.loads(body)["data"]["id"] for _, body in deliveries]
+
+
+def signature_is_valid(secret: str, headers: dict, body: str) -> bool:
+    content = f"{headers['webhook-id']}.{headers['webhook-timestamp']}.{body}"
+    digest = hmac.new(secret.encode(), content.encode(), hashlib.sha256).digest()
+    return headers["webhook-signature"] == f"v1,{base64.b64encode(digest).decode()}"
+
+
+@pytest.mark.django_db
+def test_events_of_a_transaction_are_delivered_in_batches(
+    event_types, hook_server, scheduled, settings, django_capture_on_commit_callbacks
+):
+    settings.WEBHOOK_BATCH_SIZE = 4
+    settings.WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT = 2
+    host, port = hook_server.server_address
+    endpoint = create_endpoint(
+        event_types["appliedcontrol.updated"],
+        url=f"http://{host}:{port}/hooks",
+        payload_format=WebhookEndpoint.PayloadFormats.THIN,
+    )
+    controls = create_controls(10)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for control in controls:
+            dispatch_webhook_event(control, "updated")
+
+    assert len(scheduled) <= math.ceil(len(controls) / settings.WEBHOOK_BATCH_SIZE)
+    assert all(endpoint_id == str(endpoint.id) for endpoint_id, _ in scheduled)
+    assert all(len(batch) <= settings.WEBHOOK_BATCH_SIZE for _, batch in scheduled)
+    deliveries = [delivery for _, batch in scheduled for delivery in batch]
+    assert delivered_ids(deliveries) == [str(control.id) for control in controls]
+
+    for args in scheduled:
+        deliver_webhooks.call_local(*args)
+
+    # Each event is its own signed message, sent on pooled keep-alive connections
+    assert len(hook_server.received) == len(controls)
+    assert sorted(
+        json.loads(body)["data"]["id"] for _, _, body in hook_server.received
+    ) == sorted(str(control.id) for control in controls)
+    for _, headers, body in hook_server.received:
+        assert signature_is_valid(endpoint.secret, headers, body)
+    connections = {client for client, _, _ in hook_server.received}
+    assert len(connections) <= settings.WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("rolled_back", [0, 1])
+def test_rolled_back_events_are_not_delivered(
+    event_types, scheduled, django_capture_on_commit_callbacks, rolled_back
+):
+    endpoint = create_endpoint(event_types["appliedcontrol.updated"])
+    controls = create_controls(3)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for i, control in enumerate(controls):
+            if i == rolled_back:
+                with pytest.raises(RuntimeError), transaction.atomic():
+                    dispatch_webhook_event(control, "updated")
+                    raise RuntimeError
+            else:
+                dispatch_webhook_event(control, "updated")
+
+    ((endpoint_id, deliveries),) = scheduled
+    assert endpoint_id == str(endpoint.id)
+    assert delivered_ids(deliveries) == [
+        str(control.id) for i, control in enumerate(controls) if i != rolled_back
+    ]
@@ -0,0 +1,109 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core.models import AppliedControl
+from iam.models import Folder
+from webhooks.models import WebhookEndpoint
+from webhooks.routing import get_webhook_routing
+from webhooks.service import _QueuedDelivery, dispatch_webhook_event
+
+from .fixtures import *
+
+
+def routed_ids(event_type: str) -> set[str]:
+    return {route.id for route in get_webhook_routing().endpoints_for(event_type)}
+
+
+@pytest.mark.django_db
+class TestWebhookRouting:
+    def test_routes_events_to_active_subscribed_endpoints(self, event_types):
+        folder = Folder.objects.create(
+            name="Scoped", parent_folder=Folder.get_root_folder()
+        )
+        scoped = create_endpoint(
+            event_types["appliedcontrol.created"],
+            folders=[folder],
+            payload_format=WebhookEndpoint.PayloadFormats.THIN,
+        )
+        updates = create_endpoint(event_types["appliedcontrol.updated"])
+        create_endpoint(event_types["appliedcontrol.created"], is_active=False)
+
+        routing = get_webhook_routing()
+        (route,) = routing.endpoints_for("appliedcontrol.created")
+        assert route.id == str(scoped.id)
+        assert route.payload_format == WebhookEndpoint.PayloadFormats.THIN
+        assert route.matches(folder.id)
+        assert not route.matches(Folder.get_root_folder().id)
+        (route,) = routing.endpoints_for("appliedcontrol.updated")
+        assert route.id == str(updates.id)
+        assert route.matches(folder.id)
+        assert routing.endpoints_for("appliedcontrol.deleted") == ()
+
+    def test_routing_is_empty_while_the_flag_is_off(self, event_types):
+        create_endpoint(event_types["appliedcontrol.created"])
+        assert routed_ids("appliedcontrol.created")
+        set_webhooks_flag(False)
+        assert routed_ids("appliedcontrol.created") == set()
+
+    def test_endpoint_changes_invalidate_routing(self, event_types):
+        endpoint = create_endpoint(event_types["appliedcontrol.created"])
+        assert routed_ids("appliedcontrol.updated") == set()
+
+        endpoint.event_types.add(event_types["appliedcontrol.updated"])
+        assert routed_ids("appliedcontrol.updated") == {str(endpoint.id)}
+
+        endpoint.is_active = False
+        endpoint.save()
+        assert routed_ids("appliedcontrol.updated") == set()
+
+        endpoint.is_active = True
+        endpoint.save()
+        assert routed_ids("appliedcontrol.updated") == {str(endpoint.id)}
+        endpoint.delete()
+        assert routed_ids("appliedcontrol.updated") == set()
+
+    def test_event_type_changes_invalidate_routing(self, event_types):
+        endpoint = create_endpoint(event_types["appliedcontrol.created"])
+        assert routed_ids("appliedcontrol.created") == {str(endpoint.id)}
+
+        event_type = event_types["appliedcontrol.created"]
+        event_type.name = "appliedcontrol.renamed"
+        event_type.save()
+        assert routed_ids("appliedcontrol.created") == set()
+        assert routed_ids("appliedcontrol.renamed") == {str(endpoint.id)}
+
+        event_type.delete()
+        assert routed_ids("appliedcontrol.renamed") == set()
+
+
+@pytest.mark.django_db
+def test_event_body_is_serialized_once_per_payload_format(
+    event_types, django_capture_on_commit_callbacks
+):
+    updated = event_types["appliedcontrol.updated"]
+    full = [create_endpoint(updated, name=f"full {i}") for i in range(2)]
+    thin = create_endpoint(
+        updated, name="thin", payload_format=WebhookEndpoint.PayloadFormats.THIN
+    )
+    control = AppliedControl.objects.create(
+        name="Control", folder=Folder.get_root_folder()
+    )
+    serializer = SimpleNamespace(data={"id": str(control.id), "name": control.name})
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        dispatch_webhook_event(control, "updated", serializer=serializer)
+
+    bodies = {
+        hook.endpoint_id: hook.body
+        for hook in callbacks
+        if isinstance(hook, _QueuedDelivery)
+    }
+    assert bodies.keys() == {str(endpoint.id) for endpoint in [*full, thin]}
+    # Endpoints with the same payload format share the same body object
+    assert bodies[str(full[0].id)] is bodies[str(full[1].id)]
+    assert json.loads(bodies[str(full[0].id)])["data"] == serializer.data
+    thin_body = json.loads(bodies[str(thin.id)])
+    assert thin_body["type"] == "appliedcontrol.updated"
+    assert thin_body["data"] == {"id": str(control.id)}
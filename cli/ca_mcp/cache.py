@@ -0,0 +1,56 @@
+"""TTL cache of name-to-id lookups, shared by the resolvers"""
+
+import functools
+import time
+
+from .config import RESOLVER_CACHE_TTL
+
+
+class TTLCache:
+    """Small in-memory cache whose entries expire after `ttl` seconds"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries = {}
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Cleared on every write request (see client.py), since creating, renaming
+# or deleting an object can change what a name resolves to
+resolver_cache = TTLCache(ttl=RESOLVER_CACHE_TTL)
+
+
+def cached_resolver(func):
+    """Memoize an async resolver on its arguments; errors are not cached"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            value = resolver_cache.get(key)
+        except TypeError:
+            # Unhashable arguments
+            return await func(*args, **kwargs)
+        if value is None:
+            value = await func(*args, **kwargs)
+            resolver_cache.set(key, value)
+        return value
+
+    return wrapper
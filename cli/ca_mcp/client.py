@@ -1,9 +1,23 @@
 """HTTP client utilities for CISO Assistant API"""
 
-import requests
+import asyncio
 import sys
+import weakref
+from urllib.parse import urljoin
+
+import httpx
 from rich import print as rprint
-from .config import API_URL, TOKEN, VERIFY_CERTIFICATE, HTTP_TIMEOUT
+from .cache import resolver_cache
+from .config import (
+    API_URL,
+    TOKEN,
+    VERIFY_CERTIFICATE,
+    HTTP_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+)
+
+# One pooled keep-alive client per event loop (the MCP server runs a single one)
+_clients = weakref.WeakKeyDictionary()
 
 
 def get_headers():
@@ -21,7 +35,28 @@ def get_json_headers():
     }
 
 
-def make_get_request(endpoint, params=None):
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared async client of the running event loop
+
+    Connections to the API are kept alive and reused by all the tool calls.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=VERIFY_CERTIFICATE,
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def make_get_request(endpoint, params=None):
     """
     Make a GET request to the API
 
@@ -33,16 +68,10 @@ def make_get_request(endpoint, params=None):
         Response object
     """
     url = f"{API_URL}{endpoint}"
-    return requests.get(
-        url,
-        headers=get_headers(),
-        params=params,
-        verify=VERIFY_CERTIFICATE,
-        timeout=HTTP_TIMEOUT,
-    )
+    return await get_client().get(url, headers=get_headers(), params=params)
 
 
-def make_post_request(endpoint, payload):
+async def make_post_request(endpoint, payload):
     """
     Make a POST request to the API
 
@@ -54,16 +83,11 @@ def make_post_request(endpoint, payload):
         Response object
     """
     url = f"{API_URL}{endpoint}"
-    return requests.post(
-        url,
-        headers=get_json_headers(),
-        json=payload,
-        verify=VERIFY_CERTIFICATE,
-        timeout=HTTP_TIMEOUT,
-    )
+    resolver_cache.clear()
+    return await get_client().post(url, headers=get_json_headers(), json=payload)
 
 
-def make_patch_request(endpoint, payload):
+async def make_patch_request(endpoint, payload):
     """
     Make a PATCH request to the API
 
@@ -75,16 +99,11 @@ def make_patch_request(endpoint, payload):
         Response object
     """
     url = f"{API_URL}{endpoint}"
-    return requests.patch(
-        url,
-        headers=get_json_headers(),
-        json=payload,
-        verify=VERIFY_CERTIFICATE,
-        timeout=HTTP_TIMEOUT,
-    )
+    resolver_cache.clear()
+    return await get_client().patch(url, headers=get_json_headers(), json=payload)
 
 
-def make_delete_request(endpoint):
+async def make_delete_request(endpoint):
     """
     Make a DELETE request to the API
 
@@ -95,12 +114,8 @@ def make_delete_request(endpoint):
         Response object
     """
     url = f"{API_URL}{endpoint}"
-    return requests.delete(
-        url,
-        headers=get_headers(),
-        verify=VERIFY_CERTIFICATE,
-        timeout=HTTP_TIMEOUT,
-    )
+    resolver_cache.clear()
+    return await get_client().delete(url, headers=get_headers())
 
 
 def handle_response(res, error_message="Error"):
@@ -137,67 +152,105 @@ def get_paginated_results(data):
     return []
 
 
-def fetch_all_results(endpoint, params=None):
+def get_total_count(data):
     """
-    Fetch all paginated results from an API endpoint by following 'next' links.
+    Total number of results of a paginated or non-paginated response
+    """
+    if isinstance(data, dict) and "count" in data:
+        return data["count"]
+    return len(get_paginated_results(data))
 
-    This function handles Django REST Framework's LimitOffsetPagination by following
-    the 'next' URL in the response until all pages are retrieved.
+
+async def fetch_page(endpoint, params=None, limit=None, offset=0):
+    """
+    Fetch a single page of results, letting the API do the slicing.
 
     Args:
-        endpoint: API endpoint (e.g., "/compliance-assessments/")
-        params: Optional query parameters (only applied to first request)
+        endpoint: API endpoint (e.g., "/threats/")
+        params: Optional query parameters
+        limit: Number of results to fetch (None for the API page size)
+        offset: Index of the first result
 
     Returns:
-        Tuple of (list of all results, error_message or None)
-
-    Example:
-        results, error = fetch_all_results("/compliance-assessments/")
-        if error:
-            return error
-        # process results...
+        Tuple of (list of results, total count, error_message or None)
     """
-    results_list = []
-    next_url = endpoint
+    params = dict(params or {})
+    if limit:
+        params["limit"] = limit
+        params["offset"] = offset
 
-    # Only apply params to the first request
-    current_params = params
+    res = await make_get_request(endpoint, params=params)
+    if res.status_code != 200:
+        return [], 0, f"Error: HTTP {res.status_code} - {res.text}"
+
+    data = res.json()
+    return get_paginated_results(data), get_total_count(data), None
+
+
+class PaginationError(Exception):
+    """Raised by iter_results when a page cannot be fetched"""
 
-    while next_url:
-        # Make request - if next_url is a full URL from pagination, extract just the path
-        if next_url.startswith("http://") or next_url.startswith("https://"):
-            # Parse the full URL to extract path and query params
-            from urllib.parse import urlparse, parse_qs
 
-            parsed = urlparse(next_url)
-            next_url = parsed.path
-            # Convert query string to params dict for subsequent requests
-            current_params = {
-                k: v[0] if len(v) == 1 else v for k, v in parse_qs(parsed.query).items()
-            }
+async def iter_results(endpoint, params=None):
+    """
+    Iterate over the results of an API endpoint, fetching the next page only
+    when the previous one has been consumed.
 
-        res = make_get_request(next_url, params=current_params)
+    Raises:
+        PaginationError: If a page cannot be fetched or has an unexpected format
+    """
+    url = f"{API_URL}{endpoint}"
+    # Only apply params to the first request, the next links include them
+    current_params = params
+
+    while url:
+        res = await get_client().get(url, headers=get_headers(), params=current_params)
 
         if res.status_code != 200:
-            error_msg = f"Error: HTTP {res.status_code} - {res.text}"
-            return results_list, error_msg
+            raise PaginationError(f"Error: HTTP {res.status_code} - {res.text}")
 
         data = res.json()
 
         # Handle paginated response
         if isinstance(data, dict) and "results" in data:
-            results = data.get("results", [])
-            results_list.extend(results)
-            next_url = data.get("next")  # Get next page URL
-            current_params = (
-                None  # Clear params for subsequent requests (included in next_url)
-            )
+            for result in data.get("results", []):
+                yield result
+            # The API returns the next link without scheme and host
+            url = data.get("next") and urljoin(API_URL, data["next"])
+            current_params = None
         # Handle non-paginated response (list)
         elif isinstance(data, list):
-            results_list.extend(data)
-            next_url = None  # No pagination for list responses
+            for result in data:
+                yield result
+            url = None
         else:
-            error_msg = f"Unexpected API response format: {type(data)}"
-            return results_list, error_msg
+            raise PaginationError(f"Unexpected API response format: {type(data)}")
+
 
+async def fetch_all_results(endpoint, params=None):
+    """
+    Fetch all paginated results from an API endpoint by following 'next' links.
+
+    This function handles Django REST Framework's LimitOffsetPagination by following
+    the 'next' URL in the response until all pages are retrieved.
+
+    Args:
+        endpoint: API endpoint (e.g., "/compliance-assessments/")
+        params: Optional query parameters (only applied to first request)
+
+    Returns:
+        Tuple of (list of all results, error_message or None)
+
+    Example:
+        results, error = await fetch_all_results("/compliance-assessments/")
+        if error:
+            return error
+        # process results...
+    """
+    results_list = []
+    try:
+        async for result in iter_results(endpoint, params=params):
+            results_list.append(result)
+    except PaginationError as e:
+        return results_list, str(e)
     return results_list, None
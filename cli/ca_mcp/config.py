@@ -21,3 +21,7 @@ VERIFY_CERTIFICATE = os.getenv("VERIFY_CERTIFICATE", "true").lower() in (
     "on",
 )
 HTTP_TIMEOUT = 30  # seconds
+# Maximum number of pooled connections to the API
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "10"))
+# How long name-to-id lookups are cached, in seconds (0 disables the cache)
+RESOLVER_CACHE_TTL = float(os.getenv("RESOLVER_CACHE_TTL", "60"))
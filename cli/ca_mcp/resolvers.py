@@ -1,9 +1,32 @@
-"""Helper functions to resolve names to UUIDs"""
+"""Helper functions to resolve names to UUIDs
 
+Lookups are cached for RESOLVER_CACHE_TTL seconds and the cache is cleared by
+every write request (see cache.py).
+"""
+
+import asyncio
+
+from .cache import cached_resolver
 from .client import make_get_request, get_paginated_results
 
 
-def resolve_folder_id(folder_name_or_id: str) -> str:
+async def resolve_many(resolver, names_or_ids, *args, **kwargs) -> list:
+    """Resolve several names or UUIDs concurrently, keeping their order
+
+    Args:
+        resolver: One of the resolve_* helpers
+        names_or_ids: Names or UUIDs to resolve
+        *args, **kwargs: Extra arguments passed to the resolver
+    """
+    return list(
+        await asyncio.gather(
+            *(resolver(value, *args, **kwargs) for value in names_or_ids)
+        )
+    )
+
+
+@cached_resolver
+async def resolve_folder_id(folder_name_or_id: str) -> str:
     """Helper function to resolve folder name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     Returns the UUID string or raises ValueError with a clear message.
@@ -13,7 +36,7 @@ def resolve_folder_id(folder_name_or_id: str) -> str:
         return folder_name_or_id
 
     # Otherwise, look up by name - return exactly one result
-    res = make_get_request("/folders/", params={"name": folder_name_or_id})
+    res = await make_get_request("/folders/", params={"name": folder_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(f"Folder '{folder_name_or_id}' API error {res.status_code}")
@@ -34,7 +57,8 @@ def resolve_folder_id(folder_name_or_id: str) -> str:
     return str(folders[0]["id"])
 
 
-def resolve_perimeter_id(perimeter_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_perimeter_id(perimeter_name_or_id: str) -> str:
     """Helper function to resolve perimeter name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     Returns the UUID string or raises ValueError with a clear message.
@@ -44,7 +68,7 @@ def resolve_perimeter_id(perimeter_name_or_id: str) -> str:
         return perimeter_name_or_id
 
     # Otherwise, look up by name - return exactly one result
-    res = make_get_request("/perimeters/", params={"name": perimeter_name_or_id})
+    res = await make_get_request("/perimeters/", params={"name": perimeter_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(
@@ -67,7 +91,8 @@ def resolve_perimeter_id(perimeter_name_or_id: str) -> str:
     return str(perimeters[0]["id"])
 
 
-def resolve_risk_matrix_id(matrix_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_risk_matrix_id(matrix_name_or_id: str) -> str:
     """Helper function to resolve risk matrix name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
@@ -76,7 +101,7 @@ def resolve_risk_matrix_id(matrix_name_or_id: str) -> str:
         return matrix_name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request("/risk-matrices/", params={"name": matrix_name_or_id})
+    res = await make_get_request("/risk-matrices/", params={"name": matrix_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(
@@ -97,7 +122,8 @@ def resolve_risk_matrix_id(matrix_name_or_id: str) -> str:
     return matrices[0]["id"]
 
 
-def resolve_framework_id(framework_name_or_urn_or_id: str) -> str:
+@cached_resolver
+async def resolve_framework_id(framework_name_or_urn_or_id: str) -> str:
     """Helper function to resolve framework name/URN to UUID
     If already a UUID, returns it. If a name or URN, looks it up via API.
     """
@@ -107,12 +133,12 @@ def resolve_framework_id(framework_name_or_urn_or_id: str) -> str:
 
     # Try URN search first if it looks like a URN
     if framework_name_or_urn_or_id.startswith("urn:"):
-        res = make_get_request(
+        res = await make_get_request(
             "/frameworks/", params={"urn": framework_name_or_urn_or_id}
         )
     else:
         # Search by name
-        res = make_get_request(
+        res = await make_get_request(
             "/frameworks/", params={"name": framework_name_or_urn_or_id}
         )
 
@@ -135,7 +161,8 @@ def resolve_framework_id(framework_name_or_urn_or_id: str) -> str:
     return frameworks[0]["id"]
 
 
-def resolve_risk_assessment_id(assessment_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_risk_assessment_id(assessment_name_or_id: str) -> str:
     """Helper function to resolve risk assessment name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
@@ -144,7 +171,9 @@ def resolve_risk_assessment_id(assessment_name_or_id: str) -> str:
         return assessment_name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request("/risk-assessments/", params={"name": assessment_name_or_id})
+    res = await make_get_request(
+        "/risk-assessments/", params={"name": assessment_name_or_id}
+    )
 
     if res.status_code != 200:
         raise ValueError(
@@ -165,7 +194,8 @@ def resolve_risk_assessment_id(assessment_name_or_id: str) -> str:
     return assessments[0]["id"]
 
 
-def resolve_asset_id(asset_name_or_id: str, folder_id: str = None) -> str:
+@cached_resolver
+async def resolve_asset_id(asset_name_or_id: str, folder_id: str = None) -> str:
     """Helper function to resolve asset name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
 
@@ -182,7 +212,7 @@ def resolve_asset_id(asset_name_or_id: str, folder_id: str = None) -> str:
     if folder_id:
         params["folder"] = folder_id
 
-    res = make_get_request("/assets/", params=params)
+    res = await make_get_request("/assets/", params=params)
 
     if res.status_code != 200:
         raise ValueError(f"Asset '{asset_name_or_id}' API error {res.status_code}")
@@ -201,7 +231,8 @@ def resolve_asset_id(asset_name_or_id: str, folder_id: str = None) -> str:
     return assets[0]["id"]
 
 
-def resolve_risk_scenario_id(scenario_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_risk_scenario_id(scenario_name_or_id: str) -> str:
     """Helper function to resolve risk scenario name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
@@ -210,7 +241,9 @@ def resolve_risk_scenario_id(scenario_name_or_id: str) -> str:
         return scenario_name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request("/risk-scenarios/", params={"name": scenario_name_or_id})
+    res = await make_get_request(
+        "/risk-scenarios/", params={"name": scenario_name_or_id}
+    )
 
     if res.status_code != 200:
         raise ValueError(
@@ -231,7 +264,10 @@ def resolve_risk_scenario_id(scenario_name_or_id: str) -> str:
     return scenarios[0]["id"]
 
 
-def resolve_applied_control_id(control_name_or_id: str, folder_id: str = None) -> str:
+@cached_resolver
+async def resolve_applied_control_id(
+    control_name_or_id: str, folder_id: str = None
+) -> str:
     """Helper function to resolve applied control name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
 
@@ -248,7 +284,7 @@ def resolve_applied_control_id(control_name_or_id: str, folder_id: str = None) -
     if folder_id:
         params["folder"] = folder_id
 
-    res = make_get_request("/applied-controls/", params=params)
+    res = await make_get_request("/applied-controls/", params=params)
 
     if res.status_code != 200:
         raise ValueError(
@@ -269,7 +305,8 @@ def resolve_applied_control_id(control_name_or_id: str, folder_id: str = None) -
     return controls[0]["id"]
 
 
-def resolve_requirement_assessment_id(requirement_assessment_id: str) -> str:
+@cached_resolver
+async def resolve_requirement_assessment_id(requirement_assessment_id: str) -> str:
     """Validate requirement assessment UUID (only UUIDs accepted, no names)"""
     if "-" in requirement_assessment_id and len(requirement_assessment_id) == 36:
         return requirement_assessment_id
@@ -279,7 +316,8 @@ def resolve_requirement_assessment_id(requirement_assessment_id: str) -> str:
     )
 
 
-def resolve_compliance_assessment_id(assessment_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_compliance_assessment_id(assessment_name_or_id: str) -> str:
     """Helper function to resolve compliance assessment (audit) name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
@@ -288,7 +326,7 @@ def resolve_compliance_assessment_id(assessment_name_or_id: str) -> str:
         return assessment_name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request(
+    res = await make_get_request(
         "/compliance-assessments/", params={"name": assessment_name_or_id}
     )
 
@@ -312,7 +350,8 @@ def resolve_compliance_assessment_id(assessment_name_or_id: str) -> str:
     return assessments[0]["id"]
 
 
-def resolve_id_or_name(name_or_id: str, endpoint: str) -> str:
+@cached_resolver
+async def resolve_id_or_name(name_or_id: str, endpoint: str) -> str:
     """Generic helper function to resolve name to UUID for any endpoint
     If already a UUID, returns it. If a name, looks it up via API.
 
@@ -328,7 +367,7 @@ def resolve_id_or_name(name_or_id: str, endpoint: str) -> str:
         return name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request(endpoint, params={"name": name_or_id})
+    res = await make_get_request(endpoint, params={"name": name_or_id})
 
     if res.status_code != 200:
         raise ValueError(f"'{name_or_id}' at {endpoint} API error {res.status_code}")
@@ -347,7 +386,8 @@ def resolve_id_or_name(name_or_id: str, endpoint: str) -> str:
     return results[0]["id"]
 
 
-def resolve_threat_id(
+@cached_resolver
+async def resolve_threat_id(
     threat_name_or_id: str, library: str = None, folder_id: str = None
 ) -> str:
     """Helper function to resolve threat name to UUID
@@ -369,12 +409,12 @@ def resolve_threat_id(
     params = {"name": threat_name_or_id}
     if library:
         # Resolve library URN to ID if needed
-        library_id = resolve_library_id(library)
+        library_id = await resolve_library_id(library)
         params["library"] = library_id
     if folder_id:
         params["folder"] = folder_id
 
-    res = make_get_request("/threats/", params=params)
+    res = await make_get_request("/threats/", params=params)
 
     if res.status_code != 200:
         raise ValueError(f"Threat '{threat_name_or_id}' API error {res.status_code}")
@@ -399,12 +439,15 @@ def resolve_threat_id(
     return threats[0]["id"]
 
 
-def resolve_library_id(library_urn_or_id: str) -> str:
+@cached_resolver
+async def resolve_library_id(library_urn_or_id: str) -> str:
     """Resolve library URN to UUID"""
     if "-" in library_urn_or_id and len(library_urn_or_id) == 36:
         return library_urn_or_id
 
-    res = make_get_request("/loaded-libraries/", params={"urn": library_urn_or_id})
+    res = await make_get_request(
+        "/loaded-libraries/", params={"urn": library_urn_or_id}
+    )
 
     if res.status_code != 200:
         raise ValueError(f"Library '{library_urn_or_id}' API error {res.status_code}")
@@ -424,7 +467,8 @@ def resolve_library_id(library_urn_or_id: str) -> str:
     return str(libraries[0]["id"])
 
 
-def resolve_vulnerability_id(vulnerability_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_vulnerability_id(vulnerability_name_or_id: str) -> str:
     """Helper function to resolve vulnerability name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
@@ -433,7 +477,9 @@ def resolve_vulnerability_id(vulnerability_name_or_id: str) -> str:
         return vulnerability_name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request("/vulnerabilities/", params={"name": vulnerability_name_or_id})
+    res = await make_get_request(
+        "/vulnerabilities/", params={"name": vulnerability_name_or_id}
+    )
 
     if res.status_code != 200:
         raise ValueError(
@@ -455,7 +501,8 @@ def resolve_vulnerability_id(vulnerability_name_or_id: str) -> str:
     return str(vulnerabilities[0]["id"])
 
 
-def resolve_task_template_id(task_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_task_template_id(task_name_or_id: str) -> str:
     """Helper function to resolve task template name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
@@ -464,7 +511,7 @@ def resolve_task_template_id(task_name_or_id: str) -> str:
         return task_name_or_id
 
     # Otherwise, look up by name
-    res = make_get_request("/task-templates/", params={"name": task_name_or_id})
+    res = await make_get_request("/task-templates/", params={"name": task_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(
@@ -490,14 +537,15 @@ def resolve_task_template_id(task_name_or_id: str) -> str:
 # ============================================================================
 
 
-def resolve_entity_id(entity_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_entity_id(entity_name_or_id: str) -> str:
     """Helper function to resolve entity name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in entity_name_or_id and len(entity_name_or_id) == 36:
         return entity_name_or_id
 
-    res = make_get_request("/entities/", params={"name": entity_name_or_id})
+    res = await make_get_request("/entities/", params={"name": entity_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(f"Entity '{entity_name_or_id}' API error {res.status_code}")
@@ -516,14 +564,15 @@ def resolve_entity_id(entity_name_or_id: str) -> str:
     return entities[0]["id"]
 
 
-def resolve_solution_id(solution_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_solution_id(solution_name_or_id: str) -> str:
     """Helper function to resolve solution name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in solution_name_or_id and len(solution_name_or_id) == 36:
         return solution_name_or_id
 
-    res = make_get_request("/solutions/", params={"name": solution_name_or_id})
+    res = await make_get_request("/solutions/", params={"name": solution_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(
@@ -544,14 +593,15 @@ def resolve_solution_id(solution_name_or_id: str) -> str:
     return solutions[0]["id"]
 
 
-def resolve_contract_id(contract_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_contract_id(contract_name_or_id: str) -> str:
     """Helper function to resolve contract name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in contract_name_or_id and len(contract_name_or_id) == 36:
         return contract_name_or_id
 
-    res = make_get_request("/contracts/", params={"name": contract_name_or_id})
+    res = await make_get_request("/contracts/", params={"name": contract_name_or_id})
 
     if res.status_code != 200:
         raise ValueError(
@@ -572,14 +622,15 @@ def resolve_contract_id(contract_name_or_id: str) -> str:
     return contracts[0]["id"]
 
 
-def resolve_entity_assessment_id(assessment_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_entity_assessment_id(assessment_name_or_id: str) -> str:
     """Helper function to resolve entity assessment name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in assessment_name_or_id and len(assessment_name_or_id) == 36:
         return assessment_name_or_id
 
-    res = make_get_request(
+    res = await make_get_request(
         "/entity-assessments/", params={"name": assessment_name_or_id}
     )
 
@@ -602,7 +653,8 @@ def resolve_entity_assessment_id(assessment_name_or_id: str) -> str:
     return assessments[0]["id"]
 
 
-def resolve_representative_id(representative_email_or_id: str) -> str:
+@cached_resolver
+async def resolve_representative_id(representative_email_or_id: str) -> str:
     """Helper function to resolve representative email to UUID
     If already a UUID, returns it. If an email, looks it up via API.
     """
@@ -610,7 +662,7 @@ def resolve_representative_id(representative_email_or_id: str) -> str:
         return representative_email_or_id
 
     # Search by email since that's the unique identifier for representatives
-    res = make_get_request(
+    res = await make_get_request(
         "/representatives/", params={"search": representative_email_or_id}
     )
 
@@ -638,14 +690,17 @@ def resolve_representative_id(representative_email_or_id: str) -> str:
 # ============================================================================
 
 
-def resolve_ebios_rm_study_id(study_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_ebios_rm_study_id(study_name_or_id: str) -> str:
     """Helper function to resolve EBIOS RM study name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in study_name_or_id and len(study_name_or_id) == 36:
         return study_name_or_id
 
-    res = make_get_request("/ebios-rm/studies/", params={"name": study_name_or_id})
+    res = await make_get_request(
+        "/ebios-rm/studies/", params={"name": study_name_or_id}
+    )
 
     if res.status_code != 200:
         raise ValueError(
@@ -666,14 +721,15 @@ def resolve_ebios_rm_study_id(study_name_or_id: str) -> str:
     return studies[0]["id"]
 
 
-def resolve_feared_event_id(feared_event_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_feared_event_id(feared_event_name_or_id: str) -> str:
     """Helper function to resolve feared event name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in feared_event_name_or_id and len(feared_event_name_or_id) == 36:
         return feared_event_name_or_id
 
-    res = make_get_request(
+    res = await make_get_request(
         "/ebios-rm/feared-events/", params={"name": feared_event_name_or_id}
     )
 
@@ -696,7 +752,8 @@ def resolve_feared_event_id(feared_event_name_or_id: str) -> str:
     return feared_events[0]["id"]
 
 
-def resolve_ro_to_id(ro_to_id: str) -> str:
+@cached_resolver
+async def resolve_ro_to_id(ro_to_id: str) -> str:
     """Helper function to resolve RoTo couple ID
     RoTo couples don't have names, so only UUIDs are accepted.
     """
@@ -706,7 +763,8 @@ def resolve_ro_to_id(ro_to_id: str) -> str:
     raise ValueError(f"RoTo couple '{ro_to_id}' is not a valid UUID")
 
 
-def resolve_stakeholder_id(stakeholder_id: str) -> str:
+@cached_resolver
+async def resolve_stakeholder_id(stakeholder_id: str) -> str:
     """Helper function to resolve stakeholder ID
     Stakeholders are identified by entity+category, so only UUIDs are accepted.
     """
@@ -716,14 +774,15 @@ def resolve_stakeholder_id(stakeholder_id: str) -> str:
     raise ValueError(f"Stakeholder '{stakeholder_id}' is not a valid UUID")
 
 
-def resolve_strategic_scenario_id(scenario_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_strategic_scenario_id(scenario_name_or_id: str) -> str:
     """Helper function to resolve strategic scenario name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in scenario_name_or_id and len(scenario_name_or_id) == 36:
         return scenario_name_or_id
 
-    res = make_get_request(
+    res = await make_get_request(
         "/ebios-rm/strategic-scenarios/", params={"name": scenario_name_or_id}
     )
 
@@ -746,14 +805,15 @@ def resolve_strategic_scenario_id(scenario_name_or_id: str) -> str:
     return scenarios[0]["id"]
 
 
-def resolve_attack_path_id(attack_path_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_attack_path_id(attack_path_name_or_id: str) -> str:
     """Helper function to resolve attack path name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in attack_path_name_or_id and len(attack_path_name_or_id) == 36:
         return attack_path_name_or_id
 
-    res = make_get_request(
+    res = await make_get_request(
         "/ebios-rm/attack-paths/", params={"name": attack_path_name_or_id}
     )
 
@@ -776,7 +836,8 @@ def resolve_attack_path_id(attack_path_name_or_id: str) -> str:
     return attack_paths[0]["id"]
 
 
-def resolve_operational_scenario_id(scenario_id: str) -> str:
+@cached_resolver
+async def resolve_operational_scenario_id(scenario_id: str) -> str:
     """Helper function to resolve operational scenario ID
     Operational scenarios derive their name from attack paths, so only UUIDs are accepted.
     """
@@ -786,14 +847,15 @@ def resolve_operational_scenario_id(scenario_id: str) -> str:
     raise ValueError(f"Operational scenario '{scenario_id}' is not a valid UUID")
 
 
-def resolve_elementary_action_id(action_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_elementary_action_id(action_name_or_id: str) -> str:
     """Helper function to resolve elementary action name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in action_name_or_id and len(action_name_or_id) == 36:
         return action_name_or_id
 
-    res = make_get_request(
+    res = await make_get_request(
         "/ebios-rm/elementary-actions/", params={"name": action_name_or_id}
     )
 
@@ -816,14 +878,15 @@ def resolve_elementary_action_id(action_name_or_id: str) -> str:
     return actions[0]["id"]
 
 
-def resolve_operating_mode_id(mode_name_or_id: str) -> str:
+@cached_resolver
+async def resolve_operating_mode_id(mode_name_or_id: str) -> str:
     """Helper function to resolve operating mode name to UUID
     If already a UUID, returns it. If a name, looks it up via API.
     """
     if "-" in mode_name_or_id and len(mode_name_or_id) == 36:
         return mode_name_or_id
 
-    res = make_get_request(
+    res = await make_get_request(
         "/ebios-rm/operating-modes/", params={"name": mode_name_or_id}
     )
 
@@ -846,7 +909,8 @@ def resolve_operating_mode_id(mode_name_or_id: str) -> str:
     return modes[0]["id"]
 
 
-def resolve_kill_chain_id(kill_chain_id: str) -> str:
+@cached_resolver
+async def resolve_kill_chain_id(kill_chain_id: str) -> str:
     """Helper function to resolve kill chain step ID
     Kill chain steps don't have names, so only UUIDs are accepted.
     """
@@ -30,16 +30,18 @@ async def get_all_audits_with_metrics(
 
         params = {}
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
         if perimeter:
-            params["perimeter"] = resolve_perimeter_id(perimeter)
+            params["perimeter"] = await resolve_perimeter_id(perimeter)
         if status:
             params["status"] = status
         if framework:
-            params["framework"] = resolve_framework_id(framework)
+            params["framework"] = await resolve_framework_id(framework)
 
         # Get compliance assessments (with pagination)
-        audits, error = fetch_all_results("/compliance-assessments/", params=params)
+        audits, error = await fetch_all_results(
+            "/compliance-assessments/", params=params
+        )
         if error:
             return error
 
@@ -59,7 +61,7 @@ async def get_all_audits_with_metrics(
             domain = (audit.get("folder") or {}).get("str", "N/A")
 
             # Fetch requirements for this specific audit
-            requirements, req_error = fetch_all_results(
+            requirements, req_error = await fetch_all_results(
                 "/requirement-assessments/",
                 params={"compliance_assessment": audit_id},
             )
@@ -123,7 +125,7 @@ async def get_audit_gap_analysis(audit_name: str):
 
     # Resolve audit name to ID
     try:
-        audit_id = resolve_compliance_assessment_id(audit_name)
+        audit_id = await resolve_compliance_assessment_id(audit_name)
     except ValueError as e:
         return error_response(
             "Not Found",
@@ -133,7 +135,7 @@ async def get_audit_gap_analysis(audit_name: str):
         )
 
     # Fetch the audit details
-    audit_res = make_get_request(f"/compliance-assessments/{audit_id}/")
+    audit_res = await make_get_request(f"/compliance-assessments/{audit_id}/")
     if audit_res.status_code != 200:
         return error_response(
             "API Error",
@@ -146,7 +148,9 @@ async def get_audit_gap_analysis(audit_name: str):
 
     # Get all requirement assessments for this compliance assessment (with pagination)
     params = {"compliance_assessment": audit["id"]}
-    requirements, error = fetch_all_results("/requirement-assessments/", params=params)
+    requirements, error = await fetch_all_results(
+        "/requirement-assessments/", params=params
+    )
 
     if error:
         return error_response(
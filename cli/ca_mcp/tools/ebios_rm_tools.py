@@ -21,6 +21,7 @@ from ..resolvers import (
     resolve_risk_matrix_id,
     resolve_asset_id,
     resolve_entity_id,
+    resolve_many,
 )
 from ..utils.response_formatter import (
     success_response,
@@ -81,7 +82,7 @@ def _find_terminology_match(terminologies: list, user_input: str) -> dict | None
     return None
 
 
-def _resolve_or_create_risk_origin(risk_origin_input: str) -> tuple[str, bool]:
+async def _resolve_or_create_risk_origin(risk_origin_input: str) -> tuple[str, bool]:
     """Resolve a risk origin terminology by smart matching, or create a new one.
 
     Args:
@@ -91,7 +92,7 @@ def _resolve_or_create_risk_origin(risk_origin_input: str) -> tuple[str, bool]:
         Tuple of (terminology_id, was_created)
     """
     # Fetch all risk origin terminologies
-    res = make_get_request(
+    res = await make_get_request(
         "/terminologies/",
         params={"field_path": "ro_to.risk_origin", "is_visible": "true"},
     )
@@ -129,7 +130,7 @@ def _resolve_or_create_risk_origin(risk_origin_input: str) -> tuple[str, bool]:
         },
     }
 
-    create_res = make_post_request("/terminologies/", create_payload)
+    create_res = await make_post_request("/terminologies/", create_payload)
     if create_res.status_code == 201:
         new_term = create_res.json()
         return new_term["id"], True
@@ -139,7 +140,9 @@ def _resolve_or_create_risk_origin(risk_origin_input: str) -> tuple[str, bool]:
         )
 
 
-def _resolve_or_create_stakeholder_category(category_input: str) -> tuple[str, bool]:
+async def _resolve_or_create_stakeholder_category(
+    category_input: str,
+) -> tuple[str, bool]:
     """Resolve a stakeholder category terminology by smart matching, or create a new one.
 
     Args:
@@ -149,7 +152,7 @@ def _resolve_or_create_stakeholder_category(category_input: str) -> tuple[str, b
         Tuple of (terminology_id, was_created)
     """
     # Fetch all entity relationship terminologies
-    res = make_get_request(
+    res = await make_get_request(
         "/terminologies/",
         params={"field_path": "entity.relationship", "is_visible": "true"},
     )
@@ -183,7 +186,7 @@ def _resolve_or_create_stakeholder_category(category_input: str) -> tuple[str, b
         },
     }
 
-    create_res = make_post_request("/terminologies/", create_payload)
+    create_res = await make_post_request("/terminologies/", create_payload)
     if create_res.status_code == 201:
         new_term = create_res.json()
         return new_term["id"], True
@@ -215,14 +218,14 @@ async def get_ebios_rm_studies(
         filters = {}
 
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         if status:
             params["status"] = status
             filters["status"] = status
 
-        res = make_get_request("/ebios-rm/studies/", params=params)
+        res = await make_get_request("/ebios-rm/studies/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -287,14 +290,14 @@ async def get_feared_events(
         filters = {}
 
         if ebios_rm_study:
-            params["ebios_rm_study"] = resolve_ebios_rm_study_id(ebios_rm_study)
+            params["ebios_rm_study"] = await resolve_ebios_rm_study_id(ebios_rm_study)
             filters["ebios_rm_study"] = ebios_rm_study
 
         if is_selected is not None:
             params["is_selected"] = str(is_selected).lower()
             filters["is_selected"] = is_selected
 
-        res = make_get_request("/ebios-rm/feared-events/", params=params)
+        res = await make_get_request("/ebios-rm/feared-events/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -362,14 +365,14 @@ async def get_ro_to_couples(
         filters = {}
 
         if ebios_rm_study:
-            params["ebios_rm_study"] = resolve_ebios_rm_study_id(ebios_rm_study)
+            params["ebios_rm_study"] = await resolve_ebios_rm_study_id(ebios_rm_study)
             filters["ebios_rm_study"] = ebios_rm_study
 
         if is_selected is not None:
             params["is_selected"] = str(is_selected).lower()
             filters["is_selected"] = is_selected
 
-        res = make_get_request("/ebios-rm/ro-to/", params=params)
+        res = await make_get_request("/ebios-rm/ro-to/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -432,7 +435,7 @@ async def get_stakeholders(
         filters = {}
 
         if ebios_rm_study:
-            params["ebios_rm_study"] = resolve_ebios_rm_study_id(ebios_rm_study)
+            params["ebios_rm_study"] = await resolve_ebios_rm_study_id(ebios_rm_study)
             filters["ebios_rm_study"] = ebios_rm_study
 
         if is_selected is not None:
@@ -440,10 +443,10 @@ async def get_stakeholders(
             filters["is_selected"] = is_selected
 
         if entity:
-            params["entity"] = resolve_entity_id(entity)
+            params["entity"] = await resolve_entity_id(entity)
             filters["entity"] = entity
 
-        res = make_get_request("/ebios-rm/stakeholders/", params=params)
+        res = await make_get_request("/ebios-rm/stakeholders/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -499,10 +502,10 @@ async def get_strategic_scenarios(
         filters = {}
 
         if ebios_rm_study:
-            params["ebios_rm_study"] = resolve_ebios_rm_study_id(ebios_rm_study)
+            params["ebios_rm_study"] = await resolve_ebios_rm_study_id(ebios_rm_study)
             filters["ebios_rm_study"] = ebios_rm_study
 
-        res = make_get_request("/ebios-rm/strategic-scenarios/", params=params)
+        res = await make_get_request("/ebios-rm/strategic-scenarios/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -566,11 +569,11 @@ async def get_attack_paths(
         filters = {}
 
         if ebios_rm_study:
-            params["ebios_rm_study"] = resolve_ebios_rm_study_id(ebios_rm_study)
+            params["ebios_rm_study"] = await resolve_ebios_rm_study_id(ebios_rm_study)
             filters["ebios_rm_study"] = ebios_rm_study
 
         if strategic_scenario:
-            params["strategic_scenario"] = resolve_strategic_scenario_id(
+            params["strategic_scenario"] = await resolve_strategic_scenario_id(
                 strategic_scenario
             )
             filters["strategic_scenario"] = strategic_scenario
@@ -579,7 +582,7 @@ async def get_attack_paths(
             params["is_selected"] = str(is_selected).lower()
             filters["is_selected"] = is_selected
 
-        res = make_get_request("/ebios-rm/attack-paths/", params=params)
+        res = await make_get_request("/ebios-rm/attack-paths/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -636,10 +639,10 @@ async def get_operational_scenarios(
         filters = {}
 
         if ebios_rm_study:
-            params["ebios_rm_study"] = resolve_ebios_rm_study_id(ebios_rm_study)
+            params["ebios_rm_study"] = await resolve_ebios_rm_study_id(ebios_rm_study)
             filters["ebios_rm_study"] = ebios_rm_study
 
-        res = make_get_request("/ebios-rm/operational-scenarios/", params=params)
+        res = await make_get_request("/ebios-rm/operational-scenarios/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -715,10 +718,10 @@ async def get_elementary_actions(
         filters = {}
 
         if operating_mode:
-            params["operating_modes"] = resolve_operating_mode_id(operating_mode)
+            params["operating_modes"] = await resolve_operating_mode_id(operating_mode)
             filters["operating_mode"] = operating_mode
 
-        res = make_get_request("/ebios-rm/elementary-actions/", params=params)
+        res = await make_get_request("/ebios-rm/elementary-actions/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -773,12 +776,12 @@ async def get_operating_modes(
         filters = {}
 
         if operational_scenario:
-            params["operational_scenario"] = resolve_operational_scenario_id(
+            params["operational_scenario"] = await resolve_operational_scenario_id(
                 operational_scenario
             )
             filters["operational_scenario"] = operational_scenario
 
-        res = make_get_request("/ebios-rm/operating-modes/", params=params)
+        res = await make_get_request("/ebios-rm/operating-modes/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -845,9 +848,9 @@ async def get_kill_chains(
         operating_mode: Operating mode ID (required)
     """
     try:
-        operating_mode_id = resolve_operating_mode_id(operating_mode)
+        operating_mode_id = await resolve_operating_mode_id(operating_mode)
 
-        res = make_get_request(
+        res = await make_get_request(
             "/ebios-rm/kill-chains/",
             params={"operating_mode": operating_mode_id},
         )
@@ -953,8 +956,8 @@ async def create_ebios_rm_study(
     try:
         from ..resolvers import resolve_compliance_assessment_id
 
-        folder_id = resolve_folder_id(folder_id)
-        risk_matrix_id = resolve_risk_matrix_id(risk_matrix_id)
+        folder_id = await resolve_folder_id(folder_id)
+        risk_matrix_id = await resolve_risk_matrix_id(risk_matrix_id)
 
         payload = {
             "name": name,
@@ -969,23 +972,19 @@ async def create_ebios_rm_study(
             payload["ref_id"] = ref_id
 
         if reference_entity_id:
-            payload["reference_entity"] = resolve_entity_id(reference_entity_id)
+            payload["reference_entity"] = await resolve_entity_id(reference_entity_id)
 
         if assets:
-            resolved_assets = []
-            for asset in assets:
-                resolved_assets.append(resolve_asset_id(asset))
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         if compliance_assessments:
-            resolved_assessments = []
-            for assessment in compliance_assessments:
-                resolved_assessments.append(
-                    resolve_compliance_assessment_id(assessment)
-                )
+            resolved_assessments = await resolve_many(
+                resolve_compliance_assessment_id, compliance_assessments
+            )
             payload["compliance_assessments"] = resolved_assessments
 
-        res = make_post_request("/ebios-rm/studies/", payload)
+        res = await make_post_request("/ebios-rm/studies/", payload)
 
         if res.status_code == 201:
             study = res.json()
@@ -1033,7 +1032,7 @@ async def create_feared_event(
         assets: List of asset IDs/names affected by this feared event
     """
     try:
-        ebios_rm_study_id = resolve_ebios_rm_study_id(ebios_rm_study_id)
+        ebios_rm_study_id = await resolve_ebios_rm_study_id(ebios_rm_study_id)
 
         payload = {
             "name": name,
@@ -1048,12 +1047,10 @@ async def create_feared_event(
             payload["ref_id"] = ref_id
 
         if assets:
-            resolved_assets = []
-            for asset in assets:
-                resolved_assets.append(resolve_asset_id(asset))
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
-        res = make_post_request("/ebios-rm/feared-events/", payload)
+        res = await make_post_request("/ebios-rm/feared-events/", payload)
 
         if res.status_code == 201:
             fe = res.json()
@@ -1100,11 +1097,11 @@ async def create_ro_to_couple(
         feared_events: List of feared event IDs/names to link
     """
     try:
-        ebios_rm_study_id = resolve_ebios_rm_study_id(ebios_rm_study_id)
+        ebios_rm_study_id = await resolve_ebios_rm_study_id(ebios_rm_study_id)
 
         # Smart resolve risk origin: matches against name, translations, case/plural insensitive
         # Creates new terminology if no match found
-        risk_origin_id, was_created = _resolve_or_create_risk_origin(risk_origin)
+        risk_origin_id, was_created = await _resolve_or_create_risk_origin(risk_origin)
 
         payload = {
             "ebios_rm_study": ebios_rm_study_id,
@@ -1118,12 +1115,12 @@ async def create_ro_to_couple(
         }
 
         if feared_events:
-            resolved_feared_events = []
-            for fe in feared_events:
-                resolved_feared_events.append(resolve_feared_event_id(fe))
+            resolved_feared_events = await resolve_many(
+                resolve_feared_event_id, feared_events
+            )
             payload["feared_events"] = resolved_feared_events
 
-        res = make_post_request("/ebios-rm/ro-to/", payload)
+        res = await make_post_request("/ebios-rm/ro-to/", payload)
 
         if res.status_code == 201:
             roto = res.json()
@@ -1173,12 +1170,14 @@ async def create_stakeholder(
         justification: Justification for selection/deselection
     """
     try:
-        ebios_rm_study_id = resolve_ebios_rm_study_id(ebios_rm_study_id)
-        entity_id = resolve_entity_id(entity_id)
+        ebios_rm_study_id = await resolve_ebios_rm_study_id(ebios_rm_study_id)
+        entity_id = await resolve_entity_id(entity_id)
 
         # Smart resolve category: matches against name, translations, case/plural insensitive
         # Creates new terminology if no match found
-        category_id, was_created = _resolve_or_create_stakeholder_category(category)
+        category_id, was_created = await _resolve_or_create_stakeholder_category(
+            category
+        )
 
         payload = {
             "ebios_rm_study": ebios_rm_study_id,
@@ -1192,7 +1191,7 @@ async def create_stakeholder(
             "justification": justification,
         }
 
-        res = make_post_request("/ebios-rm/stakeholders/", payload)
+        res = await make_post_request("/ebios-rm/stakeholders/", payload)
 
         if res.status_code == 201:
             sh = res.json()
@@ -1233,8 +1232,8 @@ async def create_strategic_scenario(
         ref_id: Reference ID
     """
     try:
-        ebios_rm_study_id = resolve_ebios_rm_study_id(ebios_rm_study_id)
-        ro_to_couple_id = resolve_ro_to_id(ro_to_couple_id)
+        ebios_rm_study_id = await resolve_ebios_rm_study_id(ebios_rm_study_id)
+        ro_to_couple_id = await resolve_ro_to_id(ro_to_couple_id)
 
         payload = {
             "name": name,
@@ -1246,7 +1245,7 @@ async def create_strategic_scenario(
         if ref_id:
             payload["ref_id"] = ref_id
 
-        res = make_post_request("/ebios-rm/strategic-scenarios/", payload)
+        res = await make_post_request("/ebios-rm/strategic-scenarios/", payload)
 
         if res.status_code == 201:
             scenario = res.json()
@@ -1290,10 +1289,12 @@ async def create_attack_path(
         stakeholders: List of stakeholder IDs to link
     """
     try:
-        strategic_scenario_id = resolve_strategic_scenario_id(strategic_scenario_id)
+        strategic_scenario_id = await resolve_strategic_scenario_id(
+            strategic_scenario_id
+        )
 
         # Fetch the strategic scenario to get its ebios_rm_study (required by serializer)
-        scenario_res = make_get_request(
+        scenario_res = await make_get_request(
             f"/ebios-rm/strategic-scenarios/{strategic_scenario_id}/"
         )
         if scenario_res.status_code != 200:
@@ -1323,12 +1324,12 @@ async def create_attack_path(
             payload["ref_id"] = ref_id
 
         if stakeholders:
-            resolved_stakeholders = []
-            for sh in stakeholders:
-                resolved_stakeholders.append(resolve_stakeholder_id(sh))
+            resolved_stakeholders = await resolve_many(
+                resolve_stakeholder_id, stakeholders
+            )
             payload["stakeholders"] = resolved_stakeholders
 
-        res = make_post_request("/ebios-rm/attack-paths/", payload)
+        res = await make_post_request("/ebios-rm/attack-paths/", payload)
 
         if res.status_code == 201:
             ap = res.json()
@@ -1374,8 +1375,8 @@ async def create_operational_scenario(
     try:
         from ..resolvers import resolve_id_or_name
 
-        ebios_rm_study_id = resolve_ebios_rm_study_id(ebios_rm_study_id)
-        attack_path_id = resolve_attack_path_id(attack_path_id)
+        ebios_rm_study_id = await resolve_ebios_rm_study_id(ebios_rm_study_id)
+        attack_path_id = await resolve_attack_path_id(attack_path_id)
 
         payload = {
             "ebios_rm_study": ebios_rm_study_id,
@@ -1387,12 +1388,12 @@ async def create_operational_scenario(
         }
 
         if threats:
-            resolved_threats = []
-            for threat in threats:
-                resolved_threats.append(resolve_id_or_name(threat, "/threats/"))
+            resolved_threats = await resolve_many(
+                resolve_id_or_name, threats, "/threats/"
+            )
             payload["threats"] = resolved_threats
 
-        res = make_post_request("/ebios-rm/operational-scenarios/", payload)
+        res = await make_post_request("/ebios-rm/operational-scenarios/", payload)
 
         if res.status_code == 201:
             scenario = res.json()
@@ -1438,7 +1439,7 @@ async def create_elementary_action(
     try:
         from ..resolvers import resolve_id_or_name
 
-        folder_id = resolve_folder_id(folder_id)
+        folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -1454,9 +1455,9 @@ async def create_elementary_action(
             payload["icon"] = icon
 
         if threat_id:
-            payload["threat"] = resolve_id_or_name(threat_id, "/threats/")
+            payload["threat"] = await resolve_id_or_name(threat_id, "/threats/")
 
-        res = make_post_request("/ebios-rm/elementary-actions/", payload)
+        res = await make_post_request("/ebios-rm/elementary-actions/", payload)
 
         if res.status_code == 201:
             action = res.json()
@@ -1498,7 +1499,7 @@ async def create_operating_mode(
         elementary_actions: List of elementary action IDs/names to include
     """
     try:
-        operational_scenario_id = resolve_operational_scenario_id(
+        operational_scenario_id = await resolve_operational_scenario_id(
             operational_scenario_id
         )
 
@@ -1513,12 +1514,12 @@ async def create_operating_mode(
             payload["ref_id"] = ref_id
 
         if elementary_actions:
-            resolved_actions = []
-            for action in elementary_actions:
-                resolved_actions.append(resolve_elementary_action_id(action))
+            resolved_actions = await resolve_many(
+                resolve_elementary_action_id, elementary_actions
+            )
             payload["elementary_actions"] = resolved_actions
 
-        res = make_post_request("/ebios-rm/operating-modes/", payload)
+        res = await make_post_request("/ebios-rm/operating-modes/", payload)
 
         if res.status_code == 201:
             mode = res.json()
@@ -1571,11 +1572,11 @@ async def create_kill_chain_step(
                      (Must already be kill chain steps, stage must be <= this action's stage)
     """
     try:
-        operating_mode_id = resolve_operating_mode_id(operating_mode_id)
-        elementary_action_id = resolve_elementary_action_id(elementary_action_id)
+        operating_mode_id = await resolve_operating_mode_id(operating_mode_id)
+        elementary_action_id = await resolve_elementary_action_id(elementary_action_id)
 
         # Fetch the elementary action to get its attack stage for validation hints
-        action_res = make_get_request(
+        action_res = await make_get_request(
             f"/ebios-rm/elementary-actions/{elementary_action_id}/"
         )
         if action_res.status_code != 200:
@@ -1606,12 +1607,12 @@ async def create_kill_chain_step(
             payload["logic_operator"] = logic_operator
 
         if antecedents:
-            resolved_antecedents = []
-            for ant in antecedents:
-                resolved_antecedents.append(resolve_elementary_action_id(ant))
+            resolved_antecedents = await resolve_many(
+                resolve_elementary_action_id, antecedents
+            )
             payload["antecedents"] = resolved_antecedents
 
-        res = make_post_request("/ebios-rm/kill-chains/", payload)
+        res = await make_post_request("/ebios-rm/kill-chains/", payload)
 
         if res.status_code == 201:
             kc = res.json()
@@ -1671,7 +1672,7 @@ async def update_ebios_rm_study(
     try:
         from ..resolvers import resolve_compliance_assessment_id
 
-        resolved_study_id = resolve_ebios_rm_study_id(study_id)
+        resolved_study_id = await resolve_ebios_rm_study_id(study_id)
 
         payload = {}
 
@@ -1689,23 +1690,21 @@ async def update_ebios_rm_study(
             payload["observation"] = observation
 
         if assets is not None:
-            resolved_assets = []
-            for asset in assets:
-                resolved_assets.append(resolve_asset_id(asset))
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         if compliance_assessments is not None:
-            resolved_assessments = []
-            for assessment in compliance_assessments:
-                resolved_assessments.append(
-                    resolve_compliance_assessment_id(assessment)
-                )
+            resolved_assessments = await resolve_many(
+                resolve_compliance_assessment_id, compliance_assessments
+            )
             payload["compliance_assessments"] = resolved_assessments
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/ebios-rm/studies/{resolved_study_id}/", payload)
+        res = await make_patch_request(
+            f"/ebios-rm/studies/{resolved_study_id}/", payload
+        )
 
         if res.status_code == 200:
             study = res.json()
@@ -1753,7 +1752,7 @@ async def update_feared_event(
         assets: List of asset IDs/names (replaces existing)
     """
     try:
-        resolved_fe_id = resolve_feared_event_id(feared_event_id)
+        resolved_fe_id = await resolve_feared_event_id(feared_event_id)
 
         payload = {}
 
@@ -1771,15 +1770,15 @@ async def update_feared_event(
             payload["justification"] = justification
 
         if assets is not None:
-            resolved_assets = []
-            for asset in assets:
-                resolved_assets.append(resolve_asset_id(asset))
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/ebios-rm/feared-events/{resolved_fe_id}/", payload)
+        res = await make_patch_request(
+            f"/ebios-rm/feared-events/{resolved_fe_id}/", payload
+        )
 
         if res.status_code == 200:
             fe = res.json()
@@ -1822,7 +1821,7 @@ async def update_ro_to_couple(
         feared_events: List of feared event IDs/names (replaces existing)
     """
     try:
-        resolved_roto_id = resolve_ro_to_id(ro_to_id)
+        resolved_roto_id = await resolve_ro_to_id(ro_to_id)
 
         payload = {}
 
@@ -1840,15 +1839,15 @@ async def update_ro_to_couple(
             payload["justification"] = justification
 
         if feared_events is not None:
-            resolved_feared_events = []
-            for fe in feared_events:
-                resolved_feared_events.append(resolve_feared_event_id(fe))
+            resolved_feared_events = await resolve_many(
+                resolve_feared_event_id, feared_events
+            )
             payload["feared_events"] = resolved_feared_events
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/ebios-rm/ro-to/{resolved_roto_id}/", payload)
+        res = await make_patch_request(f"/ebios-rm/ro-to/{resolved_roto_id}/", payload)
 
         if res.status_code == 200:
             roto = res.json()
@@ -1901,7 +1900,7 @@ async def update_stakeholder(
     try:
         from ..resolvers import resolve_applied_control_id
 
-        resolved_sh_id = resolve_stakeholder_id(stakeholder_id)
+        resolved_sh_id = await resolve_stakeholder_id(stakeholder_id)
 
         payload = {}
 
@@ -1927,15 +1926,17 @@ async def update_stakeholder(
             payload["justification"] = justification
 
         if applied_controls is not None:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_controls.append(resolve_applied_control_id(control))
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/ebios-rm/stakeholders/{resolved_sh_id}/", payload)
+        res = await make_patch_request(
+            f"/ebios-rm/stakeholders/{resolved_sh_id}/", payload
+        )
 
         if res.status_code == 200:
             sh = res.json()
@@ -1972,7 +1973,7 @@ async def update_strategic_scenario(
         focused_feared_event_id: Feared event ID to focus gravity calculation on
     """
     try:
-        resolved_scenario_id = resolve_strategic_scenario_id(scenario_id)
+        resolved_scenario_id = await resolve_strategic_scenario_id(scenario_id)
 
         payload = {}
 
@@ -1983,14 +1984,14 @@ async def update_strategic_scenario(
         if ref_id is not None:
             payload["ref_id"] = ref_id
         if focused_feared_event_id is not None:
-            payload["focused_feared_event"] = resolve_feared_event_id(
+            payload["focused_feared_event"] = await resolve_feared_event_id(
                 focused_feared_event_id
             )
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/ebios-rm/strategic-scenarios/{resolved_scenario_id}/", payload
         )
 
@@ -2033,7 +2034,7 @@ async def update_attack_path(
         stakeholders: List of stakeholder IDs (replaces existing)
     """
     try:
-        resolved_ap_id = resolve_attack_path_id(attack_path_id)
+        resolved_ap_id = await resolve_attack_path_id(attack_path_id)
 
         payload = {}
 
@@ -2049,15 +2050,17 @@ async def update_attack_path(
             payload["justification"] = justification
 
         if stakeholders is not None:
-            resolved_stakeholders = []
-            for sh in stakeholders:
-                resolved_stakeholders.append(resolve_stakeholder_id(sh))
+            resolved_stakeholders = await resolve_many(
+                resolve_stakeholder_id, stakeholders
+            )
             payload["stakeholders"] = resolved_stakeholders
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/ebios-rm/attack-paths/{resolved_ap_id}/", payload)
+        res = await make_patch_request(
+            f"/ebios-rm/attack-paths/{resolved_ap_id}/", payload
+        )
 
         if res.status_code == 200:
             ap = res.json()
@@ -2098,7 +2101,7 @@ async def update_operational_scenario(
     try:
         from ..resolvers import resolve_id_or_name
 
-        resolved_scenario_id = resolve_operational_scenario_id(scenario_id)
+        resolved_scenario_id = await resolve_operational_scenario_id(scenario_id)
 
         payload = {}
 
@@ -2112,15 +2115,15 @@ async def update_operational_scenario(
             payload["justification"] = justification
 
         if threats is not None:
-            resolved_threats = []
-            for threat in threats:
-                resolved_threats.append(resolve_id_or_name(threat, "/threats/"))
+            resolved_threats = await resolve_many(
+                resolve_id_or_name, threats, "/threats/"
+            )
             payload["threats"] = resolved_threats
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/ebios-rm/operational-scenarios/{resolved_scenario_id}/", payload
         )
 
@@ -2166,7 +2169,7 @@ async def update_operating_mode(
                             This is the first step before creating kill chain steps.
     """
     try:
-        resolved_mode_id = resolve_operating_mode_id(mode_id)
+        resolved_mode_id = await resolve_operating_mode_id(mode_id)
 
         payload = {}
 
@@ -2180,15 +2183,15 @@ async def update_operating_mode(
             payload["likelihood"] = likelihood
 
         if elementary_actions is not None:
-            resolved_actions = []
-            for action in elementary_actions:
-                resolved_actions.append(resolve_elementary_action_id(action))
+            resolved_actions = await resolve_many(
+                resolve_elementary_action_id, elementary_actions
+            )
             payload["elementary_actions"] = resolved_actions
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/ebios-rm/operating-modes/{resolved_mode_id}/", payload
         )
 
@@ -2236,10 +2239,10 @@ async def update_kill_chain_step(
                      (Must already be kill chain steps, stage must be <= this action's stage)
     """
     try:
-        resolved_kc_id = resolve_kill_chain_id(kill_chain_id)
+        resolved_kc_id = await resolve_kill_chain_id(kill_chain_id)
 
         # Fetch the kill chain step to get its elementary action's attack stage
-        kc_res = make_get_request(f"/ebios-rm/kill-chains/{resolved_kc_id}/")
+        kc_res = await make_get_request(f"/ebios-rm/kill-chains/{resolved_kc_id}/")
         if kc_res.status_code != 200:
             return http_error_response(kc_res.status_code, kc_res.text)
 
@@ -2267,15 +2270,17 @@ async def update_kill_chain_step(
             payload["logic_operator"] = logic_operator
 
         if antecedents is not None:
-            resolved_antecedents = []
-            for ant in antecedents:
-                resolved_antecedents.append(resolve_elementary_action_id(ant))
+            resolved_antecedents = await resolve_many(
+                resolve_elementary_action_id, antecedents
+            )
             payload["antecedents"] = resolved_antecedents
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/ebios-rm/kill-chains/{resolved_kc_id}/", payload)
+        res = await make_patch_request(
+            f"/ebios-rm/kill-chains/{resolved_kc_id}/", payload
+        )
 
         if res.status_code == 200:
             kc = res.json()
@@ -21,7 +21,7 @@ async def get_stored_libraries(
             params["provider"] = provider
 
         # Fetch all stored libraries (with pagination)
-        libraries, error = fetch_all_results("/stored-libraries/", params=params)
+        libraries, error = await fetch_all_results("/stored-libraries/", params=params)
         if error:
             return error
 
@@ -49,7 +49,7 @@ async def get_loaded_libraries():
     """List loaded/imported libraries (frameworks) activated in the system"""
     try:
         # Fetch all loaded libraries (with pagination)
-        libraries, error = fetch_all_results("/loaded-libraries/")
+        libraries, error = await fetch_all_results("/loaded-libraries/")
         if error:
             return error
 
@@ -80,7 +80,7 @@ async def import_stored_library(urn_or_id: str) -> str:
         urn_or_id: Library URN/ID (e.g. "urn:intuitem:risk:library:nist-csf-2.0")
     """
     try:
-        res = make_post_request(f"/stored-libraries/{urn_or_id}/import/", {})
+        res = await make_post_request(f"/stored-libraries/{urn_or_id}/import/", {})
 
         if res.status_code == 200:
             result = res.json()
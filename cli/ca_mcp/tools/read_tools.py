@@ -3,7 +3,7 @@
 import json
 import sys
 from rich import print as rprint
-from ..client import make_get_request, get_paginated_results
+from ..client import make_get_request, get_paginated_results, fetch_page
 from ..utils.response_formatter import (
     success_response,
     error_response,
@@ -27,15 +27,17 @@ async def get_risk_scenarios(folder: str = None, risk_assessment: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         # Add risk assessment filter if specified - resolve name to ID if needed
         if risk_assessment:
-            params["risk_assessment"] = resolve_risk_assessment_id(risk_assessment)
+            params["risk_assessment"] = await resolve_risk_assessment_id(
+                risk_assessment
+            )
             filters["risk_assessment"] = risk_assessment
 
-        res = make_get_request("/risk-scenarios/", params=params)
+        res = await make_get_request("/risk-scenarios/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -123,10 +125,10 @@ async def get_applied_controls(folder: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
-        res = make_get_request("/applied-controls/", params=params)
+        res = await make_get_request("/applied-controls/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -209,12 +211,12 @@ async def get_audits_progress(
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         # Add perimeter filter if specified - resolve name to ID if needed
         if perimeter:
-            params["perimeter"] = resolve_perimeter_id(perimeter)
+            params["perimeter"] = await resolve_perimeter_id(perimeter)
             filters["perimeter"] = perimeter
 
         if status:
@@ -222,10 +224,10 @@ async def get_audits_progress(
             filters["status"] = status
 
         if framework:
-            params["framework"] = resolve_framework_id(framework)
+            params["framework"] = await resolve_framework_id(framework)
             filters["framework"] = framework
 
-        res = make_get_request("/compliance-assessments/", params=params)
+        res = await make_get_request("/compliance-assessments/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -286,7 +288,7 @@ async def get_folders(name: str = None):
             params["name"] = name
             filters["name"] = name
 
-        res = make_get_request("/folders/", params=params)
+        res = await make_get_request("/folders/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -341,7 +343,7 @@ async def get_perimeters(folder: str = None, name: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         # Add name filter if specified
@@ -349,7 +351,7 @@ async def get_perimeters(folder: str = None, name: str = None):
             params["name"] = name
             filters["name"] = name
 
-        res = make_get_request("/perimeters/", params=params)
+        res = await make_get_request("/perimeters/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -391,7 +393,7 @@ async def get_perimeters(folder: str = None, name: str = None):
 async def get_risk_matrices():
     """List risk matrices with IDs and names for creating risk assessments"""
     try:
-        res = make_get_request("/risk-matrices/")
+        res = await make_get_request("/risk-matrices/")
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -436,9 +438,9 @@ async def get_risk_matrix_details(matrix_id_or_name: str):
         from ..resolvers import resolve_risk_matrix_id
 
         # Resolve matrix name to ID if needed
-        matrix_id = resolve_risk_matrix_id(matrix_id_or_name)
+        matrix_id = await resolve_risk_matrix_id(matrix_id_or_name)
 
-        res = make_get_request(f"/risk-matrices/{matrix_id}/")
+        res = await make_get_request(f"/risk-matrices/{matrix_id}/")
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -561,13 +563,13 @@ async def get_risk_assessments(folder: str = None, perimeter: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
 
         # Add perimeter filter if specified - resolve name to ID if needed
         if perimeter:
-            params["perimeter"] = resolve_perimeter_id(perimeter)
+            params["perimeter"] = await resolve_perimeter_id(perimeter)
 
-        res = make_get_request("/risk-assessments/", params=params)
+        res = await make_get_request("/risk-assessments/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -623,28 +625,22 @@ async def get_threats(
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
 
         # Add library filter if specified - resolve URN to ID if needed
         if library:
-            params["library"] = resolve_library_id(library)
-
-        res = make_get_request("/threats/", params=params)
-
-        if res.status_code != 200:
-            return f"Error: HTTP {res.status_code} - {res.text}"
+            params["library"] = await resolve_library_id(library)
 
-        data = res.json()
-        threats = get_paginated_results(data)
+        # Only fetch the rows to display (0 means no limit)
+        threats, total_count, error = await fetch_page(
+            "/threats/", params=params, limit=limit if limit > 0 else None
+        )
+        if error:
+            return error
 
         if not threats:
             return "No threats found"
 
-        # Apply limit if specified (0 means no limit)
-        total_count = len(threats)
-        if limit > 0:
-            threats = threats[:limit]
-
         result = f"Found {len(threats)} of {total_count} threats"
         if provider:
             result += f" (provider: {provider})"
@@ -682,10 +678,10 @@ async def get_assets(folder: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
-        res = make_get_request("/assets/", params=params)
+        res = await make_get_request("/assets/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -738,9 +734,9 @@ async def get_incidents(folder: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
 
-        res = make_get_request("/incidents/", params=params)
+        res = await make_get_request("/incidents/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -785,9 +781,9 @@ async def get_security_exceptions(folder: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
 
-        res = make_get_request("/security-exceptions/", params=params)
+        res = await make_get_request("/security-exceptions/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -855,9 +851,9 @@ async def get_frameworks(folder: str = None):
 
         # Add folder filter if specified - resolve name to ID if needed
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
 
-        res = make_get_request("/frameworks/", params=params)
+        res = await make_get_request("/frameworks/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -903,9 +899,11 @@ async def get_business_impact_analyses(folder: str = None):
         # Add folder filter if specified - resolve name to ID if needed
         # Note: BIA filters by perimeter__folder, not folder directly
         if folder:
-            params["perimeter__folder"] = resolve_folder_id(folder)
+            params["perimeter__folder"] = await resolve_folder_id(folder)
 
-        res = make_get_request("/resilience/business-impact-analysis/", params=params)
+        res = await make_get_request(
+            "/resilience/business-impact-analysis/", params=params
+        )
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -964,7 +962,7 @@ async def get_requirement_assessments(
                 params["compliance_assessment"] = compliance_assessment_id_or_name
             else:
                 # Look up compliance assessment by name
-                ca_res = make_get_request(
+                ca_res = await make_get_request(
                     "/compliance-assessments/",
                     params={"name": compliance_assessment_id_or_name},
                 )
@@ -980,7 +978,7 @@ async def get_requirement_assessments(
         if ref_id:
             params["ref_id"] = ref_id
 
-        res = make_get_request("/requirement-assessments/", params=params)
+        res = await make_get_request("/requirement-assessments/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -1016,7 +1014,7 @@ async def get_requirement_assessments(
 async def get_quantitative_risk_studies():
     """List quantitative risk studies with IDs, names, and status"""
     try:
-        res = make_get_request("/crq/quantitative-risk-studies/")
+        res = await make_get_request("/crq/quantitative-risk-studies/")
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -1061,7 +1059,7 @@ async def get_quantitative_risk_scenarios(study_id_or_name: str = None):
                 params["quantitative_risk_study"] = study_id_or_name
             else:
                 # Look up study by name
-                study_res = make_get_request(
+                study_res = await make_get_request(
                     "/crq/quantitative-risk-studies/",
                     params={"name": study_id_or_name},
                 )
@@ -1073,7 +1071,7 @@ async def get_quantitative_risk_scenarios(study_id_or_name: str = None):
                     else:
                         return f"Quantitative risk study '{study_id_or_name}' not found"
 
-        res = make_get_request("/crq/quantitative-risk-scenarios/", params=params)
+        res = await make_get_request("/crq/quantitative-risk-scenarios/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -1123,7 +1121,7 @@ async def get_quantitative_risk_hypotheses(scenario_id_or_name: str = None):
                 params["quantitative_risk_scenario"] = scenario_id_or_name
             else:
                 # Look up scenario by name
-                scenario_res = make_get_request(
+                scenario_res = await make_get_request(
                     "/crq/quantitative-risk-scenarios/",
                     params={"name": scenario_id_or_name},
                 )
@@ -1135,7 +1133,9 @@ async def get_quantitative_risk_hypotheses(scenario_id_or_name: str = None):
                     else:
                         return f"Quantitative risk scenario '{scenario_id_or_name}' not found"
 
-        res = make_get_request("/crq/quantitative-risk-hypotheses/", params=params)
+        res = await make_get_request(
+            "/crq/quantitative-risk-hypotheses/", params=params
+        )
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -1192,7 +1192,7 @@ async def get_task_templates(
         if search:
             params["search"] = search
 
-        res = make_get_request("/task-templates/", params=params)
+        res = await make_get_request("/task-templates/", params=params)
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -1231,7 +1231,7 @@ async def get_task_template_details(task_id: str):
         task_id: Task template ID
     """
     try:
-        res = make_get_request(f"/task-templates/{task_id}/")
+        res = await make_get_request(f"/task-templates/{task_id}/")
 
         if res.status_code != 200:
             return f"Error: HTTP {res.status_code} - {res.text}"
@@ -1309,7 +1309,7 @@ async def get_vulnerabilities(
         filters = {}
 
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
         if status:
             params["status"] = status
@@ -1321,7 +1321,7 @@ async def get_vulnerabilities(
             params["search"] = search
             filters["search"] = search
 
-        res = make_get_request("/vulnerabilities/", params=params)
+        res = await make_get_request("/vulnerabilities/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -1376,8 +1376,8 @@ async def get_vulnerability(vulnerability_id: str):
     try:
         from ..resolvers import resolve_vulnerability_id
 
-        resolved_id = resolve_vulnerability_id(vulnerability_id)
-        res = make_get_request(f"/vulnerabilities/{resolved_id}/")
+        resolved_id = await resolve_vulnerability_id(vulnerability_id)
+        res = await make_get_request(f"/vulnerabilities/{resolved_id}/")
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
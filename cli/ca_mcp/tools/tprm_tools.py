@@ -13,6 +13,7 @@ from ..resolvers import (
     resolve_contract_id,
     resolve_entity_assessment_id,
     resolve_representative_id,
+    resolve_many,
 )
 from ..config import GLOBAL_FOLDER_ID
 from ..utils.response_formatter import (
@@ -45,7 +46,7 @@ async def get_entities(
         filters = {}
 
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         if is_active is not None:
@@ -56,7 +57,7 @@ async def get_entities(
             params["country"] = country
             filters["country"] = country
 
-        res = make_get_request("/entities/", params=params)
+        res = await make_get_request("/entities/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -120,11 +121,11 @@ async def get_entity_assessments(
         filters = {}
 
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         if entity:
-            params["entity"] = resolve_entity_id(entity)
+            params["entity"] = await resolve_entity_id(entity)
             filters["entity"] = entity
 
         if status:
@@ -135,7 +136,7 @@ async def get_entity_assessments(
             params["conclusion"] = conclusion
             filters["conclusion"] = conclusion
 
-        res = make_get_request("/entity-assessments/", params=params)
+        res = await make_get_request("/entity-assessments/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -190,10 +191,10 @@ async def get_representatives(entity: str = None):
         filters = {}
 
         if entity:
-            params["entity"] = resolve_entity_id(entity)
+            params["entity"] = await resolve_entity_id(entity)
             filters["entity"] = entity
 
-        res = make_get_request("/representatives/", params=params)
+        res = await make_get_request("/representatives/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -253,7 +254,7 @@ async def get_solutions(
         filters = {}
 
         if provider_entity:
-            params["provider_entity"] = resolve_entity_id(provider_entity)
+            params["provider_entity"] = await resolve_entity_id(provider_entity)
             filters["provider_entity"] = provider_entity
 
         if is_active is not None:
@@ -264,7 +265,7 @@ async def get_solutions(
             params["criticality"] = criticality
             filters["criticality"] = criticality
 
-        res = make_get_request("/solutions/", params=params)
+        res = await make_get_request("/solutions/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -326,22 +327,22 @@ async def get_contracts(
         filters = {}
 
         if folder:
-            params["folder"] = resolve_folder_id(folder)
+            params["folder"] = await resolve_folder_id(folder)
             filters["folder"] = folder
 
         if provider_entity:
-            params["provider_entity"] = resolve_entity_id(provider_entity)
+            params["provider_entity"] = await resolve_entity_id(provider_entity)
             filters["provider_entity"] = provider_entity
 
         if beneficiary_entity:
-            params["beneficiary_entity"] = resolve_entity_id(beneficiary_entity)
+            params["beneficiary_entity"] = await resolve_entity_id(beneficiary_entity)
             filters["beneficiary_entity"] = beneficiary_entity
 
         if status:
             params["status"] = status
             filters["status"] = status
 
-        res = make_get_request("/contracts/", params=params)
+        res = await make_get_request("/contracts/", params=params)
 
         if res.status_code != 200:
             return http_error_response(res.status_code, res.text)
@@ -423,7 +424,7 @@ async def create_entity(
         default_trust: Trust level 1-4
     """
     try:
-        folder_id = resolve_folder_id(folder_id)
+        folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -448,7 +449,7 @@ async def create_entity(
         payload["default_maturity"] = default_maturity
         payload["default_trust"] = default_trust
 
-        res = make_post_request("/entities/", payload)
+        res = await make_post_request("/entities/", payload)
 
         if res.status_code == 201:
             entity = res.json()
@@ -491,8 +492,8 @@ async def create_entity_assessment(
     try:
         from ..resolvers import resolve_perimeter_id
 
-        entity_id = resolve_entity_id(entity_id)
-        perimeter_id = resolve_perimeter_id(perimeter_id)
+        entity_id = await resolve_entity_id(entity_id)
+        perimeter_id = await resolve_perimeter_id(perimeter_id)
 
         payload = {
             "name": name,
@@ -506,7 +507,7 @@ async def create_entity_assessment(
         if conclusion:
             payload["conclusion"] = conclusion
 
-        res = make_post_request("/entity-assessments/", payload)
+        res = await make_post_request("/entity-assessments/", payload)
 
         if res.status_code == 201:
             assessment = res.json()
@@ -549,7 +550,7 @@ async def create_representative(
         ref_id: Reference ID
     """
     try:
-        entity_id = resolve_entity_id(entity_id)
+        entity_id = await resolve_entity_id(entity_id)
 
         payload = {
             "email": email,
@@ -569,7 +570,7 @@ async def create_representative(
         if ref_id:
             payload["ref_id"] = ref_id
 
-        res = make_post_request("/representatives/", payload)
+        res = await make_post_request("/representatives/", payload)
 
         if res.status_code == 201:
             rep = res.json()
@@ -612,7 +613,7 @@ async def create_solution(
     try:
         from ..resolvers import resolve_asset_id
 
-        provider_entity_id = resolve_entity_id(provider_entity_id)
+        provider_entity_id = await resolve_entity_id(provider_entity_id)
 
         payload = {
             "name": name,
@@ -628,13 +629,10 @@ async def create_solution(
             payload["reference_link"] = reference_link
 
         if assets:
-            resolved_assets = []
-            for asset in assets:
-                resolved_asset_id = resolve_asset_id(asset)
-                resolved_assets.append(resolved_asset_id)
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
-        res = make_post_request("/solutions/", payload)
+        res = await make_post_request("/solutions/", payload)
 
         if res.status_code == 201:
             solution = res.json()
@@ -688,8 +686,8 @@ async def create_contract(
         solutions: List of solution IDs/names to link
     """
     try:
-        provider_entity_id = resolve_entity_id(provider_entity_id)
-        folder_id = resolve_folder_id(folder_id)
+        provider_entity_id = await resolve_entity_id(provider_entity_id)
+        folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -711,13 +709,10 @@ async def create_contract(
             payload["annual_expense"] = annual_expense
 
         if solutions:
-            resolved_solutions = []
-            for solution in solutions:
-                resolved_solution_id = resolve_solution_id(solution)
-                resolved_solutions.append(resolved_solution_id)
+            resolved_solutions = await resolve_many(resolve_solution_id, solutions)
             payload["solutions"] = resolved_solutions
 
-        res = make_post_request("/contracts/", payload)
+        res = await make_post_request("/contracts/", payload)
 
         if res.status_code == 201:
             contract = res.json()
@@ -780,7 +775,7 @@ async def update_entity(
         default_trust: Trust level 1-4
     """
     try:
-        resolved_entity_id = resolve_entity_id(entity_id)
+        resolved_entity_id = await resolve_entity_id(entity_id)
 
         payload = {}
 
@@ -812,7 +807,7 @@ async def update_entity(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/entities/{resolved_entity_id}/", payload)
+        res = await make_patch_request(f"/entities/{resolved_entity_id}/", payload)
 
         if res.status_code == 200:
             entity = res.json()
@@ -859,7 +854,7 @@ async def update_entity_assessment(
         penetration: Penetration level (0-4)
     """
     try:
-        resolved_assessment_id = resolve_entity_assessment_id(assessment_id)
+        resolved_assessment_id = await resolve_entity_assessment_id(assessment_id)
 
         payload = {}
 
@@ -885,7 +880,7 @@ async def update_entity_assessment(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/entity-assessments/{resolved_assessment_id}/", payload
         )
 
@@ -928,7 +923,7 @@ async def update_representative(
         ref_id: New reference ID
     """
     try:
-        resolved_rep_id = resolve_representative_id(representative_id)
+        resolved_rep_id = await resolve_representative_id(representative_id)
 
         payload = {}
 
@@ -948,7 +943,7 @@ async def update_representative(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/representatives/{resolved_rep_id}/", payload)
+        res = await make_patch_request(f"/representatives/{resolved_rep_id}/", payload)
 
         if res.status_code == 200:
             rep = res.json()
@@ -993,7 +988,7 @@ async def update_solution(
     try:
         from ..resolvers import resolve_asset_id
 
-        resolved_solution_id = resolve_solution_id(solution_id)
+        resolved_solution_id = await resolve_solution_id(solution_id)
 
         payload = {}
 
@@ -1011,16 +1006,13 @@ async def update_solution(
             payload["criticality"] = criticality
 
         if assets is not None:
-            resolved_assets = []
-            for asset in assets:
-                resolved_asset_id = resolve_asset_id(asset)
-                resolved_assets.append(resolved_asset_id)
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/solutions/{resolved_solution_id}/", payload)
+        res = await make_patch_request(f"/solutions/{resolved_solution_id}/", payload)
 
         if res.status_code == 200:
             solution = res.json()
@@ -1067,7 +1059,7 @@ async def update_contract(
         solutions: List of solution IDs/names (replaces existing)
     """
     try:
-        resolved_contract_id = resolve_contract_id(contract_id)
+        resolved_contract_id = await resolve_contract_id(contract_id)
 
         payload = {}
 
@@ -1089,16 +1081,13 @@ async def update_contract(
             payload["annual_expense"] = annual_expense
 
         if solutions is not None:
-            resolved_solutions = []
-            for solution in solutions:
-                resolved_solution_id = resolve_solution_id(solution)
-                resolved_solutions.append(resolved_solution_id)
+            resolved_solutions = await resolve_many(resolve_solution_id, solutions)
             payload["solutions"] = resolved_solutions
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/contracts/{resolved_contract_id}/", payload)
+        res = await make_patch_request(f"/contracts/{resolved_contract_id}/", payload)
 
         if res.status_code == 200:
             contract = res.json()
@@ -16,6 +16,7 @@ from ..resolvers import (
     resolve_requirement_assessment_id,
     resolve_compliance_assessment_id,
     resolve_task_template_id,
+    resolve_many,
 )
 
 
@@ -89,7 +90,7 @@ async def update_asset(
         from ..resolvers import resolve_vulnerability_id
 
         # Resolve asset name to ID if needed
-        resolved_asset_id = resolve_asset_id(asset_id)
+        resolved_asset_id = await resolve_asset_id(asset_id)
 
         # Build update payload with only provided fields
         payload = {}
@@ -119,7 +120,7 @@ async def update_asset(
         if dora_discontinuing_impact is not None:
             payload["dora_discontinuing_impact"] = dora_discontinuing_impact
         if folder_id is not None:
-            payload["folder"] = resolve_folder_id(folder_id)
+            payload["folder"] = await resolve_folder_id(folder_id)
         if filtering_labels is not None:
             payload["filtering_labels"] = filtering_labels
         if owner is not None:
@@ -130,31 +131,37 @@ async def update_asset(
             payload["support_assets"] = support_assets
 
         if parent_assets is not None:
-            resolved_parents = []
-            for parent in parent_assets:
-                resolved_parents.append(resolve_asset_id(parent))
+            resolved_parents = await resolve_many(resolve_asset_id, parent_assets)
             payload["parent_assets"] = resolved_parents
 
         if applied_controls is not None:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_controls.append(resolve_applied_control_id(control))
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
 
         if vulnerabilities is not None:
-            resolved_vulns = []
-            for vuln in vulnerabilities:
-                resolved_vulns.append(resolve_vulnerability_id(vuln))
+            resolved_vulns = await resolve_many(
+                resolve_vulnerability_id, vulnerabilities
+            )
             payload["vulnerabilities"] = resolved_vulns
 
-        needs_objectives = any(p is not None for p in [
-            sec_confidentiality, sec_confidentiality_enabled,
-            sec_integrity, sec_integrity_enabled,
-            sec_availability, sec_availability_enabled,
-            dro_rto, dro_rpo, dro_mtd,
-        ])
+        needs_objectives = any(
+            p is not None
+            for p in [
+                sec_confidentiality,
+                sec_confidentiality_enabled,
+                sec_integrity,
+                sec_integrity_enabled,
+                sec_availability,
+                sec_availability_enabled,
+                dro_rto,
+                dro_rpo,
+                dro_mtd,
+            ]
+        )
         if needs_objectives:
-            fetch_res = make_get_request(f"/assets/{resolved_asset_id}/")
+            fetch_res = await make_get_request(f"/assets/{resolved_asset_id}/")
             current_asset = fetch_res.json() if fetch_res.status_code == 200 else {}
 
             raw_sec = current_asset.get("security_objectives") or {}
@@ -163,38 +170,70 @@ async def update_asset(
             raw_dro = current_asset.get("disaster_recovery_objectives") or {}
             cur_dro = raw_dro.get("objectives", {}) if isinstance(raw_dro, dict) else {}
 
-            if any(p is not None for p in [
-                sec_confidentiality, sec_confidentiality_enabled,
-                sec_integrity, sec_integrity_enabled,
-                sec_availability, sec_availability_enabled,
-            ]):
+            if any(
+                p is not None
+                for p in [
+                    sec_confidentiality,
+                    sec_confidentiality_enabled,
+                    sec_integrity,
+                    sec_integrity_enabled,
+                    sec_availability,
+                    sec_availability_enabled,
+                ]
+            ):
+
                 def _merge_cia(key, new_val, new_enabled):
                     existing = cur_sec.get(key) or {"value": 0, "is_enabled": False}
                     return {
-                        "value": new_val if new_val is not None else existing.get("value", 0),
-                        "is_enabled": new_enabled if new_enabled is not None else existing.get("is_enabled", False),
+                        "value": new_val
+                        if new_val is not None
+                        else existing.get("value", 0),
+                        "is_enabled": new_enabled
+                        if new_enabled is not None
+                        else existing.get("is_enabled", False),
                     }
+
                 payload["security_objectives"] = {
                     "objectives": {
-                        "confidentiality": _merge_cia("confidentiality", sec_confidentiality, sec_confidentiality_enabled),
-                        "integrity": _merge_cia("integrity", sec_integrity, sec_integrity_enabled),
-                        "availability": _merge_cia("availability", sec_availability, sec_availability_enabled),
+                        "confidentiality": _merge_cia(
+                            "confidentiality",
+                            sec_confidentiality,
+                            sec_confidentiality_enabled,
+                        ),
+                        "integrity": _merge_cia(
+                            "integrity", sec_integrity, sec_integrity_enabled
+                        ),
+                        "availability": _merge_cia(
+                            "availability", sec_availability, sec_availability_enabled
+                        ),
                     }
                 }
 
             if any(p is not None for p in [dro_rto, dro_rpo, dro_mtd]):
                 payload["disaster_recovery_objectives"] = {
                     "objectives": {
-                        "rto": {"value": dro_rto if dro_rto is not None else (cur_dro.get("rto") or {}).get("value", 0)},
-                        "rpo": {"value": dro_rpo if dro_rpo is not None else (cur_dro.get("rpo") or {}).get("value", 0)},
-                        "mtd": {"value": dro_mtd if dro_mtd is not None else (cur_dro.get("mtd") or {}).get("value", 0)},
+                        "rto": {
+                            "value": dro_rto
+                            if dro_rto is not None
+                            else (cur_dro.get("rto") or {}).get("value", 0)
+                        },
+                        "rpo": {
+                            "value": dro_rpo
+                            if dro_rpo is not None
+                            else (cur_dro.get("rpo") or {}).get("value", 0)
+                        },
+                        "mtd": {
+                            "value": dro_mtd
+                            if dro_mtd is not None
+                            else (cur_dro.get("mtd") or {}).get("value", 0)
+                        },
                     }
                 }
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/assets/{resolved_asset_id}/", payload)
+        res = await make_patch_request(f"/assets/{resolved_asset_id}/", payload)
 
         if res.status_code == 200:
             asset = res.json()
@@ -253,7 +292,7 @@ async def update_risk_scenario(
     """
     try:
         # Resolve risk scenario name to ID if needed
-        resolved_scenario_id = resolve_risk_scenario_id(risk_scenario_id)
+        resolved_scenario_id = await resolve_risk_scenario_id(risk_scenario_id)
 
         # Build update payload with only provided fields
         payload = {}
@@ -287,15 +326,14 @@ async def update_risk_scenario(
 
         # Resolve risk assessment name to ID if needed
         if risk_assessment_id is not None:
-            resolved_assessment_id = resolve_risk_assessment_id(risk_assessment_id)
+            resolved_assessment_id = await resolve_risk_assessment_id(
+                risk_assessment_id
+            )
             payload["risk_assessment"] = resolved_assessment_id
 
         # Resolve asset names to IDs if provided
         if assets is not None:
-            resolved_assets = []
-            for asset in assets:
-                resolved_asset_id = resolve_asset_id(asset)
-                resolved_assets.append(resolved_asset_id)
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         # Resolve threat names to IDs if provided
@@ -307,7 +345,9 @@ async def update_risk_scenario(
                 if "-" in threat and len(threat) == 36:
                     resolved_threats.append(threat)
                 else:
-                    threat_res = make_get_request("/threats/", params={"name": threat})
+                    threat_res = await make_get_request(
+                        "/threats/", params={"name": threat}
+                    )
                     if threat_res.status_code == 200:
                         threat_data = threat_res.json()
                         threat_results = get_paginated_results(threat_data)
@@ -321,33 +361,33 @@ async def update_risk_scenario(
 
         # Resolve applied control names to IDs if provided
         if applied_controls is not None:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_control_id = resolve_applied_control_id(control)
-                resolved_controls.append(resolved_control_id)
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
 
         # Resolve existing applied control names to IDs if provided
         if existing_applied_controls is not None:
-            resolved_existing_controls = []
-            for control in existing_applied_controls:
-                resolved_control_id = resolve_applied_control_id(control)
-                resolved_existing_controls.append(resolved_control_id)
+            resolved_existing_controls = await resolve_many(
+                resolve_applied_control_id, existing_applied_controls
+            )
             payload["existing_applied_controls"] = resolved_existing_controls
 
         # Resolve vulnerability names to IDs if provided
         if vulnerabilities is not None:
             from ..resolvers import resolve_vulnerability_id
 
-            resolved_vulnerabilities = []
-            for vuln in vulnerabilities:
-                resolved_vulnerabilities.append(resolve_vulnerability_id(vuln))
+            resolved_vulnerabilities = await resolve_many(
+                resolve_vulnerability_id, vulnerabilities
+            )
             payload["vulnerabilities"] = resolved_vulnerabilities
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/risk-scenarios/{resolved_scenario_id}/", payload)
+        res = await make_patch_request(
+            f"/risk-scenarios/{resolved_scenario_id}/", payload
+        )
 
         if res.status_code == 200:
             scenario = res.json()
@@ -404,7 +444,7 @@ async def update_applied_control(
     """
     try:
         # Resolve control name to ID if needed
-        resolved_control_id = resolve_applied_control_id(control_id)
+        resolved_control_id = await resolve_applied_control_id(control_id)
 
         # Build update payload with only provided fields
         payload = {}
@@ -441,7 +481,9 @@ async def update_applied_control(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/applied-controls/{resolved_control_id}/", payload)
+        res = await make_patch_request(
+            f"/applied-controls/{resolved_control_id}/", payload
+        )
 
         if res.status_code == 200:
             control = res.json()
@@ -480,7 +522,7 @@ async def update_requirement_assessment(
     """
     try:
         # Validate UUID
-        resolved_id = resolve_requirement_assessment_id(requirement_assessment_id)
+        resolved_id = await resolve_requirement_assessment_id(requirement_assessment_id)
 
         # Build update payload with only provided fields
         payload = {}
@@ -502,16 +544,17 @@ async def update_requirement_assessment(
         if selected is not None:
             payload["selected"] = selected
         if applied_controls is not None:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_control_id = resolve_applied_control_id(control)
-                resolved_controls.append(resolved_control_id)
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/requirement-assessments/{resolved_id}/", payload)
+        res = await make_patch_request(
+            f"/requirement-assessments/{resolved_id}/", payload
+        )
 
         if res.status_code == 200:
             req_assessment = res.json()
@@ -543,10 +586,12 @@ async def update_requirement_assessments(
             return "Error: No updates provided"
 
         # Resolve compliance assessment
-        resolved_ca_id = resolve_compliance_assessment_id(compliance_assessment_id)
+        resolved_ca_id = await resolve_compliance_assessment_id(
+            compliance_assessment_id
+        )
 
         # Fetch all requirement assessments for this compliance assessment once
-        all_ras, error = fetch_all_results(
+        all_ras, error = await fetch_all_results(
             "/requirement-assessments/",
             params={"compliance_assessment": resolved_ca_id},
         )
@@ -598,7 +643,9 @@ async def update_requirement_assessments(
                 failed.append(f"{ref_id}: no fields to update")
                 continue
 
-            res = make_patch_request(f"/requirement-assessments/{ra_id}/", payload)
+            res = await make_patch_request(
+                f"/requirement-assessments/{ra_id}/", payload
+            )
             if res.status_code == 200:
                 succeeded.append(ref_id)
             else:
@@ -652,12 +699,12 @@ async def update_quantitative_risk_study(
         from ..resolvers import resolve_id_or_name
 
         # Resolve study name to ID if needed
-        resolved_study_id = resolve_id_or_name(
+        resolved_study_id = await resolve_id_or_name(
             study_id, "/crq/quantitative-risk-studies/"
         )
 
         # First, get current study to preserve existing risk tolerance if partially updating
-        get_res = make_get_request(
+        get_res = await make_get_request(
             f"/crq/quantitative-risk-studies/{resolved_study_id}/"
         )
         if get_res.status_code != 200:
@@ -742,7 +789,7 @@ async def update_quantitative_risk_study(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/crq/quantitative-risk-studies/{resolved_study_id}/", payload
         )
 
@@ -781,7 +828,7 @@ async def update_quantitative_risk_scenario(
         from ..resolvers import resolve_id_or_name, resolve_asset_id
 
         # Resolve scenario name to ID if needed
-        resolved_scenario_id = resolve_id_or_name(
+        resolved_scenario_id = await resolve_id_or_name(
             scenario_id, "/crq/quantitative-risk-scenarios/"
         )
 
@@ -801,10 +848,7 @@ async def update_quantitative_risk_scenario(
 
         # Resolve asset names to IDs if provided
         if assets is not None:
-            resolved_assets = []
-            for asset in assets:
-                resolved_asset_id = resolve_asset_id(asset)
-                resolved_assets.append(resolved_asset_id)
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         # Resolve threat names to IDs if provided
@@ -816,7 +860,9 @@ async def update_quantitative_risk_scenario(
                 if "-" in threat and len(threat) == 36:
                     resolved_threats.append(threat)
                 else:
-                    threat_res = make_get_request("/threats/", params={"name": threat})
+                    threat_res = await make_get_request(
+                        "/threats/", params={"name": threat}
+                    )
                     if threat_res.status_code == 200:
                         threat_data = threat_res.json()
                         threat_results = get_paginated_results(threat_data)
@@ -831,7 +877,7 @@ async def update_quantitative_risk_scenario(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/crq/quantitative-risk-scenarios/{resolved_scenario_id}/", payload
         )
 
@@ -876,12 +922,12 @@ async def update_quantitative_risk_hypothesis(
         from ..resolvers import resolve_id_or_name
 
         # Resolve hypothesis name to ID if needed
-        resolved_hypothesis_id = resolve_id_or_name(
+        resolved_hypothesis_id = await resolve_id_or_name(
             hypothesis_id, "/crq/quantitative-risk-hypotheses/"
         )
 
         # First, get current hypothesis to preserve existing parameters
-        get_res = make_get_request(
+        get_res = await make_get_request(
             f"/crq/quantitative-risk-hypotheses/{resolved_hypothesis_id}/"
         )
         if get_res.status_code != 200:
@@ -938,26 +984,24 @@ async def update_quantitative_risk_hypothesis(
         if existing_applied_controls is not None:
             from ..resolvers import resolve_applied_control_id
 
-            resolved_existing = []
-            for control in existing_applied_controls:
-                resolved_control_id = resolve_applied_control_id(control)
-                resolved_existing.append(resolved_control_id)
+            resolved_existing = await resolve_many(
+                resolve_applied_control_id, existing_applied_controls
+            )
             payload["existing_applied_controls"] = resolved_existing
 
         # Resolve added applied control names to IDs if provided
         if added_applied_controls is not None:
             from ..resolvers import resolve_applied_control_id
 
-            resolved_added = []
-            for control in added_applied_controls:
-                resolved_control_id = resolve_applied_control_id(control)
-                resolved_added.append(resolved_control_id)
+            resolved_added = await resolve_many(
+                resolve_applied_control_id, added_applied_controls
+            )
             payload["added_applied_controls"] = resolved_added
 
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(
+        res = await make_patch_request(
             f"/crq/quantitative-risk-hypotheses/{resolved_hypothesis_id}/", payload
         )
 
@@ -1052,10 +1096,9 @@ async def update_task_template(
         if assets is not None:
             payload["assets"] = assets
         if applied_controls is not None:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_control_id = resolve_applied_control_id(control)
-                resolved_controls.append(resolved_control_id)
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
         if compliance_assessments is not None:
             payload["compliance_assessments"] = compliance_assessments
@@ -1066,16 +1109,16 @@ async def update_task_template(
 
         # Resolve folder name to ID if provided
         if folder_id is not None:
-            resolved_folder_id = resolve_folder_id(folder_id)
+            resolved_folder_id = await resolve_folder_id(folder_id)
             payload["folder"] = resolved_folder_id
 
         if not payload:
             return "Error: No fields provided to update"
 
         # Resolve task name to ID if needed
-        resolved_task_id = resolve_task_template_id(task_id)
+        resolved_task_id = await resolve_task_template_id(task_id)
 
-        res = make_patch_request(f"/task-templates/{resolved_task_id}/", payload)
+        res = await make_patch_request(f"/task-templates/{resolved_task_id}/", payload)
 
         if res.status_code == 200:
             task = res.json()
@@ -1094,9 +1137,9 @@ async def delete_task_template(task_id: str) -> str:
     """
     try:
         # Resolve task name to ID if needed
-        resolved_task_id = resolve_task_template_id(task_id)
+        resolved_task_id = await resolve_task_template_id(task_id)
 
-        res = make_delete_request(f"/task-templates/{resolved_task_id}/")
+        res = await make_delete_request(f"/task-templates/{resolved_task_id}/")
 
         if res.status_code == 204:
             return f"Deleted task template (ID: {resolved_task_id})"
@@ -1142,7 +1185,7 @@ async def update_vulnerability(
             resolve_applied_control_id,
         )
 
-        resolved_id = resolve_vulnerability_id(vulnerability_id)
+        resolved_id = await resolve_vulnerability_id(vulnerability_id)
 
         payload = {}
 
@@ -1157,14 +1200,16 @@ async def update_vulnerability(
         if severity is not None:
             payload["severity"] = severity
         if folder_id is not None:
-            payload["folder"] = resolve_folder_id(folder_id)
+            payload["folder"] = await resolve_folder_id(folder_id)
         if filtering_labels is not None:
             payload["filtering_labels"] = filtering_labels
         if applied_controls is not None:
-            resolved_controls = [resolve_applied_control_id(c) for c in applied_controls]
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
         if assets is not None:
-            resolved_assets = [resolve_asset_id(a) for a in assets]
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
         if security_exceptions is not None:
             payload["security_exceptions"] = security_exceptions
@@ -1172,7 +1217,7 @@ async def update_vulnerability(
         if not payload:
             return "Error: No fields provided to update"
 
-        res = make_patch_request(f"/vulnerabilities/{resolved_id}/", payload)
+        res = await make_patch_request(f"/vulnerabilities/{resolved_id}/", payload)
 
         if res.status_code == 200:
             vuln = res.json()
@@ -1192,9 +1237,9 @@ async def delete_vulnerability(vulnerability_id: str) -> str:
     try:
         from ..resolvers import resolve_vulnerability_id
 
-        resolved_id = resolve_vulnerability_id(vulnerability_id)
+        resolved_id = await resolve_vulnerability_id(vulnerability_id)
 
-        res = make_delete_request(f"/vulnerabilities/{resolved_id}/")
+        res = await make_delete_request(f"/vulnerabilities/{resolved_id}/")
 
         if res.status_code == 204:
             return f"Deleted vulnerability (ID: {resolved_id})"
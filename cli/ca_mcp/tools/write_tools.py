@@ -8,6 +8,7 @@ from ..resolvers import (
     resolve_framework_id,
     resolve_risk_assessment_id,
     resolve_applied_control_id,
+    resolve_many,
 )
 from ..config import GLOBAL_FOLDER_ID
 from ..utils.response_formatter import (
@@ -36,10 +37,10 @@ async def create_folder(
         }
 
         if parent_folder_id:
-            parent_folder_id = resolve_folder_id(parent_folder_id)
+            parent_folder_id = await resolve_folder_id(parent_folder_id)
             payload["parent_folder"] = parent_folder_id
 
-        res = make_post_request("/folders/", payload)
+        res = await make_post_request("/folders/", payload)
 
         if res.status_code == 201:
             folder = res.json()
@@ -67,7 +68,7 @@ async def create_perimeter(
             folder_id = GLOBAL_FOLDER_ID
 
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -77,7 +78,7 @@ async def create_perimeter(
         if folder_id:
             payload["folder"] = folder_id
 
-        res = make_post_request("/perimeters/", payload)
+        res = await make_post_request("/perimeters/", payload)
 
         if res.status_code == 201:
             perimeter = res.json()
@@ -127,7 +128,7 @@ async def create_asset(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -139,24 +140,37 @@ async def create_asset(
             payload["folder"] = folder_id
 
         sec_params = [
-            sec_confidentiality, sec_confidentiality_enabled,
-            sec_integrity, sec_integrity_enabled,
-            sec_availability, sec_availability_enabled,
+            sec_confidentiality,
+            sec_confidentiality_enabled,
+            sec_integrity,
+            sec_integrity_enabled,
+            sec_availability,
+            sec_availability_enabled,
         ]
         if any(p is not None for p in sec_params):
             payload["security_objectives"] = {
                 "objectives": {
                     "confidentiality": {
-                        "value": sec_confidentiality if sec_confidentiality is not None else 0,
-                        "is_enabled": sec_confidentiality_enabled if sec_confidentiality_enabled is not None else sec_confidentiality is not None,
+                        "value": sec_confidentiality
+                        if sec_confidentiality is not None
+                        else 0,
+                        "is_enabled": sec_confidentiality_enabled
+                        if sec_confidentiality_enabled is not None
+                        else sec_confidentiality is not None,
                     },
                     "integrity": {
                         "value": sec_integrity if sec_integrity is not None else 0,
-                        "is_enabled": sec_integrity_enabled if sec_integrity_enabled is not None else sec_integrity is not None,
+                        "is_enabled": sec_integrity_enabled
+                        if sec_integrity_enabled is not None
+                        else sec_integrity is not None,
                     },
                     "availability": {
-                        "value": sec_availability if sec_availability is not None else 0,
-                        "is_enabled": sec_availability_enabled if sec_availability_enabled is not None else sec_availability is not None,
+                        "value": sec_availability
+                        if sec_availability is not None
+                        else 0,
+                        "is_enabled": sec_availability_enabled
+                        if sec_availability_enabled is not None
+                        else sec_availability is not None,
                     },
                 }
             }
@@ -170,7 +184,7 @@ async def create_asset(
                 }
             }
 
-        res = make_post_request("/assets/", payload)
+        res = await make_post_request("/assets/", payload)
 
         if res.status_code == 201:
             asset = res.json()
@@ -204,7 +218,7 @@ async def create_threat(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -220,7 +234,7 @@ async def create_threat(
         if folder_id:
             payload["folder"] = folder_id
 
-        res = make_post_request("/threats/", payload)
+        res = await make_post_request("/threats/", payload)
 
         if res.status_code == 201:
             threat = res.json()
@@ -255,7 +269,7 @@ async def create_applied_control(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -270,7 +284,7 @@ async def create_applied_control(
         if eta:
             payload["eta"] = eta
 
-        res = make_post_request("/applied-controls/", payload)
+        res = await make_post_request("/applied-controls/", payload)
 
         if res.status_code == 201:
             control = res.json()
@@ -303,14 +317,14 @@ async def create_risk_assessment(
     """
     try:
         # Resolve risk matrix name to ID if needed
-        risk_matrix_id = resolve_risk_matrix_id(risk_matrix_id)
+        risk_matrix_id = await resolve_risk_matrix_id(risk_matrix_id)
 
         # Resolve perimeter name to ID if needed
-        perimeter_id = resolve_perimeter_id(perimeter_id)
+        perimeter_id = await resolve_perimeter_id(perimeter_id)
 
         # Resolve folder name to ID if needed (optional)
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
         elif GLOBAL_FOLDER_ID:
             folder_id = GLOBAL_FOLDER_ID
 
@@ -327,7 +341,7 @@ async def create_risk_assessment(
         if folder_id:
             payload["folder"] = folder_id
 
-        res = make_post_request("/risk-assessments/", payload)
+        res = await make_post_request("/risk-assessments/", payload)
 
         if res.status_code == 201:
             assessment = res.json()
@@ -386,11 +400,11 @@ async def create_risk_scenario(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         # Resolve risk assessment name to ID if needed
         if risk_assessment_id:
-            risk_assessment_id = resolve_risk_assessment_id(risk_assessment_id)
+            risk_assessment_id = await resolve_risk_assessment_id(risk_assessment_id)
 
         payload = {
             "name": name,
@@ -414,45 +428,37 @@ async def create_risk_scenario(
 
         # Resolve asset names to IDs if provided (pass folder_id to scope lookup)
         if assets:
-            resolved_assets = []
-            for asset in assets:
-                resolved_asset_id = resolve_asset_id(asset, folder_id=folder_id)
-                resolved_assets.append(resolved_asset_id)
+            resolved_assets = await resolve_many(
+                resolve_asset_id, assets, folder_id=folder_id
+            )
             payload["assets"] = resolved_assets
 
         # Resolve threat names to IDs if provided (pass folder_id to scope lookup for custom threats)
         if threats:
             from ..resolvers import resolve_threat_id
 
-            resolved_threats = []
-            for threat in threats:
-                resolved_threat_id = resolve_threat_id(
-                    threat, library=threat_library, folder_id=folder_id
-                )
-                resolved_threats.append(resolved_threat_id)
+            resolved_threats = await resolve_many(
+                resolve_threat_id, threats, library=threat_library, folder_id=folder_id
+            )
             payload["threats"] = resolved_threats
 
         # Resolve new/planned applied control names to IDs if provided (pass folder_id to scope lookup)
         if applied_controls:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_control_id = resolve_applied_control_id(
-                    control, folder_id=folder_id
-                )
-                resolved_controls.append(resolved_control_id)
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls, folder_id=folder_id
+            )
             payload["applied_controls"] = resolved_controls
 
         # Resolve existing applied control names to IDs if provided (pass folder_id to scope lookup)
         if existing_applied_controls:
-            resolved_existing_controls = []
-            for control in existing_applied_controls:
-                resolved_control_id = resolve_applied_control_id(
-                    control, folder_id=folder_id
-                )
-                resolved_existing_controls.append(resolved_control_id)
+            resolved_existing_controls = await resolve_many(
+                resolve_applied_control_id,
+                existing_applied_controls,
+                folder_id=folder_id,
+            )
             payload["existing_applied_controls"] = resolved_existing_controls
 
-        res = make_post_request("/risk-scenarios/", payload)
+        res = await make_post_request("/risk-scenarios/", payload)
 
         if res.status_code == 201:
             scenario = res.json()
@@ -505,14 +511,14 @@ async def create_business_impact_analysis(
     """
     try:
         # Resolve risk matrix name to ID if needed
-        risk_matrix_id = resolve_risk_matrix_id(risk_matrix_id)
+        risk_matrix_id = await resolve_risk_matrix_id(risk_matrix_id)
 
         # Resolve perimeter name to ID if needed
-        perimeter_id = resolve_perimeter_id(perimeter_id)
+        perimeter_id = await resolve_perimeter_id(perimeter_id)
 
         # Resolve folder name to ID if needed (optional)
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
         elif GLOBAL_FOLDER_ID:
             folder_id = GLOBAL_FOLDER_ID
 
@@ -529,7 +535,7 @@ async def create_business_impact_analysis(
         if folder_id:
             payload["folder"] = folder_id
 
-        res = make_post_request("/resilience/business-impact-analysis/", payload)
+        res = await make_post_request("/resilience/business-impact-analysis/", payload)
 
         if res.status_code == 201:
             bia = res.json()
@@ -562,14 +568,14 @@ async def create_compliance_assessment(
     """
     try:
         # Resolve framework name/URN to ID if needed
-        framework_id = resolve_framework_id(framework_id)
+        framework_id = await resolve_framework_id(framework_id)
 
         # Resolve perimeter name to ID if needed
-        perimeter_id = resolve_perimeter_id(perimeter_id)
+        perimeter_id = await resolve_perimeter_id(perimeter_id)
 
         # Resolve folder name to ID if needed (optional)
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
         elif GLOBAL_FOLDER_ID:
             folder_id = GLOBAL_FOLDER_ID
 
@@ -586,7 +592,7 @@ async def create_compliance_assessment(
         if folder_id:
             payload["folder"] = folder_id
 
-        res = make_post_request("/compliance-assessments/", payload)
+        res = await make_post_request("/compliance-assessments/", payload)
 
         if res.status_code == 201:
             assessment = res.json()
@@ -631,7 +637,7 @@ async def create_quantitative_risk_study(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -689,7 +695,7 @@ async def create_quantitative_risk_study(
 
             payload["risk_tolerance"] = risk_tolerance
 
-        res = make_post_request("/crq/quantitative-risk-studies/", payload)
+        res = await make_post_request("/crq/quantitative-risk-studies/", payload)
 
         if res.status_code == 201:
             study = res.json()
@@ -732,10 +738,10 @@ async def create_quantitative_risk_scenario(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         # Resolve study name to ID if needed
-        study_id = resolve_id_or_name(
+        study_id = await resolve_id_or_name(
             quantitative_risk_study_id, "/crq/quantitative-risk-studies/"
         )
 
@@ -754,25 +760,21 @@ async def create_quantitative_risk_scenario(
 
         # Resolve asset names to IDs if provided (pass folder_id to scope lookup)
         if assets:
-            resolved_assets = []
-            for asset in assets:
-                resolved_asset_id = resolve_asset_id(asset, folder_id=folder_id)
-                resolved_assets.append(resolved_asset_id)
+            resolved_assets = await resolve_many(
+                resolve_asset_id, assets, folder_id=folder_id
+            )
             payload["assets"] = resolved_assets
 
         # Resolve threat names to IDs if provided (pass folder_id to scope lookup for custom threats)
         if threats:
             from ..resolvers import resolve_threat_id
 
-            resolved_threats = []
-            for threat in threats:
-                resolved_threat_id = resolve_threat_id(
-                    threat, library=threat_library, folder_id=folder_id
-                )
-                resolved_threats.append(resolved_threat_id)
+            resolved_threats = await resolve_many(
+                resolve_threat_id, threats, library=threat_library, folder_id=folder_id
+            )
             payload["threats"] = resolved_threats
 
-        res = make_post_request("/crq/quantitative-risk-scenarios/", payload)
+        res = await make_post_request("/crq/quantitative-risk-scenarios/", payload)
 
         if res.status_code == 201:
             scenario = res.json()
@@ -824,10 +826,10 @@ async def create_quantitative_risk_hypothesis(
 
         # Resolve folder name to ID if needed
         if folder_id:
-            folder_id = resolve_folder_id(folder_id)
+            folder_id = await resolve_folder_id(folder_id)
 
         # Resolve scenario name to ID if needed
-        scenario_id = resolve_id_or_name(
+        scenario_id = await resolve_id_or_name(
             quantitative_risk_scenario_id, "/crq/quantitative-risk-scenarios/"
         )
 
@@ -859,25 +861,21 @@ async def create_quantitative_risk_hypothesis(
 
         # Resolve existing applied control names to IDs if provided (pass folder_id to scope lookup)
         if existing_applied_controls:
-            resolved_existing = []
-            for control in existing_applied_controls:
-                resolved_control_id = resolve_applied_control_id(
-                    control, folder_id=folder_id
-                )
-                resolved_existing.append(resolved_control_id)
+            resolved_existing = await resolve_many(
+                resolve_applied_control_id,
+                existing_applied_controls,
+                folder_id=folder_id,
+            )
             payload["existing_applied_controls"] = resolved_existing
 
         # Resolve added applied control names to IDs if provided (pass folder_id to scope lookup)
         if added_applied_controls:
-            resolved_added = []
-            for control in added_applied_controls:
-                resolved_control_id = resolve_applied_control_id(
-                    control, folder_id=folder_id
-                )
-                resolved_added.append(resolved_control_id)
+            resolved_added = await resolve_many(
+                resolve_applied_control_id, added_applied_controls, folder_id=folder_id
+            )
             payload["added_applied_controls"] = resolved_added
 
-        res = make_post_request("/crq/quantitative-risk-hypotheses/", payload)
+        res = await make_post_request("/crq/quantitative-risk-hypotheses/", payload)
 
         if res.status_code == 201:
             hypothesis = res.json()
@@ -905,12 +903,12 @@ async def refresh_quantitative_risk_study_simulations(study_id: str) -> str:
         from ..resolvers import resolve_id_or_name
 
         # Resolve study name to ID if needed
-        resolved_study_id = resolve_id_or_name(
+        resolved_study_id = await resolve_id_or_name(
             study_id, "/crq/quantitative-risk-studies/"
         )
 
         # Call the retrigger-all-simulations endpoint
-        res = make_post_request(
+        res = await make_post_request(
             f"/crq/quantitative-risk-studies/{resolved_study_id}/retrigger-all-simulations/",
             {},
         )
@@ -988,7 +986,7 @@ async def create_task_template(
     """
     try:
         # Resolve folder name to ID if needed
-        folder_id = resolve_folder_id(folder_id)
+        folder_id = await resolve_folder_id(folder_id)
 
         payload = {
             "name": name,
@@ -1023,12 +1021,9 @@ async def create_task_template(
         if assets is not None:
             payload["assets"] = assets
         if applied_controls is not None:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_control_id = resolve_applied_control_id(
-                    control, folder_id=folder_id
-                )
-                resolved_controls.append(resolved_control_id)
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls, folder_id=folder_id
+            )
             payload["applied_controls"] = resolved_controls
         if compliance_assessments is not None:
             payload["compliance_assessments"] = compliance_assessments
@@ -1037,7 +1032,7 @@ async def create_task_template(
         if findings_assessment is not None:
             payload["findings_assessment"] = findings_assessment
 
-        res = make_post_request("/task-templates/", payload)
+        res = await make_post_request("/task-templates/", payload)
 
         if res.status_code == 201:
             task = res.json()
@@ -1092,27 +1087,25 @@ async def create_vulnerability(
             payload["severity"] = severity
 
         if folder_id:
-            payload["folder"] = resolve_folder_id(folder_id)
+            payload["folder"] = await resolve_folder_id(folder_id)
 
         if filtering_labels:
             payload["filtering_labels"] = filtering_labels
 
         if applied_controls:
-            resolved_controls = []
-            for control in applied_controls:
-                resolved_controls.append(resolve_applied_control_id(control))
+            resolved_controls = await resolve_many(
+                resolve_applied_control_id, applied_controls
+            )
             payload["applied_controls"] = resolved_controls
 
         if assets:
-            resolved_assets = []
-            for asset in assets:
-                resolved_assets.append(resolve_asset_id(asset))
+            resolved_assets = await resolve_many(resolve_asset_id, assets)
             payload["assets"] = resolved_assets
 
         if security_exceptions:
             payload["security_exceptions"] = security_exceptions
 
-        res = make_post_request("/vulnerabilities/", payload)
+        res = await make_post_request("/vulnerabilities/", payload)
 
         if res.status_code == 201:
             vuln = res.json()
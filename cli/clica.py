@@ -7,6 +7,7 @@ import hashlib
 import struct
 import click
 import requests
+import urllib3
 import os
 from dotenv import load_dotenv
 import json
@@ -779,6 +780,109 @@ def upload_attachment(file, name):
     rprint(res.text)
 
 
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+# Block-length frames don't give the header length: it must fit in this many bytes
+BLOCK_HEADER_MAX_SIZE = 1024
+
+
+def _read_exact(stream, size):
+    """Read exactly `size` bytes, or fewer only if the stream ends"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return bytes(data)
+
+
+def read_attachment_frames(stream, attachments_dir, framing="block-length"):
+    """
+    Write the attachments of a batch download stream to attachments_dir.
+
+    With the "header-length" framing, each frame is
+    [4-byte header length][JSON header][file bytes], the header giving the
+    file size. With the "block-length" framing of older servers, the prefix
+    is the length of header and file together, and the header ends where its
+    JSON object does; a file whose header announces another size is skipped.
+    Files are copied to disk in fixed-size chunks and hashed on the fly; a
+    file is only moved into place once its hash matches.
+
+    Yields (header, size) for every attachment saved.
+    Raises OSError if the stream ends in the middle of a frame.
+    """
+    buffer = bytearray(ATTACHMENT_CHUNK_SIZE)
+    view = memoryview(buffer)
+    decoder = json.JSONDecoder()
+
+    while True:
+        prefix = _read_exact(stream, 4)
+        if not prefix:
+            return
+        if len(prefix) < 4:
+            raise OSError("Truncated frame header")
+        length = struct.unpack(">I", prefix)[0]
+
+        if framing == "header-length":
+            header_bytes = _read_exact(stream, length)
+            if len(header_bytes) < length:
+                raise OSError("Truncated frame header")
+            header = json.loads(header_bytes)
+            size = header["size"]
+            leading = b""
+        else:
+            peek_size = min(length, BLOCK_HEADER_MAX_SIZE)
+            block_start = _read_exact(stream, peek_size)
+            if len(block_start) < peek_size:
+                raise OSError("Truncated frame header")
+            # JSON headers are ASCII, and latin-1 keeps character and byte
+            # offsets aligned whatever the file bytes that follow
+            header, header_length = decoder.raw_decode(block_start.decode("latin-1"))
+            # The block length delimits the frame, whatever the header says
+            size = length - header_length
+            leading = block_start[header_length:]
+
+        file_path = (
+            attachments_dir
+            / f"{header['evidence_id']}_v{header['version']}_{header['filename']}"
+        )
+        part_path = file_path.with_name(file_path.name + ".part")
+
+        hash_obj = hashlib.sha256(leading)
+        remaining = size - len(leading)
+        with open(part_path, "wb") as f:
+            f.write(leading)
+            while remaining > 0:
+                n = stream.readinto(view[: min(ATTACHMENT_CHUNK_SIZE, remaining)])
+                if not n:
+                    break
+                hash_obj.update(view[:n])
+                f.write(view[:n])
+                remaining -= n
+
+        if remaining > 0:
+            part_path.unlink()
+            raise OSError(f"Truncated file {header['filename']}")
+
+        if header.get("size", size) != size:
+            part_path.unlink()
+            rprint(
+                f"[yellow]Warning: Size mismatch for {header['filename']} "
+                f"({size} bytes framed, {header['size']} announced), skipping[/yellow]"
+            )
+            continue
+
+        if header.get("hash") and hash_obj.hexdigest() != header["hash"]:
+            part_path.unlink()
+            rprint(
+                f"[yellow]Warning: Hash mismatch for {header['filename']}, skipping[/yellow]"
+            )
+            continue
+
+        part_path.replace(file_path)
+        yield header, size
+
+
 @cli.command(name="backup-full")
 @click.option(
     "--dest-dir",
@@ -928,7 +1032,7 @@ def backup_full(dest_dir, batch_size, resume):
             res = requests.post(
                 url,
                 headers=headers,
-                json={"revision_ids": batch_ids},
+                json={"revision_ids": batch_ids, "framing": "header-length"},
                 verify=VERIFY_CERTIFICATE,
                 stream=True,
             )
@@ -941,68 +1045,35 @@ def backup_full(dest_dir, batch_size, resume):
                 rprint(res.text, file=sys.stderr)
                 continue
 
-            # Parse streaming response
-            buffer = b""
-            for chunk in res.iter_content(chunk_size=10240 * 1024):  # NOTE: 10MB chunks
-                buffer += chunk
-
-                while len(buffer) >= 4:
-                    # Read 4-byte length prefix
-                    total_size = struct.unpack(">I", buffer[:4])[0]
-
-                    if len(buffer) < 4 + total_size:
-                        # Not enough data yet
-                        break
-
-                    # Extract block
-                    block_data = buffer[4 : 4 + total_size]
-                    buffer = buffer[4 + total_size :]
-
-                    # Parse JSON header (try up to 1KB)
-                    header = None
-                    header_end = 0
-                    for j in range(1, min(1024, len(block_data))):
-                        try:
-                            header = json.loads(block_data[:j].decode("utf-8"))
-                            header_end = j
-                            break
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            continue
-
-                    if not header:
-                        rprint(
-                            "[yellow]Warning: Could not parse header in block[/yellow]"
-                        )
-                        continue
-
-                    file_bytes = block_data[header_end:]
-
-                    # Save file
-                    evidence_id = header["evidence_id"]
-                    version = header["version"]
-                    filename = header["filename"]
-                    file_hash = header["hash"]
-
-                    file_path = attachments_dir / f"{evidence_id}_v{version}_{filename}"
-                    with open(file_path, "wb") as f:
-                        f.write(file_bytes)
-
+            # Parse streaming response frame by frame, writing files as they arrive
+            # Servers that predate the header-length framing ignore the
+            # request for it and don't send this header
+            framing = res.headers.get("X-Attachment-Framing", "block-length")
+            res.raw.decode_content = True
+            try:
+                for header, size in read_attachment_frames(
+                    res.raw, attachments_dir, framing
+                ):
                     total_downloaded += 1
-                    total_bytes += len(file_bytes)
-
-                    # Add to manifest
-                    manifest_entry = {
+                    total_bytes += size
+                    existing_manifest[header["id"]] = {
                         "id": header["id"],
-                        "evidence_id": evidence_id,
-                        "version": version,
-                        "filename": filename,
-                        "hash": file_hash,
-                        "size": len(file_bytes),
+                        "evidence_id": header["evidence_id"],
+                        "version": header["version"],
+                        "filename": header["filename"],
+                        "hash": header["hash"],
+                        "size": size,
                         "downloaded": True,
                         "timestamp": datetime.now().isoformat(),
                     }
-
-                    existing_manifest[header["id"]] = manifest_entry
+            except (OSError, ValueError, urllib3.exceptions.HTTPError) as e:
+                rprint(
+                    f"[bold red]Error reading batch stream: {e}[/bold red]",
+                    file=sys.stderr,
+                )
+                continue
+            finally:
+                res.close()
 
             rprint(
                 f"[green]✓ Batch {i // batch_size + 1} completed ({total_downloaded} files, {total_bytes / 1024 / 1024:.1f} MB)[/green]"
@@ -1134,6 +1205,7 @@ def restore_full(src_dir, verify_hashes):
                     "size": len(file_bytes),
                 }
                 header_bytes = json.dumps(header).encode("utf-8")
+                # Uploads always use the block-length framing
                 total_size = len(header_bytes) + len(file_bytes)
 
                 # Write directly (OS will buffer intelligently)
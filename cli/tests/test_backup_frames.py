@@ -0,0 +1,102 @@
+import hashlib
+import io
+import json
+import os
+import struct
+import sys
+
+import pytest
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, BASE_DIR)
+from clica import read_attachment_frames  # noqa: E402
+
+FRAMINGS = ["header-length", "block-length"]
+
+
+def frame(revision, content, framing, hash=None, size=None):
+    header = {
+        "id": revision,
+        "evidence_id": f"evidence-{revision}",
+        "version": 1,
+        "filename": f"{revision}.txt",
+        "hash": hash or hashlib.sha256(content).hexdigest(),
+        "size": len(content) if size is None else size,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    if framing == "header-length":
+        prefix = struct.pack(">I", len(header_bytes))
+    else:
+        prefix = struct.pack(">I", len(header_bytes) + len(content))
+    return prefix + header_bytes + content
+
+
+def read_all(data, attachments_dir, framing):
+    return list(read_attachment_frames(io.BytesIO(data), attachments_dir, framing))
+
+
+@pytest.mark.parametrize("framing", FRAMINGS)
+class TestReadAttachmentFrames:
+    def test_multiple_attachments(self, tmp_path, framing):
+        contents = {
+            "a": b"first file",
+            "b": b"",
+            # Starts like a JSON value, to check where the header ends
+            "c": b'{"x": 1} \x00\xff' * 5000,
+        }
+        data = b"".join(frame(k, v, framing) for k, v in contents.items())
+
+        saved = read_all(data, tmp_path, framing)
+
+        assert [(header["id"], size) for header, size in saved] == [
+            (k, len(v)) for k, v in contents.items()
+        ]
+        for revision, content in contents.items():
+            path = tmp_path / f"evidence-{revision}_v1_{revision}.txt"
+            assert path.read_bytes() == content
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_empty_stream(self, tmp_path, framing):
+        assert read_all(b"", tmp_path, framing) == []
+
+    @pytest.mark.parametrize("cut", [2, 10])
+    def test_truncated_header(self, tmp_path, framing, cut):
+        data = frame("a", b"first file", framing)
+
+        with pytest.raises(OSError, match="Truncated frame header"):
+            read_all(data[:cut], tmp_path, framing)
+
+    def test_truncated_file(self, tmp_path, framing):
+        data = frame("a", b"first file", framing) + frame("b", b"x" * 5000, framing)
+
+        saved = read_attachment_frames(io.BytesIO(data[:-1]), tmp_path, framing)
+        header, _ = next(saved)
+        assert header["id"] == "a"
+        with pytest.raises(OSError, match="Truncated file b.txt"):
+            next(saved)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["evidence-a_v1_a.txt"]
+
+    def test_hash_mismatch_is_skipped(self, tmp_path, framing):
+        data = frame("a", b"first file", framing, hash="0" * 64) + frame(
+            "b", b"second file", framing
+        )
+
+        saved = read_all(data, tmp_path, framing)
+
+        assert [header["id"] for header, _ in saved] == ["b"]
+        assert [p.name for p in tmp_path.iterdir()] == ["evidence-b_v1_b.txt"]
+
+
+@pytest.mark.parametrize("announced", [5, 15])
+def test_block_length_wins_over_header_size(tmp_path, announced):
+    content = b"first file"
+    data = frame("a", content, "block-length", size=announced) + frame(
+        "b", b"second file", "block-length"
+    )
+
+    saved = read_all(data, tmp_path, "block-length")
+
+    assert [(header["id"], size) for header, size in saved] == [("b", 11)]
+    assert [p.name for p in tmp_path.iterdir()] == ["evidence-b_v1_b.txt"]
+    assert (tmp_path / "evidence-b_v1_b.txt").read_bytes() == b"second file"
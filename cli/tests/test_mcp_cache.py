@@ -0,0 +1,165 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add the parent directory to the path to import ca_mcp
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ca_mcp import cache, client
+from ca_mcp.cache import TTLCache, cached_resolver, resolver_cache
+
+
+class FakeClock:
+    """Stands in for time.monotonic in ca_mcp.cache"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def empty_resolver_cache():
+    resolver_cache.clear()
+    yield
+    resolver_cache.clear()
+
+
+class TestTTLCache:
+    """Test the expiring name-to-id cache"""
+
+    def test_hit(self, clock):
+        ttl_cache = TTLCache(ttl=60)
+        ttl_cache.set("folder", "id-1")
+        assert ttl_cache.get("folder") == "id-1"
+
+    def test_miss(self, clock):
+        ttl_cache = TTLCache(ttl=60)
+        ttl_cache.set("folder", "id-1")
+        assert ttl_cache.get("perimeter") is None
+
+    def test_expiry(self, clock):
+        ttl_cache = TTLCache(ttl=60)
+        ttl_cache.set("folder", "id-1")
+        clock.now += 59
+        assert ttl_cache.get("folder") == "id-1"
+        clock.now += 2
+        assert ttl_cache.get("folder") is None
+
+    def test_zero_ttl_disables_the_cache(self, clock):
+        ttl_cache = TTLCache(ttl=0)
+        ttl_cache.set("folder", "id-1")
+        assert ttl_cache.get("folder") is None
+
+
+class TestCachedResolver:
+    """Test the memoisation of the resolvers"""
+
+    @pytest.fixture
+    def resolver(self):
+        calls = []
+
+        @cached_resolver
+        async def resolve_name(name, **kwargs):
+            calls.append(name)
+            if name == "missing":
+                raise ValueError(f"{name} not found")
+            return f"id-of-{name}"
+
+        resolve_name.calls = calls
+        return resolve_name
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_the_lookup(self, clock, resolver):
+        assert await resolver("folder") == "id-of-folder"
+        assert await resolver("folder") == "id-of-folder"
+        assert resolver.calls == ["folder"]
+
+    @pytest.mark.asyncio
+    async def test_miss_on_other_arguments(self, clock, resolver):
+        await resolver("folder")
+        await resolver("folder", perimeter="p1")
+        await resolver("perimeter")
+        assert resolver.calls == ["folder", "folder", "perimeter"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_looked_up_again(self, clock, resolver):
+        await resolver("folder")
+        clock.now += resolver_cache.ttl + 1
+        await resolver("folder")
+        assert resolver.calls == ["folder", "folder"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, clock, resolver):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await resolver("missing")
+        assert resolver.calls == ["missing", "missing"]
+
+    @pytest.mark.asyncio
+    async def test_unhashable_arguments_bypass_the_cache(self, clock, resolver):
+        await resolver("folder", tags=["a"])
+        await resolver("folder", tags=["a"])
+        assert resolver.calls == ["folder", "folder"]
+
+
+class TestClientPool:
+    """Test that the API client and its connections are shared by the calls"""
+
+    @pytest.fixture
+    def created_clients(self, monkeypatch):
+        """AsyncClients created by get_client, answering from a mock transport"""
+        created = []
+        async_client = httpx.AsyncClient
+
+        def handler(request):
+            return httpx.Response(200, json={"results": [], "method": request.method})
+
+        def make_client(**kwargs):
+            new_client = async_client(transport=httpx.MockTransport(handler), **kwargs)
+            created.append(new_client)
+            return new_client
+
+        monkeypatch.setattr(client.httpx, "AsyncClient", make_client)
+        monkeypatch.setattr(client, "API_URL", "https://ca.test/api")
+        return created
+
+    @pytest.mark.asyncio
+    async def test_calls_reuse_the_client(self, created_clients):
+        responses = [await client.make_get_request("/folders/") for _ in range(3)]
+        await client.make_patch_request("/folders/1/", {"name": "renamed"})
+        assert all(res.status_code == 200 for res in responses)
+        assert len(created_clients) == 1
+        assert client.get_client() is created_clients[0]
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self, created_clients):
+        first = client.get_client()
+        await first.aclose()
+        assert client.get_client() is not first
+        assert len(created_clients) == 2
+
+    def test_one_client_per_event_loop(self, created_clients):
+        async def get_client():
+            return client.get_client()
+
+        clients = [asyncio.run(get_client()) for _ in range(2)]
+        assert clients[0] is not clients[1]
+
+    @pytest.mark.asyncio
+    async def test_writes_clear_the_resolver_cache(self, created_clients):
+        resolver_cache.set("folder", "id-1")
+        await client.make_get_request("/folders/")
+        assert resolver_cache.get("folder") == "id-1"
+        await client.make_post_request("/folders/", {"name": "new"})
+        assert resolver_cache.get("folder") is None
@@ -1,4 +1,6 @@
 import sys
+import threading
+from functools import partial
 
 import click
 import requests
@@ -16,6 +18,7 @@ import utils.api as api
 from loguru import logger
 
 from utils.kafka import build_kafka_config
+from workers import CommitOnRevoke, WorkerPool, consume_records, message_key
 
 
 log_message_format = (
@@ -35,6 +38,9 @@ logger.add(
 
 auth_data = dict()
 
+# Workers hitting an expired session renew it one at a time
+_auth_lock = threading.Lock()
+
 
 @click.group()
 def cli():
@@ -77,20 +83,97 @@ def auth(email: str, password: str):
     return _auth(email, password)
 
 
+def parse_record(msg):
+    """
+    Decode a consumed record into its (ordering key, message) pair, or None
+    when it cannot be processed.
+    """
+    logger.trace("Consumed record.", key=msg.key, value=msg.value)
+    try:
+        message = json.loads(msg.value.decode("utf-8"))
+    except Exception as e:
+        logger.error(f"Error decoding message: {e}")
+        return None
+
+    if message.get("message_type") not in message_registry.REGISTRY:
+        logger.error(
+            "Message type not supported. Skipping. Check the message registry for supported events.",
+            message_type=message.get("message_type"),
+            supported_message_types=list(message_registry.REGISTRY.keys()),
+        )
+        return None
+
+    return message_key(msg.key, message), message
+
+
+def process_message(message, error_producer):
+    """
+    Process a message, renewing the session when it expired. Requests without
+    a response are retried, failed requests are raised and any other error is
+    sent to the errors topic.
+    """
+    logger.info(f"Processing event: {message.get('message_type')}")
+
+    # Wrap the processing in a loop that allows for retries.
+    while True:
+        try:
+            message_registry.REGISTRY[message.get("message_type")](message)
+        except requests.exceptions.RequestException as e:
+            logger.error("Request failed", response=e.response)
+            if e.response is not None:
+                logger.error(
+                    f"Request failed with status code {e.response.status_code} and message: {e.response.text}"
+                )
+                if e.response.status_code == 401:
+                    if not settings.AUTO_RENEW_SESSION:
+                        logger.error("Session expired. Please run the `auth` command.")
+                        raise
+                    try:
+                        logger.debug(
+                            "Automatic session renewal enabled, attempting silent reauthentication."
+                        )
+                        with _auth_lock:
+                            _auth(settings.USER_EMAIL, settings.USER_PASSWORD)
+                        continue
+                    except Exception as e:
+                        logger.error(
+                            "Silent reauthentication failed. Please run the `auth` command.",
+                            e,
+                        )
+                        raise
+                raise
+
+        except Exception as e:
+            # NOTE: This exception is necessary to avoid the dispatcher stopping and not consuming any more messages.
+            logger.exception("Message could not be consumed")
+            error_producer.send(
+                settings.ERRORS_TOPIC,
+                value=json.dumps({"message": message, "error": str(e)}).encode(),
+            )
+            break  # break out of retry loop; we don't want to retry on non-request errors
+        else:
+            # Processing succeeded; break out of the retry loop.
+            break
+
+
 @click.command()
 def consume():
     """
     Consume messages from the Kafka topic and process them.
+
+    Messages are processed concurrently by CONSUMER_WORKERS workers. Messages
+    with the same key (or the same selector when they have no key) are
+    processed in order, and offsets are committed once processed.
     """
     kafka_cfg = build_kafka_config()
     logger.info("Starting consumer", bootstrap_servers=settings.BOOTSTRAP_SERVERS)
     try:
         consumer = KafkaConsumer(
-            # topic
-            "observation",
             # consumer configs
             group_id="my-group",
             auto_offset_reset="earliest",
+            # Offsets are committed by the dispatcher once processed
+            enable_auto_commit=False,
             **kafka_cfg,
             # value_deserializer=lambda v: v,
         )
@@ -113,73 +196,22 @@ def consume():
             bootstrap_servers=settings.BOOTSTRAP_SERVERS,
             error=e,
         )
+        consumer.close()
         sys.exit(1)
 
+    pool = WorkerPool(
+        partial(process_message, error_producer=error_producer),
+        workers=settings.CONSUMER_WORKERS,
+    )
+    # topic
+    consumer.subscribe(["observation"], listener=CommitOnRevoke(consumer, pool))
+
     try:
         logger.info(
             f"Dispatcher up and running {'(authenticated)' if kafka_cfg.get('security_protocol') else '(unauthenticated)'}",
+            workers=settings.CONSUMER_WORKERS,
         )
-        for msg in consumer:
-            logger.trace("Consumed record.", key=msg.key, value=msg.value)
-            try:
-                message = json.loads(msg.value.decode("utf-8"))
-            except Exception as e:
-                logger.error(f"Error decoding message: {e}")
-                continue
-
-            if message.get("message_type") not in message_registry.REGISTRY:
-                logger.error(
-                    "Message type not supported. Skipping. Check the message registry for supported events.",
-                    message_type=message.get("message_type"),
-                    supported_message_types=list(message_registry.REGISTRY.keys()),
-                )
-                continue
-
-            logger.info(f"Processing event: {message.get('message_type')}")
-
-            # Wrap the processing in a loop that allows for retries.
-            while True:
-                try:
-                    message_registry.REGISTRY[message.get("message_type")](message)
-                except requests.exceptions.RequestException as e:
-                    logger.error("Request failed", response=e.response)
-                    if e.response is not None:
-                        logger.error(
-                            f"Request failed with status code {e.response.status_code} and message: {e.response.text}"
-                        )
-                        if e.response.status_code == 401:
-                            if not settings.AUTO_RENEW_SESSION:
-                                logger.error(
-                                    "Session expired. Please run the `auth` command."
-                                )
-                                raise
-                            try:
-                                logger.debug(
-                                    "Automatic session renewal enabled, attempting silent reauthentication."
-                                )
-                                _auth(settings.USER_EMAIL, settings.USER_PASSWORD)
-                                continue
-                            except Exception as e:
-                                logger.error(
-                                    "Silent reauthentication failed. Please run the `auth` command.",
-                                    e,
-                                )
-                                raise
-                        raise
-
-                except Exception as e:
-                    # NOTE: This exception is necessary to avoid the dispatcher stopping and not consuming any more messages.
-                    logger.exception("Message could not be consumed")
-                    error_producer.send(
-                        settings.ERRORS_TOPIC,
-                        value=json.dumps(
-                            {"message": message, "error": str(e)}
-                        ).encode(),
-                    )
-                    break  # break out of retry loop; we don't want to retry on non-request errors
-                else:
-                    # Processing succeeded; break out of the retry loop.
-                    break
+        consume_records(consumer, pool, parse_record)
 
     except UnsupportedCodecError as e:
         logger.exception("KO", e)
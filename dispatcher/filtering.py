@@ -1,8 +1,67 @@
+import json
+import threading
+import time
+from urllib.parse import urljoin
+
 import requests
 from loguru import logger
+
+import settings
 import utils.api as api
 
 
+class SelectorCache:
+    """
+    Short-lived cache of selector results, keyed by endpoint and normalised
+    selector, so that bursts of messages on the same objects resolve them once.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def make_key(endpoint: str, selector: dict, selector_mapping: dict) -> tuple:
+        return (
+            endpoint,
+            json.dumps(selector, sort_keys=True, default=str),
+            json.dumps(selector_mapping, sort_keys=True),
+        )
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, endpoint: str | None = None):
+        """Drop the results of an endpoint, or all of them."""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == endpoint]:
+                    del self._entries[key]
+
+
+selector_cache = SelectorCache(ttl=settings.SELECTOR_CACHE_TTL)
+
+# Objects fetched per page when resolving a selector
+SELECTOR_PAGE_SIZE = 1000
+
+
 def process_selector(
     selector: dict[str, str],
     endpoint: str,
@@ -25,6 +84,8 @@ def process_selector(
         For 'single' target: a single object ID (string).
         For 'multiple' target: a list of object IDs.
 
+    Results are cached for SELECTOR_CACHE_TTL seconds (see SelectorCache).
+
     Raises:
         Exception: If the API call fails, the response is not as expected, or if the result count
                    does not match the expected target.
@@ -32,6 +93,12 @@ def process_selector(
     if selector_mapping is None:
         selector_mapping = {}
 
+    cache_key = SelectorCache.make_key(endpoint, selector, selector_mapping)
+    cached = selector_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Selector resolved from cache", selector=selector)
+        return list(cached) if isinstance(cached, tuple) else cached
+
     target = selector.pop("target", "single")
 
     if selector_mapping:
@@ -39,7 +106,7 @@ def process_selector(
             if key in selector_mapping:
                 selector[selector_mapping[key]] = selector.pop(key)
 
-    query_params = selector
+    query_params = {"limit": SELECTOR_PAGE_SIZE, **selector}
 
     headers = {
         "Accept": "application/json",
@@ -73,7 +140,8 @@ def process_selector(
         if isinstance(data, dict) and "results" in data:
             results = data.get("results", [])
             results_list.extend(results)
-            next_url = data.get("next")
+            # The API returns the next link without scheme and host
+            next_url = data.get("next") and urljoin(endpoint, data["next"])
         elif isinstance(data, list):
             results_list = data
             next_url = None
@@ -97,13 +165,17 @@ def process_selector(
         if "id" not in results_list[0]:
             logger.error("Result missing 'id' field", result=results_list[0])
             raise Exception("API result is missing required 'id' field")
-        return results_list[0].get("id")
+        object_id = results_list[0].get("id")
+        selector_cache.set(cache_key, object_id)
+        return object_id
     elif target == "multiple":
         # Check if any result is missing an id field
         missing_ids = [i for i, item in enumerate(results_list) if "id" not in item]
         if missing_ids:
             logger.error(f"Results at indices {missing_ids} missing 'id' field")
             raise Exception("Some API results are missing required 'id' field")
-        return [item.get("id") for item in results_list]
+        object_ids = [item.get("id") for item in results_list]
+        selector_cache.set(cache_key, tuple(object_ids))
+        return object_ids
     else:
         raise Exception(f"Unknown target specified in selector: {target}")
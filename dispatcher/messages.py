@@ -1,7 +1,8 @@
 import base64
 import io
 import urllib.parse
-from filtering import process_selector
+import requests
+from filtering import process_selector, selector_cache
 from s3fs import S3FileSystem
 
 from settings import API_URL, S3_URL, VERIFY_CERTIFICATE, get_access_token
@@ -22,6 +23,9 @@ class MessageRegistry:
 
 message_registry = MessageRegistry()
 
+# Maximum number of ids per batch action request (the API limit)
+BATCH_UPDATE_CHUNK_SIZE = 100
+
 
 def get_resource_endpoint(message: dict, resource_endpoint: str | None = None) -> str:
     """
@@ -120,6 +124,57 @@ def update_single_object(resource_endpoint: str, obj_id: str, values: dict) -> d
     return res.json() if res.text else {"id": obj_id, **values}
 
 
+def batch_update_objects(
+    resource_endpoint: str, object_ids: list, values: dict
+) -> list:
+    """
+    Updates objects with the same values through the "update" batch action, in
+    chunks of BATCH_UPDATE_CHUNK_SIZE ids. The API applies the values to each
+    object as a PATCH of that object would.
+    """
+    batch_url = f"{API_URL}/{resource_endpoint}/batch-action/"
+    updated_objects = []
+    for start in range(0, len(object_ids), BATCH_UPDATE_CHUNK_SIZE):
+        chunk = object_ids[start : start + BATCH_UPDATE_CHUNK_SIZE]
+        logger.debug(f"Batch updating {len(chunk)} {resource_endpoint}", values=values)
+        res = api.post(
+            batch_url,
+            json={"action": "update", "ids": chunk, "value": values},
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "Authorization": f"Token {get_access_token()}",
+            },
+            verify=VERIFY_CERTIFICATE,
+            timeout=300,
+        )
+        result = res.json()
+        updated_objects.extend(
+            {"id": obj["id"], **values} for obj in result.get("succeeded", [])
+        )
+        if result.get("failed"):
+            logger.error(
+                f"Failed to update {len(result['failed'])} {resource_endpoint}",
+                failed=result["failed"],
+            )
+            raise Exception(f"Failed to update {resource_endpoint}: {result['failed']}")
+    return updated_objects
+
+
+def _is_unknown_batch_action(response) -> bool:
+    """Whether the API predates the "update" batch action."""
+    if response is None:
+        return False
+    if response.status_code in (404, 405):
+        return True
+    if response.status_code != 400:
+        return False
+    try:
+        return response.json().get("error") == "Invalid action type"
+    except ValueError:
+        return False
+
+
 def update_objects(
     message: dict,
     resource_endpoint: str | None = None,
@@ -160,10 +215,28 @@ def update_objects(
 
     logger.info("Updating objects", resource=resource_endpoint, ids=object_ids)
 
+    if len(object_ids) > 1:
+        try:
+            updated_objects = batch_update_objects(
+                resource_endpoint, object_ids, values
+            )
+        except requests.exceptions.HTTPError as e:
+            # API versions without the "update" batch action
+            if not _is_unknown_batch_action(e.response):
+                raise
+            logger.warning(
+                "Batch update not available, updating objects one by one",
+                resource=resource_endpoint,
+            )
+
     # Process each update
-    for obj_id in object_ids:
-        updated_obj = update_single_object(resource_endpoint, obj_id, values)
-        updated_objects.append(updated_obj)
+    if not updated_objects:
+        for obj_id in object_ids:
+            updated_obj = update_single_object(resource_endpoint, obj_id, values)
+            updated_objects.append(updated_obj)
+
+    # Selectors on the updated fields may no longer match the same objects
+    selector_cache.invalidate(f"{API_URL}/{resource_endpoint}/")
 
     logger.success(
         "Successfully updated objects", resource=resource_endpoint, ids=object_ids
@@ -57,6 +57,8 @@ def load_env_config():
         "auto_renew_session": os.getenv("AUTO_RENEW_SESSION") == "True" or None,
         "bootstrap_servers": os.getenv("BOOTSTRAP_SERVERS"),
         "errors_topic": os.getenv("ERRORS_TOPIC"),
+        "consumer_workers": os.getenv("CONSUMER_WORKERS"),
+        "selector_cache_ttl": os.getenv("SELECTOR_CACHE_TTL"),
         "s3_url": os.getenv("S3_URL"),
         "s3_access_key": os.getenv("S3_ACCESS_KEY"),
         "s3_secret_key": os.getenv("S3_SECRET_KEY"),
@@ -298,6 +300,8 @@ KAFKA_SECURITY_PROTOCOL = config.get("kafka", {}).get(
 KAFKA_USERNAME = config.get("kafka", {}).get("sasl_plain_username", "")
 KAFKA_PASSWORD = config.get("kafka", {}).get("sasl_plain_password", "")
 ERRORS_TOPIC = config.get("errors_topic", "errors")
+CONSUMER_WORKERS = max(1, int(config.get("consumer_workers", 4)))
+SELECTOR_CACHE_TTL = float(config.get("selector_cache_ttl", 30))
 S3_URL = config.get("s3_url", "http://localhost:9000")
 S3_ACCESS_KEY = config.get("s3_access_key", "")
 S3_SECRET_KEY = config.get("s3_secret_key", "")
@@ -0,0 +1,32 @@
+import time
+
+from filtering import SelectorCache
+
+
+def test_selector_cache_key_is_normalised():
+    key = SelectorCache.make_key("/api/x/", {"ref_id": "A", "target": "multiple"}, {})
+    same = SelectorCache.make_key("/api/x/", {"target": "multiple", "ref_id": "A"}, {})
+    assert key == same
+
+
+def test_selector_cache_expires_and_invalidates():
+    cache = SelectorCache(ttl=0.05)
+    key = SelectorCache.make_key("/api/x/", {"ref_id": "A"}, {})
+    other = SelectorCache.make_key("/api/y/", {"ref_id": "A"}, {})
+    cache.set(key, ("id1", "id2"))
+    cache.set(other, "id3")
+    assert cache.get(key) == ("id1", "id2")
+
+    cache.invalidate("/api/x/")
+    assert cache.get(key) is None
+    assert cache.get(other) == "id3"
+
+    time.sleep(0.06)
+    assert cache.get(other) is None
+
+
+def test_selector_cache_disabled():
+    cache = SelectorCache(ttl=0)
+    key = SelectorCache.make_key("/api/x/", {"ref_id": "A"}, {})
+    cache.set(key, "id1")
+    assert cache.get(key) is None
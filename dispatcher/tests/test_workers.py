@@ -0,0 +1,175 @@
+import itertools
+import threading
+import time
+import zlib
+from collections import defaultdict, namedtuple
+
+import pytest
+from kafka.structs import TopicPartition
+
+from workers import WorkerPool, consume_records, message_key
+
+Record = namedtuple("Record", ["key", "offset", "message"])
+
+
+class InMemoryConsumer:
+    """
+    Stand-in for KafkaConsumer serving records from memory, one batch per poll.
+    The records of paused partitions are served again once they are resumed.
+    """
+
+    def __init__(self, batches, on_poll=None):
+        self.batches = list(batches)
+        self.committed = {}
+        self.paused = set()
+        self.polls_while_paused = 0
+        self.on_poll = on_poll
+        self.stop = threading.Event()
+
+    def poll(self, timeout_ms=0):
+        if self.paused:
+            self.polls_while_paused += 1
+        if self.on_poll is not None:
+            self.on_poll(self)
+        if not self.batches:
+            self.stop.set()
+            return {}
+        batch = self.batches.pop(0)
+        held = {p: records for p, records in batch.items() if p in self.paused}
+        if held:
+            if not self.batches:
+                self.batches.append({})
+            for partition, records in held.items():
+                self.batches[0][partition] = records + self.batches[0].get(
+                    partition, []
+                )
+        return {p: records for p, records in batch.items() if p not in held}
+
+    def pause(self, *partitions):
+        self.paused.update(partitions)
+
+    def resume(self, *partitions):
+        self.paused.difference_update(partitions)
+
+    def commit(self, offsets):
+        for partition, offset in offsets.items():
+            self.committed[partition] = offset.offset
+
+
+def parse(record):
+    return message_key(record.key, record.message), record.message
+
+
+def make_batches(partitions=2, keys=8, per_key=5):
+    batches = []
+    offsets = defaultdict(int)
+    for i in range(per_key):
+        batch = defaultdict(list)
+        for key in range(keys):
+            partition = TopicPartition("observation", key % partitions)
+            batch[partition].append(
+                Record(
+                    key=f"object-{key}".encode(),
+                    offset=offsets[partition],
+                    message={"key": key, "seq": i},
+                )
+            )
+            offsets[partition] += 1
+        batches.append(dict(batch))
+    return batches, dict(offsets)
+
+
+def run(batches, handler, workers):
+    consumer = InMemoryConsumer(batches)
+    pool = WorkerPool(handler, workers=workers)
+    consume_records(consumer, pool, parse, stop=consumer.stop)
+    return consumer
+
+
+def test_per_key_order_and_commits():
+    batches, end_offsets = make_batches()
+    seen = defaultdict(list)
+    lock = threading.Lock()
+
+    def handler(message):
+        time.sleep(0.001 * (message["key"] % 3))
+        with lock:
+            seen[message["key"]].append(message["seq"])
+
+    consumer = run(batches, handler, workers=4)
+
+    assert all(seqs == list(range(5)) for seqs in seen.values())
+    assert len(seen) == 8
+    assert consumer.committed == end_offsets
+
+
+def test_workers_process_keys_concurrently():
+    workers = 4
+    # One key per worker queue, as routed by WorkerPool.submit
+    keys = {}
+    for i in itertools.count():
+        key = f"object-{i}".encode()
+        keys.setdefault(zlib.crc32(key) % workers, key)
+        if len(keys) == workers:
+            break
+    partition = TopicPartition("observation", 0)
+    batches = [
+        {
+            partition: [
+                Record(key=key, offset=offset, message={"key": key})
+                for offset, key in enumerate(keys.values())
+            ]
+        }
+    ]
+    # Only passes once every worker is processing a message at the same time
+    barrier = threading.Barrier(workers, timeout=5)
+
+    consumer = run(batches, lambda message: barrier.wait(), workers=workers)
+
+    assert consumer.committed == {partition: workers}
+
+
+def test_full_pool_pauses_partitions_instead_of_blocking_poll():
+    batches, end_offsets = make_batches(partitions=1, keys=1, per_key=5)
+    released = threading.Event()
+    seen = []
+
+    def release_after_polls(consumer):
+        # The single worker is busy and its queue full: polling goes on
+        if consumer.polls_while_paused >= 3:
+            released.set()
+
+    def handler(message):
+        assert released.wait(timeout=5)
+        seen.append(message["seq"])
+
+    consumer = InMemoryConsumer(batches, on_poll=release_after_polls)
+    pool = WorkerPool(handler, workers=1, queue_size=1)
+    consume_records(consumer, pool, parse, stop=consumer.stop)
+
+    assert consumer.polls_while_paused >= 3
+    assert seen == list(range(5))
+    assert consumer.committed == end_offsets
+
+
+def test_failed_message_is_not_committed():
+    batches, _ = make_batches(partitions=1, keys=1, per_key=5)
+
+    def handler(message):
+        if message["seq"] == 2:
+            raise RuntimeError("API unavailable")
+
+    consumer = InMemoryConsumer(batches)
+    pool = WorkerPool(handler, workers=2)
+    with pytest.raises(RuntimeError):
+        consume_records(consumer, pool, parse, stop=consumer.stop)
+
+    # Messages 0 and 1 were processed; the failed one is consumed again
+    assert consumer.committed == {TopicPartition("observation", 0): 2}
+
+
+def test_message_key_falls_back_to_selector():
+    message = {"selector": {"ref_id": "AC-1", "target": "single"}}
+    same = {"selector": {"target": "single", "ref_id": "AC-1"}}
+    assert message_key(None, message) == message_key(None, same)
+    assert message_key(b"key", message) == b"key"
@@ -1,7 +1,11 @@
 import requests
-from settings import API_URL, get_access_token
+from requests.adapters import HTTPAdapter
+from settings import API_URL, CONSUMER_WORKERS, get_access_token
 
 session = requests.Session()
+# One pooled connection per consumer worker
+for prefix in ("http://", "https://"):
+    session.mount(prefix, HTTPAdapter(pool_maxsize=max(10, CONSUMER_WORKERS)))
 
 
 def update_session_token():
@@ -0,0 +1,288 @@
+"""
+Concurrent processing of the consumed messages.
+
+Messages are spread over a fixed number of worker threads by ordering key:
+messages with the same key always go to the same worker and are processed in
+the order they were consumed, so updates to the same object never reorder.
+
+Offsets are committed per partition up to the first message that is not
+processed yet, never past it. After a crash or a rebalance, the messages
+following it may be processed again, but no message is skipped.
+
+Polling never waits for the workers: when the queue of a worker is full, the
+messages of its partition are held back and the partition is paused until
+they are all queued, so the consumer keeps polling within max.poll.interval.ms.
+"""
+
+import json
+import queue
+import threading
+import zlib
+from collections import deque
+
+from kafka import ConsumerRebalanceListener
+from kafka.structs import OffsetAndMetadata
+from loguru import logger
+
+# Sentinel asking a worker to stop
+_STOP = object()
+
+
+def message_key(record_key, message: dict) -> bytes:
+    """
+    Ordering key of a message: the record key when the producer set one,
+    otherwise the selector of the message, which identifies its target objects.
+    """
+    if record_key:
+        return record_key
+    return json.dumps(message.get("selector"), sort_keys=True, default=str).encode()
+
+
+def offset_and_metadata(offset: int) -> OffsetAndMetadata:
+    # kafka-python < 2.1 has no leader_epoch field
+    return OffsetAndMetadata._make((offset, "", -1)[: len(OffsetAndMetadata._fields)])
+
+
+class OffsetTracker:
+    """
+    Tracks the offsets in flight per partition and the offsets safe to commit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # partition -> deque of offsets, in consumed order
+        self._done = {}  # partition -> set of processed offsets
+        self._committable = {}  # partition -> next offset to consume
+
+    def track(self, partition, offset: int):
+        with self._lock:
+            self._pending.setdefault(partition, deque()).append(offset)
+
+    def done(self, partition, offset: int):
+        with self._lock:
+            pending = self._pending.get(partition)
+            if pending is None:
+                # Partition revoked meanwhile
+                return
+            done = self._done.setdefault(partition, set())
+            done.add(offset)
+            while pending and pending[0] in done:
+                done.discard(pending[0])
+                self._committable[partition] = pending.popleft() + 1
+
+    def pop_committable(self) -> dict:
+        with self._lock:
+            committable, self._committable = self._committable, {}
+        return {
+            partition: offset_and_metadata(offset)
+            for partition, offset in committable.items()
+        }
+
+    def untrack(self, partition):
+        """
+        Drop the last offset tracked on a partition.
+        """
+        with self._lock:
+            self._pending[partition].pop()
+
+    def forget(self, partitions):
+        with self._lock:
+            for partition in partitions:
+                self._pending.pop(partition, None)
+                self._done.pop(partition, None)
+                self._committable.pop(partition, None)
+
+
+class WorkerPool:
+    """
+    Bounded pool of worker threads, each with its own bounded queue.
+
+    'handler' is called with each submitted message. An exception raised by
+    the handler is fatal: the offset of the message is not committed, the
+    workers drop the messages left in their queue and the next call to
+    raise_for_error() raises it in the consuming thread.
+
+    Messages are submitted without blocking. A message whose worker queue is
+    full is held back with the ones following it on its partition, until
+    drain() queues them.
+    """
+
+    def __init__(self, handler, workers: int = 4, queue_size: int = 100):
+        self.handler = handler
+        self.tracker = OffsetTracker()
+        self.error = None
+        self._backlog = {}  # partition -> deque of held back (key, offset, message)
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._threads = [
+            threading.Thread(
+                target=self._work, args=(q,), name=f"dispatcher-worker-{i}", daemon=True
+            )
+            for i, q in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self, q: queue.Queue):
+        while True:
+            item = q.get()
+            try:
+                if item is _STOP:
+                    return
+                partition, offset, message = item
+                if self.error is not None:
+                    continue
+                try:
+                    self.handler(message)
+                except BaseException as e:
+                    logger.exception("Worker stopped on a fatal error")
+                    self.error = e
+                else:
+                    self.tracker.done(partition, offset)
+            finally:
+                q.task_done()
+
+    def _queue(self, key, partition, offset: int, message, block=False) -> bool:
+        # Tracked before it is queued, so that its worker cannot finish it first
+        self.tracker.track(partition, offset)
+        if key is None:
+            self.tracker.done(partition, offset)
+            return True
+        try:
+            self._queues[zlib.crc32(key) % len(self._queues)].put(
+                (partition, offset, message), block=block
+            )
+        except queue.Full:
+            self.tracker.untrack(partition)
+            return False
+        return True
+
+    def submit(self, key: bytes, partition, offset: int, message: dict) -> bool:
+        """
+        Queue a message on the worker of its key, without blocking. Returns
+        False when it is held back: the partition should then be paused until
+        drain() reports it.
+        """
+        backlog = self._backlog.get(partition)
+        if backlog is None and self._queue(key, partition, offset, message):
+            return True
+        self._backlog.setdefault(partition, deque()).append((key, offset, message))
+        return False
+
+    def skip(self, partition, offset: int) -> bool:
+        """
+        Mark a message that is not processed (e.g. malformed) as done, once the
+        messages before it on its partition are queued.
+        """
+        return self.submit(None, partition, offset, None)
+
+    @property
+    def holding(self) -> bool:
+        return bool(self._backlog)
+
+    def drain(self, block=False) -> list:
+        """
+        Queue the held back messages, in order. Returns the partitions that
+        have none left.
+        """
+        drained = []
+        for partition, backlog in list(self._backlog.items()):
+            while backlog:
+                key, offset, message = backlog[0]
+                if not self._queue(key, partition, offset, message, block=block):
+                    break
+                backlog.popleft()
+            if not backlog:
+                del self._backlog[partition]
+                drained.append(partition)
+        return drained
+
+    def discard(self, partitions):
+        """
+        Drop the messages held back on 'partitions', which the next consumer of
+        these partitions will consume again.
+        """
+        for partition in partitions:
+            self._backlog.pop(partition, None)
+
+    def join(self):
+        """
+        Wait until every queued message is processed.
+        """
+        for q in self._queues:
+            q.join()
+
+    def raise_for_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        for q in self._queues:
+            q.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+
+def commit_processed(consumer, pool: WorkerPool):
+    offsets = pool.tracker.pop_committable()
+    if offsets:
+        consumer.commit(offsets)
+        logger.trace("Committed offsets", offsets=offsets)
+
+
+class CommitOnRevoke(ConsumerRebalanceListener):
+    """
+    Finish the messages in flight and commit them before partitions are
+    handed over to another consumer of the group.
+    """
+
+    def __init__(self, consumer, pool: WorkerPool):
+        self.consumer = consumer
+        self.pool = pool
+
+    def on_partitions_revoked(self, revoked):
+        self.pool.discard(revoked)
+        self.pool.join()
+        commit_processed(self.consumer, self.pool)
+        self.pool.tracker.forget(revoked)
+
+    def on_partitions_assigned(self, assigned):
+        pass
+
+
+def consume_records(consumer, pool: WorkerPool, parse, stop=None):
+    """
+    Poll 'consumer' and hand its records over to 'pool' until 'stop' is set
+    or a worker fails, committing the processed offsets after each poll.
+
+    'parse' turns a record into an (ordering key, message) pair, or None for
+    records that must be skipped. Partitions are paused while the pool holds
+    back their records, and resumed once it queued them.
+    """
+    try:
+        while stop is None or not stop.is_set():
+            drained = pool.drain()
+            if drained:
+                consumer.resume(*drained)
+            # Come back soon to queue the held back records
+            timeout_ms = 100 if pool.holding else 1000
+            for partition, records in consumer.poll(timeout_ms=timeout_ms).items():
+                queued = True
+                for record in records:
+                    parsed = parse(record)
+                    if parsed is None:
+                        queued &= pool.skip(partition, record.offset)
+                    else:
+                        key, message = parsed
+                        queued &= pool.submit(key, partition, record.offset, message)
+                    pool.raise_for_error()
+                if not queued:
+                    consumer.pause(partition)
+            pool.raise_for_error()
+            commit_processed(consumer, pool)
+        pool.drain(block=True)
+        pool.join()
+        pool.raise_for_error()
+    finally:
+        pool.close()
+        # Offsets processed before a failure are safe to commit too
+        commit_processed(consumer, pool)
@@ -774,3 +774,11 @@ AUDITLOG_MAX_RECORDS = int(os.environ.get("AUDITLOG_MAX_RECORDS", 50000))
 WEBHOOK_ALLOW_PRIVATE_IPS = os.environ.get(
     "WEBHOOK_ALLOW_PRIVATE_IPS", "False"
 ).lower() in ("true", "1", "yes")
+
+# Outgoing webhook deliveries are sent in batches of at most WEBHOOK_BATCH_SIZE
+# events per endpoint, with at most WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT
+# requests in flight to an endpoint per worker process
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 100))
+WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT = int(
+    os.environ.get("WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT", 4)
+)
@@ -13,6 +13,8 @@ export interface TreeViewNode {
 	leadProps?: object;
 	/** children nodes. */
 	children?: TreeViewNode[];
+	/** Number of children, when they are loaded on demand. */
+	childrenCount?: number;
 	/** Set the input's value. */
 	value?: unknown;
 }
@@ -9,42 +9,10 @@ async function loadCustomDashboard(fetch: typeof globalThis.fetch, dashboardId:
 	if (!dashboardRes.ok) return null;
 	const dashboard = await dashboardRes.json();
 
-	// Fetch widgets for this dashboard
-	const widgetsRes = await fetch(
-		`${BASE_API_URL}/metrology/dashboard-widgets/?dashboard=${dashboardId}`
-	);
-	const widgetsData = widgetsRes.ok ? await widgetsRes.json() : { results: [] };
-	const widgets = widgetsData.results || [];
-
-	// For each widget, fetch its samples (matches /dashboards/[id]/+page.server.ts)
-	const widgetsWithSamples = await Promise.all(
-		widgets.map(async (widget: any) => {
-			const isBuiltinMetric = widget.is_builtin_metric || widget.target_content_type;
-			if (isBuiltinMetric) {
-				const targetContentType = widget.target_content_type;
-				const targetObjectId = widget.target_object_id;
-				if (!targetContentType || !targetObjectId) {
-					return { ...widget, samples: [], builtinSamples: [] };
-				}
-				const r = await fetch(
-					`${BASE_API_URL}/metrology/builtin-metric-samples/for_object/?content_type_id=${targetContentType}&object_id=${targetObjectId}`
-				);
-				const data = r.ok ? await r.json() : [];
-				return {
-					...widget,
-					samples: [],
-					builtinSamples: Array.isArray(data) ? data : []
-				};
-			}
-			const metricInstanceId = widget.metric_instance?.id || widget.metric_instance;
-			if (!metricInstanceId) return { ...widget, samples: [], builtinSamples: [] };
-			const r = await fetch(
-				`${BASE_API_URL}/metrology/custom-metric-samples/?metric_instance=${metricInstanceId}`
-			);
-			const data = r.ok ? await r.json() : { results: [] };
-			return { ...widget, samples: data.results || [], builtinSamples: [] };
-		})
-	);
+	// Resolve all widgets with their samples in a single round trip
+	const renderRes = await fetch(`${BASE_API_URL}/metrology/dashboards/${dashboardId}/render/`);
+	const renderData = renderRes.ok ? await renderRes.json() : { widgets: [] };
+	const widgetsWithSamples = renderData.widgets || [];
 
 	return { ...dashboard, widgets: widgetsWithSamples };
 }
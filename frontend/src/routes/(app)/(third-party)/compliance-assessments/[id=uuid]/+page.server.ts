@@ -10,6 +10,7 @@ import type { PageServerLoad } from './$types';
 import { z } from 'zod';
 import { setFlash } from 'sveltekit-flash-message/server';
 import { m } from '$paraglide/messages';
+import { fetchTreeChildren } from './tree';
 
 export const load = (async ({ fetch, params, cookies, locals }) => {
 	const URLModel = 'compliance-assessments';
@@ -66,7 +67,7 @@ export const load = (async ({ fetch, params, cookies, locals }) => {
 		{ validationFlowForm }
 	] = await Promise.all([
 		fetch(objectEndpoint).then((res) => res.json()),
-		fetch(`${endpoint}tree/`).then((res) => res.json()),
+		fetchTreeChildren(fetch, `${endpoint}tree/children/`),
 		fetch(`${BASE_API_URL}/${URLModel}/${params.id}/donut_data/`).then((res) => res.json()),
 		fetch(`${BASE_API_URL}/${URLModel}/${params.id}/global_score/`).then((res) => res.json()),
 		fetch(`${BASE_API_URL}/${URLModel}/${params.id}/threats_metrics/`).then((res) => res.json()),
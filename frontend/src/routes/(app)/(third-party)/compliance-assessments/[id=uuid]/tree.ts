@@ -0,0 +1,30 @@
+import type { Node } from './types';
+
+const TREE_PAGE_SIZE = 500;
+
+/**
+ * Load all the children of a requirement node (top-level nodes when nodeId
+ * is omitted), following the pages of the tree/children endpoint. Children
+ * come without their own children, with counts over their subtrees.
+ */
+export async function fetchTreeChildren(
+	fetch: typeof globalThis.fetch,
+	endpoint: string,
+	nodeId?: string
+): Promise<Record<string, Node>> {
+	const children: Record<string, Node> = {};
+	let cursor: string | null = null;
+	do {
+		const params = new URLSearchParams({ limit: String(TREE_PAGE_SIZE) });
+		if (nodeId) params.set('node', nodeId);
+		if (cursor) params.set('cursor', cursor);
+		const res = await fetch(`${endpoint}?${params.toString()}`);
+		if (!res.ok) throw new Error(`Failed to load requirement tree: ${res.statusText}`);
+		const page = await res.json();
+		for (const { id, ...node } of page.results) {
+			children[id] = node;
+		}
+		cursor = page.next;
+	} while (cursor);
+	return children;
+}
@@ -0,0 +1,22 @@
+import { BASE_API_URL } from '$lib/utils/constants';
+
+import { error, type NumericRange } from '@sveltejs/kit';
+import type { RequestHandler } from './$types';
+
+export const GET: RequestHandler = async ({ fetch, params, url }) => {
+	const endpoint = `${BASE_API_URL}/compliance-assessments/${params.id}/tree/children/${
+		url.searchParams ? '?' + url.searchParams.toString() : ''
+	}`;
+
+	const res = await fetch(endpoint);
+	if (!res.ok) {
+		error(res.status as NumericRange<400, 599>, await res.json());
+	}
+	const data = await res.json();
+
+	return new Response(JSON.stringify(data), {
+		headers: {
+			'Content-Type': 'application/json'
+		}
+	});
+};
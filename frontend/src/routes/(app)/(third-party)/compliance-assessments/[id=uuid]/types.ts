@@ -13,4 +13,10 @@ export interface Node {
 	score?: number; // Assuming that the score field exists in nodes similar to leaves
 	is_scored?: boolean; // Assuming that the is_scored field exists in nodes similar to leaves
 	weight?: number; // Weight multiplier for score calculations
+	// Counts over the subtree, sent by the tree/children endpoint
+	children_count?: number;
+	requirements_count?: number;
+	result_counts?: Record<string, number>;
+	status_counts?: Record<string, number>;
+	scored_weight?: number;
 }